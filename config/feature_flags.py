@@ -41,13 +41,13 @@ class FeatureFlags:
         if cls._initialized:
             return
 
-        cls.USE_TYPED_EVENTS = cls._get_flag("USE_TYPED_EVENTS", default=False)
+        cls.USE_TYPED_EVENTS = cls._get_flag("USE_TYPED_EVENTS", default=True)
         cls.ENABLE_MIGRATION_LOGS = cls._get_flag("ENABLE_MIGRATION_LOGS", default=True)
         cls.ENABLE_PERF_TRACKING = cls._get_flag("ENABLE_PERF_TRACKING", default=True)
         cls._initialized = True
 
         if cls.ENABLE_MIGRATION_LOGS:
-            log.info("Feature flags initialized", flags=cls.get_all_flags())
+            log.info(f"Feature flags initialized: {cls.get_all_flags()}")
 
     @classmethod
     def _get_flag(cls, name: str, default: bool = False) -> bool:
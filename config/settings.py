@@ -13,6 +13,7 @@ HOME: str = str(Path.home())
 APP_ROOT: Path = Path(HOME)  # kept generic; app may override via sys.path logic
 CACHE_DIR: str = str(Path(HOME) / ".sierra_pnl_monitor")
 CACHE_FILE: str = str(Path(CACHE_DIR) / "equity_timeseries.jsonl")
+WARM_START_FILE: str = str(Path(CACHE_DIR) / "warm_start.json")  # services/warm_start.py
 
 # Logs directory (used by utils/logger.py)
 LOG_DIR: str = str(Path(APP_ROOT) / "Desktop" / "APPSIERRA" / "logs")
@@ -38,7 +39,7 @@ DEBUG_PERF: bool = bool(int(os.getenv("DEBUG_PERF", "0")))  # Latency, CPU, memo
 # --- Migration feature flags (can be overridden by environment variables) ---
 # See config/feature_flags.py for full documentation
 FEATURE_FLAGS: Dict[str, bool] = {
-    "USE_TYPED_EVENTS": False,  # Default: use dict events (gradual migration)
+    "USE_TYPED_EVENTS": True,  # DTC bus events are typed objects (False: raw DTC dicts)
     "ENABLE_MIGRATION_LOGS": True,  # Default: enable migration logging
     "ENABLE_PERF_TRACKING": True,  # Default: enable performance tracking
 }
@@ -198,6 +199,74 @@ def _load_config_json() -> dict[str, Any]:
 DTC_HOST: str = _env_str("SIERRA_DTC_HOST", "127.0.0.1") or "127.0.0.1"
 DTC_PORT: int = _env_int("SIERRA_DTC_PORT", 11099) or 11099
 
+# Wire capture: record every inbound DTC frame for deterministic replay
+# (see core/wire_capture.py). Unset = disabled. One run per file, the previous
+# run's capture is kept as <name>.prev<suffix>.
+DTC_CAPTURE_PATH: Optional[str] = _env_str("DTC_CAPTURE_PATH")
+DTC_CAPTURE_COMPRESS: bool = _env_bool("DTC_CAPTURE_COMPRESS", True)
+
+# -------------------- Diagnostics pipeline --------------------
+# DiagnosticsHub producers only enqueue; a background thread routes, counts
+# and dumps (see core/diagnostics.py). Sample rates keep every Nth debug/info
+# event of a category, e.g. "data=10,perf=5". Warnings and errors are never sampled.
+DIAGNOSTICS_ASYNC: bool = _env_bool("DIAGNOSTICS_ASYNC", True)
+DIAGNOSTICS_QUEUE_SIZE: int = _env_int("DIAGNOSTICS_QUEUE_SIZE", 8192) or 8192
+DIAGNOSTICS_SAMPLE_RATES: str = _env_str("DIAGNOSTICS_SAMPLE_RATES", "") or ""
+# Stream every diagnostic event to a JSONL dump (core/session_replay.py loads it);
+# one session per file, the previous session is kept as <name>.prev.jsonl
+DIAGNOSTICS_JSONL_PATH: Optional[str] = _env_str("DIAGNOSTICS_JSONL_PATH")
+
+# -------------------- Hot-path metrics --------------------
+# Latency histograms/counters for decode, dispatch, render, stats and DB writes
+# (see core/metrics.py). Off unless METRICS_ENABLED or DEBUG_PERF is set.
+METRICS_ENABLED: bool = _env_bool("METRICS_ENABLED", DEBUG_PERF)
+METRICS_DUMP_DIR: str = _env_str("METRICS_DUMP_DIR") or str(Path(CACHE_DIR) / "metrics")
+METRICS_DUMP_INTERVAL_S: float = _env_float("METRICS_DUMP_INTERVAL_S", 30.0) or 30.0
+
+# -------------------- Sampling profiler --------------------
+# Whole-process stack sampler (see core/sampling_profiler.py); writes collapsed
+# stacks + speedscope JSON on exit, on demand (DevToolbar) and for UI stalls.
+PROFILER_ENABLED: bool = _env_bool("PROFILER_ENABLED", DEBUG_PERF)
+PROFILER_INTERVAL_MS: float = _env_float("PROFILER_INTERVAL_MS", 10.0) or 10.0
+PROFILER_MAX_STACKS: int = _env_int("PROFILER_MAX_STACKS", 20000) or 20000
+PROFILER_OUTPUT_DIR: str = _env_str("PROFILER_OUTPUT_DIR") or str(Path(CACHE_DIR) / "profiles")
+
+# -------------------- SignalBus slot profiling --------------------
+# Emit counts, fan-out and per-slot execution time (cumulative/p99) for every
+# SignalBus signal; logged at shutdown (see core/signal_profiler.py).
+SIGNAL_PROFILING_ENABLED: bool = _env_bool("SIGNAL_PROFILING_ENABLED", DEBUG_PERF)
+
+# -------------------- SignalBus priority lanes --------------------
+# Critical signals (orders, positions, connection) are delivered immediately;
+# normal ones (balances, display) are coalesced per frame; background ones
+# (analytics) run only in idle time, or after BUS_BACKGROUND_MAX_WAIT_MS when
+# normal traffic never lets the lane go idle (see core/bus_lanes.py).
+BUS_LANES_ENABLED: bool = _env_bool("BUS_LANES_ENABLED", True)
+BUS_FRAME_MS: int = _env_int("BUS_FRAME_MS", 16) or 16
+BUS_IDLE_BUDGET_MS: float = _env_float("BUS_IDLE_BUDGET_MS", 4.0) or 4.0
+BUS_BACKGROUND_MAX_WAIT_MS: float = _env_float("BUS_BACKGROUND_MAX_WAIT_MS", 250.0) or 250.0
+
+# -------------------- UI stall detector --------------------
+# Heartbeat into the Qt event loop; lag past the threshold records a UIStall
+# diagnostic with the GUI thread's stack (see core/stall_detector.py).
+STALL_DETECTOR_ENABLED: bool = _env_bool("STALL_DETECTOR_ENABLED", True)
+STALL_HEARTBEAT_MS: float = _env_float("STALL_HEARTBEAT_MS", 50.0) or 50.0
+STALL_THRESHOLD_MS: float = _env_float("STALL_THRESHOLD_MS", 200.0) or 200.0
+
+# -------------------- Animation clock --------------------
+# All UI animation subscriptions tick from one timer; intervals and due times
+# are rounded to this quantum so coinciding ticks share a wakeup (core/animation_clock.py).
+ANIMATION_QUANTUM_MS: int = _env_int("ANIMATION_QUANTUM_MS", 20) or 20
+
+# -------------------- Render quality governor --------------------
+# Chart paint times are measured; when a window of frames runs over budget
+# visual quality steps down (pulse FPS, glow, trails, antialiasing) and steps
+# back up after sustained headroom (see core/render_governor.py).
+RENDER_GOVERNOR_ENABLED: bool = _env_bool("RENDER_GOVERNOR_ENABLED", True)
+RENDER_FRAME_BUDGET_MS: float = _env_float("RENDER_FRAME_BUDGET_MS", 12.0) or 12.0
+RENDER_WINDOW_FRAMES: int = _env_int("RENDER_WINDOW_FRAMES", 30) or 30
+RENDER_HEADROOM_RATIO: float = _env_float("RENDER_HEADROOM_RATIO", 0.5) or 0.5
+
 # Optional auth
 DTC_USERNAME: Optional[str] = _env_str("SIERRA_DTC_USER", None)
 DTC_PASSWORD: Optional[str] = _env_str("SIERRA_DTC_PASS", None)
@@ -343,6 +412,7 @@ __all__ = [
     "APP_ROOT",
     "CACHE_DIR",
     "CACHE_FILE",
+    "WARM_START_FILE",
     "LOG_DIR",
     "ENABLE_CONFIG_JSON",
     "DEBUG_MODE",
@@ -366,6 +436,40 @@ __all__ = [
     "DTC_PORT",
     "DTC_USERNAME",
     "DTC_PASSWORD",
+    "DTC_CAPTURE_PATH",
+    "DTC_CAPTURE_COMPRESS",
+    # Diagnostics
+    "DIAGNOSTICS_ASYNC",
+    "DIAGNOSTICS_QUEUE_SIZE",
+    "DIAGNOSTICS_SAMPLE_RATES",
+    "DIAGNOSTICS_JSONL_PATH",
+    # Metrics
+    "METRICS_ENABLED",
+    "METRICS_DUMP_DIR",
+    "METRICS_DUMP_INTERVAL_S",
+    # Sampling profiler
+    "PROFILER_ENABLED",
+    "PROFILER_INTERVAL_MS",
+    "PROFILER_MAX_STACKS",
+    "PROFILER_OUTPUT_DIR",
+    # SignalBus slot profiling
+    "SIGNAL_PROFILING_ENABLED",
+    # SignalBus priority lanes
+    "BUS_LANES_ENABLED",
+    "BUS_FRAME_MS",
+    "BUS_IDLE_BUDGET_MS",
+    "BUS_BACKGROUND_MAX_WAIT_MS",
+    # UI stall detector
+    "STALL_DETECTOR_ENABLED",
+    "STALL_HEARTBEAT_MS",
+    "STALL_THRESHOLD_MS",
+    # Animation clock
+    "ANIMATION_QUANTUM_MS",
+    # Render quality governor
+    "RENDER_GOVERNOR_ENABLED",
+    "RENDER_FRAME_BUDGET_MS",
+    "RENDER_WINDOW_FRAMES",
+    "RENDER_HEADROOM_RATIO",
     # Trading
     "LIVE_ACCOUNT",
     "SYMBOL_BASE",
@@ -523,6 +523,9 @@ _THEME_MAP = {
     "sim": SIM_THEME,
 }
 
+# Name of the theme currently copied into THEME (see switch_theme)
+_ACTIVE_THEME_NAME = "live"
+
 THEME_SWITCH_DEBUG_ENABLED = (
     os.getenv("APPSIERRA_THEME_SWITCH_DEBUG")
     or os.getenv("APPSIERRA_THEME_DEBUG")
@@ -543,7 +546,7 @@ def switch_theme(theme_name: str) -> None:
         theme_name: One of "debug", "live", or "sim"
     """
     from utils.logger import get_logger
-    global THEME
+    global THEME, _ACTIVE_THEME_NAME
 
     log = get_logger(__name__)
 
@@ -554,6 +557,7 @@ def switch_theme(theme_name: str) -> None:
     log.debug(f"[THEME SWITCH] Starting switch_theme('{theme_name_original}') -> normalized: '{theme_name}'")
 
     new_theme = _THEME_MAP.get(theme_name, DEBUG_THEME)
+    _ACTIVE_THEME_NAME = theme_name if theme_name in _THEME_MAP else "debug"
 
     if theme_name not in _THEME_MAP:
         _theme_switch_print(f"[THEME SWITCH] WARNING: Unknown theme '{theme_name}', falling back to DEBUG_THEME")
@@ -630,6 +634,11 @@ def get_theme() -> dict:
     return THEME.copy()
 
 
+def get_active_theme_name() -> str:
+    """Get the active theme name ("debug", "live" or "sim")."""
+    return _ACTIVE_THEME_NAME
+
+
 def get_theme_meta() -> dict:
     """Get theme metadata (version, color space, etc.)."""
     return THEME_META.copy()
@@ -2,13 +2,30 @@ from __future__ import annotations
 
 # File: core/__init__.py
 # Package export surface for core
-# Re-export key classes/helpers for convenient imports
-from .app_manager import MainWindow
-from .data_bridge import DTCClientJSON
-from .persistence import (
-    append_cache,
-    append_jsonl,
-    ensure_cache_dir,
-    read_cache_between,
-    read_jsonl,
-)
+# Re-export key classes/helpers for convenient imports.
+# STARTUP: exports resolve lazily (PEP 562) so importing one core module does
+# not pull in the whole package (e.g. data_bridge -> pydantic/orjson/blinker).
+import importlib
+from typing import Any
+
+
+_EXPORTS = {
+    "MainWindow": ".app_manager",
+    "DTCClientJSON": ".data_bridge",
+    "append_cache": ".persistence",
+    "append_jsonl": ".persistence",
+    "ensure_cache_dir": ".persistence",
+    "read_cache_between": ".persistence",
+    "read_jsonl": ".persistence",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,316 @@
+"""
+core/animation_clock.py
+
+Shared application animation clock.
+
+Widgets used to run their own QTimers (equity pulse 40 ms, LIVE pill 60 ms,
+LIVE dot blink, MetricCell flashing, ConnectionIcon 1 s). Each timer woke the
+process separately and kept running while the widget was hidden.
+
+One AnimationClock drives all of them from a single QTimer:
+- a subscription asks for a rate (interval_ms, rounded to ANIMATION_QUANTUM_MS)
+- due times sit on the ANIMATION_QUANTUM_MS grid, and the single-shot clock
+  timer is armed for the earliest one; every subscription due then fires on
+  that wakeup (40 ms + 60 ms subscribers wake the process ~33x/s, not the
+  ~42x/s of two timers or the 50x/s of a fixed 20 ms tick)
+- a subscription bound to a widget (owner) is suspended while the owner is
+  hidden or its window is minimized, and is dropped when the owner is
+  destroyed
+- with no running subscription the timer stops (zero idle wakeups)
+
+Subscriptions mimic the QTimer API (start/stop/isActive), so a widget swaps
+its timer for a subscription without changing its logic.
+
+Usage:
+    from core.animation_clock import get_animation_clock
+
+    self._pulse = get_animation_clock().subscribe(self._tick_pulse, 60, owner=self)
+    self._pulse.start()
+    ...
+    self._pulse.stop()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import contextlib
+import math
+import threading
+import time
+from typing import Optional
+
+from PyQt6 import QtCore, QtWidgets
+
+from config.settings import ANIMATION_QUANTUM_MS
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+# Owner / window events that can change whether a subscription may tick
+_VISIBILITY_EVENTS = frozenset(
+    {
+        QtCore.QEvent.Type.Show,
+        QtCore.QEvent.Type.Hide,
+        QtCore.QEvent.Type.WindowStateChange,
+        QtCore.QEvent.Type.ParentChange,
+    }
+)
+
+
+def _owner_visible(owner: QtWidgets.QWidget) -> bool:
+    return owner.isVisible() and not owner.window().isMinimized()
+
+
+class ClockSubscription:
+    """
+    One subscriber of the AnimationClock (QTimer-like handle).
+
+    active: started by the owner (start/stop)
+    running: active and the owner is visible, so it actually ticks
+    """
+
+    def __init__(
+        self,
+        clock: AnimationClock,
+        callback: Callable[[], None],
+        interval_ms: int,
+        owner: Optional[QtWidgets.QWidget] = None,
+    ):
+        self._clock = clock
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.owner = owner
+        self.active = False
+        self.visible = owner is None or _owner_visible(owner)
+        self.next_due = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.active and self.visible
+
+    def start(self, interval_ms: Optional[int] = None) -> None:
+        if interval_ms is not None:
+            self.interval_ms = self._clock.quantize(interval_ms)
+        self.active = True
+        self.next_due = self._clock.align(self._clock.now_ms() + self.interval_ms)
+        self._clock._reschedule()
+
+    def stop(self) -> None:
+        if self.active:
+            self.active = False
+            self._clock._reschedule()
+
+    def isActive(self) -> bool:
+        return self.active
+
+    def setInterval(self, interval_ms: int) -> None:
+        self.interval_ms = self._clock.quantize(interval_ms)
+        if self.active:
+            self._clock._reschedule()
+
+    def cancel(self) -> None:
+        """Stop and detach from the clock permanently."""
+        self._clock.unsubscribe(self)
+
+
+class AnimationClock(QtCore.QObject):
+    """
+    Single-timer tick source for UI animations.
+
+    Thread Safety:
+    - GUI thread only (subscriptions, ticks and callbacks)
+    """
+
+    def __init__(self, quantum_ms: int = ANIMATION_QUANTUM_MS, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.quantum_ms = max(1, int(quantum_ms))
+        self._subs: list[ClockSubscription] = []
+        self._owner_subs: dict[int, list[ClockSubscription]] = {}  # id(owner) -> subscriptions
+        self._watched_windows: set[int] = set()
+        # destroyed() slots are kept alive here: PyQt only references them from
+        # the sender's wrapper, and a wrapper collected in a gc cycle clears the
+        # lambda's defaults before Qt emits destroyed()
+        self._destroyed_slots: dict[tuple[str, int], Callable[..., None]] = {}
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_tick)
+
+        self.ticks = 0  # timer wakeups (diagnostics)
+
+    # =========================================================================
+    # SUBSCRIPTIONS
+    # =========================================================================
+
+    def quantize(self, interval_ms: int) -> int:
+        return max(self.quantum_ms, int(round(interval_ms / self.quantum_ms)) * self.quantum_ms)
+
+    def align(self, t_ms: float) -> float:
+        """Round a due time up to the quantum grid (coinciding ticks share a wakeup)."""
+        return math.ceil(t_ms / self.quantum_ms) * self.quantum_ms
+
+    @staticmethod
+    def now_ms() -> float:
+        return time.monotonic() * 1000.0
+
+    def subscribe(
+        self,
+        callback: Callable[[], None],
+        interval_ms: int,
+        owner: Optional[QtWidgets.QWidget] = None,
+    ) -> ClockSubscription:
+        """
+        Register a tick callback (created stopped; call start()).
+
+        With an owner widget the subscription pauses while the owner is not
+        visible and is removed when the owner is destroyed.
+        """
+        sub = ClockSubscription(self, callback, self.quantize(interval_ms), owner)
+        self._subs.append(sub)
+        if owner is not None:
+            key = id(owner)
+            if key not in self._owner_subs:
+                self._owner_subs[key] = []
+                owner.installEventFilter(self)
+                drop = self._keep_slot(("owner", key), lambda _=None, key=key: self._drop_owner(key))
+                owner.destroyed.connect(drop)
+                self._watch_window(owner)
+            self._owner_subs[key].append(sub)
+        return sub
+
+    def unsubscribe(self, sub: ClockSubscription) -> None:
+        sub.active = False
+        if sub in self._subs:
+            self._subs.remove(sub)
+        if sub.owner is not None:
+            owned = self._owner_subs.get(id(sub.owner), [])
+            if sub in owned:
+                owned.remove(sub)
+        self._reschedule()
+
+    def _keep_slot(self, key: tuple[str, int], slot: Callable[..., None]) -> Callable[..., None]:
+        self._destroyed_slots[key] = slot
+        return slot
+
+    def _drop_owner(self, key: int) -> None:
+        self._destroyed_slots.pop(("owner", key), None)
+        for sub in self._owner_subs.pop(key, []):
+            sub.active = False
+            sub.owner = None
+            if sub in self._subs:
+                self._subs.remove(sub)
+        # Owners can outlive the clock's timer during interpreter/QApplication teardown
+        with contextlib.suppress(RuntimeError):
+            self._reschedule()
+
+    def _watch_window(self, owner: QtWidgets.QWidget) -> None:
+        """Minimizing changes the window, not the owner: watch the top-level too."""
+        window = owner.window()
+        if window is not owner and id(window) not in self._watched_windows:
+            self._watched_windows.add(id(window))
+            window.installEventFilter(self)
+            unwatch = self._keep_slot(("window", id(window)), lambda _=None, key=id(window): self._unwatch_window(key))
+            window.destroyed.connect(unwatch)
+
+    def _unwatch_window(self, key: int) -> None:
+        self._destroyed_slots.pop(("window", key), None)
+        self._watched_windows.discard(key)
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() in _VISIBILITY_EVENTS:
+            # Ancestors may have been re-parented since subscribe(): re-resolve the window
+            if event.type() in (QtCore.QEvent.Type.Show, QtCore.QEvent.Type.ParentChange) and id(obj) in self._owner_subs:
+                self._watch_window(obj)
+            self._refresh_visibility()
+        return super().eventFilter(obj, event)
+
+    def _refresh_visibility(self) -> None:
+        changed = False
+        now = self.now_ms()
+        for sub in self._subs:
+            if sub.owner is None:
+                continue
+            try:
+                visible = _owner_visible(sub.owner)
+            except RuntimeError:  # owner deleted on the C++ side
+                visible = False
+            if visible != sub.visible:
+                sub.visible = visible
+                changed = True
+                if visible:
+                    sub.next_due = self.align(now)  # resume on the next grid tick
+        if changed:
+            self._reschedule()
+
+    # =========================================================================
+    # TIMER
+    # =========================================================================
+
+    def running_subscriptions(self) -> list[ClockSubscription]:
+        return [sub for sub in self._subs if sub.running]
+
+    @property
+    def idle(self) -> bool:
+        """True while no subscription is running (timer stopped)."""
+        return not self._timer.isActive()
+
+    def _reschedule(self) -> None:
+        """Arm the single-shot timer for the earliest due running subscription."""
+        due = [sub.next_due for sub in self._subs if sub.running]
+        if not due:
+            self._timer.stop()
+            return
+        self._timer.start(max(0, math.ceil(min(due) - self.now_ms())))
+
+    def _on_tick(self) -> None:
+        self.ticks += 1
+        now = self.now_ms()
+        # Half a quantum of slack absorbs timer jitter
+        due_by = now + self.quantum_ms / 2.0
+        for sub in list(self._subs):
+            if not sub.running or sub.next_due > due_by:
+                continue
+            sub.next_due += sub.interval_ms
+            if sub.next_due <= now:  # fell behind (stall): skip missed ticks
+                sub.next_due = self.align(now + sub.interval_ms)
+            try:
+                sub.callback()
+            except Exception as e:
+                log.warning(f"[AnimationClock] Tick callback failed: {e}")
+        self._reschedule()
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_clock_instance: Optional[AnimationClock] = None
+_clock_lock = threading.Lock()
+
+
+def get_animation_clock() -> AnimationClock:
+    """Get the global AnimationClock singleton (GUI thread only)."""
+    global _clock_instance
+
+    if _clock_instance is None:
+        with _clock_lock:
+            if _clock_instance is None:
+                _clock_instance = AnimationClock()
+
+    return _clock_instance
+
+
+def reset_animation_clock() -> None:
+    """
+    Stop and drop the global clock.
+
+    WARNING: Only use in tests.
+    """
+    global _clock_instance
+
+    with _clock_lock:
+        if _clock_instance is not None:
+            _clock_instance._timer.stop()
+        _clock_instance = None
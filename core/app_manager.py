@@ -21,14 +21,16 @@ from __future__ import annotations
 import contextlib
 import os
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 
 from config.settings import DEBUG_DATA, DTC_HOST, DTC_PORT, LIVE_ACCOUNT, DEFAULT_THEME_MODE
 from config.theme import THEME, ColorTheme, set_theme  # noqa: F401  # theme tokens used by helpers
-from core.data_bridge import DTCClientJSON
+from core.startup_stages import get_startup_timeline
 # MIGRATION: MessageRouter removed - using SignalBus now
+# STARTUP: core.data_bridge (pydantic/orjson/blinker) is imported by the deferred DTC stage
 from panels.panel3 import Panel3
 from utils.logger import get_logger
+from utils.theme_compiler import get_theme_compiler, register_theme_rules
 
 from panels.panel1 import Panel1
 from panels.panel2 import Panel2
@@ -65,17 +67,26 @@ def _theme_debug_log(level: str, message: str, **kwargs) -> None:
     log_method(message, **kwargs)
 
 
+def _central_widget_rules(theme) -> str:
+    """Main background (compiled into the app stylesheet per theme mode)."""
+    return f"QWidget#CentralWidget {{ background: {theme['bg_primary']}; }}"
+
+
+register_theme_rules(_central_widget_rules)
+
+
 # -------------------- MainWindow (start)
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window tying together all three panels, theme logic, and DTC wiring."""
 
     themeChanged = QtCore.pyqtSignal(str)  # emits "DEBUG" | "SIM" | "LIVE"
 
-    @staticmethod
-    def _create_panel1():
-        """Create the (decomposed) Panel1."""
+    def _create_panel1(self):
+        """Create the (decomposed) Panel1; its chart is built by the first deferred stage."""
         log.info("[Startup] Using Panel1 (decomposed architecture)")
-        return Panel1()
+        panel = Panel1(defer_chart=True)
+        self.defer_startup_stage("equity_chart", panel.build_chart)
+        return panel
 
     @staticmethod
     def _create_panel2():
@@ -95,37 +106,189 @@ class MainWindow(QtWidgets.QMainWindow):
                 import traceback
                 traceback.print_exc()
 
-        # Initialize state and UI
-        self._setup_window()
-        self._setup_state_manager()
-        self._setup_trade_services()  # ARCHITECTURE (Step 7): Initialize trade lifecycle services
-        self._setup_theme()
-        self._build_ui()
-        self._recover_open_positions()  # CRITICAL: Restore positions from database after crash/restart
-        self._setup_theme_toolbar()
-        self._setup_mode_selector()
-        self._setup_reset_balance_hotkey()
+        # STARTUP: Only what the first paint needs runs here. The schema is
+        # created up front (panels query it while building); balance loads,
+        # position recovery, DTC connect and diagnostics run as deferred stages
+        # after the window is shown (see showEvent / core/startup_stages.py).
+        timeline = get_startup_timeline()
+        self._deferred_stages: list = []
+        self._deferred_started: bool = False
+
+        with timeline.stage("window_setup"):
+            self._setup_window()
+        with timeline.stage("database_schema"):
+            self._init_database_schema()
+        with timeline.stage("state_manager"):
+            self._setup_state_manager()
+            self._setup_trade_services()  # ARCHITECTURE (Step 7): Initialize trade lifecycle services
+        with timeline.stage("warm_start"):
+            self._load_warm_start()
+        with timeline.stage("theme"):
+            self._setup_theme()
+        with timeline.stage("panels"):
+            self._build_ui()
+        with timeline.stage("toolbars"):
+            self._setup_theme_toolbar()
+            self._setup_mode_selector()
+            self._setup_reset_balance_hotkey()
+
+        self.defer_startup_stage("database", self._load_persisted_state)
+        # CRITICAL: Restore positions from database after crash/restart (before DTC connects)
+        self.defer_startup_stage("position_recovery", self._recover_open_positions)
+        self.defer_startup_stage("dtc_connect", self._init_dtc)
+        self.defer_startup_stage("diagnostics", self._run_diagnostics_and_push)
 
         if os.getenv("DEBUG_DTC", "0") == "1":
             print("DEBUG: MainWindow.__init__ COMPLETE")
         with contextlib.suppress(Exception):
             log.info("[startup] MainWindow initialized")
 
+    # -------------------- Staged startup (start)
+    def defer_startup_stage(self, name: str, fn) -> None:
+        """Queue work to run after the first paint (in order, one per event-loop turn)."""
+        if self._deferred_started:
+            get_startup_timeline().run_deferred([(name, fn)])
+        else:
+            self._deferred_stages.append((name, fn))
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._deferred_started:
+            return
+        self._deferred_started = True
+        timeline = get_startup_timeline()
+        # Zero-timer callbacks run after the pending expose/paint events
+        QtCore.QTimer.singleShot(0, lambda: timeline.mark("first_paint"))
+        self._start_stall_detector()
+        timeline.run_deferred(self._deferred_stages)
+        self._deferred_stages = []
+
+    def _start_stall_detector(self) -> None:
+        """Watch the event loop from first paint on (deferred stages included)."""
+        with contextlib.suppress(Exception):
+            from config.settings import STALL_DETECTOR_ENABLED
+
+            if STALL_DETECTOR_ENABLED:
+                from core.stall_detector import get_stall_detector
+
+                get_stall_detector().start()
+
+    def _report_stalls(self) -> None:
+        """Stop the stall watchdog and record the session's stall summary."""
+        import sys
+
+        detector_module = sys.modules.get("core.stall_detector")
+        if detector_module is None:
+            return
+        detector = detector_module.get_stall_detector()
+        detector.stop()
+        summary = detector.summary()
+        log.info(
+            f"[Shutdown] UI stalls: {summary['stall_count']} "
+            f"(total {summary['total_stall_ms']:.0f} ms, max {summary['max_stall_ms']:.0f} ms)"
+        )
+        for site in summary["by_call_site"]:
+            log.info(f"[Shutdown]   {site['count']}x {site['total_ms']:.0f} ms  {site['call_site']}")
+        from core.diagnostics import info
+
+        info("perf", "UI stall summary", event_type="UIStallSummary", context=summary)
+
+    def _report_signal_costs(self) -> None:
+        """Log the SignalBus per-slot cost report (SIGNAL_PROFILING_ENABLED only)."""
+        from core.signal_bus import get_signal_bus
+
+        profiler = get_signal_bus().profiler
+        if profiler is None:
+            return
+        log.info(f"[Shutdown] SignalBus slot costs (by cumulative time):\n{profiler.format_report(limit=15)}")
+        from core.diagnostics import info
+
+        info("perf", "SignalBus slot cost summary", event_type="SignalSlotCostSummary", context=profiler.summary())
+
+    # -------------------- Staged startup (end)
+
+    # -------------------- Warm start (start)
+    def _load_warm_start(self) -> None:
+        """
+        Prime balances and Panel3 stats from the last warm-start snapshot.
+
+        The deferred DB stages reconcile everything primed here; Panel1's curve
+        is primed in _build_ui once its EquityStateManager exists.
+        """
+        self._warm_snapshot: dict = {}
+        try:
+            from services.stats_worker import get_stats_worker
+            from services.warm_start import SAVE_INTERVAL_MS, get_warm_start_cache
+
+            cache = get_warm_start_cache()
+            self._warm_snapshot = cache.load()
+            cache.prime(self._warm_snapshot, state=self._state, stats_worker=get_stats_worker())
+
+            self._warm_start_timer = QtCore.QTimer(self)
+            self._warm_start_timer.setInterval(SAVE_INTERVAL_MS)
+            self._warm_start_timer.timeout.connect(lambda: self._save_warm_start(blocking=False))
+            self._warm_start_timer.start()
+        except Exception as e:
+            log.warning(f"[Startup] Warm-start snapshot unavailable: {e}")
+
+    def _prime_warm_start_curves(self) -> None:
+        """Seed Panel1's equity curves from the snapshot (before the first set_trading_mode)."""
+        snapshot = getattr(self, "_warm_snapshot", None)
+        equity_state = getattr(self.panel_balance, "_equity_state", None)
+        if not snapshot or equity_state is None:
+            return
+        try:
+            from services.warm_start import get_warm_start_cache
+
+            get_warm_start_cache().prime(snapshot, equity_state=equity_state)
+        except Exception as e:
+            log.warning(f"[Startup] Failed to prime equity curves: {e}")
+        self._warm_snapshot = {}
+
+    def _save_warm_start(self, blocking: bool = True) -> None:
+        """Write the warm-start snapshot (periodic saves run on a background thread)."""
+        try:
+            from services.stats_worker import get_stats_worker
+            from services.warm_start import get_warm_start_cache
+
+            cache = get_warm_start_cache()
+            equity_state = getattr(getattr(self, "panel_balance", None), "_equity_state", None)
+            if blocking:
+                cache.save(cache.collect(self._state, equity_state, get_stats_worker()))
+            else:
+                cache.save_async(self._state, equity_state, get_stats_worker())
+        except Exception as e:
+            log.warning(f"[WarmStart] Failed to save snapshot: {e}")
+
+    # -------------------- Warm start (end)
+
     def _setup_window(self) -> None:
         """Configure window properties."""
         self.setWindowTitle("APPSIERRA")
         self.setMinimumSize(1100, 720)
 
-    def _setup_state_manager(self) -> None:
-        """Initialize state manager with error handling."""
+        # Status bar messages from services (e.g. historical fill ingestion progress)
+        with contextlib.suppress(Exception):
+            from core.signal_bus import get_signal_bus
+
+            get_signal_bus().statusMessagePosted.connect(
+                self.statusBar().showMessage,
+                QtCore.Qt.ConnectionType.QueuedConnection,
+            )
+
+    def _init_database_schema(self) -> None:
+        """Create DB tables and run migrations (cheap; must precede the panels)."""
         try:
-            # Initialize database tables first
             from data.db_engine import init_db
             init_db()
+        except Exception as e:
+            log.error(f"[Startup] Failed to initialize database schema: {e}")
 
+    def _setup_state_manager(self) -> None:
+        """Initialize state manager with error handling."""
+        try:
             from core.state_manager import StateManager
             from core.app_state import set_state_manager
-            from services.balance_service import load_sim_balance_from_trades
 
             self._state = StateManager()
 
@@ -156,15 +319,37 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtCore.Qt.ConnectionType.QueuedConnection,
             )
 
-            # ARCHITECTURE FIX (Balance Service):
-            # Load SIM balance from database via services layer (not from StateManager)
-            loaded_balance = load_sim_balance_from_trades(self._state)
         except Exception as e:
             error_msg = str(e).replace('\u2705', '[OK]').replace('\u2717', '[FAIL]').replace('[OK]', '[OK]').replace('[X]', '[FAIL]')
             import traceback
             traceback.print_exc()
             self._state = None
 
+    def _load_persisted_state(self) -> None:
+        """
+        Deferred startup stage: load balances from trades.
+
+        Runs after the first paint; Panel1 shows the StateManager default until
+        the loaded balance is relayed through balanceChanged.
+        """
+        if not self._state:
+            return
+        try:
+            # ARCHITECTURE FIX (Balance Service):
+            # Load SIM balance from database via services layer (not from StateManager)
+            from services.balance_service import load_sim_balance_from_trades
+            loaded_balance = load_sim_balance_from_trades(self._state)
+
+            # Low-priority DB cross-check of the SIM ledger (first pass after startup)
+            from services.unified_balance_manager import get_balance_manager
+            get_balance_manager().start_reconciliation()
+
+            with contextlib.suppress(Exception):
+                self._state.balanceChanged.emit(self._state.get_balance_for_mode(self._state.current_mode or "SIM"))
+            log.info(f"[Startup] Persisted state loaded (SIM balance ${loaded_balance:,.2f})")
+        except Exception as e:
+            log.error(f"[Startup] Failed to load persisted state: {e}")
+
     def _setup_trade_services(self) -> None:
         """
         Initialize trade lifecycle services.
@@ -266,13 +451,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.themeChanged.connect(self.on_theme_changed)
         # Suppress timeframe handling during startup init
         self._startup_done: bool = False
-        # Apply base theme BEFORE building widgets to avoid initial flicker
+        # Apply base theme BEFORE building widgets to avoid initial flicker.
+        # The compiled stylesheet covers every mode; switches only flip the
+        # themeMode property on this window.
         with contextlib.suppress(Exception):
-            from config.theme import switch_theme
-
-            switch_theme(self.current_theme_mode.lower())
+            compiler = get_theme_compiler()
+            compiler.apply(self.current_theme_mode)
             app = QtWidgets.QApplication.instance()
             if app is not None:
+                compiler.install(app)
+                compiler.attach(self)
                 app.setFont(
                     ColorTheme.qfont(
                         int(THEME.get("ui_font_weight", 500)),
@@ -285,8 +473,9 @@ class MainWindow(QtWidgets.QMainWindow):
         # Vertical stacking: Panel1 (balance/investing), Panel2 (live), Panel3 (stats)
         central = QtWidgets.QWidget(self)
         central.setObjectName("CentralWidget")
-        # Set main background color from theme
-        central.setStyleSheet(f"QWidget#CentralWidget {{ background: {THEME.get('bg_primary', '#000000')}; }}")
+        # Main background comes from the compiled theme stylesheet
+        if not get_theme_compiler().installed:
+            central.setStyleSheet(_central_widget_rules(THEME))
         self.setCentralWidget(central)
         outer = QtWidgets.QVBoxLayout(central)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -302,31 +491,9 @@ class MainWindow(QtWidgets.QMainWindow):
             print("DEBUG: Panel3 created")
             log.debug("[Startup] Panels created: Panel1/Panel2/Panel3")
 
-        # Start DTC and diagnostics immediately
-        if os.getenv("DEBUG_DTC", "0") == "1":
-            print("DEBUG: About to initialize DTC and run diagnostics...")
-        try:
-            if not getattr(self, "_dtc_started", False):
-                if os.getenv("DEBUG_DTC", "0") == "1":
-                    log.debug("[Startup] Direct DTC init + diagnostics (panel-init path)")
-                    print("DEBUG: Calling _init_dtc()...")
-                self._init_dtc()
-                if os.getenv("DEBUG_DTC", "0") == "1":
-                    print("DEBUG: Calling _run_diagnostics_and_push()...")
-                self._run_diagnostics_and_push()
-                if os.getenv("DEBUG_DTC", "0") == "1":
-                    print("DEBUG: DTC init and diagnostics completed")
-        except Exception as e:
-            log.exception(f"[Startup] Direct init after panel build failed: {e}")
-            if os.getenv("DEBUG_DTC", "0") == "1":
-                print(f"DEBUG: DTC init FAILED: {e}")
-                import traceback
-                traceback.print_exc()
-        finally:
-            # Enable timeframe signals after startup work completes
-            self._startup_done = True
-            if os.getenv("DEBUG_DTC", "0") == "1":
-                print("DEBUG: Startup done flag set to True")
+        # DTC connect and diagnostics run as deferred startup stages (after first paint)
+        # Enable timeframe signals now that the panels exist
+        self._startup_done = True
 
         # Initialize timeframe pill color to current PnL direction
         with contextlib.suppress(Exception):
@@ -341,6 +508,9 @@ class MainWindow(QtWidgets.QMainWindow):
             if os.getenv("DEBUG_DTC", "0") == "1":
                 log.debug(f"[Theme] Reapplied {self.current_theme_mode.upper()} after panel init")
 
+        # Seed cached equity curves so set_trading_mode() paints them immediately
+        self._prime_warm_start_curves()
+
         # Initialize Panel1 with the active mode/account scope using public APIs
         try:
             if self.panel_balance and self._state:
@@ -495,9 +665,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 tb.setMovable(False)
                 self.addToolBar(QtCore.Qt.ToolBarArea.TopToolBarArea, tb)
 
-                act_debug = QtWidgets.QAction("DEBUG", self)
-                act_sim = QtWidgets.QAction("SIM", self)
-                act_live = QtWidgets.QAction("LIVE", self)
+                act_debug = QtGui.QAction("DEBUG", self)
+                act_sim = QtGui.QAction("SIM", self)
+                act_live = QtGui.QAction("LIVE", self)
 
                 act_debug.triggered.connect(lambda: self._set_theme_mode("DEBUG"))
                 act_sim.triggered.connect(lambda: self._set_theme_mode("SIM"))
@@ -509,11 +679,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
                 # Optional: Optimize Archives action (manual trigger for SQLite VACUUM)
                 with contextlib.suppress(Exception):
-                    act_opt = QtWidgets.QAction("Optimize Archives", self)
+                    act_opt = QtGui.QAction("Optimize Archives", self)
                     act_opt.triggered.connect(self._optimize_archives_ui)
                     tb.addSeparator()
                     tb.addAction(act_opt)
 
+                # Dev controls (theme cycle, font size, Perf metrics overlay)
+                with contextlib.suppress(Exception):
+                    from widgets.dev_toolbar import DevToolbar
+
+                    tb.addSeparator()
+                    tb.addWidget(DevToolbar(self))
+
     def _setup_mode_selector(self) -> None:
         """Setup mode selector hotkey (Ctrl+Shift+M)."""
         try:
@@ -585,111 +762,56 @@ class MainWindow(QtWidgets.QMainWindow):
     def _set_theme_mode(self, mode: str) -> None:
         """
         Switch theme mode (called by toolbar buttons or hotkey).
-        Sets the theme, emits signal, and updates central widget background.
 
         Args:
             mode: One of "DEBUG", "SIM", or "LIVE"
         """
-        try:
-            _theme_debug_log("info", f"[THEME DEBUG] _set_theme_mode() called with mode='{mode}'")
-
-            if mode not in ("DEBUG", "SIM", "LIVE"):
-                _theme_debug_log("warning", f"[THEME DEBUG] Invalid mode: {mode}, skipping")
-                return
-
-            # Switch the THEME dictionary
-            from config.theme import switch_theme
-
-            _theme_debug_log("debug", f"[THEME DEBUG] Calling switch_theme('{mode.lower()}')")
-            switch_theme(mode.lower())
-            _theme_debug_log("debug", "[THEME DEBUG] switch_theme() returned successfully")
-
-            # Emit signal to trigger on_theme_changed
-            _theme_debug_log("debug", f"[THEME DEBUG] Emitting themeChanged signal with mode='{mode}'")
-            self.themeChanged.emit(mode)
-            _theme_debug_log("debug", "[THEME DEBUG] themeChanged signal emitted")
-
-            # Update central widget background
-            central = self.centralWidget()
-            bg_color = THEME.get('bg_primary', '#000000')
-            _theme_debug_log("debug", f"[THEME DEBUG] Central widget bg_primary color: {bg_color}")
-
-            if central:
-                stylesheet = f"QWidget#CentralWidget {{ background: {bg_color}; }}"
-                _theme_debug_log("debug", f"[THEME DEBUG] Setting central widget stylesheet: {stylesheet}")
-                central.setStyleSheet(stylesheet)
-                _theme_debug_log("debug", "[THEME DEBUG] Central widget stylesheet applied")
-            else:
-                _theme_debug_log("warning", "[THEME DEBUG] centralWidget() returned None")
-
-            _theme_debug_log("info", f"[THEME DEBUG] _set_theme_mode() completed successfully for mode='{mode}'")
-        except Exception as e:
-            _theme_debug_log("error", f"[THEME DEBUG] Error in _set_theme_mode: {e}", exc_info=True)
+        if mode not in ("DEBUG", "SIM", "LIVE"):
+            _theme_debug_log("warning", f"[THEME DEBUG] Invalid mode: {mode}, skipping")
+            return
+        # on_theme_changed does the switch (single path for toolbar and signal)
+        self.themeChanged.emit(mode)
 
     def on_theme_changed(self, mode: str) -> None:
         """
         Respond to theme mode changes ("DEBUG" / "SIM" / "LIVE").
-        Refreshes all panels and UI elements to match new theme.
+
+        The compiler updates THEME, flips the themeMode property on this
+        window and re-polishes the themed widgets once (no stylesheet is
+        rebuilt or re-parsed). Panels then get themeChangeRequested for the
+        state that is not stylesheet driven (painter colors, icons).
 
         Args:
             mode: One of "DEBUG", "SIM", or "LIVE"
         """
         try:
-            _theme_debug_log("info", f"[THEME DEBUG] on_theme_changed() called with mode='{mode}'")
-
             if mode not in ("DEBUG", "SIM", "LIVE"):
                 _theme_debug_log("warning", f"[THEME DEBUG] Invalid mode in on_theme_changed: {mode}")
                 return
 
             self.current_theme_mode = mode
-            _theme_debug_log("debug", f"[THEME DEBUG] Set current_theme_mode to: {self.current_theme_mode}")
-
-            # CRITICAL FIX: Switch the THEME dictionary to match the mode
-            from config.theme import switch_theme
-            _theme_debug_log("debug", f"[THEME DEBUG] Calling switch_theme('{mode.lower()}') in on_theme_changed")
-            switch_theme(mode.lower())
-            _theme_debug_log("debug", "[THEME DEBUG] switch_theme() completed in on_theme_changed")
+            compiler = get_theme_compiler()
+            compiler.apply(mode)
 
             # Refresh connection icon
-            _theme_debug_log("debug", "[THEME DEBUG] Looking for connection icon in panel_balance")
             icon = getattr(self.panel_balance, "conn_icon", None)
-            if icon:
-                _theme_debug_log("debug", f"[THEME DEBUG] Found conn_icon: {icon}")
-                if hasattr(icon, "refresh_theme"):
-                    _theme_debug_log("debug", "[THEME DEBUG] Calling icon.refresh_theme()")
-                    icon.refresh_theme()
-                    _theme_debug_log("debug", "[THEME DEBUG] icon.refresh_theme() completed")
-                else:
-                    _theme_debug_log("warning", "[THEME DEBUG] conn_icon does not have refresh_theme method")
-            else:
-                _theme_debug_log("debug", "[THEME DEBUG] No conn_icon found in panel_balance")
+            if icon is not None and hasattr(icon, "refresh_theme"):
+                icon.refresh_theme()
 
             # PHASE 4: Refresh all panels via SignalBus (replaces direct calls)
-            _theme_debug_log("debug", "[THEME DEBUG] Attempting to emit themeChangeRequested signal on SignalBus")
             try:
                 from core.signal_bus import get_signal_bus
-                signal_bus = get_signal_bus()
-                _theme_debug_log("debug", f"[THEME DEBUG] Got signal_bus instance: {signal_bus}")
-                _theme_debug_log("debug", "[THEME DEBUG] Emitting themeChangeRequested signal")
-                signal_bus.themeChangeRequested.emit()
-                _theme_debug_log("debug", "[THEME DEBUG] themeChangeRequested signal emitted successfully")
+
+                get_signal_bus().themeChangeRequested.emit()
             except Exception as e:
                 _theme_debug_log("error", f"[THEME DEBUG] Failed to emit theme change signal: {e}", exc_info=True)
 
-            # Update central widget background
-            _theme_debug_log("debug", "[THEME DEBUG] Updating central widget background")
-            central = self.centralWidget()
-            if central:
-                bg_color = THEME.get('bg_primary', '#000000')
-                _theme_debug_log("debug", f"[THEME DEBUG] Central widget bg_primary: {bg_color}")
-                stylesheet = f"QWidget#CentralWidget {{ background: {bg_color}; }}"
-                _theme_debug_log("debug", f"[THEME DEBUG] Setting central widget stylesheet: {stylesheet}")
-                central.setStyleSheet(stylesheet)
-                _theme_debug_log("debug", "[THEME DEBUG] Central widget stylesheet applied")
-            else:
-                _theme_debug_log("warning", "[THEME DEBUG] centralWidget() returned None")
+            if not compiler.installed:
+                central = self.centralWidget()
+                if central:
+                    central.setStyleSheet(_central_widget_rules(THEME))
 
-            _theme_debug_log("info", f"[THEME DEBUG] on_theme_changed() completed for mode='{mode}'")
+            _theme_debug_log("info", f"[THEME DEBUG] Switched to '{mode}' in {compiler.last_switch_ms:.2f} ms")
         except Exception as e:
             _theme_debug_log("error", f"[THEME DEBUG] Error in on_theme_changed: {e}", exc_info=True)
 
@@ -837,6 +959,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
             # MIGRATION: MessageRouter removed - panels now subscribe to SignalBus directly
             # All DTC events are emitted via SignalBus Qt signals for thread-safe delivery
+            from core.data_bridge import DTCClientJSON
+
             self._dtc = DTCClientJSON(host=host, port=port)
 
             if os.getenv("DEBUG_DTC", "0") == "1":
@@ -886,6 +1010,14 @@ class MainWindow(QtWidgets.QMainWindow):
             # to prevent double-firing the same event
             if hasattr(c, "messageReceived"):
                 c.messageReceived.connect(self._on_dtc_message)
+
+            # Heartbeats (with the request-to-first-response latency) come from the client
+            from core.signal_bus import get_signal_bus
+
+            get_signal_bus().dtcHeartbeat.connect(
+                self._on_dtc_heartbeat,
+                QtCore.Qt.ConnectionType.QueuedConnection,
+            )
         except Exception:
             pass
 
@@ -899,6 +1031,13 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+        # Periodic hot-path metrics dump (METRICS_ENABLED / DEBUG_PERF)
+        with contextlib.suppress(Exception):
+            from core import metrics
+
+            if metrics.is_enabled():
+                metrics.get_metrics_registry().start_dumping()
+
     # -------------------- DTC signal bridges --------------------
     def _on_dtc_connected(self) -> None:
         """Called when DTC connection is established (updates outer ring)."""
@@ -920,13 +1059,16 @@ class MainWindow(QtWidgets.QMainWindow):
         # No explicit action needed - the connection dot will automatically
         # transition to yellow/red based on heartbeat timeout
 
+    def _on_dtc_heartbeat(self, latency_ms: float) -> None:
+        """Called for every DTC heartbeat (updates outer ring + latency)."""
+        icon = getattr(self.panel_balance, "conn_icon", None)
+        if icon and hasattr(icon, "mark_heartbeat"):
+            icon.mark_heartbeat(latency_ms)
+
     def _on_dtc_message(self, msg: dict) -> None:
-        """Called when any DTC message is received (updates both rings)."""
+        """Called when any DTC message is received (updates inner core)."""
         icon = getattr(self.panel_balance, "conn_icon", None)
         if icon:
-            # Check if this is a heartbeat message (Type 3)
-            if msg.get("Type") == 3 and hasattr(icon, "mark_heartbeat"):
-                icon.mark_heartbeat()
             # All messages count as data activity
             if hasattr(icon, "mark_data_activity"):
                 icon.mark_data_activity()
@@ -948,6 +1090,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
         shutdown_errors = []
 
+        # Shutdown blocks the GUI thread by design: stop the stall watchdog first
+        with contextlib.suppress(Exception):
+            self._report_stalls()
+        with contextlib.suppress(Exception):
+            self._report_signal_costs()
+
         # Step 1: Save panel states (Panel2 position state, Panel3 settings, etc.)
         try:
             print("[1/6] Saving panel states...")
@@ -1040,11 +1188,22 @@ class MainWindow(QtWidgets.QMainWindow):
         try:
             print("[5/6] Closing database connections...")
 
-            from data.db_engine import engine
+            # Snapshot balances/curves/stats for the next launch, then stop
+            # background stats/ledger queries before the pool goes away
+            with contextlib.suppress(Exception):
+                self._warm_start_timer.stop()
+            self._save_warm_start(blocking=True)
+            with contextlib.suppress(Exception):
+                from services.stats_worker import get_stats_worker
+                get_stats_worker().shutdown()
+            with contextlib.suppress(Exception):
+                from services.unified_balance_manager import get_balance_manager
+                get_balance_manager().stop_reconciliation()
+
+            from data.db_engine import dispose_engine
 
-            if engine:
-                # Dispose of connection pool
-                engine.dispose()
+            # Dispose of connection pool (engine is created lazily; may not exist)
+            if dispose_engine():
                 print("   Database connection pool disposed")
                 log.info("[Shutdown] Database connections closed")
             else:
@@ -1057,6 +1216,11 @@ class MainWindow(QtWidgets.QMainWindow):
             log.error(f"[Shutdown] {error_msg}")
 
         # Step 6: Final summary
+        with contextlib.suppress(Exception):
+            from core import metrics
+
+            metrics.get_metrics_registry().stop_dumping()
+
         try:
             print("[6/6] Shutdown complete")
 
@@ -0,0 +1,339 @@
+"""
+core/bus_lanes.py
+
+Priority lanes for SignalBus delivery.
+
+Every SignalBus signal belongs to one lane (SIGNAL_LANES):
+
+    critical    orders, positions, fills, connection and mode state.
+                Not wrapped at all: emit() delivers immediately, as before.
+    normal      balances and display requests. Emits are queued and delivered
+                together once per frame (BUS_FRAME_MS); coalescing signals
+                keep only the latest arguments per key (e.g. per account).
+    background  analytics work (trade-closed analytics, metrics reloads,
+                snapshot analysis). Delivered from a zero-timeout timer, i.e.
+                only once the Qt event queue is drained, in slices of at most
+                BUS_IDLE_BUDGET_MS, and only while the normal lane is empty -
+                unless the oldest item has waited BUS_BACKGROUND_MAX_WAIT_MS,
+                then one slice runs anyway (sustained balance traffic cannot
+                starve analytics).
+
+A slow Panel3 stats reload can therefore no longer sit in front of an order
+update in the FIFO event queue: it runs in idle time, after it.
+
+Per lane the scheduler tracks queue depth (current/max), enqueued,
+delivered and coalesced counts, and enqueue-to-delivery wait time
+(lane_stats()). With core/metrics enabled the same data is recorded as
+"bus.lane.<lane>.depth" gauges and "bus.lane.<lane>.wait" histograms.
+
+Emits from worker threads are queued the same way and delivered on the
+scheduler's (GUI) thread. BUS_LANES_ENABLED=0 restores immediate delivery
+for every signal.
+
+Usage:
+    bus = get_signal_bus()            # lanes installed (BUS_LANES_ENABLED)
+    bus.balanceUpdated.emit(1.0, "Sim1")   # delivered on the next frame
+    bus.lanes.lane_stats()["normal"]["wait_p99_ms"]
+    bus.lanes.drain()                 # deliver everything now (tests, shutdown)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import itertools
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from PyQt6 import QtCore
+
+from config.settings import BUS_BACKGROUND_MAX_WAIT_MS, BUS_FRAME_MS, BUS_IDLE_BUDGET_MS
+from core import metrics
+from core.metrics import LatencyHistogram
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+CRITICAL = "critical"
+NORMAL = "normal"
+BACKGROUND = "background"
+LANES = (CRITICAL, NORMAL, BACKGROUND)
+
+#: Normal-lane delivery rounds per frame (slots that emit into the lane again)
+MAX_FLUSH_ROUNDS = 3
+
+
+def _latest(args: tuple) -> Hashable:
+    """Coalesce key: one pending emit per signal (latest wins)."""
+    return ()
+
+
+def _by_arg(index: int) -> Callable[[tuple], Hashable]:
+    """Coalesce key: one pending emit per value of args[index] (latest wins)."""
+    return lambda args: args[index] if len(args) > index else None
+
+
+def _by_scope(args: tuple) -> Hashable:
+    payload = args[0] if args and isinstance(args[0], dict) else {}
+    return payload.get("mode"), payload.get("account"), payload.get("timeframe")
+
+
+@dataclass(frozen=True)
+class LaneRoute:
+    lane: str
+    #: Coalesce key from the emit args; None = deliver every emit, in order
+    coalesce: Optional[Callable[[tuple], Hashable]] = None
+
+
+#: SignalBus signal -> lane. Signals not listed are critical.
+SIGNAL_LANES: dict[str, LaneRoute] = {
+    # Normal: balances and display, once per frame
+    "balanceUpdated": LaneRoute(NORMAL, _by_arg(1)),  # per account
+    "balanceDisplayRequested": LaneRoute(NORMAL, _by_arg(1)),  # per mode
+    "equityPointRequested": LaneRoute(NORMAL),  # every point is kept
+    "statsPrecomputed": LaneRoute(NORMAL, _by_scope),
+    "uiRefreshRequested": LaneRoute(NORMAL, _latest),
+    "statusMessagePosted": LaneRoute(NORMAL, _latest),
+    "errorMessagePosted": LaneRoute(NORMAL),
+    "themeChangeRequested": LaneRoute(NORMAL, _latest),
+    "liveDotVisibilityRequested": LaneRoute(NORMAL, _latest),
+    "liveDotPulsingRequested": LaneRoute(NORMAL, _latest),
+    "vwapUpdated": LaneRoute(NORMAL, _by_arg(0)),  # per symbol
+    # Background: analytics, idle time only
+    "tradeClosedForAnalytics": LaneRoute(BACKGROUND),
+    "metricsReloadRequested": LaneRoute(BACKGROUND, _by_arg(0)),  # per timeframe
+    "snapshotAnalysisRequested": LaneRoute(BACKGROUND, _latest),
+}
+
+
+def lane_of(signal: str) -> str:
+    route = SIGNAL_LANES.get(signal)
+    return route.lane if route is not None else CRITICAL
+
+
+# =============================================================================
+# LANE STATE
+# =============================================================================
+
+
+class _Lane:
+    __slots__ = ("name", "pending", "seq", "enqueued", "delivered", "coalesced", "max_depth", "wait")
+
+    def __init__(self, name: str):
+        self.name = name
+        #: key -> [inner signal, args, enqueue time]; dict order = delivery order
+        self.pending: dict[Hashable, list[Any]] = {}
+        self.seq = itertools.count()
+        self.enqueued = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.wait = LatencyHistogram()
+
+
+class LanedSignal:
+    """
+    Stand-in for a normal/background SignalBus signal: emit() queues into
+    the lane; connect/disconnect and everything else go to the wrapped
+    signal (a pyqtBoundSignal or ProfiledSignal).
+    """
+
+    def __init__(self, name: str, inner: Any, route: LaneRoute, scheduler: BusLaneScheduler):
+        self._name = name
+        self._inner = inner
+        self._route = route
+        self._scheduler = scheduler
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._inner, attr)
+
+    def __call__(self, *args: Any) -> None:
+        self.emit(*args)
+
+    def emit(self, *args: Any) -> None:
+        self._scheduler.post(self._name, self._inner, self._route, args)
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+
+class BusLaneScheduler(QtCore.QObject):
+    """
+    Queues normal/background emits and delivers them by priority.
+
+    Thread Safety:
+    - post() may be called from any thread (one lock guards the queues)
+    - Delivery always runs on the scheduler's thread (the GUI thread)
+    """
+
+    #: Cross-thread wake-up: arms the lane timer on the scheduler's thread
+    _wakeRequested = QtCore.pyqtSignal(str)
+
+    def __init__(
+        self,
+        frame_ms: int = BUS_FRAME_MS,
+        idle_budget_ms: float = BUS_IDLE_BUDGET_MS,
+        background_max_wait_ms: float = BUS_BACKGROUND_MAX_WAIT_MS,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self.frame_ms = max(1, int(frame_ms))
+        self.idle_budget_ms = max(0.1, float(idle_budget_ms))
+        self.background_max_wait_ms = max(float(self.frame_ms), float(background_max_wait_ms))
+
+        self._lock = threading.Lock()
+        self._lanes = {NORMAL: _Lane(NORMAL), BACKGROUND: _Lane(BACKGROUND)}
+
+        self._frame_timer = QtCore.QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(self.frame_ms)
+        self._frame_timer.timeout.connect(self._flush_normal)
+
+        # Zero-timeout timer: fires once the event queue has been processed
+        self._idle_timer = QtCore.QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(0)
+        self._idle_timer.timeout.connect(self._run_background)
+
+        self._wakeRequested.connect(self._arm)
+
+    # =========================================================================
+    # INSTALL
+    # =========================================================================
+
+    def install(self, bus: QtCore.QObject) -> None:
+        """Shadow the bus's normal/background signals with LanedSignals."""
+        for name, route in SIGNAL_LANES.items():
+            current = getattr(bus, name, None)
+            if current is None or isinstance(current, LanedSignal):
+                continue
+            setattr(bus, name, LanedSignal(name, current, route, self))
+
+    # =========================================================================
+    # QUEUEING
+    # =========================================================================
+
+    def post(self, name: str, inner: Any, route: LaneRoute, args: tuple) -> None:
+        lane = self._lanes[route.lane]
+        key = (name, route.coalesce(args)) if route.coalesce is not None else next(lane.seq)
+        with self._lock:
+            lane.enqueued += 1
+            entry = lane.pending.get(key)
+            if entry is not None:
+                entry[1] = args  # latest wins; waits since the first emit
+                lane.coalesced += 1
+            else:
+                lane.pending[key] = [inner, args, time.perf_counter()]
+            depth = len(lane.pending)
+            lane.max_depth = max(lane.max_depth, depth)
+        metrics.gauge(f"bus.lane.{lane.name}.depth", depth)
+
+        if QtCore.QThread.currentThread() is self.thread():
+            self._arm(lane.name)
+        else:
+            self._wakeRequested.emit(lane.name)
+
+    def _arm(self, lane: str) -> None:
+        if lane == NORMAL:
+            if not self._frame_timer.isActive():
+                self._frame_timer.start()
+        elif not self._idle_timer.isActive() and (not self._lanes[NORMAL].pending or self._background_overdue()):
+            self._idle_timer.start()
+
+    def _background_overdue(self) -> bool:
+        """True once the oldest background item has waited background_max_wait_ms."""
+        with self._lock:
+            pending = self._lanes[BACKGROUND].pending
+            if not pending:
+                return False
+            oldest = next(iter(pending.values()))[2]  # dict order = enqueue order
+        return (time.perf_counter() - oldest) * 1000.0 >= self.background_max_wait_ms
+
+    # =========================================================================
+    # DELIVERY
+    # =========================================================================
+
+    def _take(self, lane: _Lane, limit: Optional[int] = None) -> list[list[Any]]:
+        with self._lock:
+            if limit is None or limit >= len(lane.pending):
+                entries = list(lane.pending.values())
+                lane.pending.clear()
+            else:
+                keys = list(itertools.islice(lane.pending, limit))
+                entries = [lane.pending.pop(key) for key in keys]
+            depth = len(lane.pending)
+        metrics.gauge(f"bus.lane.{lane.name}.depth", depth)
+        return entries
+
+    def _deliver(self, lane: _Lane, entry: list[Any]) -> None:
+        inner, args, enqueued_at = entry
+        wait_ms = (time.perf_counter() - enqueued_at) * 1000.0
+        with self._lock:
+            lane.delivered += 1
+            lane.wait.record_ms(wait_ms)
+        metrics.observe(f"bus.lane.{lane.name}.wait", enqueued_at)
+        try:
+            inner.emit(*args)
+        except Exception as e:
+            log.warning(f"[BusLanes] {lane.name} delivery failed: {e}")
+
+    def _flush_normal(self) -> None:
+        lane = self._lanes[NORMAL]
+        for _ in range(MAX_FLUSH_ROUNDS):
+            entries = self._take(lane)
+            if not entries:
+                break
+            for entry in entries:
+                self._deliver(lane, entry)
+        if lane.pending:
+            self._frame_timer.start()
+        if self._lanes[BACKGROUND].pending:
+            self._arm(BACKGROUND)  # idle normal lane, or background overdue
+
+    def _run_background(self) -> None:
+        if self._lanes[NORMAL].pending and not self._background_overdue():
+            return  # re-armed by the next frame flush
+        lane = self._lanes[BACKGROUND]
+        deadline = time.perf_counter() + self.idle_budget_ms / 1000.0
+        while lane.pending and time.perf_counter() < deadline:
+            for entry in self._take(lane, limit=1):
+                self._deliver(lane, entry)
+        if lane.pending:
+            self._arm(BACKGROUND)
+
+    def drain(self) -> None:
+        """Deliver everything pending now, normal lane first (tests, shutdown)."""
+        self._frame_timer.stop()
+        self._idle_timer.stop()
+        for name in (NORMAL, BACKGROUND):
+            lane = self._lanes[name]
+            for _ in range(MAX_FLUSH_ROUNDS):
+                entries = self._take(lane)
+                if not entries:
+                    break
+                for entry in entries:
+                    self._deliver(lane, entry)
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
+    def lane_stats(self) -> dict[str, dict[str, Any]]:
+        """Per lane: depth, max_depth, enqueued, delivered, coalesced, wait p50/p99/max (ms)."""
+        with self._lock:
+            return {
+                name: {
+                    "depth": len(lane.pending),
+                    "max_depth": lane.max_depth,
+                    "enqueued": lane.enqueued,
+                    "delivered": lane.delivered,
+                    "coalesced": lane.coalesced,
+                    "wait_p50_ms": lane.wait.percentile_us(50.0) / 1000.0,
+                    "wait_p99_ms": lane.wait.percentile_us(99.0) / 1000.0,
+                    "wait_max_ms": lane.wait.max_us / 1000.0,
+                }
+                for name, lane in self._lanes.items()
+            }
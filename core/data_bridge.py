@@ -26,12 +26,13 @@ Thread Safety:
 from __future__ import annotations
 
 import contextlib
+import os
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Union
 
 from blinker import Signal
 import orjson
-from pydantic import BaseModel, Field
 from PyQt6 import QtCore, QtNetwork
 import structlog
 
@@ -52,7 +53,12 @@ from services.dtc_protocol import (
     is_logon_success,
     parse_messages,
 )
-from utils.request_timeout import RequestTimeoutManager
+from config.feature_flags import use_typed_events
+from core import metrics
+from core.wire_capture import WireRecorder, replay_capture
+from domain.events import BalanceUpdateEvent, OrderUpdateEvent, PositionUpdateEvent, TradeAccountEvent
+from services.fill_ingestion import HistoricalFillIngestor
+from utils.request_correlator import PendingRequest, RequestCorrelator
 
 
 # -------------------- Imports (end)
@@ -74,99 +80,15 @@ signal_order = Signal("order")
 from core.signal_bus import get_signal_bus
 
 
-# -------------------- AppMessage model (start)
-class AppMessage(BaseModel):
-    """App-internal normalized envelope routed to MessageRouter and Qt signal."""
-
-    type: str = Field(..., description="TRADE_ACCOUNT | BALANCE_UPDATE | POSITION_UPDATE | ORDER_UPDATE")
-    payload: dict = Field(default_factory=dict)
-
-
-# -------------------- AppMessage model (end)
-
 # -------------------- DTC helper normalizers (start)
 # Note: _type_to_name moved to services/dtc_constants.py::type_to_name()
+# Field coercion lives in the typed events (domain/events.py::*.from_dtc)
 
+#: Typed events produced by the normalizer (one per routed DTC message)
+AppEvent = Union[TradeAccountEvent, BalanceUpdateEvent, PositionUpdateEvent, OrderUpdateEvent]
 
-def _normalize_trade_account(msg: dict) -> dict:
-    for k in ("TradeAccount", "Account", "account"):
-        v = msg.get(k)
-        if isinstance(v, str) and v.strip():
-            return {"account": v.strip()}
-    return {}
-
-
-def _pick_balance(msg: dict) -> Optional[float]:
-    for k in ("BalanceAvailableForNewPositions", "AccountValue", "NetLiquidatingValue", "CashBalance"):
-        v = msg.get(k)
-        try:
-            if v is not None:
-                return float(v)
-        except Exception:
-            continue
-    return None
 
-
-def _normalize_balance(msg: dict) -> dict:
-    bal = _pick_balance(msg)
-    out = {"balance": bal} if bal is not None else {}
-    for k in ("TradeAccount", "AccountValue", "NetLiquidatingValue", "CashBalance", "AvailableFunds"):
-        if k in msg and msg[k] is not None:
-            out[k] = msg[k]
-    return out
-
-
-def _normalize_position(msg: dict) -> dict:
-    sym = msg.get("Symbol") or msg.get("symbol")
-    qty = msg.get("PositionQuantity", msg.get("Quantity", msg.get("qty", 0)))
-    avg = msg.get("AveragePrice", msg.get("avg_entry"))
-    out = {
-        "symbol": sym,
-        "qty": int(qty) if isinstance(qty, (int, float)) else 0,
-        "avg_entry": float(avg) if isinstance(avg, (int, float, str)) and str(avg) not in ("", "None") else None,
-    }
-    # Include trade account if present to allow mode switching
-    if "TradeAccount" in msg and msg["TradeAccount"] is not None:
-        out["TradeAccount"] = msg["TradeAccount"]
-    # Optional timestamp
-    if "DateTime" in msg and msg["DateTime"] is not None:
-        out["DateTime"] = msg["DateTime"]
-    for k in ("OpenProfitLoss", "UnrealizedProfitLoss", "ClosedProfitLoss"):
-        if k in msg and msg[k] is not None:
-            out[k] = msg[k]
-    return out
-
-
-def _normalize_order(msg: dict) -> dict:
-    keep: dict[str, Any] = {}
-    fields = (
-        "Symbol",
-        "BuySell",
-        "OrderStatus",
-        "Price1",
-        "Price2",
-        "FilledQuantity",
-        "Quantity",
-        "AverageFillPrice",
-        "LastFillPrice",
-        "ServerOrderID",
-        "ClientOrderID",
-        "TimeInForce",
-        "Text",
-        "UpdateReason",
-        "OrderType",
-        "DateTime",
-    )
-    for k in fields:
-        if k in msg and msg[k] is not None:
-            keep[k] = msg[k]
-    # Include trade account if present to allow mode switching
-    if "TradeAccount" in msg and msg["TradeAccount"] is not None:
-        keep["TradeAccount"] = msg["TradeAccount"]
-    return keep
-
-
-def _dtc_to_app_event(dtc: dict) -> Optional[AppMessage]:
+def _dtc_to_app_event(dtc: dict) -> Optional[AppEvent]:
     msg_type = dtc.get("Type")
     name = type_to_name(msg_type)
 
@@ -176,20 +98,20 @@ def _dtc_to_app_event(dtc: dict) -> Optional[AppMessage]:
 
     # Route account-related messages
     if name in ("TradeAccountResponse", "TradeAccountsResponse"):
-        return AppMessage(type="TRADE_ACCOUNT", payload=_normalize_trade_account(dtc))
+        return TradeAccountEvent.from_dtc(dtc)
 
     # Route balance updates (Types 600, 602)
     if name in ("AccountBalanceUpdate", "AccountBalanceResponse"):
         log.debug(f"[DTC] Routing balance message Type={msg_type}, name={name}, payload preview: {str(dtc)[:150]}")
-        return AppMessage(type="BALANCE_UPDATE", payload=_normalize_balance(dtc))
+        return BalanceUpdateEvent.from_dtc(dtc)
 
     # Route position updates (Type 306)
     if name == "PositionUpdate":
-        return AppMessage(type="POSITION_UPDATE", payload=_normalize_position(dtc))
+        return PositionUpdateEvent.from_dtc(dtc)
 
     # Route order/fill updates (Types 301, 304, 307)
     if name in ("OrderUpdate", "OrderFillResponse", "HistoricalOrderFillResponse"):
-        return AppMessage(type="ORDER_UPDATE", payload=_normalize_order(dtc))
+        return OrderUpdateEvent.from_dtc(dtc)
 
     # DEBUG: Log unhandled message types (helps identify missing handlers)
     with contextlib.suppress(Exception):
@@ -201,6 +123,10 @@ def _dtc_to_app_event(dtc: dict) -> Optional[AppMessage]:
 # -------------------- DTC helper normalizers (end)
 
 
+# Read once: checked on every heartbeat
+_DEBUG_DTC = os.getenv("DEBUG_DTC", "0") == "1"
+
+
 # -------------------- DTC Client (start)
 class DTCClientJSON(QtCore.QObject):
     # Public Qt signals
@@ -211,6 +137,8 @@ class DTCClientJSON(QtCore.QObject):
     errorOccurred = QtCore.pyqtSignal(str)
     session_ready = QtCore.pyqtSignal()  # fires when fully connected (post-logon)
 
+    _HEARTBEAT_FRAME = orjson.dumps(build_heartbeat()) + b"\x00"
+
     # -------------------- __init__ (start)
     def __init__(self, host="127.0.0.1", port=11099, _sim_mode: bool = False):
         """
@@ -233,10 +161,13 @@ class DTCClientJSON(QtCore.QObject):
         self._sock.disconnected.connect(self._on_disconnected)
         self._sock.errorOccurred.connect(self._on_error)
 
+        # Bus payloads: typed events (default) or raw DTC dicts (rollback)
+        self._typed_events = use_typed_events()
+
         # Buffers and timers
         self._buf = bytearray()
-        self._heartbeat_timer: Optional[QtCore.QTimer] = None
-        self._watchdog_timer: Optional[QtCore.QTimer] = None
+        self._keepalive_timer: Optional[QtCore.QTimer] = None
+        self._last_rx_ns = self._last_tx_ns = time.monotonic_ns()
         self._reconnect_timer: Optional[QtCore.QTimer] = None
         self._reconnect_attempts: int = 0
 
@@ -251,24 +182,38 @@ class DTCClientJSON(QtCore.QObject):
         # Debug throttle state (ms since monotonic epoch)
         self._debug_dump_next_allowed: float = 0.0
 
-        # Request timeout tracking
-        self._timeout_manager = RequestTimeoutManager(default_timeout=15.0)
+        # Request/response correlation + timeout tracking
+        self._requests = RequestCorrelator(default_timeout=15.0)
         self._timeout_check_timer: Optional[QtCore.QTimer] = None
         self._init_timeout_checker()
 
+        # Bulk ingestion of the startup historical-fill response (RequestID 4)
+        self._fill_ingestor = HistoricalFillIngestor(parent=self)
+
+        # Optional wire capture of inbound frames (DTC_CAPTURE_PATH)
+        self._recorder: Optional[WireRecorder] = None
+        self._capture_args: Optional[tuple[str, bool, dict]] = None  # resumed by connect()
+        try:
+            from config.settings import DTC_CAPTURE_COMPRESS, DTC_CAPTURE_PATH
+        except Exception:
+            DTC_CAPTURE_PATH = None
+            DTC_CAPTURE_COMPRESS = True
+        if DTC_CAPTURE_PATH and not _sim_mode:
+            self.start_capture(DTC_CAPTURE_PATH, compress=DTC_CAPTURE_COMPRESS)
+
     # -------------------- __init__ (end)
 
     # -------------------- Timeout Management (start)
     def _init_timeout_checker(self) -> None:
-        """Initialize periodic timeout checking (every 5 seconds)"""
+        """Initialize the timer wheel tick (runs only while requests are pending)"""
         self._timeout_check_timer = QtCore.QTimer(self)
         self._timeout_check_timer.timeout.connect(self._check_request_timeouts)
-        self._timeout_check_timer.setInterval(5000)  # Check every 5 seconds
+        self._timeout_check_timer.setInterval(250)  # Timer wheel tick
 
     def _check_request_timeouts(self) -> None:
-        """Periodic check for timed out DTC requests"""
+        """Advance the timer wheel and report expired DTC requests"""
         try:
-            timed_out = self._timeout_manager.check_timeouts()
+            timed_out = self._requests.advance()
 
             for req in timed_out:
                 log.warning(
@@ -287,14 +232,18 @@ class DTCClientJSON(QtCore.QObject):
         except Exception as e:
             log.error("timeout_check_failed", error=str(e))
 
+        # Nothing left to expire: stop ticking until the next request
+        if self._requests.get_pending_count() == 0:
+            self._stop_timeout_checker()
+
     def _start_timeout_checker(self) -> None:
-        """Start the timeout checking timer"""
+        """Start the timer wheel tick"""
         if self._timeout_check_timer and not self._timeout_check_timer.isActive():
             self._timeout_check_timer.start()
             log.debug("timeout_checker_started")
 
     def _stop_timeout_checker(self) -> None:
-        """Stop the timeout checking timer"""
+        """Stop the timer wheel tick"""
         if self._timeout_check_timer and self._timeout_check_timer.isActive():
             self._timeout_check_timer.stop()
             log.debug("timeout_checker_stopped")
@@ -315,15 +264,49 @@ class DTCClientJSON(QtCore.QObject):
     # -------------------- Lifecycle (start)
     def connect(self) -> None:
         log.info("dtc.tcp.connect", host=self._host, port=self._port)
+        self._resume_capture()
         self._sock.connectToHost(self._host, self._port)
 
     def disconnect(self) -> None:
         self._stop_keepalive_system()
         if self._sock.state() != QtNetwork.QAbstractSocket.SocketState.UnconnectedState:
             self._sock.disconnectFromHost()
+        self._close_recorder()  # flushed to disk; the next connect() resumes it
 
     # -------------------- Lifecycle (end)
 
+    # -------------------- Wire capture (start)
+    def start_capture(self, path: str, compress: bool = True, **kwargs: Any) -> WireRecorder:
+        """Record every inbound frame to path (see core/wire_capture.py)."""
+        self.stop_capture()
+        self._capture_args = (path, compress, kwargs)
+        self._recorder = WireRecorder(path, compress=compress, **kwargs)
+        return self._recorder
+
+    def stop_capture(self) -> Optional[dict]:
+        """Flush and close the active capture. Returns its stats, or None if not recording."""
+        self._capture_args = None
+        return self._close_recorder()
+
+    def _resume_capture(self) -> None:
+        """Reopen a capture closed by disconnect() and append to it."""
+        if self._recorder is None and self._capture_args is not None:
+            path, compress, kwargs = self._capture_args
+            self._recorder = WireRecorder(path, compress=compress, resume=True, **kwargs)
+
+    def _close_recorder(self) -> Optional[dict]:
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return None
+        recorder.close()
+        return recorder.stats()
+
+    def replay_capture(self, path: str, speed: Optional[float] = None, on_wait: Optional[Callable] = None) -> dict:
+        """Feed a capture through _handle_frame (speed=None: as fast as possible)."""
+        return replay_capture(path, self._handle_frame, speed=speed, on_wait=on_wait)
+
+    # -------------------- Wire capture (end)
+
     # -------------------- Qt socket handlers (start)
     def _on_connected(self) -> None:
         log.info("dtc.tcp.connected")
@@ -331,9 +314,6 @@ class DTCClientJSON(QtCore.QObject):
         if self._reconnect_timer and self._reconnect_timer.isActive():
             self._reconnect_timer.stop()
 
-        # Start timeout checking when connected
-        self._start_timeout_checker()
-
         # Emit connection event
         self.connected.emit()
         # NEW: Also emit to SignalBus
@@ -370,9 +350,10 @@ class DTCClientJSON(QtCore.QObject):
         log.info("dtc.tcp.disconnected")
         self._stop_keepalive_system()
 
-        # Stop timeout checking and reset pending requests
+        # Stop timeout checking and fail pending requests
         self._stop_timeout_checker()
-        self._timeout_manager.reset()
+        self._requests.cancel_all("disconnected")
+        self._fill_ingestor.reset()
 
         # Emit disconnection event
         self.disconnected.emit()
@@ -451,52 +432,99 @@ class DTCClientJSON(QtCore.QObject):
     # -------------------- Handshake readiness (end)
 
     # -------------------- Heartbeat + Watchdog (start)
+    # One coarse timer drives both roles. Timestamps are time.monotonic_ns()
+    # integers: stamping a frame costs one clock read, no datetime objects.
+    KEEPALIVE_TICK_MS = 1000
+    HEARTBEAT_INTERVAL_NS = 5_000_000_000  # send when nothing was written for 5s
+    STALE_TIMEOUT_NS = 25_000_000_000  # abort when nothing was received for 25s
+    LATENCY_PROBE_INTERVAL_NS = 30_000_000_000  # refresh request_rtt_ms when older than 30s
+    LATENCY_PROBE = "LATENCY_PROBE"  # request type of the probe (response is not routed)
+
     def _init_keepalive_system(self) -> None:
-        from datetime import datetime
+        now = time.monotonic_ns()
+        self._last_rx_ns = now
+        self._last_tx_ns = now
+
+        if self._keepalive_timer is None:
+            self._keepalive_timer = QtCore.QTimer(self)
+            self._keepalive_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+            self._keepalive_timer.timeout.connect(self._on_keepalive_tick)
+        self._keepalive_timer.start(self.KEEPALIVE_TICK_MS)
+
+    def _on_keepalive_tick(self) -> None:
+        now = time.monotonic_ns()
 
-        self._last_msg_ts = datetime.now()
-        self._timeout_sec = 25
-        self._heartbeat_interval_ms = 5000
-        self._watchdog_interval_ms = 2000
+        # Watchdog: no inbound traffic at all for too long
+        if now - self._last_rx_ns > self.STALE_TIMEOUT_NS:
+            log.error("dtc.watchdog.stale_abort")
+            self._stop_keepalive_system()
+            self._sock.abort()
+            self.disconnected.emit()
+            return
 
-        self._heartbeat_timer = QtCore.QTimer(self)
-        self._heartbeat_timer.timeout.connect(self._send_heartbeat)
-        self._heartbeat_timer.start(self._heartbeat_interval_ms)
+        # Heartbeat: only needed when the link has been quiet on our side
+        if now - self._last_tx_ns >= self.HEARTBEAT_INTERVAL_NS:
+            self._send_heartbeat(now)
 
-        self._watchdog_timer = QtCore.QTimer(self)
-        self._watchdog_timer.timeout.connect(self._check_connection_staleness)
-        self._watchdog_timer.start(self._watchdog_interval_ms)
+        # Latency probe: keep request_rtt_ms live once startup requests are done
+        measured_at = self._requests.last_latency_at_ns
+        if (
+            measured_at is not None
+            and now - measured_at >= self.LATENCY_PROBE_INTERVAL_NS
+            and not self._probe_pending()
+        ):
+            self._send_latency_probe()
 
-    def _send_heartbeat(self) -> None:
+    def _send_heartbeat(self, now_ns: Optional[int] = None) -> None:
         try:
             if self._sock.state() == QtNetwork.QAbstractSocket.SocketState.ConnectedState:
-                hb_msg = build_heartbeat()
-                self._sock.write(orjson.dumps(hb_msg) + b"\x00")
+                self._sock.write(self._HEARTBEAT_FRAME)
                 self._sock.flush()
+                self._last_tx_ns = now_ns or time.monotonic_ns()
                 # Only log heartbeats when DEBUG_DTC=1 to reduce noise
-                import os
-                if os.getenv("DEBUG_DTC", "0") == "1":
+                if _DEBUG_DTC:
                     log.debug("dtc.heartbeat.sent")
         except Exception as e:
             log.warning("dtc.heartbeat.error", err=str(e))
 
-    def _check_connection_staleness(self) -> None:
-        from datetime import datetime, timedelta
+    def _send_latency_probe(self) -> None:
+        """Send a small TradeAccountsRequest purely to measure request latency."""
+        if self._sock.state() != QtNetwork.QAbstractSocket.SocketState.ConnectedState:
+            return
+        self.send_request({"Type": 400}, self.LATENCY_PROBE, timeout=10.0)
+        if _DEBUG_DTC:
+            log.debug("dtc.latency_probe.sent")
 
-        if datetime.now() - self._last_msg_ts > timedelta(seconds=self._timeout_sec):
-            log.error("dtc.watchdog.stale_abort")
-            self._sock.abort()
-            self.disconnected.emit()
+    def _probe_pending(self) -> bool:
+        return any(p.request_type == self.LATENCY_PROBE for p in self._requests.pending())
 
-    def _update_last_message_time(self) -> None:
-        from datetime import datetime
+    def _on_heartbeat_received(self) -> None:
+        """
+        Publish a heartbeat to SignalBus.dtcHeartbeat with the current latency.
+
+        DTC heartbeats are not echoes (each side sends on its own interval), so
+        the gap between ours and the server's is not a round-trip. The latency
+        is the time from a correlated request to its first response frame,
+        refreshed by a latency probe when no request was answered recently.
+        """
+        rtt_ms = self.request_rtt_ms
+        latency = rtt_ms if rtt_ms is not None else -1.0
+        try:
+            get_signal_bus().dtcHeartbeat.emit(latency)
+        except Exception as e:
+            log.warning("signal_bus.heartbeat.error", error=str(e))
 
-        self._last_msg_ts = datetime.now()
+    @property
+    def request_rtt_ms(self) -> Optional[float]:
+        """Send-to-first-response time of the last answered DTC request in ms (None until one)."""
+        return self._requests.last_latency_ms
+
+    def _update_last_message_time(self) -> None:
+        self._last_rx_ns = time.monotonic_ns()
 
     def _stop_keepalive_system(self) -> None:
-        for t in (self._heartbeat_timer, self._watchdog_timer):
-            if t and t.isActive():
-                t.stop()
+        if self._keepalive_timer and self._keepalive_timer.isActive():
+            self._keepalive_timer.stop()
 
     # -------------------- Heartbeat + Watchdog (end)
 
@@ -535,14 +563,19 @@ class DTCClientJSON(QtCore.QObject):
                     del self._buf[: i + 1]
                     if not raw:
                         continue
+                    if self._recorder is not None:
+                        self._recorder.record(raw)
                     self._update_last_message_time()
+                    metrics.incr("dtc.frames")
                     self._handle_frame(raw)
         except Exception as e:
             log.error("dtc.read.error", err=str(e))
 
     def _handle_frame(self, raw: bytes) -> None:
+        t0 = metrics.now()
         try:
             dtc = orjson.loads(raw)
+            metrics.observe("dtc.decode", t0)
         except Exception as e:
             log.warning("dtc.json.decode_fail", sample=raw[:160], err=str(e))
             # Heuristic: detect Binary DTC frames (little-endian size + type)
@@ -558,27 +591,16 @@ class DTCClientJSON(QtCore.QObject):
             log.warning("dtc.json.non_object", sample=preview[:80])
             return
 
-        # COMPREHENSIVE DEBUG: Log ALL responses with their RequestID to trace misrouted messages
+        # Correlate responses with the request that produced them
         msg_type = dtc.get("Type")
         req_id = dtc.get("RequestID")
         msg_name = type_to_name(msg_type)
 
-        # Create a REQUEST_ID_MAP to understand which responses belong to which requests
-        REQUEST_ID_MAP = {
-            1: "Type 400 (TradeAccountsRequest)",
-            2: "Type 500 (PositionsRequest) - SKIPPED",
-            3: "Type 305 (OpenOrdersRequest)",
-            4: "Type 303 (HistoricalOrderFillRequest)",
-            5: "Type 601 (AccountBalanceRequest)",
-        }
-
-        # Mark request as completed when response received (timeout tracking)
-        if req_id is not None:
-            self._timeout_manager.mark_completed(req_id)
+        pending = self._requests.on_response(dtc) if req_id is not None else None
 
         # Log all responses with RequestID for debugging request/response correlation
         if req_id is not None:
-            expected_request = REQUEST_ID_MAP.get(req_id, f"Unknown RequestID {req_id}")
+            expected_request = pending.request_type if pending else f"Unknown RequestID {req_id}"
             log.info(
                 "dtc.response.routing",
                 type=msg_type,
@@ -589,10 +611,18 @@ class DTCClientJSON(QtCore.QObject):
                 qty=dtc.get("Quantity"),
             )
 
+        # Latency probe responses only feed request_rtt_ms
+        if pending is not None and pending.request_type == self.LATENCY_PROBE:
+            return
+
         # NOTE: Type 306 messages from Type 305 OpenOrdersRequest
         # Sierra sends Type 306 (PositionUpdate) in response to Type 305 (OpenOrdersRequest)
         # Process all messages normally - don't reject any
 
+        # Server heartbeats drive the connection icon (with the request round-trip)
+        if msg_type == HEARTBEAT:
+            self._on_heartbeat_received()
+
         # Intercept handshake control frames
         t = dtc.get("Type")
         # Note: We skip ENCODING_REQUEST/RESPONSE negotiation since Sierra Chart doesn't support it
@@ -623,10 +653,20 @@ class DTCClientJSON(QtCore.QObject):
             self.message.emit(dtc)
             self.messageReceived.emit(dtc)
 
+        # Historical fills for the startup request are buffered and written to
+        # OrderRecord in one transaction instead of being routed one by one
+        if self._fill_ingestor.accepts(dtc):
+            self._fill_ingestor.add_fill(dtc)
+            return
+
         # Normalize & dispatch app-level event
+        t0 = metrics.now()
         app_msg = _dtc_to_app_event(dtc)
+        metrics.observe("dtc.normalize", t0)
         if app_msg:
-            self._emit_app(app_msg)
+            t0 = metrics.now()
+            self._emit_app(app_msg, dtc)
+            metrics.observe("bus.emit", t0)
 
     # -------------------- Inbound I/O (end)
 
@@ -636,8 +676,7 @@ class DTCClientJSON(QtCore.QObject):
 
         # Stagger requests slightly to avoid burst disconnects
         def send_trade_accounts():
-            self.send({"Type": 400, "RequestID": 1})
-            self._timeout_manager.register_request(1, "TRADE_ACCOUNTS_REQUEST", timeout=15.0)
+            self.send_request({"Type": 400}, "TRADE_ACCOUNTS_REQUEST", timeout=15.0)
             log.info("dtc.request.trade_accounts")
 
         def send_positions():
@@ -651,8 +690,7 @@ class DTCClientJSON(QtCore.QObject):
             log.info("dtc.request.positions", status="skipped", reason="Use live updates instead")
 
         def send_open_orders():
-            self.send({"Type": 305, "RequestID": 3})
-            self._timeout_manager.register_request(3, "OPEN_ORDERS_REQUEST", timeout=10.0)
+            self.send_request({"Type": 305}, "OPEN_ORDERS_REQUEST", timeout=10.0)
             log.info("dtc.request.orders")
 
         def send_fills():
@@ -661,13 +699,15 @@ class DTCClientJSON(QtCore.QObject):
             days = 30
             now = int(time.time())
             start_ts = now - days * 86400
-            self.send({"Type": 303, "RequestID": 4, "StartDateTime": start_ts})
-            self._timeout_manager.register_request(4, "HISTORICAL_FILLS_REQUEST", timeout=30.0)
+            self.send_request(
+                {"Type": 303, "StartDateTime": start_ts},
+                "HISTORICAL_FILLS_REQUEST",
+                timeout=30.0,
+                before_send=self._fill_ingestor.begin,
+            )
             log.info("dtc.request.fills", days=30)
 
         def send_balance():
-            # Balance request uses request_account_balance which has its own RequestID
-            # We'll register it there
             self.request_account_balance(None)
 
         QtCore.QTimer.singleShot(0, send_trade_accounts)
@@ -704,51 +744,43 @@ class DTCClientJSON(QtCore.QObject):
                     )
 
     # -------------------- Dispatch to app (start)
-    def _emit_app(self, app_msg: AppMessage) -> None:
-        data = app_msg.model_dump()
-        with contextlib.suppress(Exception):
-            # (Compatibility) If someone listens to messageReceived for app-envelopes, reuse it.
-            self.messageReceived.emit(data)  # harmless if no slots connected
+    def _emit_app(self, event: AppEvent, dtc: Optional[dict] = None) -> None:
+        """
+        Publish one normalized event on the SignalBus.
 
-        # Get debug flag
-        try:
-            from config.settings import DEBUG_DATA
-        except Exception:
-            DEBUG_DATA = False
+        The typed event itself is the payload (object signals: no dict copy
+        or QVariantMap conversion). With USE_TYPED_EVENTS off the raw DTC
+        dict is published instead; handlers coerce it with from_dtc().
+        """
+        payload = event if self._typed_events or dtc is None else dtc
 
         # ARCHITECTURE FIX (Step 2): SignalBus is now the ONLY runtime event bus
         # Blinker signals have been removed from runtime dispatch
         try:
             signal_bus = get_signal_bus()
 
-            if app_msg.type == "TRADE_ACCOUNT":
-                signal_bus.tradeAccountReceived.emit(app_msg.payload)
+            if isinstance(event, PositionUpdateEvent):
+                signal_bus.positionUpdated.emit(payload)
 
-            elif app_msg.type == "BALANCE_UPDATE":
-                balance = app_msg.payload.get("CashBalance", 0.0)
-                account = app_msg.payload.get("TradeAccount", "")
-                signal_bus.balanceUpdated.emit(balance, account)
+            elif isinstance(event, OrderUpdateEvent):
+                signal_bus.orderUpdateReceived.emit(payload)
 
-            elif app_msg.type == "POSITION_UPDATE":
-                signal_bus.positionUpdated.emit(app_msg.payload)
+            elif isinstance(event, BalanceUpdateEvent):
+                balance = event.cash_balance if event.cash_balance is not None else 0.0
+                signal_bus.balanceUpdated.emit(balance, event.account)
 
-            elif app_msg.type == "ORDER_UPDATE":
-                signal_bus.orderUpdateReceived.emit(app_msg.payload)
+            elif isinstance(event, TradeAccountEvent):
+                signal_bus.tradeAccountReceived.emit(payload)
 
         except Exception as e:
-            log.warning("dtc.signal.error", type=app_msg.type, err=str(e))
+            log.warning("dtc.signal.error", type=type(event).__name__, err=str(e))
 
         # MIGRATION: MessageRouter.route() call removed - panels now receive via SignalBus
 
         # Only log dispatch for meaningful updates (filter out zero-quantity positions)
-        if app_msg.type == "POSITION_UPDATE":
-            payload = app_msg.payload
-            qty = payload.get("qty", 0)
-            avg = payload.get("avg_entry")
-            # Skip logging empty position closures
-            if qty == 0 and (avg is None or avg == 0.0):
-                return
-        log.debug("dtc.dispatch", type=app_msg.type, payload_preview=str(app_msg.payload)[:200])
+        if isinstance(event, PositionUpdateEvent) and event.is_flat and not event.average_price:
+            return
+        log.debug("dtc.dispatch", type=type(event).__name__, payload=event)
 
     # -------------------- Dispatch to app (end)
 
@@ -759,27 +791,57 @@ class DTCClientJSON(QtCore.QObject):
             if self._sock.state() == QtNetwork.QAbstractSocket.SocketState.ConnectedState:
                 self._sock.write(data)
                 self._sock.flush()
+                # Any outbound traffic doubles as a keepalive
+                self._last_tx_ns = time.monotonic_ns()
             else:
                 log.warning("dtc.send.disconnected", dropped=True)
         except Exception as e:
             log.error("dtc.send.error", err=str(e))
 
-    def request_account_balance(self, account: Optional[str] = None) -> None:
+    def send_request(
+        self,
+        msg: dict,
+        request_type: str,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[PendingRequest], None]] = None,
+        before_send: Optional[Callable[[int], None]] = None,
+    ) -> Future:
+        """
+        Send a request with a freshly allocated RequestID.
+
+        Args:
+            msg: DTC request (RequestID is filled in)
+            request_type: Request name used for timeouts and latency stats
+            timeout: Seconds before the request expires (None = type default)
+            callback: Called with the PendingRequest on completion or expiry
+            before_send: Called with the RequestID before the message is written
+
+        Returns:
+            Future resolving to the list of response messages once the final
+            one arrives (TimeoutError / ConnectionError on expiry/disconnect)
+        """
+        pending = self._requests.register(request_type, timeout=timeout, callback=callback)
+        if before_send is not None:
+            before_send(pending.request_id)
+        self.send({**msg, "RequestID": pending.request_id})
+        self._start_timeout_checker()
+        return pending.future
+
+    def request_latency_stats(self) -> dict:
+        """Per-request-type round-trip latency histograms (ms)."""
+        return self._requests.get_latency_stats()
+
+    def request_account_balance(self, account: Optional[str] = None) -> Future:
         """Request account balance from DTC server (type 601)."""
-        from config.settings import DEBUG_DATA, LIVE_ACCOUNT
+        from config.settings import LIVE_ACCOUNT
 
         acct = account or LIVE_ACCOUNT or ""
-        msg = {
-            "Type": 601,  # ACCOUNT_BALANCE_REQUEST
-            "RequestID": 1,
-            "TradeAccount": acct,
-        }
         log.info(f"dtc.request.balance.{acct}")
-        self.send(msg)
-        # Register timeout for this request
-        request_id = msg.get("RequestID", 0)
-        if request_id:
-            self._timeout_manager.register_request(request_id, "ACCOUNT_BALANCE_REQUEST", timeout=10.0)
+        return self.send_request(
+            {"Type": 601, "TradeAccount": acct},  # ACCOUNT_BALANCE_REQUEST
+            "ACCOUNT_BALANCE_REQUEST",
+            timeout=10.0,
+        )
 
     # -------------------- Outbound (end)
 
@@ -26,14 +26,17 @@ Usage:
     hub = DiagnosticsHub.get_instance()
     snapshot = hub.snapshot(max_events=500)
     hub.export_json("logs/debug_session.json")
+    hub.export_jsonl("logs/debug_session.jsonl")  # streaming format for SessionReplay
 """
 
+import atexit
 from collections import deque
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-import inspect
+import functools
+import itertools
 import json
 import os
 from pathlib import Path
@@ -43,6 +46,8 @@ import time
 import traceback
 from typing import Any, Dict, List, Optional, Set
 
+import orjson
+
 # Import existing logger for fallback
 from utils.logger import get_logger
 
@@ -166,6 +171,110 @@ class EventRouter:
                 print(f"[DIAGNOSTICS] Handler error: {e}", file=sys.stderr)
 
 
+#: Events buffered between producers and the dispatch thread before dropping
+DEFAULT_QUEUE_SIZE = 8192
+
+#: Max events the dispatch thread takes off the queue per batch
+_DISPATCH_BATCH = 512
+
+#: Levels that sampling never drops
+_UNSAMPLED_LEVELS = frozenset({"warn", "error", "fatal"})
+
+
+def parse_sample_rates(spec: str) -> dict[str, int]:
+    """
+    Parse a sample-rate spec like "data=10,perf=5" (keep every Nth event).
+
+    Invalid entries and rates below 2 are ignored.
+    """
+    rates: dict[str, int] = {}
+    for part in (spec or "").split(","):
+        name, _, value = part.partition("=")
+        try:
+            rate = int(value)
+        except ValueError:
+            continue
+        if name.strip() and rate > 1:
+            rates[name.strip().lower()] = rate
+    return rates
+
+
+#: Streaming dump format version (header line of every .jsonl dump)
+JSONL_FORMAT_VERSION = 1
+
+
+def _jsonl_line(record: dict[str, Any]) -> bytes:
+    return orjson.dumps(record, default=str) + b"\n"
+
+
+class JsonlEventWriter:
+    """
+    Router handler that streams every dispatched event to a JSONL dump.
+
+    One JSON object per line: a {"_meta": "session"} header, the events in
+    dispatch order, and a {"_meta": "summary"} trailer written by close().
+    It runs on the dispatch thread, so producers never pay for the write.
+    core/session_replay.py loads these dumps incrementally.
+
+    One session per file: an existing dump at path is rotated to
+    <name>.prev.jsonl (replacing the older one) before the new header.
+
+    Usage:
+        writer = hub.stream_to_jsonl("logs/session.jsonl")
+        ...
+        writer.close()
+    """
+
+    def __init__(self, path: str | Path, hub: Optional["DiagnosticsHub"] = None, session_start: Optional[str] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._hub = hub
+        self._lock = threading.Lock()
+        if self.path.exists() and self.path.stat().st_size:
+            self.path.replace(self.previous_path)
+        self._fh = open(self.path, "wb")
+        self.events_written = 0
+        self._fh.write(
+            _jsonl_line(
+                {
+                    "_meta": "session",
+                    "format": JSONL_FORMAT_VERSION,
+                    "session_start": session_start or datetime.now(UTC).isoformat(),
+                }
+            )
+        )
+
+    @property
+    def previous_path(self) -> Path:
+        """Where the previous session's dump is kept."""
+        return self.path.with_name(f"{self.path.stem}.prev{self.path.suffix}")
+
+    def __call__(self, event: DiagnosticEvent) -> None:
+        self.write(event.to_dict())
+
+    def write(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.write(_jsonl_line(record))
+            self.events_written += 1
+
+    def close(self) -> None:
+        """Write the summary trailer and close (unregisters from the hub)."""
+        hub = self._hub
+        if hub is not None:
+            hub.router.unregister_handler(self)
+        summary: dict[str, Any] = {"_meta": "summary", "session_end": datetime.now(UTC).isoformat()}
+        if hub is not None:
+            summary["statistics"] = hub.get_statistics()
+            summary["markers"] = dict(hub.markers)
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.write(_jsonl_line(summary))
+            self._fh.close()
+
+
 class DiagnosticsHub:
     """
     Singleton hub for managing diagnostic events.
@@ -176,25 +285,43 @@ class DiagnosticsHub:
     - Export to JSON for post-mortem analysis
     - Session replay support
     - Thread-safe operations
+
+    Pipeline:
+    - emit_event() only appends to a bounded queue (no locks on the hot path;
+      deque.append is atomic). When the queue is full the event is dropped and
+      counted instead of blocking the producer (e.g. the DTC socket handler).
+    - A daemon dispatch thread drains the queue in batches and does the ring
+      buffer, statistics, fatal dumps and handler routing.
+    - Per-category sampling keeps every Nth debug/info event for high-volume
+      categories; warnings and errors always pass.
+    - Readers (snapshot, get_statistics, export_json, events) flush first, so
+      they see everything emitted before the call.
+    - DIAGNOSTICS_ASYNC=0 restores synchronous dispatch on the caller's thread.
     """
 
     _instance = None
     _lock = threading.Lock()
 
-    def __init__(self, max_events: int = 1000):
+    def __init__(
+        self,
+        max_events: int = 1000,
+        queue_size: Optional[int] = None,
+        async_dispatch: Optional[bool] = None,
+        sample_rates: Optional[dict[str, int]] = None,
+    ):
         if DiagnosticsHub._instance is not None:
             raise RuntimeError("DiagnosticsHub is a singleton. Use get_instance().")
 
         self.max_events = max_events
-        self.events: deque[DiagnosticEvent] = deque(maxlen=max_events)
+        self._events: deque[DiagnosticEvent] = deque(maxlen=max_events)
         self.router = EventRouter()
         self._event_lock = threading.Lock()
-        self._event_counter = 0
+        self._event_ids = itertools.count(1)
         from datetime import UTC
 
         self._session_start = datetime.now(UTC).isoformat()
 
-        # Statistics
+        # Statistics (written by the dispatcher under _event_lock)
         self.stats = {
             "total_events": 0,
             "events_by_category": {},
@@ -203,13 +330,51 @@ class DiagnosticsHub:
             "fatal_count": 0,
         }
 
+        # Producer -> dispatcher queue
+        if queue_size is None:
+            queue_size = getattr(settings, "DIAGNOSTICS_QUEUE_SIZE", DEFAULT_QUEUE_SIZE) if settings else DEFAULT_QUEUE_SIZE
+        if async_dispatch is None:
+            async_dispatch = getattr(settings, "DIAGNOSTICS_ASYNC", True) if settings else True
+        if sample_rates is None:
+            sample_rates = parse_sample_rates(getattr(settings, "DIAGNOSTICS_SAMPLE_RATES", "") if settings else "")
+        self.queue_size = max(1, int(queue_size))
+        self.async_dispatch = bool(async_dispatch)
+        self._queue: deque[DiagnosticEvent] = deque()
+        self._wake = threading.Event()
+        self._idle = threading.Condition()
+        self._busy = False
+        self._stopping = False
+        self._dispatch_thread: Optional[threading.Thread] = None
+
+        # Producer-side counters (approximate under heavy contention; never block)
+        self._dropped = 0
+        self._sampled_out = 0
+        self._queue_high_water = 0
+        self._sample_rates: dict[str, int] = {}
+        self._sample_counters: dict[str, Any] = {}
+        for category, rate in sample_rates.items():
+            self.set_sampling(category, rate)
+
         # Performance markers
         self.markers: dict[str, float] = {}
 
         # Register default console handler
         self.router.register_handler(self._console_handler)
 
-        logger.info(f"DiagnosticsHub initialized (buffer size: {max_events})")
+        # Optional full-session stream (the ring buffer only keeps max_events)
+        jsonl_path = getattr(settings, "DIAGNOSTICS_JSONL_PATH", None) if settings else None
+        self._jsonl_writer: Optional[JsonlEventWriter] = None
+        if jsonl_path:
+            try:
+                self._jsonl_writer = self.stream_to_jsonl(jsonl_path)
+                atexit.register(self._jsonl_writer.close)
+            except OSError as e:
+                logger.warning(f"Diagnostics JSONL stream disabled ({jsonl_path}): {e}")
+
+        logger.info(
+            f"DiagnosticsHub initialized (buffer size: {max_events}, queue: {self.queue_size}, "
+            f"async: {self.async_dispatch})"
+        )
 
     @classmethod
     def get_instance(cls, max_events: int = 1000) -> "DiagnosticsHub":
@@ -220,39 +385,182 @@ class DiagnosticsHub:
                     cls._instance = cls(max_events)
         return cls._instance
 
-    def emit_event(self, event: DiagnosticEvent):
+    @classmethod
+    def reset_instance(cls) -> None:
         """
-        Emit a diagnostic event.
+        Stop the dispatch thread and discard the singleton.
 
-        The event is:
-        1. Added to ring buffer
-        2. Routed to all handlers
-        3. Statistics updated
+        WARNING: Only use in tests.
         """
-        with self._event_lock:
-            # Generate event ID
-            self._event_counter += 1
-            event.event_id = f"evt_{self._event_counter:06d}"
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+            cls._instance = None
+
+    @property
+    def events(self) -> deque[DiagnosticEvent]:
+        """Ring buffer of dispatched events (pending events are flushed first)."""
+        self.flush()
+        return self._events
+
+    def emit_event(self, event: DiagnosticEvent) -> bool:
+        """
+        Emit a diagnostic event.
 
-            # Add to buffer
-            self.events.append(event)
+        The producer only assigns an event ID and enqueues. The dispatch
+        thread then:
+        1. Adds it to the ring buffer
+        2. Updates statistics
+        3. Routes it to all handlers
 
-            # Update statistics
-            self.stats["total_events"] += 1
-            self.stats["events_by_category"][event.category] = (
-                self.stats["events_by_category"].get(event.category, 0) + 1
-            )
-            self.stats["events_by_level"][event.level] = self.stats["events_by_level"].get(event.level, 0) + 1
+        Returns:
+            False when the event was sampled out or dropped (queue full)
+        """
+        if not self._admit(event.category, event.level):
+            return False
+        return self._enqueue(event)
+
+    def _admit(self, category: str, level: str) -> bool:
+        """Sampling gate (checked before an event is even built by log_event)."""
+        rate = self._sample_rates.get(category)
+        if rate and level not in _UNSAMPLED_LEVELS:
+            counter = self._sample_counters.get(category)
+            if counter is not None and next(counter) % rate:
+                self._sampled_out += 1
+                return False
+        return True
+
+    def _enqueue(self, event: DiagnosticEvent) -> bool:
+        if not self.async_dispatch or self._stopping:
+            event.event_id = f"evt_{next(self._event_ids):06d}"
+            self._dispatch([event])
+            return True
+
+        queue = self._queue
+        depth = len(queue)
+        if depth >= self.queue_size:
+            self._dropped += 1
+            return False
+
+        event.event_id = f"evt_{next(self._event_ids):06d}"
+        queue.append(event)
+        if depth >= self._queue_high_water:
+            self._queue_high_water = depth + 1
+        if depth == 0:
+            if self._dispatch_thread is None:
+                self._start_dispatcher()
+            self._wake.set()
+        return True
+
+    def set_sampling(self, category: str, every_n: int) -> None:
+        """
+        Keep only every Nth debug/info event of a category (every_n <= 1 disables).
 
-            if event.level == EventLevel.ERROR.value:
-                self.stats["errors_count"] += 1
-            elif event.level == EventLevel.FATAL.value:
-                self.stats["fatal_count"] += 1
-                # Auto-dump on fatal errors
-                self._auto_dump_on_fatal(event)
+        Warnings, errors and fatals are never sampled.
+        """
+        category = category.lower()
+        rates = dict(self._sample_rates)
+        counters = dict(self._sample_counters)
+        if every_n > 1:
+            rates[category] = int(every_n)
+            counters[category] = itertools.count()
+        else:
+            rates.pop(category, None)
+            counters.pop(category, None)
+        # Swap whole dicts so producers never see a half-updated mapping
+        self._sample_counters = counters
+        self._sample_rates = rates
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until every event emitted so far has been dispatched.
 
-        # Route to handlers (outside lock to avoid deadlock)
-        self.router.route(event)
+        Returns:
+            True when the queue drained within timeout
+        """
+        if not self.async_dispatch or threading.current_thread() is self._dispatch_thread:
+            return True
+        if self._queue and self._dispatch_thread is None:
+            self._start_dispatcher()
+        self._wake.set()
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._busy and not self._queue, timeout)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Drain pending events and stop the dispatch thread."""
+        thread = self._dispatch_thread
+        self._stopping = True
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        # Anything enqueued after the thread exited is dispatched inline
+        self._drain()
+
+    # -------------------- Dispatch thread (start)
+    def _start_dispatcher(self) -> None:
+        with self._idle:
+            if self._dispatch_thread is not None or self._stopping:
+                return
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_loop,
+                name="DiagnosticsDispatch",
+                daemon=True,
+            )
+            self._dispatch_thread.start()
+        atexit.register(self.stop, 0.5)
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopping:
+            self._wake.wait(0.25)
+            self._wake.clear()
+            self._drain()
+        self._drain()
+
+    def _drain(self) -> None:
+        """Dispatch queued events in batches until the queue is empty."""
+        queue = self._queue
+        while True:
+            self._busy = True
+            batch: list[DiagnosticEvent] = []
+            try:
+                for _ in range(_DISPATCH_BATCH):
+                    batch.append(queue.popleft())
+            except IndexError:
+                pass
+            if batch:
+                self._dispatch(batch)
+            if not queue:
+                with self._idle:
+                    self._busy = False
+                    self._idle.notify_all()
+                if not queue:
+                    return
+
+    def _dispatch(self, batch: list[DiagnosticEvent]) -> None:
+        """Buffer, count and route a batch (dispatch thread, or caller when synchronous)."""
+        fatals = []
+        with self._event_lock:
+            stats = self.stats
+            by_category = stats["events_by_category"]
+            by_level = stats["events_by_level"]
+            for event in batch:
+                self._events.append(event)
+                stats["total_events"] += 1
+                by_category[event.category] = by_category.get(event.category, 0) + 1
+                by_level[event.level] = by_level.get(event.level, 0) + 1
+                if event.level == EventLevel.ERROR.value:
+                    stats["errors_count"] += 1
+                elif event.level == EventLevel.FATAL.value:
+                    stats["fatal_count"] += 1
+                    fatals.append(event)
+
+        # Auto-dump and route outside the lock (handlers may read the hub)
+        for event in fatals:
+            self._auto_dump_on_fatal(event)
+        for event in batch:
+            self.router.route(event)
+
+    # -------------------- Dispatch thread (end)
 
     def snapshot(self, max_events: Optional[int] = None) -> list[dict[str, Any]]:
         """
@@ -264,8 +572,9 @@ class DiagnosticsHub:
         Returns:
             List of event dictionaries
         """
+        self.flush()
         with self._event_lock:
-            events = list(self.events)
+            events = list(self._events)
 
         if max_events is not None:
             events = events[-max_events:]
@@ -285,7 +594,7 @@ class DiagnosticsHub:
         snapshot_data = {
             "session_start": self._session_start,
             "session_end": datetime.now(UTC).isoformat(),
-            "statistics": self.stats,
+            "statistics": self.get_statistics(),
             "markers": self.markers,
             "events": self.snapshot(),
         }
@@ -299,10 +608,32 @@ class DiagnosticsHub:
         logger.info(f"Diagnostics exported to {path}")
         return path
 
+    def export_jsonl(self, path: str) -> str:
+        """
+        Export the buffered events as a streaming JSONL dump (see JsonlEventWriter).
+
+        Same content as export_json(), but loadable incrementally by
+        SessionReplay for sessions too large to hold in memory.
+        """
+        Path(path).unlink(missing_ok=True)
+        writer = JsonlEventWriter(path, hub=self, session_start=self._session_start)
+        for record in self.snapshot():
+            writer.write(record)
+        writer.close()
+        logger.info(f"Diagnostics exported to {path}")
+        return path
+
+    def stream_to_jsonl(self, path: str) -> JsonlEventWriter:
+        """Stream every event dispatched from now on to a new JSONL dump (previous one rotated)."""
+        writer = JsonlEventWriter(path, hub=self, session_start=self._session_start)
+        self.router.register_handler(writer)
+        return writer
+
     def clear(self):
         """Clear all buffered events"""
+        self.flush()
         with self._event_lock:
-            self.events.clear()
+            self._events.clear()
         logger.debug("Diagnostics buffer cleared")
 
     def mark_performance(self, marker_name: str, timestamp: Optional[float] = None):
@@ -394,9 +725,27 @@ class DiagnosticsHub:
             print(f"[DIAGNOSTICS] Failed to create crash dump: {e}", file=sys.stderr)
 
     def get_statistics(self) -> dict[str, Any]:
-        """Get current statistics"""
+        """Get current statistics (including pipeline counters)"""
+        self.flush()
         with self._event_lock:
-            return self.stats.copy()
+            stats = self.stats.copy()
+            stats["events_by_category"] = dict(stats["events_by_category"])
+            stats["events_by_level"] = dict(stats["events_by_level"])
+        stats["dropped_events"] = self._dropped
+        stats["sampled_out"] = self._sampled_out
+        stats["queue_depth"] = len(self._queue)
+        stats["queue_high_water"] = self._queue_high_water
+        return stats
+
+
+@functools.lru_cache(maxsize=1024)
+def _module_for_path(file_path: str) -> str:
+    """Dotted module name for a source path (cached; called for every event)."""
+    try:
+        rel_path = os.path.relpath(file_path, os.getcwd())
+        return rel_path.replace(os.sep, ".").replace(".py", "")
+    except ValueError:
+        return os.path.basename(file_path).replace(".py", "")
 
 
 def log_event(
@@ -432,26 +781,17 @@ def log_event(
             context={"host": "127.0.0.1", "port": 11099}
         )
     """
-    # Capture caller information
-    frame = inspect.currentframe()
-    caller_frame = frame.f_back if frame else None
-
-    file_path = None
-    line_number = None
-    function_name = None
-    module = "unknown"
+    hub = DiagnosticsHub.get_instance()
+    if not hub._admit(category, level):
+        return
 
-    if caller_frame:
-        file_path = caller_frame.f_code.co_filename
-        line_number = caller_frame.f_lineno
-        function_name = caller_frame.f_code.co_name
+    # Capture caller information
+    caller_frame = sys._getframe(1)
 
-        # Extract module name from file path
-        try:
-            rel_path = os.path.relpath(file_path, os.getcwd())
-            module = rel_path.replace(os.sep, ".").replace(".py", "")
-        except ValueError:
-            module = os.path.basename(file_path).replace(".py", "")
+    file_path = caller_frame.f_code.co_filename
+    line_number = caller_frame.f_lineno
+    function_name = caller_frame.f_code.co_name
+    module = _module_for_path(file_path)
 
     # Get thread information
     thread = threading.current_thread()
@@ -465,8 +805,6 @@ def log_event(
         stack_trace = "".join(stack_trace[:-1])  # Exclude this function
 
     # Create event
-    from datetime import UTC
-
     event = DiagnosticEvent(
         timestamp=datetime.now(UTC).isoformat(),
         category=category,
@@ -484,9 +822,8 @@ def log_event(
         stack_trace=stack_trace,
     )
 
-    # Emit through hub
-    hub = DiagnosticsHub.get_instance()
-    hub.emit_event(event)
+    # Enqueue through hub (sampling already applied above)
+    hub._enqueue(event)
 
 
 # Convenience functions for common levels
@@ -0,0 +1,415 @@
+"""
+core/metrics.py
+
+Hot-path metrics: counters, gauges and latency histograms.
+
+DiagnosticsHub records discrete events; this module answers "how long does
+X take, how often, and how bad is the tail" for the paths that run per
+frame or per tick:
+
+    dtc.decode       orjson.loads of one inbound frame
+    dtc.normalize    DTC dict -> typed event (domain/events.py)
+    bus.emit         SignalBus emit for one typed event (direct slots included)
+    bus.lane.*.wait  enqueue-to-delivery wait per SignalBus priority lane
+    qt_bridge.drain  one batch of marshaled callbacks (utils/qt_bridge.py)
+    panel2.tick      Panel2 market-data tick (state, metrics, display)
+    panel1.replot    EquityChart.replot
+    stats.compute    one Panel3 stats payload (worker thread)
+    db.write         one session commit
+
+Latencies go into log-linear (HDR-style) histograms: O(1) record, bounded
+relative error (~1.6%), sparse buckets that merge by addition, so dumps from
+several runs can be aggregated exactly (tools/metrics_exporter.py --metrics).
+
+Near-zero cost when disabled: now() returns 0.0 and observe() returns on
+the first check, so an instrumented path pays two function calls.
+Enabled by METRICS_ENABLED (defaults to DEBUG_PERF) or set_enabled(True)
+(the DevToolbar "Perf" toggle does this).
+
+Usage:
+    from core import metrics
+
+    t0 = metrics.now()
+    decode(raw)
+    metrics.observe("dtc.decode", t0)
+
+    with metrics.timed("db.write"):
+        session.commit()
+
+    metrics.incr("dtc.frames")
+    metrics.gauge("stats.queue_depth", q.qsize())
+
+    get_metrics_registry().snapshot()      # JSON-ready dict
+"""
+
+from __future__ import annotations
+
+import atexit
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+import orjson
+
+from config.settings import METRICS_DUMP_DIR, METRICS_DUMP_INTERVAL_S, METRICS_ENABLED
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+#: Format version of the dump files
+METRICS_FORMAT_VERSION = 1
+
+#: Percentiles reported in snapshots and the overlay
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# Log-linear bucketing: values below 2**_SUB_BITS microseconds get one bucket
+# each; above that every power of two is split into 2**_SUB_BITS buckets.
+_SUB_BITS = 6
+_SUB_COUNT = 1 << _SUB_BITS
+
+_enabled: bool = bool(METRICS_ENABLED)
+
+
+# =============================================================================
+# HISTOGRAM
+# =============================================================================
+
+
+def _bucket_index(us: int) -> int:
+    if us < _SUB_COUNT:
+        return us
+    shift = us.bit_length() - _SUB_BITS - 1
+    return ((shift + 1) << _SUB_BITS) + (us >> shift) - _SUB_COUNT
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Inclusive [low, high] microsecond range covered by a bucket."""
+    if index < _SUB_COUNT:
+        return index, index
+    shift = (index >> _SUB_BITS) - 1
+    mantissa = (index & (_SUB_COUNT - 1)) + _SUB_COUNT
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram (microsecond resolution).
+
+    Not thread-safe on its own; MetricsRegistry serializes access.
+    """
+
+    __slots__ = ("buckets", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record_us(self, us: int) -> None:
+        us = max(0, int(us))
+        index = _bucket_index(us)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if not self.count or us < self.min_us:
+            self.min_us = us
+        if us > self.max_us:
+            self.max_us = us
+        self.count += 1
+        self.total_us += us
+
+    def record_ms(self, ms: float) -> None:
+        self.record_us(round(ms * 1000.0))
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's samples (exact: buckets are aligned)."""
+        if not other.count:
+            return
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.min_us = other.min_us if not self.count else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    def percentile_us(self, pct: float) -> float:
+        """Value at the given percentile (bucket midpoint, clamped to min/max)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * pct // 100))  # ceil
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                low, high = _bucket_bounds(index)
+                return float(min(max((low + high) / 2.0, self.min_us), self.max_us))
+        return float(self.max_us)
+
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "mean_ms": round(self.mean_us() / 1000.0, 4),
+        }
+        for pct in PERCENTILES:
+            out[f"p{pct:g}_ms"] = round(self.percentile_us(pct) / 1000.0, 4)
+        out["max_ms"] = round(self.max_us / 1000.0, 4)
+        out["buckets"] = {str(index): n for index, n in sorted(self.buckets.items())}
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyHistogram:
+        hist = cls()
+        hist.buckets = {int(index): int(n) for index, n in (data.get("buckets") or {}).items()}
+        hist.count = int(data.get("count", sum(hist.buckets.values())))
+        hist.total_us = int(data.get("total_us", 0))
+        hist.min_us = int(data.get("min_us", 0))
+        hist.max_us = int(data.get("max_us", 0))
+        return hist
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and latency histograms for one process.
+
+    Thread Safety:
+    - Recorded from the GUI thread and worker threads; one lock guards all
+      three maps (held only for a dict update)
+    - The dump thread copies under the lock and writes outside it
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, float] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._started_at = time.time()
+
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_stop = threading.Event()
+        self._dump_path: Optional[Path] = None
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = float(value)
+
+    def record_ms(self, name: str, ms: float) -> None:
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = LatencyHistogram()
+            hist.record_ms(ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._started_at = time.time()
+
+    # =========================================================================
+    # READING
+    # =========================================================================
+
+    def histogram(self, name: str) -> Optional[LatencyHistogram]:
+        """Copy of one histogram (None if nothing was recorded)."""
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                return None
+            copy = LatencyHistogram()
+            copy.merge(hist)
+            return copy
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready view of everything recorded so far."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {name: hist.to_dict() for name, hist in self._histograms.items()}
+        now = time.time()
+        return {
+            "format": METRICS_FORMAT_VERSION,
+            "pid": os.getpid(),
+            "started_at": self._started_at,
+            "timestamp": now,
+            "uptime_s": round(now - self._started_at, 3),
+            "counters": counters,
+            "gauges": gauges,
+            "histograms": histograms,
+        }
+
+    def summary_rows(self) -> list[dict[str, Any]]:
+        """One row per histogram (name, count, p50/p99/max in ms), sorted by name."""
+        with self._lock:
+            items = sorted(self._histograms.items())
+            return [
+                {
+                    "name": name,
+                    "count": hist.count,
+                    "p50_ms": hist.percentile_us(50.0) / 1000.0,
+                    "p99_ms": hist.percentile_us(99.0) / 1000.0,
+                    "max_ms": hist.max_us / 1000.0,
+                }
+                for name, hist in items
+            ]
+
+    # =========================================================================
+    # PERIODIC DUMP
+    # =========================================================================
+
+    def dump(self, path: Optional[Path | str] = None) -> Optional[Path]:
+        """Write the snapshot as JSON (temp file + rename). Returns the path or None."""
+        target = Path(path) if path is not None else self._dump_path
+        if target is None:
+            return None
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = target.with_suffix(".tmp")
+            temp_path.write_bytes(orjson.dumps(self.snapshot(), option=orjson.OPT_INDENT_2))
+            temp_path.replace(target)
+            return target
+        except Exception as e:
+            log.warning(f"[Metrics] Dump to {target} failed: {e}")
+            return None
+
+    def start_dumping(
+        self,
+        directory: Path | str = METRICS_DUMP_DIR,
+        interval_s: float = METRICS_DUMP_INTERVAL_S,
+    ) -> Path:
+        """
+        Dump the snapshot every interval_s on a daemon thread (and once at exit).
+
+        Each process writes its own file (metrics_<start>_<pid>.json), which
+        is overwritten with the cumulative snapshot on every dump.
+        """
+        if self._dump_thread is not None and self._dump_thread.is_alive():
+            return self._dump_path  # type: ignore[return-value]
+
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self._started_at))
+        self._dump_path = Path(directory) / f"metrics_{stamp}_{os.getpid()}.json"
+        self._dump_stop.clear()
+
+        def _run() -> None:
+            while not self._dump_stop.wait(max(0.1, interval_s)):
+                self.dump()
+
+        self._dump_thread = threading.Thread(target=_run, name="MetricsDump", daemon=True)
+        self._dump_thread.start()
+        atexit.register(self.stop_dumping)
+        log.info(f"[Metrics] Dumping to {self._dump_path} every {interval_s:g}s")
+        return self._dump_path
+
+    def stop_dumping(self) -> None:
+        """Stop the dump thread and write a final snapshot."""
+        thread = self._dump_thread
+        if thread is None:
+            return
+        self._dump_thread = None
+        self._dump_stop.set()
+        thread.join(timeout=2.0)
+        self.dump()
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_metrics_instance: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global MetricsRegistry singleton (thread-safe creation)."""
+    global _metrics_instance
+
+    if _metrics_instance is None:
+        with _metrics_lock:
+            if _metrics_instance is None:
+                _metrics_instance = MetricsRegistry()
+
+    return _metrics_instance
+
+
+def reset_metrics_registry() -> None:
+    """
+    Drop the global registry (stops its dump thread).
+
+    WARNING: Only use in tests.
+    """
+    global _metrics_instance
+
+    with _metrics_lock:
+        if _metrics_instance is not None:
+            _metrics_instance._dump_stop.set()
+        _metrics_instance = None
+
+
+# =============================================================================
+# HOT-PATH API
+# =============================================================================
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off at runtime (already recorded data is kept)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def now() -> float:
+    """Start timestamp for observe(); 0.0 when metrics are disabled."""
+    return time.perf_counter() if _enabled else 0.0
+
+
+def observe(name: str, t0: float) -> None:
+    """Record the time since t0 (from now()) into the named histogram."""
+    if not _enabled or not t0:
+        return
+    get_metrics_registry().record_ms(name, (time.perf_counter() - t0) * 1000.0)
+
+
+def incr(name: str, n: int = 1) -> None:
+    if _enabled:
+        get_metrics_registry().incr(name, n)
+
+
+def gauge(name: str, value: float) -> None:
+    if _enabled:
+        get_metrics_registry().gauge(name, value)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Context manager form of now()/observe(); records even if the body raises."""
+    t0 = now()
+    try:
+        yield
+    finally:
+        observe(name, t0)
@@ -0,0 +1,246 @@
+"""
+core/render_governor.py
+
+Adaptive render quality governor.
+
+Chart paint paths report how long each full-plot frame took to render
+(partial repaints such as the endpoint pulse are not reported). Frames are
+evaluated in windows of RENDER_WINDOW_FRAMES; the window's p90 paint time is
+compared with RENDER_FRAME_BUDGET_MS:
+- over budget: quality steps down one level
+- under budget * RENDER_HEADROOM_RATIO for RECOVERY_WINDOWS windows in a row:
+  quality steps back up one level (hysteresis, so it does not flap)
+
+Levels degrade in a fixed order (QUALITY_STEPS), cheapest visual loss first:
+    level 0: full quality
+    level 1: pulse animation at half FPS
+    level 2: + no glow halo
+    level 3: + no trail lines
+    level 4: + no antialiasing
+
+Every transition is emitted as qualityChanged(level), logged, and reported
+as a DiagnosticsHub event (category "perf", event_type "RenderQualityChanged").
+
+Usage:
+    from core.render_governor import get_render_governor
+
+    governor = get_render_governor()
+    governor.qualityChanged.connect(self._apply_quality)
+
+    # in the paint path, for full-plot frames
+    started = time.perf_counter()
+    super().paintEvent(ev)
+    governor.record_frame((time.perf_counter() - started) * 1000.0)
+
+    if governor.degraded("glow"):
+        ...
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+import threading
+from typing import Any, Optional
+
+from PyQt6 import QtCore
+
+from config.settings import (
+    RENDER_FRAME_BUDGET_MS,
+    RENDER_GOVERNOR_ENABLED,
+    RENDER_HEADROOM_RATIO,
+    RENDER_WINDOW_FRAMES,
+)
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+#: Degradation order: QUALITY_STEPS[i] is off (or reduced) from level i + 1 on
+QUALITY_STEPS = ("pulse_fps", "glow", "trails", "antialias")
+MAX_LEVEL = len(QUALITY_STEPS)
+
+#: Consecutive calm windows required before stepping back up
+RECOVERY_WINDOWS = 3
+
+#: Transitions kept for diagnostics/summary
+MAX_RECORDED_TRANSITIONS = 100
+
+
+@dataclass
+class QualityTransition:
+    at: str  # ISO timestamp (UTC)
+    from_level: int
+    to_level: int
+    step: str  # QUALITY_STEPS entry turned off (down) or back on (up)
+    p90_ms: float
+    budget_ms: float
+
+
+def _p90(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[int(0.9 * (len(ordered) - 1))]
+
+
+class RenderQualityGovernor(QtCore.QObject):
+    """
+    Steps render quality down/up from measured frame times.
+
+    Thread Safety:
+    - GUI thread only (frames are recorded from paint events)
+    """
+
+    #: Emitted on every transition with the new level (0 = full quality)
+    qualityChanged = QtCore.pyqtSignal(int)
+
+    def __init__(
+        self,
+        budget_ms: float = RENDER_FRAME_BUDGET_MS,
+        window_frames: int = RENDER_WINDOW_FRAMES,
+        headroom_ratio: float = RENDER_HEADROOM_RATIO,
+        recovery_windows: int = RECOVERY_WINDOWS,
+        enabled: bool = RENDER_GOVERNOR_ENABLED,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self.budget_ms = max(0.1, float(budget_ms))
+        self.window_frames = max(1, int(window_frames))
+        self.headroom_ratio = min(1.0, max(0.0, float(headroom_ratio)))
+        self.recovery_windows = max(1, int(recovery_windows))
+        self.enabled = enabled
+
+        self._level = 0
+        self._frames: list[float] = []
+        self._calm_windows = 0
+        self._transitions: deque[QualityTransition] = deque(maxlen=MAX_RECORDED_TRANSITIONS)
+        self.frames_recorded = 0
+        self.last_p90_ms: Optional[float] = None
+
+    # =========================================================================
+    # STATE
+    # =========================================================================
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    def degraded(self, step: str) -> bool:
+        """True while the given QUALITY_STEPS entry is turned down."""
+        return QUALITY_STEPS.index(step) < self._level
+
+    def transitions(self) -> list[QualityTransition]:
+        return list(self._transitions)
+
+    # =========================================================================
+    # MEASUREMENT
+    # =========================================================================
+
+    def record_frame(self, frame_ms: float) -> None:
+        """Report one frame's paint time (ms)."""
+        if not self.enabled:
+            return
+        self.frames_recorded += 1
+        self._frames.append(frame_ms)
+        if len(self._frames) >= self.window_frames:
+            p90 = _p90(self._frames)
+            self._frames.clear()
+            self._evaluate(p90)
+
+    def _evaluate(self, p90: float) -> None:
+        self.last_p90_ms = p90
+        if p90 > self.budget_ms:
+            self._calm_windows = 0
+            if self._level < MAX_LEVEL:
+                self._transition(self._level + 1, p90)
+        elif p90 < self.budget_ms * self.headroom_ratio:
+            self._calm_windows += 1
+            if self._calm_windows >= self.recovery_windows and self._level > 0:
+                self._calm_windows = 0
+                self._transition(self._level - 1, p90)
+        else:
+            self._calm_windows = 0
+
+    def _transition(self, level: int, p90: float) -> None:
+        down = level > self._level
+        transition = QualityTransition(
+            at=datetime.now(UTC).isoformat(),
+            from_level=self._level,
+            to_level=level,
+            step=QUALITY_STEPS[min(level, self._level)],
+            p90_ms=round(p90, 2),
+            budget_ms=self.budget_ms,
+        )
+        self._level = level
+        self._transitions.append(transition)
+
+        action = "off" if down else "on"
+        log.info(
+            f"[RenderGovernor] Quality {transition.from_level} -> {level}: {transition.step} {action} "
+            f"(p90 {p90:.1f} ms, budget {self.budget_ms:.1f} ms)"
+        )
+        self._emit_diagnostic(transition, down)
+        self.qualityChanged.emit(level)
+
+    def _emit_diagnostic(self, transition: QualityTransition, down: bool) -> None:
+        try:
+            from core.diagnostics import DiagnosticEvent, DiagnosticsHub
+
+            DiagnosticsHub.get_instance().emit_event(
+                DiagnosticEvent(
+                    timestamp=transition.at,
+                    category="perf",
+                    level="warn" if down else "info",
+                    module="core.render_governor",
+                    event_type="RenderQualityChanged",
+                    message=(
+                        f"Render quality {'down' if down else 'up'} to level {transition.to_level} "
+                        f"({transition.step} {'off' if down else 'on'})"
+                    ),
+                    context=asdict(transition),
+                    elapsed_ms=transition.p90_ms,
+                )
+            )
+        except Exception as e:
+            log.debug(f"[RenderGovernor] Diagnostics emit failed: {e}")
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "level": self._level,
+            "budget_ms": self.budget_ms,
+            "frames_recorded": self.frames_recorded,
+            "last_p90_ms": self.last_p90_ms,
+            "transitions": [asdict(t) for t in self._transitions],
+        }
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_governor_instance: Optional[RenderQualityGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_render_governor() -> RenderQualityGovernor:
+    """Get the global RenderQualityGovernor singleton (GUI thread only)."""
+    global _governor_instance
+
+    if _governor_instance is None:
+        with _governor_lock:
+            if _governor_instance is None:
+                _governor_instance = RenderQualityGovernor()
+
+    return _governor_instance
+
+
+def reset_render_governor() -> None:
+    """
+    Drop the global governor.
+
+    WARNING: Only use in tests.
+    """
+    global _governor_instance
+
+    with _governor_lock:
+        _governor_instance = None
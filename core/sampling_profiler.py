@@ -0,0 +1,370 @@
+"""
+core/sampling_profiler.py
+
+Built-in sampling profiler (opt-in, DEBUG_PERF=1 or PROFILER_ENABLED=1).
+
+A daemon thread wakes every PROFILER_INTERVAL_MS, reads every thread's
+current frame with sys._current_frames() and counts the collapsed stack
+("Thread;module:function;module:function"). Nothing is installed in the
+profiled threads (no settrace/setprofile), so the cost is one stack walk
+per thread per sample on the sampler thread.
+
+Memory is bounded:
+- at most max_stacks distinct stacks; overflow samples are counted under
+  "<thread>;[truncated]"
+- stacks are cut to max_depth frames (leaf side kept)
+- a ring of recent samples (RECENT_WINDOW_S) for stall windows
+
+Output (on demand, on shutdown, or for a stall window):
+- collapsed text: one "stack count" line per stack (flamegraph.pl,
+  speedscope, inferno all read it)
+- speedscope JSON: one sampled profile per thread
+
+Usage:
+    from core.sampling_profiler import get_sampling_profiler
+
+    profiler = get_sampling_profiler()
+    profiler.start()
+    ...
+    profiler.write_speedscope("reports/profiles/run.speedscope.json")
+    profiler.dump()                              # both formats, timestamped
+    profiler.dump_window(t_start, t_end, "stall")  # only the stall's samples
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import deque
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any, Optional
+
+import orjson
+
+from config.settings import (
+    PROFILER_ENABLED,
+    PROFILER_INTERVAL_MS,
+    PROFILER_MAX_STACKS,
+    PROFILER_OUTPUT_DIR,
+)
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+#: Frames kept per stack (innermost side)
+MAX_DEPTH = 128
+
+#: Seconds of individual samples kept for dump_window()
+RECENT_WINDOW_S = 30.0
+
+#: Label for samples dropped once max_stacks distinct stacks exist
+TRUNCATED_FRAME = "[truncated]"
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class SamplingProfiler:
+    """
+    Periodic whole-process stack sampler.
+
+    Thread Safety:
+    - Only the sampler thread writes samples; readers copy under _lock
+    - start()/stop() may be called from any thread
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = PROFILER_INTERVAL_MS,
+        max_stacks: int = PROFILER_MAX_STACKS,
+        max_depth: int = MAX_DEPTH,
+        output_dir: Path | str = PROFILER_OUTPUT_DIR,
+    ):
+        self.interval_s = max(0.001, float(interval_ms) / 1000.0)
+        self.max_stacks = max(1, int(max_stacks))
+        self.max_depth = max(1, int(max_depth))
+        self.output_dir = Path(output_dir)
+
+        self._lock = threading.Lock()
+        self._stacks: dict[str, int] = {}
+        # One entry per sample (all threads' stacks), so the window is
+        # RECENT_WINDOW_S regardless of the thread count
+        self._recent: deque[tuple[float, tuple[str, ...]]] = deque(
+            maxlen=max(1, int(RECENT_WINDOW_S / self.interval_s))
+        )
+        self._labels: dict[Any, str] = {}
+        self._thread_names: dict[int, str] = {}
+        self._names_refreshed = 0.0
+
+        self.samples = 0
+        self.truncated = 0
+        self.started_at = 0.0
+        self.sampling_ms = 0.0  # total time spent inside sample()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._exit_dump_registered = False
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, dump_on_exit: bool = False) -> None:
+        """Start sampling on a daemon thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.started_at = self.started_at or time.time()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        if dump_on_exit and not self._exit_dump_registered:
+            self._exit_dump_registered = True
+            atexit.register(self._dump_at_exit)
+        log.info(f"[Profiler] Sampling every {self.interval_s * 1000.0:g} ms (max {self.max_stacks} stacks)")
+
+    def stop(self) -> None:
+        thread = self._thread
+        self._thread = None
+        self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stacks.clear()
+            self._recent.clear()
+            self.samples = 0
+            self.truncated = 0
+            self.sampling_ms = 0.0
+
+    def _dump_at_exit(self) -> None:
+        self.stop()
+        if self.samples:
+            self.dump()
+
+    # =========================================================================
+    # SAMPLING
+    # =========================================================================
+
+    def _run(self) -> None:
+        next_at = time.perf_counter()
+        while not self._stop.is_set():
+            self.sample()
+            next_at += self.interval_s
+            delay = next_at - time.perf_counter()
+            if delay < 0:
+                # Fell behind (GIL contention, suspended process): don't burst
+                next_at = time.perf_counter()
+                delay = 0.0
+            self._stop.wait(delay)
+
+    def sample(self) -> None:
+        """Take one sample of every thread except the sampler itself."""
+        started = time.perf_counter()
+        own = threading.get_ident()
+        frames = sys._current_frames()
+        if started - self._names_refreshed > 1.0 or len(frames) > len(self._thread_names):
+            self._thread_names = {t.ident: t.name for t in threading.enumerate() if t.ident}
+            self._names_refreshed = started
+
+        now = time.time()
+        collected = []
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            collected.append(self._collapse(self._thread_names.get(ident, f"Thread-{ident}"), frame))
+        del frames
+
+        with self._lock:
+            keys = []
+            for key in collected:
+                if key not in self._stacks and len(self._stacks) >= self.max_stacks:
+                    self.truncated += 1
+                    key = f"{key.split(';', 1)[0]};{TRUNCATED_FRAME}"
+                self._stacks[key] = self._stacks.get(key, 0) + 1
+                keys.append(key)
+            self._recent.append((now, tuple(keys)))
+            self.samples += 1
+            self.sampling_ms += (time.perf_counter() - started) * 1000.0
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        labels = self._labels
+        parts: list[str] = []
+        depth = 0
+        while frame is not None and depth < self.max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+                label = labels[code] = f"{module}:{code.co_name}".replace(";", ":")
+            parts.append(label)
+            frame = frame.f_back
+            depth += 1
+        parts.append(thread_name.replace(";", ":"))
+        parts.reverse()
+        return ";".join(parts)
+
+    # =========================================================================
+    # READING
+    # =========================================================================
+
+    def collapsed(self, start: Optional[float] = None, end: Optional[float] = None) -> dict[str, int]:
+        """Stack -> sample count, for the whole run or a wall-clock window."""
+        with self._lock:
+            if start is None and end is None:
+                return dict(self._stacks)
+            recent = list(self._recent)
+        lo = start if start is not None else float("-inf")
+        hi = end if end is not None else float("inf")
+        out: dict[str, int] = {}
+        for ts, keys in recent:
+            if lo <= ts <= hi:
+                for key in keys:
+                    out[key] = out.get(key, 0) + 1
+        return out
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self.running,
+                "samples": self.samples,
+                "distinct_stacks": len(self._stacks),
+                "truncated": self.truncated,
+                "interval_ms": self.interval_s * 1000.0,
+                "overhead_ms_per_sample": round(self.sampling_ms / self.samples, 4) if self.samples else 0.0,
+            }
+
+    # =========================================================================
+    # OUTPUT
+    # =========================================================================
+
+    def write_collapsed(self, path: Path | str, stacks: Optional[dict[str, int]] = None) -> Path:
+        """Write flamegraph.pl-style collapsed stacks ("a;b;c 42" per line)."""
+        stacks = self.collapsed() if stacks is None else stacks
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{key} {count}" for key, count in sorted(stacks.items())]
+        target.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        return target
+
+    def to_speedscope(self, stacks: Optional[dict[str, int]] = None, name: str = "APPSIERRA") -> dict[str, Any]:
+        """Speedscope "sampled" document, one profile per thread."""
+        stacks = self.collapsed() if stacks is None else stacks
+        frames: list[dict[str, str]] = []
+        frame_index: dict[str, int] = {}
+        per_thread: dict[str, tuple[list[list[int]], list[int]]] = {}
+
+        for key, count in sorted(stacks.items()):
+            thread_name, _, rest = key.partition(";")
+            indices = []
+            for label in rest.split(";") if rest else []:
+                index = frame_index.get(label)
+                if index is None:
+                    index = frame_index[label] = len(frames)
+                    module, _, function = label.rpartition(":")
+                    frames.append({"name": function or label, "file": module})
+                indices.append(index)
+            samples, weights = per_thread.setdefault(thread_name, ([], []))
+            samples.append(indices)
+            weights.append(count)
+
+        interval_ms = self.interval_s * 1000.0
+        profiles = [
+            {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights) * interval_ms,
+                "samples": samples,
+                "weights": [w * interval_ms for w in weights],
+            }
+            for thread_name, (samples, weights) in sorted(per_thread.items())
+        ]
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "core.sampling_profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def write_speedscope(self, path: Path | str, stacks: Optional[dict[str, int]] = None) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(orjson.dumps(self.to_speedscope(stacks, name=target.stem)))
+        return target
+
+    def dump(self, label: str = "profile", stacks: Optional[dict[str, int]] = None) -> list[Path]:
+        """Write both formats to output_dir as <label>_<timestamp>.{collapsed.txt,speedscope.json}."""
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        base = self.output_dir / f"{label}_{stamp}_{os.getpid()}"
+        stacks = self.collapsed() if stacks is None else stacks
+        try:
+            paths = [
+                self.write_collapsed(base.parent / f"{base.name}.collapsed.txt", stacks),
+                self.write_speedscope(base.parent / f"{base.name}.speedscope.json", stacks),
+            ]
+        except Exception as e:
+            log.warning(f"[Profiler] Dump failed: {e}")
+            return []
+        log.info(f"[Profiler] Wrote {sum(stacks.values())} samples to {paths[1]}")
+        return paths
+
+    def dump_window(self, start: float, end: float, label: str = "stall") -> list[Path]:
+        """Dump only the samples taken between two time.time() stamps (e.g. a UI stall)."""
+        stacks = self.collapsed(start, end)
+        if not stacks:
+            return []
+        return self.dump(label, stacks)
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_profiler_instance: Optional[SamplingProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """Get the global SamplingProfiler singleton (thread-safe creation)."""
+    global _profiler_instance
+
+    if _profiler_instance is None:
+        with _profiler_lock:
+            if _profiler_instance is None:
+                _profiler_instance = SamplingProfiler()
+
+    return _profiler_instance
+
+
+def reset_sampling_profiler() -> None:
+    """
+    Stop and drop the global profiler.
+
+    WARNING: Only use in tests.
+    """
+    global _profiler_instance
+
+    with _profiler_lock:
+        if _profiler_instance is not None:
+            _profiler_instance.stop()
+        _profiler_instance = None
+
+
+def start_if_enabled() -> Optional[SamplingProfiler]:
+    """Start the global profiler when PROFILER_ENABLED/DEBUG_PERF is set (dumps at exit)."""
+    if not PROFILER_ENABLED:
+        return None
+    profiler = get_sampling_profiler()
+    profiler.start(dump_on_exit=True)
+    return profiler
@@ -7,33 +7,50 @@ Provides tools for:
 - Filtering and searching through historical events
 - Generating forensic reports
 
+Dump formats:
+- JSONL (DiagnosticsHub.export_jsonl / stream_to_jsonl, DIAGNOSTICS_JSONL_PATH):
+  read line by line; events stay on disk and are re-read by byte offset only
+  when a result is materialized
+- JSON (DiagnosticsHub.export_json): legacy single document, loaded whole
+
+Either way, loading builds a columnar SessionIndex: timestamps parsed once
+into epoch floats, interned categories/levels/messages, per-category and
+per-level row lists, and time-ordered rows so time ranges and timeline
+buckets are bisects instead of passes over every event.
+
 Usage:
     from core.session_replay import SessionReplay
 
     # Load a session from dump file
-    replay = SessionReplay.from_file("logs/debug_snapshot_20250106_123045.json")
+    replay = SessionReplay.from_file("logs/debug_session.jsonl")
 
     # Playback events in real-time
     replay.playback(speed=10.0, filter_category="network")
 
     # Analyze patterns
     stats = replay.analyze()
-    print(f"Total events: {stats['total_events']}")
-    print(f"Error rate: {stats['error_rate']:.2%}")
+    print(f"Total events: {stats.total_events}")
+    print(f"Error rate: {stats.error_rate:.2%}")
 
-    # Search for specific events
-    results = replay.search(pattern="connection.*failed", category="network")
+    # Search for specific events (index-backed; regex runs once per distinct message)
+    results = replay.search(pattern="connection.*failed", category="network", start=t0, end=t1)
 """
 
-from collections import defaultdict
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
 from datetime import datetime
+import heapq
 import json
+import math
 from pathlib import Path
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
 
 from core.diagnostics import DiagnosticEvent
 from utils.logger import get_logger
@@ -41,6 +58,13 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_EVENT_FIELDS = frozenset(f.name for f in fields(DiagnosticEvent))
+_REQUIRED_FIELDS = ("timestamp", "category", "level", "module", "event_type", "message")
+_ERROR_LEVELS = ("error", "fatal")
+
+#: Accepted forms for search() time bounds: epoch seconds, ISO string or datetime
+TimeBound = Union[float, int, str, datetime, None]
+
 
 @dataclass
 class EventPattern:
@@ -69,26 +93,281 @@ class SessionAnalysis:
     timeline_summary: list[tuple[str, int]]  # (time_bucket, event_count)
 
 
+def _to_epoch(value: Any) -> Optional[float]:
+    """Epoch seconds for an ISO timestamp / datetime / number (None if unparseable)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class _Interner:
+    """String <-> small int table."""
+
+    __slots__ = ("values", "_ids")
+
+    def __init__(self):
+        self.values: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def id_for(self, value: str) -> int:
+        ident = self._ids.get(value)
+        if ident is None:
+            ident = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return ident
+
+    def get(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+
+
+class SessionIndex:
+    """
+    Columnar, indexed store for one session's events (one row per event).
+
+    Rows are time-ordered after finalize(). Per row only numbers are kept
+    (epoch timestamp, interned category/level/message ids, elapsed_ms and the
+    byte offset of the JSONL line); the full event is re-read from the dump
+    (or the in-memory record list for legacy JSON) on demand.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.ts = array("d")
+        self.category_ids = array("H")
+        self.level_ids = array("B")
+        self.message_ids = array("I")
+        self.elapsed = array("d")  # NaN = no elapsed_ms
+        self.offsets = array("q")  # JSONL byte offset (or record list position)
+        self.categories = _Interner()
+        self.levels = _Interner()
+        self.messages = _Interner()
+
+        self.by_category: dict[int, array] = {}
+        self.by_level: dict[int, array] = {}
+        self.by_message: dict[int, array] = {}
+        self.skipped = 0
+
+        self._records: Optional[list[dict[str, Any]]] = None if path else []
+        self._fh = None
+        self._fh_lock = threading.Lock()
+        self._last_ts = 0.0
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    # -------------------- Building (start)
+    def add(self, record: dict[str, Any], offset: int = -1) -> bool:
+        """Index one event record. Returns False (and counts it) when malformed."""
+        if not all(k in record for k in _REQUIRED_FIELDS) or not _EVENT_FIELDS.issuperset(record):
+            self.skipped += 1
+            return False
+
+        ts = _to_epoch(record["timestamp"])
+        if ts is None:
+            ts = self._last_ts  # keep position; analysis treats it as "no time elapsed"
+        self._last_ts = ts
+
+        elapsed = record.get("elapsed_ms")
+        self.ts.append(ts)
+        self.category_ids.append(self.categories.id_for(str(record["category"])))
+        self.level_ids.append(self.levels.id_for(str(record["level"])))
+        self.message_ids.append(self.messages.id_for(str(record["message"])))
+        self.elapsed.append(float(elapsed) if isinstance(elapsed, (int, float)) else math.nan)
+        if self._records is not None:
+            self.offsets.append(len(self._records))
+            self._records.append(record)
+        else:
+            self.offsets.append(offset)
+        return True
+
+    def finalize(self) -> None:
+        """Sort rows by time (stable) and build the inverted indexes."""
+        ts = self.ts
+        if any(ts[i] > ts[i + 1] for i in range(len(ts) - 1)):
+            order = sorted(range(len(ts)), key=ts.__getitem__)
+            for name in ("ts", "category_ids", "level_ids", "message_ids", "elapsed", "offsets"):
+                column = getattr(self, name)
+                setattr(self, name, array(column.typecode, (column[i] for i in order)))
+
+        self.by_category = self._postings(self.category_ids)
+        self.by_level = self._postings(self.level_ids)
+        self.by_message = self._postings(self.message_ids)
+
+    @staticmethod
+    def _postings(column: array) -> dict[int, array]:
+        """{value: ascending rows holding it}"""
+        index: dict[int, array] = {}
+        for row, value in enumerate(column):
+            postings = index.get(value)
+            if postings is None:
+                postings = index[value] = array("I")
+            postings.append(row)
+        return index
+
+    # -------------------- Building (end)
+
+    # -------------------- Queries (start)
+    def row_range(self, start: Optional[float] = None, end: Optional[float] = None) -> tuple[int, int]:
+        """[lo, hi) rows with start <= ts <= end."""
+        lo = 0 if start is None else bisect_left(self.ts, start)
+        hi = len(self.ts) if end is None else bisect_right(self.ts, end)
+        return lo, max(lo, hi)
+
+    def rows(
+        self,
+        category: Optional[str] = None,
+        level: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        message_ids: Optional[set[int]] = None,
+    ) -> Iterable[int]:
+        """Row numbers (ascending) matching category/level/message ids within a time range."""
+        lo, hi = self.row_range(start, end)
+        filters = []  # (posting list, column, wanted id)
+        if message_ids is not None:
+            # Union of the matching messages' rows, as one sorted posting list
+            postings = [self.by_message[i] for i in message_ids if i in self.by_message]
+            if not postings:
+                return ()
+            merged = postings[0] if len(postings) == 1 else array("I", heapq.merge(*postings))
+            filters.append((merged, None, None))
+        for name, interner, index, column in (
+            (category, self.categories, self.by_category, self.category_ids),
+            (level, self.levels, self.by_level, self.level_ids),
+        ):
+            if name is None:
+                continue
+            ident = interner.get(name)
+            if ident is None:
+                return ()
+            filters.append((index[ident], column, ident))
+
+        if not filters:
+            return range(lo, hi)
+
+        # Walk the shortest posting list inside the time window, check the other columns
+        filters.sort(key=lambda f: len(f[0]))
+        postings = filters[0][0]
+        window = postings[bisect_left(postings, lo) : bisect_left(postings, hi)]
+        for _, column, ident in filters[1:]:
+            if column is None:
+                window = [row for row in window if self.message_ids[row] in message_ids]
+            else:
+                window = [row for row in window if column[row] == ident]
+        return window
+
+    def message_ids_matching(self, pattern: "re.Pattern[str]") -> set[int]:
+        """Distinct message ids whose text matches (regex runs once per distinct message)."""
+        return {i for i, text in enumerate(self.messages.values) if pattern.search(text)}
+
+    def bucket_counts(self, bucket_size_sec: float) -> list[tuple[float, int]]:
+        """[(bucket_offset_sec, count)] for non-empty buckets, relative to the first event."""
+        ts = self.ts
+        if not ts:
+            return []
+        first = ts[0]
+        out = []
+        row = 0
+        n = len(ts)
+        while row < n:
+            bucket = math.floor((ts[row] - first) / bucket_size_sec)
+            nxt = bisect_left(ts, first + (bucket + 1) * bucket_size_sec, row)
+            out.append((bucket * bucket_size_sec, nxt - row))
+            row = nxt
+        return out
+
+    # -------------------- Queries (end)
+
+    # -------------------- Materialization (start)
+    def record(self, row: int) -> dict[str, Any]:
+        """Full event record for a row (re-read from the dump for JSONL sessions)."""
+        return self.records([row])[0]
+
+    def records(self, rows: Iterable[int]) -> list[dict[str, Any]]:
+        rows = list(rows)
+        if self._records is not None:
+            return [self._records[self.offsets[r]] for r in rows]
+
+        out: dict[int, dict[str, Any]] = {}
+        with self._fh_lock:
+            if self._fh is None:
+                self._fh = open(self.path, "rb")
+            # Read in file order (sequential I/O), return in row order
+            for r in sorted(set(rows), key=self.offsets.__getitem__):
+                self._fh.seek(self.offsets[r])
+                out[r] = orjson.loads(self._fh.readline())
+        return [out[r] for r in rows]
+
+    def event(self, row: int) -> DiagnosticEvent:
+        return DiagnosticEvent(**self.record(row))
+
+    def events(self, rows: Iterable[int]) -> list[DiagnosticEvent]:
+        return [DiagnosticEvent(**rec) for rec in self.records(rows)]
+
+    def close(self) -> None:
+        with self._fh_lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    # -------------------- Materialization (end)
+
+
+class _EventView(Sequence):
+    """Read-only, lazily materialized list of DiagnosticEvents over a SessionIndex."""
+
+    def __init__(self, index: SessionIndex):
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._index.events(range(len(self._index))[item])
+        if item < 0:
+            item += len(self._index)
+        if not 0 <= item < len(self._index):
+            raise IndexError("event index out of range")
+        return self._index.event(item)
+
+    def __iter__(self) -> Iterator[DiagnosticEvent]:
+        n = len(self._index)
+        for lo in range(0, n, 1024):
+            yield from self._index.events(range(lo, min(lo + 1024, n)))
+
+
 class SessionReplay:
     """
     Replay and analyze diagnostic event sessions.
 
     Loads event dumps and provides playback, analysis, and forensic capabilities.
+    Queries run against a SessionIndex; `events` is a lazy view that only
+    builds DiagnosticEvent objects for the rows actually accessed.
     """
 
     def __init__(self):
-        self.events: list[DiagnosticEvent] = []
+        self.index = SessionIndex()
         self.metadata: dict[str, Any] = {}
         self.session_start: Optional[str] = None
         self.session_end: Optional[str] = None
 
+    @property
+    def events(self) -> _EventView:
+        return _EventView(self.index)
+
     @classmethod
     def from_file(cls, filepath: str) -> "SessionReplay":
         """
         Load session from diagnostic dump file.
 
         Args:
-            filepath: Path to JSON dump file
+            filepath: Path to JSONL or JSON dump file
 
         Returns:
             SessionReplay instance
@@ -114,44 +393,103 @@ class SessionReplay:
         return replay
 
     def load_from_file(self, filepath: str):
-        """Load session data from file"""
+        """Load session data from file (JSONL is streamed, JSON is loaded whole)"""
         try:
             path = Path(filepath)
             if not path.exists():
                 raise FileNotFoundError(f"Dump file not found: {filepath}")
 
-            with open(path) as f:
-                data = json.load(f)
-
-            self.load_from_dict(data)
-            logger.info(f"Loaded session with {len(self.events)} events from {filepath}")
+            if self._is_jsonl(path):
+                self.load_from_jsonl(path)
+            else:
+                with open(path) as f:
+                    data = json.load(f)
+                self.load_from_dict(data)
+            logger.info(f"Loaded session with {len(self.index)} events from {filepath}")
 
         except Exception as e:
             logger.error(f"Failed to load session from {filepath}: {e}")
             raise
 
+    @staticmethod
+    def _is_jsonl(path: Path) -> bool:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            return True
+        with open(path, "rb") as f:
+            first = f.readline()
+        try:
+            head = orjson.loads(first)
+        except orjson.JSONDecodeError:
+            return False  # multi-line (indented) JSON document
+        return isinstance(head, dict) and ("_meta" in head or "timestamp" in head) and "events" not in head
+
+    def load_from_jsonl(self, filepath: Union[str, Path]) -> None:
+        """
+        Stream a JSONL dump into the index.
+
+        Only the index columns are kept in memory; event lines are re-read by
+        byte offset when a query materializes them. A truncated last line (dump
+        still being written, or a crash) is skipped.
+        """
+        path = Path(filepath)
+        self.close()
+        index = SessionIndex(path)
+        self.metadata = {"statistics": {}, "markers": {}}
+        self.session_start = self.session_end = None
+
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                line_offset = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    index.skipped += 1
+                    continue
+                meta = record.get("_meta") if isinstance(record, dict) else None
+                if meta == "session":
+                    self.session_start = record.get("session_start")
+                elif meta == "summary":
+                    self.session_end = record.get("session_end")
+                    self.metadata = {
+                        "statistics": record.get("statistics", {}),
+                        "markers": record.get("markers", {}),
+                    }
+                elif isinstance(record, dict):
+                    index.add(record, line_offset)
+                else:
+                    index.skipped += 1
+
+        index.finalize()
+        self.index = index
+        if index.skipped:
+            logger.warning(f"Skipped {index.skipped} malformed records in {path}")
+        logger.debug(f"Indexed {len(index)} events")
+
     def load_from_dict(self, data: dict[str, Any]):
         """Load session data from dictionary"""
         # Extract metadata
+        self.close()
         self.session_start = data.get("session_start")
         self.session_end = data.get("session_end")
         self.metadata = {"statistics": data.get("statistics", {}), "markers": data.get("markers", {})}
 
-        # Parse events
-        events_data = data.get("events", [])
-        self.events = []
-
-        for event_dict in events_data:
-            try:
-                event = DiagnosticEvent(**event_dict)
-                self.events.append(event)
-            except Exception as e:
-                logger.warning(f"Failed to parse event: {e}")
+        # Index events (sorted by timestamp in finalize)
+        index = SessionIndex()
+        for event_dict in data.get("events", []):
+            if not isinstance(event_dict, dict) or not index.add(event_dict):
+                logger.warning(f"Failed to parse event: {event_dict!r:.120}")
+        index.finalize()
+        self.index = index
 
-        # Sort events by timestamp
-        self.events.sort(key=lambda e: e.timestamp)
+        logger.debug(f"Loaded {len(self.index)} events")
 
-        logger.debug(f"Loaded {len(self.events)} events")
+    def close(self) -> None:
+        """Release the dump file handle (JSONL sessions)."""
+        self.index.close()
 
     def playback(
         self,
@@ -169,39 +507,34 @@ class SessionReplay:
             filter_level: Optional level filter
             callback: Optional callback for each event
         """
-        if not self.events:
+        index = self.index
+        if not len(index):
             logger.warning("No events to playback")
             return
 
         logger.info(f"Starting playback at {speed}x speed")
         start_time = time.time()
 
-        # Get first event timestamp as reference
-        first_timestamp = self._parse_timestamp(self.events[0].timestamp)
+        # First event timestamp is the reference
+        first_timestamp = index.ts[0]
+        rows = list(index.rows(filter_category, filter_level))
 
-        for event in self.events:
-            # Apply filters
-            if filter_category and event.category != filter_category:
-                continue
-            if filter_level and event.level != filter_level:
-                continue
+        for lo in range(0, len(rows), 256):
+            chunk = rows[lo : lo + 256]
+            for row, event in zip(chunk, index.events(chunk)):
+                # Calculate delay for real-time playback
+                target_playback_time = (index.ts[row] - first_timestamp) / speed
+                delay = target_playback_time - (time.time() - start_time)
 
-            # Calculate delay for real-time playback
-            event_timestamp = self._parse_timestamp(event.timestamp)
-            elapsed_in_session = (event_timestamp - first_timestamp).total_seconds()
-            target_playback_time = elapsed_in_session / speed
-            actual_elapsed = time.time() - start_time
+                # Sleep if we're ahead of schedule
+                if delay > 0:
+                    time.sleep(delay)
 
-            # Sleep if we're ahead of schedule
-            delay = target_playback_time - actual_elapsed
-            if delay > 0:
-                time.sleep(delay)
-
-            # Execute callback
-            if callback:
-                callback(event)
-            else:
-                self._default_playback_output(event)
+                # Execute callback
+                if callback:
+                    callback(event)
+                else:
+                    self._default_playback_output(event)
 
         logger.info("Playback complete")
 
@@ -216,7 +549,9 @@ class SessionReplay:
         Returns:
             SessionAnalysis with comprehensive session statistics
         """
-        if not self.events:
+        index = self.index
+        total_events = len(index)
+        if not total_events:
             return SessionAnalysis(
                 total_events=0,
                 duration_sec=0.0,
@@ -230,62 +565,35 @@ class SessionReplay:
                 timeline_summary=[],
             )
 
-        # Basic counts
-        total_events = len(self.events)
-        categories = defaultdict(int)
-        levels = defaultdict(int)
-        error_count = 0
-        fatal_count = 0
-
-        for event in self.events:
-            categories[event.category] += 1
-            levels[event.level] += 1
-
-            if event.level == "error":
-                error_count += 1
-            elif event.level == "fatal":
-                fatal_count += 1
-                error_count += 1
+        # Basic counts straight from the posting lists
+        categories = {index.categories.values[i]: len(rows) for i, rows in index.by_category.items()}
+        levels = {index.levels.values[i]: len(rows) for i, rows in index.by_level.items()}
+        fatal_count = levels.get("fatal", 0)
+        error_count = levels.get("error", 0) + fatal_count
 
         # Calculate duration
-        first_time = self._parse_timestamp(self.events[0].timestamp)
-        last_time = self._parse_timestamp(self.events[-1].timestamp)
-        duration_sec = (last_time - first_time).total_seconds()
+        duration_sec = index.ts[-1] - index.ts[0]
         events_per_second = total_events / duration_sec if duration_sec > 0 else 0
 
         # Error rate
         error_rate = error_count / total_events if total_events > 0 else 0
 
-        # Performance stats
-        perf_stats = self._analyze_performance()
-
-        # Detect patterns
-        patterns = self._detect_patterns()
-
-        # Timeline summary (events per minute)
-        timeline = self._create_timeline_summary()
-
         return SessionAnalysis(
             total_events=total_events,
             duration_sec=duration_sec,
             events_per_second=events_per_second,
             error_rate=error_rate,
             fatal_count=fatal_count,
-            categories=dict(categories),
-            levels=dict(levels),
-            patterns=patterns,
-            performance_stats=perf_stats,
-            timeline_summary=timeline,
+            categories=categories,
+            levels=levels,
+            patterns=self._detect_patterns(),
+            performance_stats=self._analyze_performance(),
+            timeline_summary=self._create_timeline_summary(),
         )
 
     def _analyze_performance(self) -> dict[str, Any]:
         """Analyze performance-related events"""
-        perf_events = [e for e in self.events if e.category == "perf" or e.elapsed_ms is not None]
-
-        if not perf_events:
-            return {}
-
-        elapsed_times = [e.elapsed_ms for e in perf_events if e.elapsed_ms is not None]
+        elapsed_times = [v for v in self.index.elapsed if v == v]  # drop NaN (no elapsed_ms)
 
         if not elapsed_times:
             return {}
@@ -309,82 +617,91 @@ class SessionReplay:
 
     def _detect_patterns(self) -> list[EventPattern]:
         """Detect common patterns in events"""
+        index = self.index
         patterns = []
 
         # Pattern 1: Repeated errors
-        error_sequences = self._find_error_sequences()
-        if error_sequences:
+        error_runs = self._find_error_runs()
+        if error_runs:
             patterns.append(
                 EventPattern(
                     pattern_type="repeated_errors",
-                    description=f"Found {len(error_sequences)} sequences of repeated errors",
-                    occurrences=len(error_sequences),
-                    example_events=[seq[0].to_dict() for seq in error_sequences[:3]],
+                    description=f"Found {len(error_runs)} sequences of repeated errors",
+                    occurrences=len(error_runs),
+                    example_events=index.records(lo for lo, _ in error_runs[:3]),
                     severity="error",
                 )
             )
 
-        # Pattern 2: Retry patterns
-        retry_events = [e for e in self.events if "retry" in e.message.lower() or "attempt" in e.message.lower()]
-        if retry_events:
+        # Pattern 2: Retry patterns (matched once per distinct message)
+        retry_ids = {i for i, text in enumerate(index.messages.values) if "retry" in text.lower() or "attempt" in text.lower()}
+        retry_count = sum(len(index.by_message[i]) for i in retry_ids)
+        if retry_count:
+            examples = self._first_rows(lambda row: index.message_ids[row] in retry_ids)
             patterns.append(
                 EventPattern(
                     pattern_type="retry_attempts",
-                    description=f"Detected {len(retry_events)} retry attempts",
-                    occurrences=len(retry_events),
-                    example_events=[e.to_dict() for e in retry_events[:3]],
+                    description=f"Detected {retry_count} retry attempts",
+                    occurrences=retry_count,
+                    example_events=index.records(examples),
                     severity="warn",
                 )
             )
 
         # Pattern 3: Performance degradation
-        perf_issues = [e for e in self.events if e.elapsed_ms and e.elapsed_ms > 1000]
-        if perf_issues:
+        slow_count = sum(1 for v in index.elapsed if v > 1000)
+        if slow_count:
+            examples = self._first_rows(lambda row: index.elapsed[row] > 1000)
             patterns.append(
                 EventPattern(
                     pattern_type="slow_operations",
-                    description=f"Found {len(perf_issues)} operations exceeding 1 second",
-                    occurrences=len(perf_issues),
-                    example_events=[e.to_dict() for e in perf_issues[:3]],
+                    description=f"Found {slow_count} operations exceeding 1 second",
+                    occurrences=slow_count,
+                    example_events=index.records(examples),
                     severity="warn",
                 )
             )
 
         return patterns
 
-    def _find_error_sequences(self) -> list[list[DiagnosticEvent]]:
-        """Find sequences of consecutive errors"""
-        sequences = []
-        current_sequence = []
-
-        for event in self.events:
-            if event.level in ["error", "fatal"]:
-                current_sequence.append(event)
+    def _first_rows(self, predicate: Callable[[int], bool], limit: int = 3) -> list[int]:
+        out = []
+        for row in range(len(self.index)):
+            if predicate(row):
+                out.append(row)
+                if len(out) == limit:
+                    break
+        return out
+
+    def _find_error_runs(self, min_length: int = 3) -> list[tuple[int, int]]:
+        """[lo, hi) row ranges of at least min_length consecutive error/fatal events"""
+        error_ids = {self.index.levels.get(name) for name in _ERROR_LEVELS} - {None}
+        runs = []
+        run_start = None
+
+        for row, level_id in enumerate(self.index.level_ids):
+            if level_id in error_ids:
+                if run_start is None:
+                    run_start = row
             else:
-                if len(current_sequence) >= 3:  # Min 3 consecutive errors
-                    sequences.append(current_sequence)
-                current_sequence = []
+                if run_start is not None and row - run_start >= min_length:
+                    runs.append((run_start, row))
+                run_start = None
 
-        if len(current_sequence) >= 3:
-            sequences.append(current_sequence)
+        end = len(self.index)
+        if run_start is not None and end - run_start >= min_length:
+            runs.append((run_start, end))
 
-        return sequences
+        return runs
 
     def _create_timeline_summary(self, bucket_size_sec: int = 60) -> list[tuple[str, int]]:
         """Create timeline summary with event counts per time bucket"""
-        if not self.events:
-            return []
+        return [(f"{int(b)}s", count) for b, count in self.index.bucket_counts(bucket_size_sec)]
 
-        timeline = defaultdict(int)
-        first_time = self._parse_timestamp(self.events[0].timestamp)
-
-        for event in self.events:
-            event_time = self._parse_timestamp(event.timestamp)
-            elapsed = (event_time - first_time).total_seconds()
-            bucket = int(elapsed // bucket_size_sec) * bucket_size_sec
-            timeline[bucket] += 1
-
-        return sorted([(f"{b}s", count) for b, count in timeline.items()])
+    def count_between(self, start: TimeBound = None, end: TimeBound = None) -> int:
+        """Number of events with start <= timestamp <= end (bisect, no scan)."""
+        lo, hi = self.index.row_range(_to_epoch(start) if start is not None else None, _to_epoch(end) if end is not None else None)
+        return hi - lo
 
     def search(
         self,
@@ -393,44 +710,57 @@ class SessionReplay:
         level: Optional[str] = None,
         context_key: Optional[str] = None,
         context_value: Optional[Any] = None,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        limit: Optional[int] = None,
     ) -> list[DiagnosticEvent]:
         """
         Search for events matching criteria.
 
+        Category, level and time range come from the index; the regex is run
+        once per distinct message; only context filters read event records.
+
         Args:
             pattern: Regex pattern to match against message
             category: Category filter
             level: Level filter
             context_key: Context key to check
             context_value: Context value to match
+            start: Earliest timestamp (epoch seconds, ISO string or datetime)
+            end: Latest timestamp (inclusive)
+            limit: Maximum number of results (earliest first)
 
         Returns:
             List of matching events
         """
-        results = []
-        pattern_re = re.compile(pattern, re.IGNORECASE) if pattern else None
-
-        for event in self.events:
-            # Category filter
-            if category and event.category != category:
-                continue
-
-            # Level filter
-            if level and event.level != level:
-                continue
+        index = self.index
+        matched = index.message_ids_matching(re.compile(pattern, re.IGNORECASE)) if pattern else None
+        rows: Iterable[int] = index.rows(
+            category,
+            level,
+            _to_epoch(start) if start is not None else None,
+            _to_epoch(end) if end is not None else None,
+            message_ids=matched,
+        )
 
-            # Pattern filter
-            if pattern_re and not pattern_re.search(event.message):
-                continue
+        # Context filters (need the full record)
+        if context_key is None:
+            rows = list(rows)[:limit] if limit is not None else list(rows)
+            return index.events(rows)
 
-            # Context filters
-            if context_key is not None:
-                if context_key not in event.context:
+        results = []
+        rows = list(rows)
+        for lo in range(0, len(rows), 1024):
+            chunk = rows[lo : lo + 1024]
+            for record in index.records(chunk):
+                context = record.get("context") or {}
+                if context_key not in context:
                     continue
-                if context_value is not None and event.context[context_key] != context_value:
+                if context_value is not None and context[context_key] != context_value:
                     continue
-
-            results.append(event)
+                results.append(DiagnosticEvent(**record))
+                if limit is not None and len(results) >= limit:
+                    return results
 
         return results
 
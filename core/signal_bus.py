@@ -14,16 +14,28 @@ Benefits:
 - Decoupled (panels don't need references to each other)
 - Testable (signals can be mocked with pytest-qt)
 - Single source of truth for all application events
+
+Per-slot cost attribution: with SIGNAL_PROFILING_ENABLED (or
+enable_profiling()) every signal records emits, fan-out and per-slot
+execution time; see core/signal_profiler.py and SignalBus.profiler.
+
+Priority lanes: with BUS_LANES_ENABLED (default) balance/display signals are
+coalesced per frame and analytics signals run in idle time, so they never
+delay orders and positions; see core/bus_lanes.py and SignalBus.lanes.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from PyQt6 import QtCore
 
 import structlog
 
+if TYPE_CHECKING:
+    from core.bus_lanes import BusLaneScheduler
+    from core.signal_profiler import SignalProfiler
+
 log = structlog.get_logger(__name__)
 
 
@@ -39,8 +51,8 @@ class SignalBus(QtCore.QObject):
     # ACCOUNT EVENTS
     # ========================================================================
 
-    #: TradeAccount response from DTC (full dict)
-    tradeAccountReceived = QtCore.pyqtSignal(dict)
+    #: TradeAccount response from DTC (domain.events.TradeAccountEvent)
+    tradeAccountReceived = QtCore.pyqtSignal(object)
 
     #: Balance updated (balance, account)
     balanceUpdated = QtCore.pyqtSignal(float, str)
@@ -58,8 +70,8 @@ class SignalBus(QtCore.QObject):
     #: Position opened - emits Position domain object
     positionOpened = QtCore.pyqtSignal(object)
 
-    #: Position update from DTC (dict with position fields)
-    positionUpdated = QtCore.pyqtSignal(dict)
+    #: Position update from DTC (domain.events.PositionUpdateEvent)
+    positionUpdated = QtCore.pyqtSignal(object)
 
     #: Position closed - emits trade record dict (OUTCOME event from service)
     positionClosed = QtCore.pyqtSignal(dict)
@@ -78,8 +90,8 @@ class SignalBus(QtCore.QObject):
     #: Order fill received from DTC
     orderFillReceived = QtCore.pyqtSignal(dict)
 
-    #: Order status update from DTC
-    orderUpdateReceived = QtCore.pyqtSignal(dict)
+    #: Order status update / fill from DTC (domain.events.OrderUpdateEvent)
+    orderUpdateReceived = QtCore.pyqtSignal(object)
 
     #: Order submission requested
     orderSubmitRequested = QtCore.pyqtSignal(dict)  # order params
@@ -103,7 +115,7 @@ class SignalBus(QtCore.QObject):
     #: DTC session ready for requests
     dtcSessionReady = QtCore.pyqtSignal()
 
-    #: Heartbeat received (timestamp)
+    #: Heartbeat received (DTC request-to-first-response latency in ms, -1.0 until measured)
     dtcHeartbeat = QtCore.pyqtSignal(float)
 
     # ========================================================================
@@ -168,6 +180,9 @@ class SignalBus(QtCore.QObject):
     #: Metrics reload requested
     metricsReloadRequested = QtCore.pyqtSignal(str)  # timeframe
 
+    #: Stats computed off the UI thread by StatsPrecomputeWorker
+    statsPrecomputed = QtCore.pyqtSignal(dict)  # {"mode", "account", "timeframe", "payload"}
+
     #: Snapshot analysis requested
     snapshotAnalysisRequested = QtCore.pyqtSignal()
 
@@ -181,10 +196,52 @@ class SignalBus(QtCore.QObject):
     #: VWAP updated on chart
     vwapUpdated = QtCore.pyqtSignal(str, float)  # symbol, vwap
 
-    def __init__(self):
+    def __init__(self, profile: Optional[bool] = None, lanes: Optional[bool] = None):
         super().__init__()
+        #: Slot cost attribution (None unless profiling is enabled)
+        self.profiler: Optional[SignalProfiler] = None
+        #: Priority lane scheduler (None when every signal is delivered immediately)
+        self.lanes: Optional[BusLaneScheduler] = None
+        from config.settings import BUS_LANES_ENABLED, SIGNAL_PROFILING_ENABLED
+
+        if SIGNAL_PROFILING_ENABLED if profile is None else profile:
+            self.enable_profiling()
+        if BUS_LANES_ENABLED if lanes is None else lanes:
+            self.enable_lanes()
         log.info("signal_bus.initialized", msg="SignalBus created")
 
+    def enable_profiling(self) -> SignalProfiler:
+        """
+        Record emits, fan-out and per-slot execution time for every signal.
+
+        Only connections made after this call are timed, so the global bus
+        enables it at construction. Off by default: the signals stay plain
+        pyqtBoundSignals with no wrapper in the emit path.
+        """
+        if self.profiler is None:
+            from core.signal_profiler import SignalProfiler
+
+            self.profiler = SignalProfiler()
+            self.profiler.instrument(self)
+            if self.lanes is not None:
+                self.lanes.install(self)  # lanes stay outermost
+            log.info("signal_bus.profiling_enabled", msg="Per-slot cost attribution on")
+        return self.profiler
+
+    def enable_lanes(self) -> BusLaneScheduler:
+        """
+        Route normal/background signals through priority lanes.
+
+        The scheduler lives in the bus's thread (the GUI thread for the
+        global bus); critical signals are left untouched.
+        """
+        if self.lanes is None:
+            from core.bus_lanes import BusLaneScheduler
+
+            self.lanes = BusLaneScheduler(parent=self)
+            self.lanes.install(self)
+        return self.lanes
+
     def emit_safe(self, signal: QtCore.pyqtSignal, *args, **kwargs):
         """
         Emit a signal with error handling.
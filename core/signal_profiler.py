@@ -0,0 +1,338 @@
+"""
+core/signal_profiler.py
+
+Per-signal, per-slot cost attribution for the SignalBus.
+
+When a balance or order burst stalls the UI, the question is which
+subscriber of positionUpdated / orderUpdateReceived / balanceUpdated is
+slow. With profiling on, every SignalBus signal attribute is shadowed by a
+ProfiledSignal proxy: connect() wraps the slot in a timing probe, emit()
+counts emits and fan-out (connected slots at emit time). Each
+(signal, slot) pair gets a call count and a latency histogram
+(core/metrics.LatencyHistogram), so report() can rank subscribers by
+cumulative, mean, p99 or max execution time.
+
+Opt-in (SIGNAL_PROFILING_ENABLED, defaults to DEBUG_PERF). When off nothing
+is installed: the bus's signals are the plain pyqtBoundSignals, so emits and
+connects cost exactly what they did before.
+
+Only connections made after profiling is enabled are attributed (the
+probe is installed at connect time); get_signal_bus() enables it at
+construction, before any panel subscribes.
+
+Thread affinity is preserved: a slot that is a bound method of a QObject is
+called through a probe QObject living in (and parented to) the receiver, so
+queued delivery and auto-disconnect on receiver deletion work as before.
+
+Usage:
+    bus = get_signal_bus()               # SIGNAL_PROFILING_ENABLED=1
+    ...
+    bus.profiler.report(sort_by="p99_ms", limit=10)
+    print(bus.profiler.format_report())
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Optional
+import weakref
+
+from PyQt6 import QtCore
+
+from core.metrics import LatencyHistogram
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+#: Columns report() can sort by
+REPORT_SORT_KEYS = ("total_ms", "mean_ms", "p99_ms", "max_ms", "calls", "emits", "fan_out")
+
+
+# =============================================================================
+# SLOT PROBES
+# =============================================================================
+
+
+def slot_name(slot: Any) -> str:
+    """Readable name for a connected callable (module.qualname)."""
+    if isinstance(slot, functools.partial):
+        return f"partial({slot_name(slot.func)})"
+    func = getattr(slot, "__func__", slot)
+    qualname = getattr(func, "__qualname__", None) or type(slot).__qualname__
+    module = getattr(func, "__module__", None)
+    return f"{module}.{qualname}" if module else qualname
+
+
+def _arity(slot: Callable) -> Optional[int]:
+    """Positional arguments the slot accepts (None = any), like PyQt's own slot matching."""
+    try:
+        params = inspect.signature(slot).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    count = 0
+    for param in params:
+        if param.kind == param.VAR_POSITIONAL:
+            return None
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            count += 1
+    return count
+
+
+class _SlotProbe(QtCore.QObject):
+    """Carries a wrapped bound-method slot in the receiver's thread (and lifetime)."""
+
+    def __init__(self, call: Callable[..., None]):
+        super().__init__()
+        self._call = call
+
+    def invoke(self, *args: Any) -> None:
+        self._call(*args)
+
+
+class _Connection:
+    __slots__ = ("slot", "stats", "wrapper", "handle", "probe")
+
+    def __init__(self, slot: Any, stats: LatencyHistogram):
+        self.slot = slot  # the callable, or a WeakMethod for bound methods
+        self.stats = stats
+        self.wrapper: Any = None
+        self.handle: Any = None
+        self.probe: Optional[_SlotProbe] = None
+
+    def matches(self, slot: Any) -> bool:
+        if self.handle is slot:
+            return True
+        own = self.slot() if isinstance(self.slot, weakref.WeakMethod) else self.slot
+        return own is not None and own == slot
+
+
+# =============================================================================
+# PROFILED SIGNAL
+# =============================================================================
+
+
+class ProfiledSignal:
+    """
+    Stand-in for one pyqtBoundSignal on a profiled SignalBus.
+
+    connect/disconnect/emit keep the pyqtBoundSignal signatures; anything
+    else (signal, __getitem__ overloads) is delegated to the bound signal.
+    """
+
+    def __init__(self, name: str, bound: Any, profiler: SignalProfiler):
+        self._name = name
+        self._bound = bound
+        self._profiler = profiler
+        self._connections: list[_Connection] = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._bound, attr)
+
+    def __call__(self, *args: Any) -> None:
+        self.emit(*args)
+
+    # -------------------------------------------------------------------------
+
+    def emit(self, *args: Any) -> None:
+        self._profiler._record_emit(self._name, len(self._connections))
+        self._bound.emit(*args)
+
+    def connect(self, slot: Any, *args: Any, **kwargs: Any) -> Any:
+        # Signal-to-signal forwarding keeps its native connection (not a slot)
+        if isinstance(slot, (QtCore.pyqtBoundSignal, ProfiledSignal)):
+            target = slot._bound if isinstance(slot, ProfiledSignal) else slot
+            return self._bound.connect(target, *args, **kwargs)
+
+        # Mirror PyQt: bound-method receivers are held weakly, other callables strongly
+        held: Any = weakref.WeakMethod(slot) if inspect.ismethod(slot) else slot
+        conn = _Connection(held, self._profiler._stats_for(self._name, slot_name(slot)))
+        call = self._timed(held, _arity(slot), conn.stats)
+        receiver = getattr(slot, "__self__", None)
+        if isinstance(receiver, QtCore.QObject):
+            probe = _SlotProbe(call)
+            probe.moveToThread(receiver.thread())
+            probe.setParent(receiver)
+            probe.destroyed.connect(functools.partial(self._forget, conn))
+            conn.probe, conn.wrapper = probe, probe.invoke
+        else:
+            conn.wrapper = call
+
+        conn.handle = self._bound.connect(conn.wrapper, *args, **kwargs)
+        with self._lock:
+            self._connections.append(conn)
+        return conn.handle
+
+    def disconnect(self, slot: Any = None) -> None:
+        if slot is None:
+            with self._lock:
+                self._connections.clear()
+            self._bound.disconnect()
+            return
+        if isinstance(slot, (QtCore.pyqtBoundSignal, ProfiledSignal)):
+            self._bound.disconnect(slot._bound if isinstance(slot, ProfiledSignal) else slot)
+            return
+
+        with self._lock:
+            match = next(
+                (c for c in self._connections if c.matches(slot)),
+                None,
+            )
+            if match is not None:
+                self._connections.remove(match)
+        if match is None:
+            raise TypeError(f"{slot_name(slot)} is not connected to {self._name}")
+        self._bound.disconnect(match.handle)
+        if match.probe is not None:
+            match.probe.setParent(None)
+            match.probe.deleteLater()
+
+    def _forget(self, conn: _Connection, *_: Any) -> None:
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+
+    # -------------------------------------------------------------------------
+
+    def _timed(self, held: Any, arity: Optional[int], stats: LatencyHistogram) -> Callable[..., None]:
+        record = self._profiler._record_call
+        resolve = held if isinstance(held, weakref.WeakMethod) else (lambda: held)
+
+        def call(*args: Any) -> None:
+            target = resolve()
+            if target is None:
+                return
+            started = time.perf_counter_ns()
+            try:
+                target(*(args if arity is None else args[:arity]))
+            finally:
+                record(stats, time.perf_counter_ns() - started)
+
+        return call
+
+
+# =============================================================================
+# PROFILER
+# =============================================================================
+
+
+class SignalProfiler:
+    """
+    Emit counts, fan-out and slot execution times for one SignalBus.
+
+    Thread Safety:
+    - Slots run on the GUI thread and on worker threads; one lock guards the
+      counters and histograms (held only for the update)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._emits: dict[str, int] = {}
+        self._max_fan_out: dict[str, int] = {}
+        self._slots: dict[tuple[str, str], LatencyHistogram] = {}
+        self._started_at = time.time()
+
+    # =========================================================================
+    # INSTRUMENTATION
+    # =========================================================================
+
+    def instrument(self, bus: QtCore.QObject) -> None:
+        """Shadow every pyqtSignal of the bus with a ProfiledSignal."""
+        for cls in reversed(type(bus).__mro__):
+            for name, attr in vars(cls).items():
+                if isinstance(attr, QtCore.pyqtSignal):
+                    setattr(bus, name, ProfiledSignal(name, getattr(cls, name).__get__(bus, type(bus)), self))
+
+    def _stats_for(self, signal: str, slot: str) -> LatencyHistogram:
+        with self._lock:
+            hist = self._slots.get((signal, slot))
+            if hist is None:
+                hist = self._slots[(signal, slot)] = LatencyHistogram()
+            return hist
+
+    def _record_emit(self, signal: str, fan_out: int) -> None:
+        with self._lock:
+            self._emits[signal] = self._emits.get(signal, 0) + 1
+            if fan_out > self._max_fan_out.get(signal, 0):
+                self._max_fan_out[signal] = fan_out
+
+    def _record_call(self, stats: LatencyHistogram, elapsed_ns: int) -> None:
+        with self._lock:
+            stats.record_us(elapsed_ns // 1000)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._emits.clear()
+            self._max_fan_out.clear()
+            for hist in self._slots.values():
+                hist.__init__()  # connections hold these histograms: clear in place
+            self._started_at = time.time()
+
+    # =========================================================================
+    # REPORT
+    # =========================================================================
+
+    def report(self, sort_by: str = "total_ms", limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        One row per (signal, slot) that ran, most expensive first.
+
+        Rows: signal, slot, emits, fan_out (max connected slots at emit),
+        calls, total_ms, mean_ms, p99_ms, max_ms.
+        """
+        if sort_by not in REPORT_SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {REPORT_SORT_KEYS}, got {sort_by!r}")
+        with self._lock:
+            rows = [
+                {
+                    "signal": signal,
+                    "slot": slot,
+                    "emits": self._emits.get(signal, 0),
+                    "fan_out": self._max_fan_out.get(signal, 0),
+                    "calls": hist.count,
+                    "total_ms": hist.total_us / 1000.0,
+                    "mean_ms": hist.mean_us() / 1000.0,
+                    "p99_ms": hist.percentile_us(99.0) / 1000.0,
+                    "max_ms": hist.max_us / 1000.0,
+                }
+                for (signal, slot), hist in self._slots.items()
+                if hist.count
+            ]
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[:limit] if limit is not None else rows
+
+    def signal_counts(self) -> dict[str, dict[str, int]]:
+        """Per-signal emit count and max fan-out (signals that were emitted)."""
+        with self._lock:
+            return {
+                name: {"emits": count, "fan_out": self._max_fan_out.get(name, 0)}
+                for name, count in sorted(self._emits.items())
+            }
+
+    def format_report(self, sort_by: str = "total_ms", limit: Optional[int] = 20) -> str:
+        """Fixed-width text table of report() for logs and the console."""
+        lines = [
+            f"{'signal':<24} {'slot':<56} {'emits':>7} {'fan':>4} {'calls':>7} "
+            f"{'total ms':>9} {'mean ms':>8} {'p99 ms':>8} {'max ms':>8}"
+        ]
+        for row in self.report(sort_by, limit):
+            lines.append(
+                f"{row['signal']:<24} {row['slot'][-56:]:<56} {row['emits']:>7} {row['fan_out']:>4} "
+                f"{row['calls']:>7} {row['total_ms']:>9.2f} {row['mean_ms']:>8.3f} "
+                f"{row['p99_ms']:>8.3f} {row['max_ms']:>8.3f}"
+            )
+        return "\n".join(lines)
+
+    def summary(self, limit: int = 10) -> dict[str, Any]:
+        """JSON-ready session summary (top slots by cumulative time)."""
+        return {
+            "uptime_s": round(time.time() - self._started_at, 3),
+            "signals": self.signal_counts(),
+            "top_slots": [
+                {k: round(v, 4) if isinstance(v, float) else v for k, v in row.items()}
+                for row in self.report("total_ms", limit)
+            ],
+        }
@@ -22,6 +22,9 @@ FORBIDDEN USAGE:
   - Runtime balance writes (use TradeManager.record_closed_trade() instead)
   - Hotkey reset (use StateManager.reset_sim_balance_to_10k() instead)
 
+In-memory balances are held by services.unified_balance_manager (the same
+store the runtime SIM ledger uses); this module only adds the JSON file layer.
+
 This module will be removed entirely in a future cleanup once all references
 are verified to be offline-only.
 ================================================================================
@@ -52,11 +55,16 @@ class SimBalanceManager:
     """
 
     def __init__(self):
-        # Account-scoped balances: {account: balance}
-        self._balances: dict[str, float] = {}
-        # Track which accounts have been initialized
+        # Track which accounts have been loaded from disk
+        # (balances themselves live in UnifiedBalanceManager)
         self._initialized_accounts: set[str] = set()
 
+    @staticmethod
+    def _store():
+        from services.unified_balance_manager import get_balance_manager
+
+        return get_balance_manager()
+
     def _get_balance_file(self, account: str) -> Path:
         """Get account-scoped balance file path."""
         # Sanitize account for filename
@@ -121,12 +129,12 @@ class SimBalanceManager:
         Example:
             balance = manager.get_balance("Sim1")
         """
-        if account not in self._balances:
+        if account not in self._initialized_accounts:
             # Load from disk
-            self._balances[account] = self._load(account)
+            self._store().set_balance("SIM", account, self._load(account))
             self._initialized_accounts.add(account)
 
-        return self._balances[account]
+        return self._store().get_balance("SIM", account)
 
     def set_balance(self, account: str, balance: float) -> None:
         """
@@ -139,7 +147,8 @@ class SimBalanceManager:
         Example:
             manager.set_balance("Sim1", 12000.0)
         """
-        self._balances[account] = float(balance)
+        self._store().set_balance("SIM", account, float(balance))
+        self._initialized_accounts.add(account)
         self._save(account, balance)
         log.debug(f"[SIM] Balance updated for {account}: ${balance:,.2f}")
 
@@ -0,0 +1,351 @@
+"""
+core/stall_detector.py
+
+UI event-loop stall detector.
+
+A watchdog thread posts a heartbeat into the Qt event loop every
+STALL_HEARTBEAT_MS and waits for the GUI thread to run it. The delay between
+posting and running is the event-loop lag. When a heartbeat is still pending
+after STALL_THRESHOLD_MS the watchdog grabs the GUI thread's stack *while it
+is stuck* (sys._current_frames), so the stall is attributed to the code that
+was actually running (a synchronous stats query, a DB commit, a replot).
+
+When the late heartbeat finally runs, the stall is recorded:
+- DiagnosticsHub event (category "perf", level "warn", event_type "UIStall")
+  with duration, call site (file/line/function) and the captured stack
+- "ui.stall" latency histogram in core/metrics.py (when metrics are enabled)
+- the sampling profiler's samples for the stall window, if it is running
+- stallDetected signal (dict) for live UI
+
+summary() aggregates the session (count, total/max duration, worst stalls,
+top call sites); MainWindow logs it and emits a "UIStallSummary" event at
+shutdown.
+
+Usage:
+    from core.stall_detector import get_stall_detector
+
+    detector = get_stall_detector()   # create on the GUI thread
+    detector.start()
+    ...
+    detector.stop()
+    detector.summary()
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Optional
+
+from PyQt6 import QtCore
+
+from config.settings import STALL_HEARTBEAT_MS, STALL_THRESHOLD_MS
+from core import metrics
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+#: Stalls kept individually (aggregates cover the whole session)
+MAX_RECORDED_STALLS = 200
+
+#: Frames kept per captured stack (innermost side)
+MAX_STACK_DEPTH = 64
+
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+
+
+@dataclass
+class UIStall:
+    started_at: str  # ISO timestamp (UTC) of the heartbeat post
+    duration_ms: float
+    call_site: str  # "path:line in function" (innermost app frame)
+    function: str
+    stack: str
+
+
+def _call_site(stack: traceback.StackSummary) -> Optional[traceback.FrameSummary]:
+    """Innermost frame from this repo (library frames are skipped), else the innermost frame."""
+    for frame in reversed(stack):
+        if frame.filename.startswith(_REPO_ROOT) and not frame.filename.endswith("stall_detector.py"):
+            return frame
+    return stack[-1] if stack else None
+
+
+def _relative(path: str) -> str:
+    return path[len(_REPO_ROOT) + 1 :] if path.startswith(_REPO_ROOT) else path
+
+
+class StallDetector(QtCore.QObject):
+    """
+    Heartbeat watchdog for the GUI thread.
+
+    Thread Safety:
+    - Must be created on the GUI thread (the heartbeat slot runs there)
+    - The watchdog thread and the slot share _posted_at/_stall_stack under _lock
+    """
+
+    #: Emitted on the GUI thread for every recorded stall (UIStall as dict)
+    stallDetected = QtCore.pyqtSignal(dict)
+
+    # Emitted by the watchdog thread; queued into the GUI thread's event loop
+    _heartbeat = QtCore.pyqtSignal()
+
+    def __init__(
+        self,
+        interval_ms: float = STALL_HEARTBEAT_MS,
+        threshold_ms: float = STALL_THRESHOLD_MS,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self.interval_s = max(0.005, float(interval_ms) / 1000.0)
+        self.threshold_ms = max(1.0, float(threshold_ms))
+        self._gui_ident = threading.get_ident()
+
+        self._lock = threading.Lock()
+        self._posted_at: Optional[float] = None  # perf_counter of the pending heartbeat
+        self._posted_wall: float = 0.0
+        self._stall_stack: Optional[traceback.StackSummary] = None
+
+        self._stalls: deque[UIStall] = deque(maxlen=MAX_RECORDED_STALLS)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._by_site: Counter[str] = Counter()
+        self._site_ms: Counter[str] = Counter()
+        self._started_wall = 0.0
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self._heartbeat.connect(self._on_heartbeat, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._started_wall = self._started_wall or time.time()
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+        log.info(
+            f"[StallDetector] Watching GUI thread (heartbeat {self.interval_s * 1000.0:g} ms, "
+            f"threshold {self.threshold_ms:g} ms)"
+        )
+
+    def stop(self) -> None:
+        thread = self._thread
+        self._thread = None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout=2.0)
+        with self._lock:
+            self._posted_at = None
+            self._stall_stack = None
+
+    # =========================================================================
+    # WATCHDOG THREAD
+    # =========================================================================
+
+    def _watch(self) -> None:
+        threshold_s = self.threshold_ms / 1000.0
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            with self._lock:
+                posted_at = self._posted_at
+                if posted_at is None:
+                    self._posted_at = posted_at = now
+                    self._posted_wall = time.time()
+                    self._stall_stack = None
+                    post, capture = True, False
+                else:
+                    post = False
+                    capture = self._stall_stack is None and now - posted_at >= threshold_s
+
+            if post:
+                self._heartbeat.emit()
+            elif capture:
+                stack = self._capture_gui_stack()
+                with self._lock:
+                    if self._posted_at == posted_at:
+                        self._stall_stack = stack
+
+            # Wake exactly at the threshold while a heartbeat is outstanding
+            with self._lock:
+                waiting = self._posted_at is not None and self._stall_stack is None
+            wait = self.interval_s
+            if waiting:
+                wait = max(0.001, min(wait, posted_at + threshold_s - time.perf_counter()))
+            self._stop.wait(wait)
+
+    def _capture_gui_stack(self) -> traceback.StackSummary:
+        frame = sys._current_frames().get(self._gui_ident)
+        if frame is None:
+            return traceback.StackSummary()
+        try:
+            return traceback.extract_stack(frame, limit=MAX_STACK_DEPTH)
+        finally:
+            del frame
+
+    # =========================================================================
+    # GUI THREAD
+    # =========================================================================
+
+    def _on_heartbeat(self) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            posted_at, posted_wall, stack = self._posted_at, self._posted_wall, self._stall_stack
+            self._posted_at = None
+            self._stall_stack = None
+        if posted_at is None:
+            return
+        metrics.observe("ui.loop_lag", posted_at)
+        lag_ms = (now - posted_at) * 1000.0
+        if lag_ms >= self.threshold_ms:
+            self._record_stall(lag_ms, posted_wall, stack)
+
+    def _record_stall(
+        self,
+        duration_ms: float,
+        started_wall: float,
+        stack: Optional[traceback.StackSummary],
+    ) -> UIStall:
+        site = _call_site(stack) if stack else None
+        if site is not None:
+            call_site = f"{_relative(site.filename)}:{site.lineno} in {site.name}"
+        else:
+            call_site = "unknown (stall ended before capture)"
+        stall = UIStall(
+            started_at=datetime.fromtimestamp(started_wall, UTC).isoformat(),
+            duration_ms=round(duration_ms, 1),
+            call_site=call_site,
+            function=site.name if site is not None else "",
+            stack="".join(stack.format()) if stack else "",
+        )
+
+        self._stalls.append(stall)
+        self._count += 1
+        self._total_ms += duration_ms
+        self._max_ms = max(self._max_ms, duration_ms)
+        self._by_site[call_site] += 1
+        self._site_ms[call_site] += duration_ms
+
+        if metrics.is_enabled():
+            metrics.get_metrics_registry().record_ms("ui.stall", duration_ms)
+        self._emit_diagnostic(stall, site)
+        self._dump_profile_window(started_wall, started_wall + duration_ms / 1000.0)
+        log.warning(f"[StallDetector] UI thread stalled {duration_ms:.0f} ms at {call_site}")
+        self.stallDetected.emit(asdict(stall))
+        return stall
+
+    def _emit_diagnostic(self, stall: UIStall, site: Optional[traceback.FrameSummary]) -> None:
+        try:
+            from core.diagnostics import DiagnosticEvent, DiagnosticsHub
+
+            DiagnosticsHub.get_instance().emit_event(
+                DiagnosticEvent(
+                    timestamp=stall.started_at,
+                    category="perf",
+                    level="warn",
+                    module="core.stall_detector",
+                    event_type="UIStall",
+                    message=f"UI thread stalled {stall.duration_ms:.0f} ms in {stall.function or 'unknown'}",
+                    context={
+                        "duration_ms": stall.duration_ms,
+                        "threshold_ms": self.threshold_ms,
+                        "call_site": stall.call_site,
+                    },
+                    file_path=site.filename if site is not None else None,
+                    line_number=site.lineno if site is not None else None,
+                    function_name=site.name if site is not None else None,
+                    thread_id=self._gui_ident,
+                    thread_name="MainThread",
+                    elapsed_ms=stall.duration_ms,
+                    stack_trace=stall.stack or None,
+                )
+            )
+        except Exception as e:
+            log.debug(f"[StallDetector] Diagnostics emit failed: {e}")
+
+    @staticmethod
+    def _dump_profile_window(start: float, end: float) -> None:
+        """Write the sampling profiler's samples for the stall (off the GUI thread)."""
+        profiler_module = sys.modules.get("core.sampling_profiler")
+        if profiler_module is None:
+            return
+        profiler = profiler_module.get_sampling_profiler()
+        if profiler.running:
+            threading.Thread(
+                target=profiler.dump_window, args=(start, end, "stall"), name="StallProfileDump", daemon=True
+            ).start()
+
+    # =========================================================================
+    # SESSION SUMMARY
+    # =========================================================================
+
+    def stalls(self) -> list[UIStall]:
+        return list(self._stalls)
+
+    def summary(self, top: int = 5) -> dict[str, Any]:
+        """Session stall summary (aggregates cover every stall, not only the retained ones)."""
+        worst = sorted(self._stalls, key=lambda s: s.duration_ms, reverse=True)[:top]
+        return {
+            "session_start": datetime.fromtimestamp(self._started_wall, UTC).isoformat() if self._started_wall else None,
+            "threshold_ms": self.threshold_ms,
+            "stall_count": self._count,
+            "total_stall_ms": round(self._total_ms, 1),
+            "max_stall_ms": round(self._max_ms, 1),
+            "mean_stall_ms": round(self._total_ms / self._count, 1) if self._count else 0.0,
+            "worst": [{"duration_ms": s.duration_ms, "call_site": s.call_site, "started_at": s.started_at} for s in worst],
+            "by_call_site": [
+                {"call_site": site, "count": n, "total_ms": round(self._site_ms[site], 1)}
+                for site, n in self._by_site.most_common(top)
+            ],
+        }
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_stall_instance: Optional[StallDetector] = None
+_stall_lock = threading.Lock()
+
+
+def get_stall_detector() -> StallDetector:
+    """Get the global StallDetector singleton (first call must be on the GUI thread)."""
+    global _stall_instance
+
+    if _stall_instance is None:
+        with _stall_lock:
+            if _stall_instance is None:
+                _stall_instance = StallDetector()
+
+    return _stall_instance
+
+
+def reset_stall_detector() -> None:
+    """
+    Stop and drop the global detector.
+
+    WARNING: Only use in tests.
+    """
+    global _stall_instance
+
+    with _stall_lock:
+        if _stall_instance is not None:
+            _stall_instance.stop()
+        _stall_instance = None
@@ -0,0 +1,205 @@
+"""
+core/startup_stages.py
+
+Staged startup timeline.
+
+Startup is split into a synchronous shell (everything needed to paint the
+window) and deferred stages that run after the first paint, one per
+event-loop turn, so the window stays responsive while the database, DTC
+connection and diagnostics come up.
+
+Every stage is timed against a process-wide origin (the import of this
+module, which main.py does first). tools/startup_profiler.py reads the
+report and checks it against its STARTUP_BUDGET_MS regression budget.
+
+Usage:
+    from core.startup_stages import get_startup_timeline
+
+    timeline = get_startup_timeline()
+    with timeline.stage("window_shell"):
+        win = MainWindow()
+
+    timeline.run_deferred([("database", load_db), ("dtc_connect", init_dtc)])
+
+    timeline.report()
+    # {"stages": [{"name", "start_ms", "ms", "deferred"}, ...],
+    #  "marks": {"first_paint": 412.3}, "deferred_pending": 0}
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+import threading
+import time
+from typing import Any, Optional
+
+from PyQt6 import QtCore
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Process-wide origin: main.py imports this module before anything heavy
+_ORIGIN = time.perf_counter()
+
+
+@dataclass
+class StageTiming:
+    name: str
+    start_ms: float  # since origin
+    ms: float
+    deferred: bool = False
+    error: Optional[str] = None
+
+
+class StartupTimeline(QtCore.QObject):
+    """
+    Records startup stage timings and runs deferred stages.
+
+    Deferred stages run on the GUI thread, each on its own event-loop turn
+    (QTimer.singleShot(0)), so paint and input events are processed between
+    them. A failing stage is logged and recorded; later stages still run.
+
+    Signals:
+    - deferredFinished(dict): report() after the last deferred stage
+    """
+
+    deferredFinished = QtCore.pyqtSignal(dict)
+
+    def __init__(self, origin: Optional[float] = None):
+        super().__init__()
+        self._origin = origin if origin is not None else _ORIGIN
+        self._stages: list[StageTiming] = []
+        self._marks: dict[str, float] = {}
+        self._pending: deque[tuple[str, Callable[[], Any]]] = deque()
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    @contextmanager
+    def stage(self, name: str, deferred: bool = False) -> Iterator[None]:
+        """Time a block as one stage. Exceptions are recorded and re-raised."""
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self._record(name, start, deferred, error)
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (first write wins, e.g. "first_paint")."""
+        self._marks.setdefault(name, self._elapsed_ms(time.perf_counter()))
+
+    # =========================================================================
+    # DEFERRED STAGES
+    # =========================================================================
+
+    def run_deferred(self, stages: Iterable[tuple[str, Callable[[], Any]]]) -> None:
+        """Queue stages to run after the current event-loop turn, in order."""
+        was_idle = not self._pending
+        self._pending.extend(stages)
+        if was_idle and self._pending:
+            QtCore.QTimer.singleShot(0, self._run_next)
+
+    @property
+    def deferred_pending(self) -> int:
+        return len(self._pending)
+
+    def _run_next(self) -> None:
+        if not self._pending:
+            return
+        name, fn = self._pending.popleft()
+        start = time.perf_counter()
+        error = None
+        try:
+            fn()
+        except Exception as e:
+            error = str(e)
+            log.error(f"[Startup] Deferred stage '{name}' failed: {e}")
+        self._record(name, start, True, error)
+
+        if self._pending:
+            QtCore.QTimer.singleShot(0, self._run_next)
+        else:
+            report = self.report()
+            log.info(f"[Startup] Deferred stages complete at {report['total_ms']:.0f} ms")
+            self.deferredFinished.emit(report)
+
+    # =========================================================================
+    # REPORTING
+    # =========================================================================
+
+    def report(self) -> dict[str, Any]:
+        stages = [asdict(s) for s in self._stages]
+        total = max((s.start_ms + s.ms for s in self._stages), default=0.0)
+        return {
+            "stages": stages,
+            "marks": dict(self._marks),
+            "total_ms": round(total, 2),
+            "deferred_pending": len(self._pending),
+        }
+
+    def stage_ms(self, name: str) -> Optional[float]:
+        """Duration of the last stage recorded under name."""
+        for s in reversed(self._stages):
+            if s.name == name:
+                return s.ms
+        return None
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _elapsed_ms(self, t: float) -> float:
+        return round((t - self._origin) * 1000.0, 2)
+
+    def _record(self, name: str, start: float, deferred: bool, error: Optional[str]) -> None:
+        end = time.perf_counter()
+        timing = StageTiming(
+            name=name,
+            start_ms=self._elapsed_ms(start),
+            ms=round((end - start) * 1000.0, 2),
+            deferred=deferred,
+            error=error,
+        )
+        self._stages.append(timing)
+        log.debug(f"[Startup] Stage '{name}' took {timing.ms:.1f} ms")
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_timeline_instance: Optional[StartupTimeline] = None
+_timeline_lock = threading.Lock()
+
+
+def get_startup_timeline() -> StartupTimeline:
+    """Get the process-wide StartupTimeline (thread-safe creation)."""
+    global _timeline_instance
+
+    if _timeline_instance is None:
+        with _timeline_lock:
+            if _timeline_instance is None:
+                _timeline_instance = StartupTimeline()
+
+    return _timeline_instance
+
+
+def reset_startup_timeline() -> None:
+    """
+    Discard recorded stages and restart the clock.
+
+    WARNING: Only use in tests and tools/startup_profiler.py.
+    """
+    global _timeline_instance
+
+    with _timeline_lock:
+        _timeline_instance = StartupTimeline(origin=time.perf_counter())
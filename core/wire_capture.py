@@ -0,0 +1,359 @@
+"""
+core/wire_capture.py
+
+Wire-level capture and replay of inbound DTC frames.
+
+SessionReplay works on DiagnosticEvents, which is too late in the pipeline to
+reproduce a slowdown caused by the byte stream itself. WireRecorder sits in
+DTCClientJSON._on_ready_read and stores every inbound frame exactly as it came
+off the socket, with a monotonic timestamp, so an incident can be replayed
+through _handle_frame deterministically.
+
+File format (little-endian):
+    header   MAGIC(6) version(u8) flags(u8) wall_start(f64) mono_start_ns(u64)
+    block*   stored_len(u32) raw_len(u32) data[stored_len]
+    data     record* (zlib-compressed when FLAG_ZLIB is set)
+    record   t_ns(u64, since mono_start) length(u32) frame[length]
+
+Blocks are self-contained, so a capture cut short by a crash is readable up
+to the last complete block.
+
+One process per file: an existing capture at path is rotated to
+<name>.prev<suffix> (replacing the older one) before the new header, so a
+restart keeps the capture of the run that crashed. resume=True reopens a
+capture written earlier by this process (e.g. across a reconnect) and
+appends to it instead.
+
+Overhead:
+- record() runs on the GUI thread: one struct.pack and a bytearray append
+  under an uncontended lock
+- Compression and disk writes happen on a background thread every
+  flush_interval seconds (or when a block fills)
+- Frames are dropped (and counted) when the writer falls behind by more than
+  max_pending_bytes, or once the file reaches max_file_bytes
+
+Usage:
+    recorder = WireRecorder("logs/dtc_capture.bin", compress=True)
+    recorder.record(raw_frame)
+    recorder.close()
+
+    stats = replay_capture("logs/dtc_capture.bin", client._handle_frame)            # fast
+    stats = replay_capture("logs/dtc_capture.bin", client._handle_frame, speed=1.0) # recorded pace
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+import struct
+import threading
+import time
+from typing import Any, Optional
+import zlib
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+
+MAGIC = b"DTCCAP"
+VERSION = 1
+FLAG_ZLIB = 0x01
+
+_HEADER = struct.Struct("<6sBBdQ")
+_BLOCK = struct.Struct("<II")
+_RECORD = struct.Struct("<QI")
+
+#: Hand the pending buffer to the writer once it reaches this size
+BLOCK_BYTES = 256 * 1024
+
+#: Captures started before this process cannot be resumed (other time base)
+_PROCESS_START_WALL = time.time()
+
+
+@dataclass(frozen=True)
+class CaptureHeader:
+    """Metadata stored at the start of a capture file."""
+
+    version: int
+    compressed: bool
+    wall_start: float  # time.time() when recording started
+    mono_start_ns: int  # time.monotonic_ns() when recording started
+
+
+class WireRecorder:
+    """
+    Append-only recorder for raw inbound frames.
+
+    Thread Safety:
+    - record() may be called from any thread (normally the GUI thread)
+    - _pending is protected by _lock; the file is only touched by the writer thread
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compress: bool = True,
+        flush_interval: float = 1.0,
+        max_pending_bytes: int = 16 * 1024 * 1024,
+        max_file_bytes: Optional[int] = None,
+        resume: bool = False,
+    ):
+        self.path = Path(path)
+        self.compress = compress
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending_bytes
+        self._max_file = max_file_bytes
+
+        self._lock = threading.Lock()
+        self._pending = bytearray()
+        self._wake = threading.Event()
+        self._closed = False
+
+        self.frames = 0
+        self.dropped = 0
+        self.bytes_in = 0
+        self.bytes_written = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        existing = self._resumable_header() if resume else None
+        if existing is not None:
+            # Same process, same monotonic clock: keep the original time base
+            self.compress = existing.compressed
+            self._mono_start = existing.mono_start_ns
+            self._file = self.path.open("ab")
+            self.bytes_written = self.path.stat().st_size
+        else:
+            if self.path.exists() and self.path.stat().st_size:
+                self.path.replace(self.previous_path)
+            self._mono_start = time.monotonic_ns()
+            self._file = self.path.open("wb")
+            header = _HEADER.pack(MAGIC, VERSION, FLAG_ZLIB if compress else 0, time.time(), self._mono_start)
+            self._file.write(header)
+            self.bytes_written = len(header)
+
+        self._writer = threading.Thread(target=self._run, name="WireRecorder", daemon=True)
+        self._writer.start()
+        log.info("wire.capture.started", path=str(self.path), compress=self.compress, resumed=existing is not None)
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def record(self, frame: bytes | bytearray, t_ns: Optional[int] = None) -> bool:
+        """
+        Append one frame (without its null terminator).
+
+        Returns:
+            False if the frame was dropped (closed, writer behind, or size cap)
+        """
+        t = (t_ns if t_ns is not None else time.monotonic_ns()) - self._mono_start
+        with self._lock:
+            if self._closed or len(self._pending) >= self._max_pending:
+                self.dropped += 1
+                return False
+            self._pending += _RECORD.pack(t, len(frame))
+            self._pending += frame
+            self.frames += 1
+            self.bytes_in += len(frame)
+            full = len(self._pending) >= BLOCK_BYTES
+        if full:
+            self._wake.set()
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush everything still pending and close the file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._writer.join(timeout)
+        log.info("wire.capture.closed", **self.stats())
+
+    @property
+    def previous_path(self) -> Path:
+        """Where the previous run's capture is kept."""
+        return self.path.with_name(f"{self.path.stem}.prev{self.path.suffix}")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "bytes_in": self.bytes_in,
+            "bytes_written": self.bytes_written,
+        }
+
+    def _resumable_header(self) -> Optional[CaptureHeader]:
+        """Header of an existing capture started by this process, else None."""
+        try:
+            header = read_header(self.path)
+        except (OSError, ValueError):
+            return None
+        if header.mono_start_ns > time.monotonic_ns() or header.wall_start < _PROCESS_START_WALL:
+            return None  # written by an earlier run: rotate instead
+        return header
+
+    # =========================================================================
+    # WRITER THREAD
+    # =========================================================================
+
+    def _run(self) -> None:
+        try:
+            while True:
+                self._wake.wait(self._flush_interval)
+                self._wake.clear()
+                with self._lock:
+                    data = bytes(self._pending)
+                    self._pending.clear()
+                    closing = self._closed
+                if data:
+                    self._write_block(data)
+                if closing:
+                    return
+        except Exception as e:
+            log.error("wire.capture.write_failed", path=str(self.path), error=str(e))
+            with self._lock:
+                self._closed = True
+        finally:
+            self._file.close()
+
+    def _write_block(self, data: bytes) -> None:
+        if self._max_file is not None and self.bytes_written >= self._max_file:
+            # Size cap reached: count whole records as dropped
+            lost = _count_records(data)
+            with self._lock:
+                self.dropped += lost
+                self.frames -= lost
+            return
+        stored = zlib.compress(data, 1) if self.compress else data
+        self._file.write(_BLOCK.pack(len(stored), len(data)))
+        self._file.write(stored)
+        self._file.flush()
+        self.bytes_written += _BLOCK.size + len(stored)
+
+
+# =============================================================================
+# READER + REPLAY
+# =============================================================================
+
+
+def read_header(path: str | Path) -> CaptureHeader:
+    with Path(path).open("rb") as f:
+        return _parse_header(f.read(_HEADER.size))
+
+
+def iter_capture(path: str | Path) -> Iterator[tuple[int, bytes]]:
+    """Yield (t_ns since recording start, frame) for every complete record."""
+    with Path(path).open("rb") as f:
+        header = _parse_header(f.read(_HEADER.size))
+        while True:
+            prefix = f.read(_BLOCK.size)
+            if len(prefix) < _BLOCK.size:
+                return
+            stored_len, raw_len = _BLOCK.unpack(prefix)
+            stored = f.read(stored_len)
+            if len(stored) < stored_len:
+                log.warning("wire.capture.truncated", path=str(path))
+                return
+            data = zlib.decompress(stored) if header.compressed else stored
+            if len(data) != raw_len:
+                log.warning("wire.capture.corrupt_block", path=str(path))
+                return
+
+            view = memoryview(data)
+            offset = 0
+            while offset < raw_len:
+                t_ns, length = _RECORD.unpack_from(view, offset)
+                offset += _RECORD.size
+                yield t_ns, bytes(view[offset : offset + length])
+                offset += length
+
+
+def replay_capture(
+    path: str | Path,
+    handler: Callable[[bytes], Any],
+    speed: Optional[float] = None,
+    on_wait: Optional[Callable[[], Any]] = None,
+) -> dict[str, Any]:
+    """
+    Feed a capture back through handler (normally DTCClientJSON._handle_frame).
+
+    Args:
+        path: Capture file written by WireRecorder
+        handler: Called with each raw frame, in recorded order
+        speed: None = as fast as possible; 1.0 = recorded pace; 10.0 = 10x faster
+        on_wait: Called repeatedly while waiting for the next frame in paced
+            mode (e.g. QApplication.processEvents); defaults to sleeping
+
+    Returns:
+        {"frames", "elapsed_s", "frames_per_s", "handle_ms": {"p50", "p99", "max"}, "lag_ms_max"}
+    """
+    durations: list[int] = []
+    max_lag_ns = 0
+    started = time.monotonic_ns()
+
+    for t_ns, frame in iter_capture(path):
+        if speed:
+            due = started + int(t_ns / speed)
+            while True:
+                now = time.monotonic_ns()
+                if now >= due:
+                    break
+                if on_wait is not None:
+                    on_wait()
+                else:
+                    time.sleep(min((due - now) / 1e9, 0.05))
+            max_lag_ns = max(max_lag_ns, time.monotonic_ns() - due)
+
+        t0 = time.perf_counter_ns()
+        handler(frame)
+        durations.append(time.perf_counter_ns() - t0)
+
+    elapsed_s = (time.monotonic_ns() - started) / 1e9
+    durations.sort()
+    return {
+        "frames": len(durations),
+        "elapsed_s": round(elapsed_s, 3),
+        "frames_per_s": round(len(durations) / elapsed_s, 1) if elapsed_s > 0 else 0.0,
+        "handle_ms": {
+            "p50": round(_percentile_ns(durations, 50) / 1e6, 4),
+            "p99": round(_percentile_ns(durations, 99) / 1e6, 4),
+            "max": round(durations[-1] / 1e6, 4) if durations else 0.0,
+        },
+        "lag_ms_max": round(max_lag_ns / 1e6, 3),
+    }
+
+
+# =============================================================================
+# INTERNAL HELPERS
+# =============================================================================
+
+
+def _parse_header(raw: bytes) -> CaptureHeader:
+    if len(raw) < _HEADER.size:
+        raise ValueError("Not a DTC capture file (short header)")
+    magic, version, flags, wall_start, mono_start = _HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError("Not a DTC capture file (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"Unsupported DTC capture version {version}")
+    return CaptureHeader(version, bool(flags & FLAG_ZLIB), wall_start, mono_start)
+
+
+def _count_records(data: bytes) -> int:
+    count = offset = 0
+    while offset < len(data):
+        _, length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size + length
+        count += 1
+    return count
+
+
+def _percentile_ns(sorted_values: list[int], pct: float) -> int:
+    if not sorted_values:
+        return 0
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[idx]
@@ -3,41 +3,101 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from contextlib import contextmanager
-from typing import Tuple
-
-from sqlalchemy import text
-from sqlmodel import Session, SQLModel, create_engine
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from config.settings import DB_URL, DEBUG_MODE  # DEBUG_MODE optional but recommended
-from data import schema  # ensures models are registered via import side-effects
+from core import metrics
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlmodel import Session
 
 
 # --- Engine (pre-ping to avoid stale connections; echo bound to DEBUG_MODE) ---
-# Try to create engine with primary DB_URL
-engine = None
+# STARTUP: sqlmodel/sqlalchemy and the schema models are imported and the
+# engine is created on first use (get_engine()), not at import time.
+# `from data.db_engine import engine` still works via module __getattr__.
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
 _db_init_error = None
 
-try:
-    engine = create_engine(
-        DB_URL,
-        echo=bool(DEBUG_MODE),
-        pool_pre_ping=True,
-        # For SQLite, allow auto-create
-        **({"isolation_level": "AUTOCOMMIT"} if "sqlite" in DB_URL else {}),
-    )
-except Exception as e:
-    _db_init_error = e
-    print(f"[DB] ERROR: Failed to create engine with {DB_URL}: {e}")
-    # Try in-memory SQLite fallback
+
+def get_engine() -> Engine:
+    """Return the shared engine, creating it on first call (thread-safe)."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+    return _engine
+
+
+def _create_engine() -> Engine:
+    global _db_init_error
+    from sqlmodel import create_engine
+
+    from data import schema  # noqa: F401  # ensures models are registered via import side-effects
+
+    _instrument_commits()
+
+    # Try to create engine with primary DB_URL
     try:
-        engine = create_engine(
-            "sqlite:///:memory:",
+        return create_engine(
+            DB_URL,
             echo=bool(DEBUG_MODE),
+            pool_pre_ping=True,
+            # For SQLite, allow auto-create
+            **({"isolation_level": "AUTOCOMMIT"} if "sqlite" in DB_URL else {}),
         )
-        print("[DB] WARNING: Using in-memory SQLite fallback (data will be lost on restart)")
-    except Exception as e2:
-        print(f"[DB] CRITICAL: Even fallback database failed: {e2}")
-        raise
+    except Exception as e:
+        _db_init_error = e
+        print(f"[DB] ERROR: Failed to create engine with {DB_URL}: {e}")
+        # Try in-memory SQLite fallback
+        try:
+            fallback = create_engine(
+                "sqlite:///:memory:",
+                echo=bool(DEBUG_MODE),
+            )
+            print("[DB] WARNING: Using in-memory SQLite fallback (data will be lost on restart)")
+            return fallback
+        except Exception as e2:
+            print(f"[DB] CRITICAL: Even fallback database failed: {e2}")
+            raise
+
+
+def _instrument_commits() -> None:
+    """Time every Session.commit() into the "db.write" metric (core/metrics.py)."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session as OrmSession
+
+    if event.contains(OrmSession, "before_commit", _on_before_commit):
+        return
+    event.listen(OrmSession, "before_commit", _on_before_commit)
+    event.listen(OrmSession, "after_commit", _on_after_commit)
+
+
+def _on_before_commit(session) -> None:
+    session.info["_metrics_commit_t0"] = metrics.now()
+
+
+def _on_after_commit(session) -> None:
+    metrics.observe("db.write", session.info.pop("_metrics_commit_t0", 0.0))
+
+
+def dispose_engine() -> bool:
+    """Dispose the connection pool if the engine was ever created. Returns True if disposed."""
+    engine = _engine
+    if engine is None:
+        return False
+    engine.dispose()
+    return True
+
+
+def __getattr__(name: str) -> Any:
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db() -> None:
@@ -45,6 +105,9 @@ def init_db() -> None:
     Create all database tables based on SQLModel metadata.
     Also runs any pending migrations.
     """
+    from sqlmodel import SQLModel
+
+    engine = get_engine()
     tables = list(SQLModel.metadata.tables.keys())
     print("Models registered in SQLModel metadata:")
     if tables:
@@ -66,6 +129,9 @@ def _run_migrations() -> None:
     """
     from pathlib import Path
 
+    from sqlalchemy import text
+
+    engine = get_engine()
     migrations_dir = Path(__file__).parent / "migrations"
 
     if not migrations_dir.exists():
@@ -103,7 +169,10 @@ def get_session() -> Iterator[Session]:
     Closes/rolls back on exception; commits nothing implicitly.
     Handles connection errors gracefully with auto-reconnect attempt.
     """
-    s = Session(engine)
+    from sqlalchemy import text
+    from sqlmodel import Session
+
+    s = Session(get_engine())
     try:
         # Test connection with lightweight query
         s.execute(text("SELECT 1"))
@@ -125,7 +194,9 @@ def health_check() -> tuple[bool, str]:
     Returns (ok, detail). Uses SQLAlchemy text() to avoid 'Not an executable object'.
     """
     try:
-        with engine.connect() as conn:
+        from sqlalchemy import text
+
+        with get_engine().connect() as conn:
             # Works across SQLAlchemy 2.x; no implicit text execution
             conn.execute(text("SELECT 1"))
         return True, "DB OK (SELECT 1)"
@@ -14,71 +14,113 @@ Architecture Benefits:
 - Testability: Easy to mock and test
 - Maintainability: Clear contracts between components
 
+DTC bus events (TradeAccountEvent, BalanceUpdateEvent, PositionUpdateEvent,
+OrderUpdateEvent) are frozen, slotted dataclasses built once by the DTC
+normalizer (from_dtc) with every field already coerced, so handlers read
+attributes instead of re-doing alias/.get() chains. They travel the SignalBus
+as `object` payloads (no QVariantMap conversion across threads).
+
 Usage:
     from domain.events import OrderUpdateEvent, PositionUpdateEvent
 
-    # Create event
-    event = OrderUpdateEvent(
-        account="Sim1",
-        order_id=12345,
-        price=Decimal("6750.25"),
-        quantity=1,
-        mode="SIM"
-    )
+    # Build from a raw DTC message (or a legacy normalized dict)
+    event = PositionUpdateEvent.from_dtc({"Type": 306, "Symbol": "MESZ25", "PositionQuantity": 1, ...})
 
     # Emit via SignalBus
-    signal_bus.orderUpdateReceived.emit(event)
+    signal_bus.positionUpdated.emit(event)
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
+
+from utils.trade_mode import detect_mode_from_account
+
+
+# =============================================================================
+# DTC FIELD COERCION
+# =============================================================================
+
+def _first(msg: Mapping[str, Any], *keys: str) -> Any:
+    """First non-None value among alias keys."""
+    for key in keys:
+        value = msg.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _float(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value: Any) -> Optional[int]:
+    number = _float(value)
+    return int(number) if number is not None else None
+
+
+def _str(value: Any) -> str:
+    return value.strip() if isinstance(value, str) else ("" if value is None else str(value))
+
+
+def _mode(account: str) -> str:
+    """Trading mode for an account ("" when the message carries none)."""
+    return detect_mode_from_account(account) if account else ""
 
 
 # =============================================================================
 # ACCOUNT EVENTS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradeAccountEvent:
-    """Trade account response from DTC."""
+    """Trade account response from DTC (TradeAccountResponse / TradeAccountsResponse)."""
     account: str
-    balance: Optional[float] = None
-    cash_balance: Optional[float] = None
-    securities_value: Optional[float] = None
-    margin_requirement: Optional[float] = None
-    open_positions_profit_loss: Optional[float] = None
-    daily_profit_loss: Optional[float] = None
-    timestamp: Optional[datetime] = None
 
-    # Raw DTC message (for debugging)
-    raw_message: Optional[dict] = field(default=None, repr=False)
+    @classmethod
+    def from_dtc(cls, msg: Mapping[str, Any]) -> "TradeAccountEvent":
+        return cls(account=_str(_first(msg, "TradeAccount", "Account", "account")))
 
 
 # =============================================================================
 # POSITION EVENTS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PositionUpdateEvent:
-    """Position update from DTC."""
+    """Position update from DTC (PositionUpdate, Type 306)."""
     symbol: str
-    account: str
-    quantity: float  # Positive = long, negative = short
-    average_price: float
-    mode: str  # "SIM", "LIVE", or "DEBUG"
+    account: str  # TradeAccount ("" when absent)
+    quantity: int  # Positive = long, negative = short
+    average_price: Optional[float]
+    mode: str = ""  # "SIM", "LIVE", "DEBUG" ("" when no account)
 
     # Optional fields
-    position_id: Optional[str] = None
-    trade_account: Optional[str] = None
-    unrealized_pnl: Optional[float] = None
-    timestamp: Optional[datetime] = None
-
-    # Raw DTC message (for debugging)
-    raw_message: Optional[dict] = field(default=None, repr=False)
+    open_pnl: Optional[float] = None
+    date_time: Optional[float] = None  # DTC DateTime (epoch seconds)
+
+    @classmethod
+    def from_dtc(cls, msg: Mapping[str, Any]) -> "PositionUpdateEvent":
+        """Coerce a DTC PositionUpdate (or a legacy normalized dict: qty/avg_entry/symbol)."""
+        account = _str(msg.get("TradeAccount"))
+        return cls(
+            symbol=_str(_first(msg, "Symbol", "symbol")),
+            account=account,
+            quantity=_int(_first(msg, "PositionQuantity", "Quantity", "qty")) or 0,
+            average_price=_float(_first(msg, "AveragePrice", "avg_entry")),
+            mode=_mode(account),
+            open_pnl=_float(_first(msg, "OpenProfitLoss", "UnrealizedProfitLoss")),
+            date_time=_float(msg.get("DateTime")),
+        )
 
     @property
     def is_long(self) -> bool:
@@ -248,29 +290,64 @@ class OrderFillEvent:
     raw_message: Optional[dict] = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderUpdateEvent:
-    """Order status update from DTC."""
-    order_id: int
-    symbol: str
-    account: str
-    status: str  # "PENDING", "FILLED", "PARTIALLY_FILLED", "CANCELLED", etc.
-    mode: str
-
-    # Order details
-    order_type: Optional[str] = None
-    side: Optional[str] = None  # "BUY" or "SELL"
-    price: Optional[float] = None
-    quantity: Optional[float] = None
-    filled_quantity: Optional[float] = None
-    remaining_quantity: Optional[float] = None
+    """Order status update / fill from DTC (OrderUpdate, OrderFillResponse, HistoricalOrderFillResponse)."""
+    symbol: str = ""
+    account: str = ""  # TradeAccount ("" when absent)
+    mode: str = ""  # "SIM", "LIVE", "DEBUG" ("" when no account)
+
+    # DTC enums kept as their wire codes
+    status: Optional[int] = None  # OrderStatus (3, 7 = filled)
+    side: Optional[int] = None  # BuySell (1 = buy, 2 = sell)
+    order_type: Optional[int] = None
+
+    # Prices / quantities
+    price1: Optional[float] = None
+    price2: Optional[float] = None
+    quantity: Optional[int] = None
+    filled_quantity: Optional[int] = None
+    average_fill_price: Optional[float] = None
+    last_fill_price: Optional[float] = None
+
+    # Identification / context
+    server_order_id: Optional[str] = None
+    client_order_id: Optional[str] = None
+    time_in_force: Optional[int] = None
+    text: Optional[str] = None
+    update_reason: Optional[int] = None
+    date_time: Optional[float] = None  # DTC DateTime (epoch seconds)
+
+    @classmethod
+    def from_dtc(cls, msg: Mapping[str, Any]) -> "OrderUpdateEvent":
+        account = _str(msg.get("TradeAccount"))
+        server_id = msg.get("ServerOrderID")
+        client_id = msg.get("ClientOrderID")
+        text = msg.get("Text")
+        return cls(
+            symbol=_str(msg.get("Symbol")),
+            account=account,
+            mode=_mode(account),
+            status=_int(msg.get("OrderStatus")),
+            side=_int(msg.get("BuySell")),
+            order_type=_int(msg.get("OrderType")),
+            price1=_float(msg.get("Price1")),
+            price2=_float(msg.get("Price2")),
+            quantity=_int(msg.get("Quantity")),
+            filled_quantity=_int(msg.get("FilledQuantity")),
+            average_fill_price=_float(msg.get("AverageFillPrice")),
+            last_fill_price=_float(msg.get("LastFillPrice")),
+            server_order_id=None if server_id is None else str(server_id),
+            client_order_id=None if client_id is None else str(client_id),
+            time_in_force=_int(msg.get("TimeInForce")),
+            text=None if text is None else str(text),
+            update_reason=_int(msg.get("UpdateReason")),
+            date_time=_float(msg.get("DateTime")),
+        )
 
-    # Timestamps
-    order_time: Optional[datetime] = None
-    update_time: Optional[datetime] = None
-
-    # Raw DTC message (for debugging)
-    raw_message: Optional[dict] = field(default=None, repr=False)
+    @property
+    def is_filled(self) -> bool:
+        return self.status in (3, 7)
 
 
 @dataclass
@@ -293,16 +370,34 @@ class OrderSubmitRequestEvent:
 # BALANCE EVENTS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BalanceUpdateEvent:
-    """Balance updated event."""
-    balance: float
+    """Account balance from DTC (AccountBalanceUpdate / AccountBalanceResponse)."""
+    balance: Optional[float]  # First of BalanceAvailableForNewPositions, AccountValue, NetLiquidatingValue, CashBalance
     account: str
-    mode: str
-    timestamp: Optional[datetime] = None
-
-    # Source of balance update (for debugging)
-    source: Optional[str] = None  # "DTC", "TRADE_CLOSE", "MANUAL_RESET", etc.
+    mode: str = ""
+    cash_balance: Optional[float] = None
+    account_value: Optional[float] = None
+    net_liquidating_value: Optional[float] = None
+    available_funds: Optional[float] = None
+
+    @classmethod
+    def from_dtc(cls, msg: Mapping[str, Any]) -> "BalanceUpdateEvent":
+        account = _str(msg.get("TradeAccount"))
+        balance = None
+        for key in ("BalanceAvailableForNewPositions", "AccountValue", "NetLiquidatingValue", "CashBalance"):
+            balance = _float(msg.get(key))
+            if balance is not None:
+                break
+        return cls(
+            balance=balance,
+            account=account,
+            mode=_mode(account),
+            cash_balance=_float(msg.get("CashBalance")),
+            account_value=_float(msg.get("AccountValue")),
+            net_liquidating_value=_float(msg.get("NetLiquidatingValue")),
+            available_funds=_float(msg.get("AvailableFunds")),
+        )
 
 
 @dataclass
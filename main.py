@@ -2,11 +2,15 @@ import contextlib
 import os
 import sys
 
+# Imported first: its import time is the origin of the startup timeline
+from core.startup_stages import get_startup_timeline
+
 from PyQt6 import QtWidgets
 
 from config.theme import THEME, ColorTheme, validate_theme_system
 from core.app_manager import MainWindow
 from utils.logger import get_logger
+from utils.qt_bridge import install_invocation_queue
 
 # Initialize logger system early (including structlog configuration)
 get_logger()
@@ -20,10 +24,17 @@ if os.getenv("DEBUG_DTC", "0") == "1":
 
 
 def main():
-    # Validate theme system on startup
-    validate_theme_system()
+    timeline = get_startup_timeline()
+    timeline.mark("imports")
 
     app = QtWidgets.QApplication(sys.argv)
+    # Cross-thread invocation queue lives on this (main) thread from the start
+    install_invocation_queue()
+    # Opt-in sampling profiler (DEBUG_PERF / PROFILER_ENABLED); dumps at exit
+    with contextlib.suppress(Exception):
+        from core.sampling_profiler import start_if_enabled
+
+        start_if_enabled()
     # Set application font globally from THEME
     with contextlib.suppress(Exception):
         app.setFont(
@@ -32,7 +43,10 @@ def main():
                 int(THEME.get("ui_font_size", 14)),
             )
         )
-    win = MainWindow()
+    with timeline.stage("window_shell"):
+        win = MainWindow()
+    # Theme validation only logs problems: run it after the first paint
+    win.defer_startup_stage("theme_validation", validate_theme_system)
     win.show()
     sys.exit(app.exec())
 
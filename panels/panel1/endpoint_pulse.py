@@ -0,0 +1,162 @@
+"""
+panels/panel1/endpoint_pulse.py
+
+Cheap endpoint animation layer for the Panel1 equity chart.
+
+The breathing endpoint dot and the sonar ripple rings are drawn by one small
+QGraphicsObject pinned to the last data point. It ignores the view transform
+(sizes are in device pixels) and has a fixed bounding rect, so an animation
+frame repaints only that rect instead of re-rendering the equity line.
+
+Pens and brushes are precomputed once per (PnL color, phase step); a pulse
+tick only selects a frame and calls update().
+
+Usage:
+    from panels.panel1.endpoint_pulse import PULSE_PHASE_STEPS, EndpointPulseItem
+
+    item = EndpointPulseItem()
+    plot.addItem(item, ignoreBounds=True)
+    item.set_color("#22C55E")
+    item.set_anchor(x, y)
+    item.set_phase_step((step + 1) % PULSE_PHASE_STEPS)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Optional
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+#: Phase steps per pulse cycle (~0.035 rad per 40 ms tick, as before)
+PULSE_PHASE_STEPS = 180
+
+RIPPLE_COUNT = 3
+
+# Diameters in device pixels (match the previous ScatterPlotItem sizes)
+_DOT_BASE = 8.0
+_DOT_BREATH = 1.5
+_RIPPLE_BASE = 8.0
+_RIPPLE_SPREAD = 18.0
+
+_EXTENT = (_RIPPLE_BASE + _RIPPLE_SPREAD) / 2.0 + 2.0  # max radius + pen/antialias margin
+
+
+@dataclass(frozen=True)
+class _PulseFrame:
+    dot_radius: float
+    dot_brush: QtGui.QBrush
+    rings: tuple[tuple[float, QtGui.QPen], ...]  # (radius, pen)
+
+
+def _build_frames(color_hex: str) -> tuple[_PulseFrame, ...]:
+    """Precompute every animation frame for one PnL color."""
+    base = QtGui.QColor(color_hex)
+    frames = []
+    for step in range(PULSE_PHASE_STEPS):
+        phase = 2.0 * math.pi * step / PULSE_PHASE_STEPS
+
+        # Endpoint breathing effect
+        pulse = 0.5 + 0.5 * math.sin(phase)
+        dot_color = QtGui.QColor(base)
+        dot_color.setAlphaF(0.85 - 0.25 * pulse)
+
+        # Sonar ripple rings (brighter inner edge, expanding)
+        rings = []
+        for i in range(RIPPLE_COUNT):
+            ring_phase = (phase + i * 2.0 * math.pi / RIPPLE_COUNT) % (2.0 * math.pi)
+            frac = (1.0 + math.sin(ring_phase)) / 2.0
+            alpha = max(0.0, 0.42 * (1.0 - frac)) * (1.0 - frac * 0.6)
+            ring_color = QtGui.QColor(base)
+            ring_color.setAlphaF(alpha)
+            pen = QtGui.QPen(ring_color, 1.0)
+            pen.setCosmetic(True)
+            rings.append(((_RIPPLE_BASE + frac * _RIPPLE_SPREAD) / 2.0, pen))
+
+        frames.append(
+            _PulseFrame(
+                dot_radius=(_DOT_BASE + _DOT_BREATH * pulse) / 2.0,
+                dot_brush=QtGui.QBrush(dot_color),
+                rings=tuple(rings),
+            )
+        )
+    return tuple(frames)
+
+
+class EndpointPulseItem(QtWidgets.QGraphicsObject):
+    """
+    Endpoint dot + ripple rings drawn in device pixels at a data point.
+
+    Add to a PlotItem with ignoreBounds=True so it never affects auto-range.
+    """
+
+    # Shared across charts: frames depend only on the color
+    _frame_cache: dict[str, tuple[_PulseFrame, ...]] = {}
+
+    def __init__(self, parent: Optional[QtWidgets.QGraphicsItem] = None):
+        super().__init__(parent)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations, True)
+        self._rect = QtCore.QRectF(-_EXTENT, -_EXTENT, 2.0 * _EXTENT, 2.0 * _EXTENT)
+        self._frames: tuple[_PulseFrame, ...] = ()
+        self._color: Optional[str] = None
+        self._step = 0
+        self._anchor: Optional[tuple[float, float]] = None
+        self._antialiased = True
+
+    # ------------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------------
+
+    def set_color(self, color_hex: str) -> None:
+        if color_hex == self._color:
+            return
+        frames = self._frame_cache.get(color_hex)
+        if frames is None:
+            frames = self._frame_cache[color_hex] = _build_frames(color_hex)
+        self._color = color_hex
+        self._frames = frames
+        self.update()
+
+    def set_anchor(self, x: float, y: float) -> None:
+        """Pin the pulse to a data point (view coordinates)."""
+        anchor = (float(x), float(y))
+        if anchor != self._anchor:
+            self._anchor = anchor
+            self.setPos(*anchor)
+
+    def set_phase_step(self, step: int) -> None:
+        self._step = step % PULSE_PHASE_STEPS
+        self.update()
+
+    @property
+    def phase_step(self) -> int:
+        return self._step
+
+    def set_antialiased(self, enabled: bool) -> None:
+        if enabled != self._antialiased:
+            self._antialiased = enabled
+            self.update()
+
+    # ------------------------------------------------------------------------
+    # QGraphicsItem
+    # ------------------------------------------------------------------------
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._rect
+
+    def paint(self, painter: QtGui.QPainter, option, widget=None) -> None:
+        if not self._frames:
+            return
+        frame = self._frames[self._step]
+        center = QtCore.QPointF(0.0, 0.0)
+
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, self._antialiased)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        for radius, pen in frame.rings:
+            painter.setPen(pen)
+            painter.drawEllipse(center, radius, radius)
+
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(frame.dot_brush)
+        painter.drawEllipse(center, frame.dot_radius, frame.dot_radius)
@@ -12,6 +12,18 @@ This module handles:
 - Auto-ranging based on timeframe
 - PnL-driven color updates
 
+Animation cost:
+- The endpoint dot and ripples are one EndpointPulseItem (endpoint_pulse.py)
+  that repaints only its own small rect; its pens/brushes are precomputed
+- Line, glow and pulse colors change only when the PnL color changes
+- The pulse pauses while the window is minimized, hidden, unexposed
+  (occluded, where the platform reports it) or not the active window
+- Every full-plot paint reports its duration to the render governor
+  (core/render_governor.py); pulse-only repaints of the endpoint rect are
+  not reported, so they cannot dilute the window. When frames overrun the
+  budget quality steps
+  down (pulse FPS, glow, trails, antialiasing) and back up with headroom
+
 Architecture:
 - Encapsulates all PyQtGraph rendering
 - Stateful (manages plot items, animation state)
@@ -39,26 +51,93 @@ Usage:
 from __future__ import annotations
 
 import contextlib
-import math
+import functools
+import importlib.util
+import time
 from typing import Any, Optional
 
 from PyQt6 import QtCore, QtGui
 
 from config.theme import THEME, ColorTheme
+from core import metrics
+from core.animation_clock import ClockSubscription, get_animation_clock
+from core.render_governor import RenderQualityGovernor, get_render_governor
+from panels.panel1.endpoint_pulse import PULSE_PHASE_STEPS, EndpointPulseItem
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
-# Try to import pyqtgraph (may not be available in all environments)
-try:
-    import pyqtgraph as pg  # type: ignore
-    HAS_PYQTGRAPH = True
-except ImportError:
-    pg = None
-    HAS_PYQTGRAPH = False
+# STARTUP: pyqtgraph (optional) is the heaviest import under Panel1, so it is
+# imported by create_plot_widget() rather than at module load; pg stays None
+# until the first chart is built.
+pg: Any = None
+
+
+def _pyqtgraph_installed() -> bool:
+    try:
+        return importlib.util.find_spec("pyqtgraph") is not None
+    except (ImportError, ValueError):  # ValueError: blocked via sys.modules["pyqtgraph"] = None
+        return False
+
+
+HAS_PYQTGRAPH = _pyqtgraph_installed()
+if not HAS_PYQTGRAPH:
     log.warning("pyqtgraph not available - chart rendering disabled")
 
 
+def _import_pyqtgraph() -> Optional[Any]:
+    """Import pyqtgraph (a sys.modules lookup after the first call); None when it is missing."""
+    global pg
+    try:
+        import pyqtgraph  # type: ignore
+    except ImportError:
+        return None
+    pg = pyqtgraph
+    return pg
+
+
+#: Pulse interval at full quality (~25 FPS); doubled at the "pulse_fps" step
+PULSE_INTERVAL_MS = 40
+
+# A paint counts as a plot frame for the render governor when its dirty rect
+# covers at least this fraction of the viewport (pulse ticks cover ~1%)
+FULL_FRAME_FRACTION = 0.5
+
+# Window events that can change whether the pulse should run
+_ANIMATION_GATE_EVENTS = frozenset(
+    {
+        QtCore.QEvent.Type.Show,
+        QtCore.QEvent.Type.Hide,
+        QtCore.QEvent.Type.WindowStateChange,
+        QtCore.QEvent.Type.WindowActivate,
+        QtCore.QEvent.Type.WindowDeactivate,
+        QtCore.QEvent.Type.Expose,
+        QtCore.QEvent.Type.ParentChange,
+    }
+)
+
+
+@functools.cache
+def _timed_plot_widget_class(base: type) -> type:
+    """PlotWidget subclass reporting full-plot paint durations (built lazily: pg is optional)."""
+
+    class TimedPlotWidget(base):
+        frame_sink = None  # callable(frame_ms)
+
+        def paintEvent(self, ev):
+            started = time.perf_counter()
+            super().paintEvent(ev)
+            if self.frame_sink is not None and self._is_full_frame(ev.rect()):
+                self.frame_sink((time.perf_counter() - started) * 1000.0)
+
+        def _is_full_frame(self, dirty: QtCore.QRect) -> bool:
+            view = self.viewport().rect()
+            view_area = view.width() * view.height()
+            return view_area > 0 and dirty.width() * dirty.height() >= FULL_FRAME_FRACTION * view_area
+
+    return TimedPlotWidget
+
+
 class EquityChart(QtCore.QObject):
     """
     PyQtGraph equity chart renderer with animation.
@@ -72,12 +151,17 @@ class EquityChart(QtCore.QObject):
     - Timeframe-based auto-ranging
     """
 
-    def __init__(self, parent: Optional[QtCore.QObject] = None):
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        governor: Optional[RenderQualityGovernor] = None,
+    ):
         """
         Initialize equity chart renderer.
 
         Args:
             parent: Parent QObject (optional)
+            governor: Render quality governor (default: the shared one)
         """
         super().__init__(parent)
 
@@ -87,16 +171,29 @@ class EquityChart(QtCore.QObject):
         self._line: Optional[Any] = None  # Main equity line
         self._trail_lines: list[Any] = []  # Trailing lines
         self._glow_line: Optional[Any] = None  # Glow halo
-        self._endpoint: Optional[Any] = None  # Endpoint dot
-        self._ripple_items: list[Any] = []  # Sonar ripple rings
+        self._pulse_item: Optional[EndpointPulseItem] = None  # Endpoint dot + sonar ripples
 
         # Animation state
-        self._pulse_timer: Optional[QtCore.QTimer] = None
-        self._pulse_phase: float = 0.0
+        self._pulse_timer: Optional[ClockSubscription] = None  # Shared animation clock
+        self._pulse_epoch: float = time.monotonic()  # phase origin (wall clock)
+        self._animation_requested: bool = False
+        self._hooked_window: Optional[QtCore.QObject] = None
+        self._hooked_handle: Optional[QtCore.QObject] = None
+        self._line_color: Optional[str] = None  # Color the line/glow/pulse are drawn with
+
+        # Window events are applied after delivery (state flags settle with the event)
+        self._gate_timer = QtCore.QTimer(self)
+        self._gate_timer.setSingleShot(True)
+        self._gate_timer.setInterval(0)
+        self._gate_timer.timeout.connect(self._sync_animation)
 
         # Configuration
         self._perf_safe: bool = bool(THEME.get("perf_safe", False))
 
+        # Adaptive quality (applied on every governor transition)
+        self._governor = governor or get_render_governor()
+        self._governor.qualityChanged.connect(self._apply_quality)
+
         # Current data and state
         self._current_points: list[tuple[float, float]] = []
         self._current_timeframe: str = "LIVE"
@@ -120,13 +217,14 @@ class EquityChart(QtCore.QObject):
         Returns:
             PlotWidget instance, or None if pyqtgraph unavailable
         """
-        if not HAS_PYQTGRAPH or pg is None:
+        if not HAS_PYQTGRAPH or _import_pyqtgraph() is None:
             log.error("Cannot create plot widget - pyqtgraph not available")
             return None
 
         try:
             # Create PlotWidget
-            self._plot = pg.PlotWidget()
+            self._plot = _timed_plot_widget_class(pg.PlotWidget)()
+            self._plot.frame_sink = self._governor.record_frame
             self._vb = self._plot.getPlotItem().getViewBox()
 
             # Styling
@@ -144,6 +242,9 @@ class EquityChart(QtCore.QObject):
             # Initialize plot items (line, trails, endpoint, ripples)
             self._init_plot_items()
 
+            # Pause the pulse with the window (see eventFilter)
+            self._plot.installEventFilter(self)
+
             return self._plot
 
         except Exception as e:
@@ -203,26 +304,14 @@ class EquityChart(QtCore.QObject):
                 )
                 self._glow_line.setZValue(3)
 
-            # Endpoint dot (breathing effect)
-            self._endpoint = pg.ScatterPlotItem(
-                size=8,
-                brush=pg.mkBrush(base_color),
-                pen=pg.mkPen(None)
-            )
-            self._endpoint.setZValue(15)
-            self._plot.addItem(self._endpoint)
-
-            # Sonar ripple rings (3 expanding circles)
-            self._ripple_items = []
-            for _ in range(3):
-                ripple = pg.ScatterPlotItem(
-                    size=8,
-                    brush=pg.mkBrush(None),
-                    pen=pg.mkPen(base_color, width=1.0)
-                )
-                ripple.setZValue(12)
-                self._plot.addItem(ripple)
-                self._ripple_items.append(ripple)
+            # Endpoint dot + sonar ripple rings (pixel-space overlay)
+            self._pulse_item = EndpointPulseItem()
+            self._pulse_item.setZValue(15)
+            self._pulse_item.setVisible(False)
+            self._plot.addItem(self._pulse_item, ignoreBounds=True)
+
+            self._apply_line_color(ColorTheme.pnl_color_from_direction(self._current_pnl_direction))
+            self._apply_quality(self._governor.level)
 
         except Exception as e:
             log.error(f"Error initializing plot items: {e}")
@@ -233,24 +322,80 @@ class EquityChart(QtCore.QObject):
         """
         Start pulse animation (25 FPS).
 
-        Creates timer and connects to _on_pulse_tick().
+        The timer only runs while the chart's window is visible, exposed and
+        active; it resumes automatically when that changes back.
         """
-        if self._pulse_timer is not None:
+        if self._animation_requested:
             return  # Already started
 
-        self._pulse_timer = QtCore.QTimer(self)
-        self._pulse_timer.setInterval(40)  # ~25 FPS
-        self._pulse_timer.timeout.connect(self._on_pulse_tick)
-        self._pulse_timer.start()
-        self._pulse_phase = 0.0
+        self._animation_requested = True
+        if self._pulse_timer is None and self._plot is not None:
+            # ~25 FPS; the clock also suspends it while the plot is hidden
+            self._pulse_timer = get_animation_clock().subscribe(
+                self._on_pulse_tick, self._pulse_interval_ms(), owner=self._plot
+            )
+        self._pulse_epoch = time.monotonic()
+        self._hook_window()
+        self._sync_animation()
 
     def stop_animation(self) -> None:
         """
         Stop pulse animation.
         """
+        self._animation_requested = False
         if self._pulse_timer is not None:
             self._pulse_timer.stop()
-            self._pulse_timer = None
+
+    @property
+    def animation_paused(self) -> bool:
+        """True while animation is requested but held by the window state."""
+        return self._animation_requested and not (self._pulse_timer is not None and self._pulse_timer.running)
+
+    def _animation_allowed(self) -> bool:
+        plot = self._plot
+        if plot is None or not plot.isVisible():
+            return False
+        window = plot.window()
+        if window.isMinimized() or not window.isActiveWindow():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _sync_animation(self) -> None:
+        timer = self._pulse_timer
+        if timer is None:
+            return
+        run = self._animation_requested and self._animation_allowed()
+        if run and not timer.isActive():
+            timer.start()
+        elif not run and timer.isActive():
+            timer.stop()
+
+    def _hook_window(self) -> None:
+        """Watch the top-level window (and its QWindow for expose changes)."""
+        if self._plot is None:
+            return
+        window = self._plot.window()
+        handle = window.windowHandle()
+        if window is self._hooked_window and handle is self._hooked_handle:
+            return
+        for obj in (self._hooked_window, self._hooked_handle):
+            if obj is not None and obj is not self._plot:
+                with contextlib.suppress(RuntimeError):
+                    obj.removeEventFilter(self)
+        if window is not self._plot:
+            window.installEventFilter(self)
+        if handle is not None:
+            handle.installEventFilter(self)
+        self._hooked_window, self._hooked_handle = window, handle
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Pause/resume the pulse on window state, visibility and focus changes."""
+        if event.type() in _ANIMATION_GATE_EVENTS and self._animation_requested:
+            if event.type() in (QtCore.QEvent.Type.Show, QtCore.QEvent.Type.ParentChange):
+                self._hook_window()
+            self._gate_timer.start()
+        return super().eventFilter(obj, event)
 
     def replot(
         self,
@@ -267,6 +412,10 @@ class EquityChart(QtCore.QObject):
         if self._line is None or self._plot is None:
             return
 
+        with metrics.timed("panel1.replot"):
+            self._replot(points, timeframe)
+
+    def _replot(self, points: list[tuple[float, float]], timeframe: str) -> None:
         self._current_points = list(points)
         self._current_timeframe = timeframe
 
@@ -278,11 +427,9 @@ class EquityChart(QtCore.QObject):
                 self._line.setData(xs, ys)
 
                 # Update endpoint (only visible for LIVE and 1D)
-                if self._endpoint is not None:
-                    if timeframe in ("LIVE", "1D"):
-                        self._endpoint.setData([xs[-1]], [ys[-1]])
-                    else:
-                        self._endpoint.setData([], [])
+                if self._pulse_item is not None:
+                    self._pulse_item.set_anchor(xs[-1], ys[-1])
+                    self._pulse_item.setVisible(timeframe in ("LIVE", "1D"))
 
             except Exception as e:
                 log.error(f"replot setData failed: {e}")
@@ -302,14 +449,8 @@ class EquityChart(QtCore.QObject):
             # No data - clear all
             with contextlib.suppress(Exception):
                 self._line.setData([], [])
-                if self._endpoint is not None:
-                    self._endpoint.setData([], [])
-
-        # Enforce ripple visibility based on timeframe
-        with contextlib.suppress(Exception):
-            if timeframe not in ("LIVE", "1D"):
-                for ripple in self._ripple_items:
-                    ripple.setData([], [])
+                if self._pulse_item is not None:
+                    self._pulse_item.setVisible(False)
 
     def update_endpoint_color(self, is_positive: Optional[bool]) -> None:
         """
@@ -319,76 +460,92 @@ class EquityChart(QtCore.QObject):
             is_positive: True for gains, False for losses, None for neutral
         """
         self._current_pnl_direction = is_positive
+        self._apply_line_color(ColorTheme.pnl_color_from_direction(is_positive))
 
-        # Color will be applied in next pulse tick
-        # (pulse tick reads _current_pnl_direction to set colors)
+    def refresh_theme(self) -> None:
+        """Re-derive the line, glow and pulse colors from the active THEME."""
+        self._apply_line_color(ColorTheme.pnl_color_from_direction(self._current_pnl_direction))
 
-    def _on_pulse_tick(self) -> None:
+    def _apply_line_color(self, color_hex: str) -> None:
         """
-        Animation loop - called every 40ms (~25 FPS).
+        Recolor main line, glow and pulse (only when the color actually changes).
 
-        Updates:
-        - Endpoint breathing effect
-        - Sonar ripple rings
-        - Glow halo pulsing
-        - Line color based on PnL
+        setPen() on the full-resolution line re-renders the whole path, so it
+        must not happen per animation frame.
         """
-        if self._plot is None or self._vb is None:
+        if color_hex == self._line_color or self._line is None:
             return
+        self._line_color = color_hex
+        base_color = QtGui.QColor(color_hex)
+
+        with contextlib.suppress(Exception):
+            self._line.setPen(pg.mkPen(base_color, width=6, join="round", cap="round"))
 
-        if not self._current_points:
+            # Soft glow (static: pulsing it would re-render the 16 px path every frame)
+            if self._glow_line is not None:
+                g = QtGui.QColor(base_color)
+                g.setAlphaF(0.075)
+                self._glow_line.setPen(pg.mkPen(g, width=16, join="round", cap="round"))
+
+            if self._pulse_item is not None:
+                self._pulse_item.set_color(color_hex)
+
+    # -------------------- Adaptive quality --------------------
+
+    def _pulse_interval_ms(self) -> int:
+        return PULSE_INTERVAL_MS * 2 if self._governor.degraded("pulse_fps") else PULSE_INTERVAL_MS
+
+    def _apply_quality(self, level: int) -> None:
+        """
+        Apply the governor's quality level (called on transitions only).
+
+        Hidden glow/trail items are skipped by replot; they get the current
+        data again when they come back.
+        """
+        if self._line is None:
+            return
+        gov = self._governor
+
+        if self._pulse_timer is not None:
+            self._pulse_timer.setInterval(self._pulse_interval_ms())
+
+        with contextlib.suppress(Exception):
+            if self._glow_line is not None:
+                self._glow_line.setVisible(not gov.degraded("glow"))
+            for trail_item in self._trail_lines:
+                trail_item.setVisible(not gov.degraded("trails"))
+            self._update_trails_and_glow()
+
+        # PlotDataItem has no setOpts in pyqtgraph 0.14; setData re-applies the
+        # current arrays with the new option
+        antialias = not gov.degraded("antialias")
+        for item in (self._line, self._glow_line, *self._trail_lines):
+            if item is not None and item.opts.get("antialias") != antialias:
+                item.setData(item.xData, item.yData, antialias=antialias)
+        if self._pulse_item is not None:
+            self._pulse_item.set_antialiased(antialias)
+
+    def _on_pulse_tick(self) -> None:
+        """
+        Animation loop - called every PULSE_INTERVAL_MS (~25 FPS; half that
+        rate while the render governor has reduced the pulse FPS).
+
+        Sets the endpoint breathing / sonar ripple frame from the time since
+        start_animation(), so a reduced tick rate shows fewer frames of the
+        same-speed cycle rather than a slow-motion one. Only the pulse item's
+        own rect is repainted; colors are applied on PnL changes.
+        """
+        item = self._pulse_item
+        if item is None or not self._current_points:
             return
 
         # Limit endpoint pulse to LIVE and 1D timeframes
         if self._current_timeframe not in ("LIVE", "1D"):
-            with contextlib.suppress(Exception):
-                if self._endpoint is not None:
-                    self._endpoint.setData([], [])
-                for ripple in self._ripple_items:
-                    ripple.setData([], [])
+            item.setVisible(False)
             return
 
-        # Advance pulse phase
-        self._pulse_phase = (self._pulse_phase + 0.035) % (2 * math.pi)
-        x, y = self._current_points[-1]
-
-        # Get PnL color
-        pnl_color = ColorTheme.pnl_color_from_direction(self._current_pnl_direction)
-        base_color = QtGui.QColor(pnl_color)
-
-        # Update main line pen dynamically (keeps graph color tied to PnL)
-        self._line.setPen(pg.mkPen(base_color, width=6, join="round", cap="round"))
-
-        # Endpoint breathing effect
-        pulse = 0.5 + 0.5 * math.sin(self._pulse_phase)
-        base_size = 8
-        size = base_size + 1.5 * pulse
-        dot_color = QtGui.QColor(base_color)
-        dot_color.setAlphaF(0.85 - 0.25 * pulse)
-        self._endpoint.setSize(size)
-        self._endpoint.setBrush(pg.mkBrush(dot_color))
-        self._endpoint.setData([x], [y])
-
-        # Sonar ripple rings (brighter inner edge, expanding)
-        for i, ripple in enumerate(self._ripple_items):
-            phase = (self._pulse_phase + (i * 2 * math.pi / len(self._ripple_items))) % (2 * math.pi)
-            frac = (1 + math.sin(phase)) / 2.0
-            radius = 8 + frac * 18.0  # Smaller radius (half of previous)
-            luminance_boost = 1.0 - frac * 0.6
-            alpha = max(0.0, 0.42 * (1.0 - frac)) * luminance_boost
-            ring_color = QtGui.QColor(base_color)
-            ring_color.setAlphaF(alpha)
-            pen = pg.mkPen(ring_color, width=1.0)
-            ripple.setPen(pen)
-            ripple.setSize(radius)
-            ripple.setData([x], [y])
-
-        # Soft glow synced to pulse (only if not perf_safe)
-        if self._glow_line is not None and not self._perf_safe:
-            g = QtGui.QColor(base_color)
-            alpha = 0.06 + 0.03 * (0.5 + 0.5 * math.sin(self._pulse_phase))
-            g.setAlphaF(min(0.25, max(0.0, alpha)))
-            self._glow_line.setPen(pg.mkPen(g, width=16, join="round", cap="round"))
+        elapsed_ms = (time.monotonic() - self._pulse_epoch) * 1000.0
+        item.set_phase_step(int(elapsed_ms // PULSE_INTERVAL_MS) % PULSE_PHASE_STEPS)
 
     def _update_trails_and_glow(self) -> None:
         """
@@ -407,13 +564,13 @@ class EquityChart(QtCore.QObject):
 
             # Update trail lines with fractional data
             for trail_item in self._trail_lines:
-                if hasattr(trail_item, "_trail_take"):
+                if hasattr(trail_item, "_trail_take") and trail_item.isVisible():
                     take = trail_item._trail_take
                     start_idx = max(0, int(len(xs) * (1 - take)))
                     trail_item.setData(xs[start_idx:], ys[start_idx:])
 
             # Update glow line (full data)
-            if self._glow_line is not None:
+            if self._glow_line is not None and self._glow_line.isVisible():
                 self._glow_line.setData(xs, ys)
 
         except Exception as e:
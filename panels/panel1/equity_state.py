@@ -99,6 +99,9 @@ class EquityStateManager(QtCore.QObject):
         # Track pending async loads (prevent duplicate requests)
         self._pending_loads: set[tuple[str, str]] = set()
 
+        # Scopes primed from the warm-start snapshot (served, but still reloaded)
+        self._warm_scopes: set[tuple[str, str]] = set()
+
         # Future watchers (prevent garbage collection)
         self._future_watchers: list[QtCore.QFutureWatcher] = []
 
@@ -153,7 +156,9 @@ class EquityStateManager(QtCore.QObject):
         """
         Get equity curve for (mode, account) scope.
 
-        If curve is not cached, initiates async load from database.
+        If curve is not cached, initiates async load from database. A curve
+        primed from the warm-start snapshot is returned immediately and the
+        database load still runs once to replace it.
 
         **CRITICAL:** Thread-safe access with QMutex.
 
@@ -169,14 +174,15 @@ class EquityStateManager(QtCore.QObject):
         # Thread-safe check if curve exists
         self._equity_mutex.lock()
         try:
-            if scope in self._equity_curves:
+            cached = self._equity_curves.get(scope)
+            if cached is not None and scope not in self._warm_scopes:
                 # Already cached - return copy to prevent external mutation
-                return list(self._equity_curves[scope])
+                return list(cached)
 
             # Check if already loading
             if scope in self._pending_loads:
-                # Load in progress - return empty for now
-                return []
+                # Load in progress - return warm copy (or empty) for now
+                return list(cached) if cached is not None else []
 
             # Mark as pending and trigger async load
             self._pending_loads.add(scope)
@@ -206,8 +212,10 @@ class EquityStateManager(QtCore.QObject):
             log.warning("[EquityStateManager] QtConcurrent not available, loading synchronously")
             data = self._load_equity_curve_from_database(mode, account)
             self._on_equity_curve_loaded(mode, account, data)
+            return data
 
-        return []  # Return empty until load completes
+        # Warm copy (or empty) until load completes
+        return list(cached) if cached is not None else []
 
     def get_active_curve(self) -> list[tuple[float, float]]:
         """
@@ -297,6 +305,46 @@ class EquityStateManager(QtCore.QObject):
                 exc_info=True
             )
 
+    def prime_curve(self, mode: str, account: str, points: list[tuple[float, float]]) -> None:
+        """
+        Seed a scope with a curve from the warm-start snapshot.
+
+        The primed curve is served until the database load for the scope
+        completes and replaces it. Scopes already loaded are left alone.
+
+        Args:
+            mode: Trading mode
+            account: Account identifier
+            points: (timestamp, balance) points
+        """
+        scope = (mode, account)
+
+        self._equity_mutex.lock()
+        try:
+            if scope in self._equity_curves:
+                return
+            self._equity_curves[scope] = [(float(ts), float(bal)) for ts, bal in points]
+            self._warm_scopes.add(scope)
+
+            if scope == (self._current_mode, self._current_account):
+                self._active_points = list(self._equity_curves[scope])
+        finally:
+            self._equity_mutex.unlock()
+
+        log.debug("[EquityStateManager] Curve primed from warm start", scope=scope, points=len(points))
+
+    def snapshot_curves(self) -> dict[tuple[str, str], list[tuple[float, float]]]:
+        """
+        Copy of every cached curve (warm-start snapshot writer).
+
+        **CRITICAL:** Thread-safe with QMutex protection.
+        """
+        self._equity_mutex.lock()
+        try:
+            return {scope: list(points) for scope, points in self._equity_curves.items()}
+        finally:
+            self._equity_mutex.unlock()
+
     def clear_curve(self, mode: str, account: str) -> None:
         """
         Clear equity curve for scope.
@@ -311,6 +359,7 @@ class EquityStateManager(QtCore.QObject):
         try:
             if scope in self._equity_curves:
                 del self._equity_curves[scope]
+            self._warm_scopes.discard(scope)
 
             # Clear active points if this is the current scope
             if scope == (self._current_mode, self._current_account):
@@ -411,6 +460,7 @@ class EquityStateManager(QtCore.QObject):
         try:
             self._equity_curves[scope] = equity_points
             self._pending_loads.discard(scope)
+            self._warm_scopes.discard(scope)
 
             # Update active curve if this is the current scope
             if scope == (self._current_mode, self._current_account):
@@ -10,6 +10,14 @@ This module handles:
 - PnL calculation for hovered point vs baseline
 - Cursor leave detection
 
+Scrubbing:
+- Mouse moves are coalesced to at most one hover update per display frame
+  (SCRUB_FRAME_MS); the latest position wins
+- set_data() caches the series as NumPy arrays once, so a hover update is a
+  binary search + interpolation (O(log n), no per-move list rebuilds)
+- Anchored baselines (1D start of day, YTD start of year) are memoized per
+  data version; set_data() bumps the version on every scope/timeframe/data change
+
 Architecture:
 - Stateful (manages hover state, current position)
 - Callback-based (calls update callbacks instead of emitting signals)
@@ -33,10 +41,11 @@ Usage:
 
 from __future__ import annotations
 
-import bisect
 from datetime import datetime
+import time
 from typing import Any, Callable, Optional
 
+import numpy as np
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from config.theme import THEME, ColorTheme
@@ -47,14 +56,12 @@ from utils.theme_helpers import normalize_color
 
 log = get_logger(__name__)
 
-# Try to import pyqtgraph (may not be available in all environments)
-try:
-    import pyqtgraph as pg  # type: ignore
-    HAS_PYQTGRAPH = True
-except ImportError:
-    pg = None
-    HAS_PYQTGRAPH = False
-    log.warning("pyqtgraph not available - hover functionality disabled")
+
+#: Minimum spacing between hover updates (one display frame at ~60 Hz)
+SCRUB_FRAME_MS = 16
+
+#: Sliding-window baselines (seconds before the hovered point)
+_BASELINE_WINDOWS = {"LIVE": 3600, "1W": 604800, "1M": 2592000, "3M": 7776000}
 
 
 class HoverHandler(QtCore.QObject):
@@ -110,6 +117,20 @@ class HoverHandler(QtCore.QObject):
         self._current_points: list[tuple[float, float]] = []
         self._current_timeframe: str = "LIVE"
 
+        # Cached series (rebuilt only in set_data)
+        self._xs: np.ndarray = np.empty(0, dtype=float)
+        self._ys: np.ndarray = np.empty(0, dtype=float)
+        self._data_version: int = 0
+        self._baseline_cache: dict[float, float] = {}  # anchor time -> balance (current version)
+
+        # Frame coalescing: latest mouse position waits for the next frame slot
+        self._pending_pos: Optional[QtCore.QPointF] = None
+        self._last_scrub_at: float = 0.0
+        self._scrub_timer = QtCore.QTimer(self)
+        self._scrub_timer.setSingleShot(True)
+        self._scrub_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._scrub_timer.timeout.connect(self._flush_scrub)
+
         # Timeframe configurations (for baseline calculations)
         self._tf_configs = {
             "LIVE": {"window_sec": 3600},
@@ -126,10 +147,13 @@ class HoverHandler(QtCore.QObject):
 
         Called after plot widget is initialized and attached to layout.
         """
-        if not HAS_PYQTGRAPH or self._plot is None:
-            log.warning("Cannot init hover elements - pyqtgraph not available")
+        if self._plot is None:
+            log.warning("Cannot init hover elements - no plot widget")
             return
 
+        # STARTUP: imported here, not at module load (see equity_chart._import_pyqtgraph)
+        import pyqtgraph as pg  # type: ignore
+
         try:
             # Hover line (85% height, vertical)
             self._hover_seg = QtWidgets.QGraphicsLineItem()
@@ -176,6 +200,17 @@ class HoverHandler(QtCore.QObject):
         self._current_points = list(points)
         self._current_timeframe = timeframe
 
+        series = np.asarray(self._current_points, dtype=float).reshape(-1, 2)
+        self._xs = np.ascontiguousarray(series[:, 0])
+        self._ys = np.ascontiguousarray(series[:, 1])
+        self._data_version += 1
+        self._baseline_cache.clear()
+
+    @property
+    def data_version(self) -> int:
+        """Incremented on every set_data() (new scope, timeframe or points)."""
+        return self._data_version
+
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
         """
         Hide hover artifacts when cursor leaves plot viewport.
@@ -199,7 +234,9 @@ class HoverHandler(QtCore.QObject):
                 if self._hover_text:
                     self._hover_text.setVisible(False)
 
-                # Reset state
+                # Reset state (drop any move still waiting for its frame)
+                self._scrub_timer.stop()
+                self._pending_pos = None
                 self._hovering = False
                 self._scrub_x = None
 
@@ -215,9 +252,36 @@ class HoverHandler(QtCore.QObject):
 
     def _on_mouse_move(self, pos: QtCore.QPointF) -> None:
         """
-        Handle mouse movement over chart.
+        Handle mouse movement over chart (coalesced to one update per frame).
 
-        Updates hover line position, timestamp text, and header display.
+        The first move after an idle frame is applied immediately; moves
+        arriving within the same frame only replace the pending position.
+
+        Args:
+            pos: Mouse position in scene coordinates
+        """
+        self._pending_pos = pos
+        if self._scrub_timer.isActive():
+            return
+
+        elapsed_ms = (time.perf_counter() - self._last_scrub_at) * 1000.0
+        if elapsed_ms >= SCRUB_FRAME_MS:
+            self._flush_scrub()
+        else:
+            self._scrub_timer.start(max(1, int(SCRUB_FRAME_MS - elapsed_ms)))
+
+    def _flush_scrub(self) -> None:
+        """Apply the latest pending mouse position."""
+        pos = self._pending_pos
+        self._pending_pos = None
+        if pos is None:
+            return
+        self._last_scrub_at = time.perf_counter()
+        self._scrub_to(pos)
+
+    def _scrub_to(self, pos: QtCore.QPointF) -> None:
+        """
+        Update hover line position, timestamp text, and header display.
 
         Args:
             pos: Mouse position in scene coordinates
@@ -225,7 +289,7 @@ class HoverHandler(QtCore.QObject):
         if self._plot is None or self._vb is None:
             return
 
-        if not self._current_points:
+        if self._xs.size == 0:
             # No data - hide hover elements
             if self._hover_seg:
                 self._hover_seg.setVisible(False)
@@ -252,17 +316,10 @@ class HoverHandler(QtCore.QObject):
         if x_mouse < xr[0] or x_mouse > xr[1]:
             return
 
-        # Extract x and y values
-        xs = [p[0] for p in self._current_points]
-        ys = [p[1] for p in self._current_points]
-
-        if not xs:
-            return
-
         # Snap to timeframe increment and clamp within dataset range
         x_snapped = TimeframeManager.snap_timestamp(self._current_timeframe, x_mouse)
-        x_snapped = max(xs[0], min(xs[-1], x_snapped))
-        y = self._interpolate_balance(xs, ys, x_snapped)
+        x_snapped = max(float(self._xs[0]), min(float(self._xs[-1]), x_snapped))
+        y = self._interpolate_balance(x_snapped)
 
         # Update state
         self._hovering = True
@@ -349,7 +406,10 @@ class HoverHandler(QtCore.QObject):
         """
         Get baseline balance for PnL calculation based on timeframe.
 
-        Uses binary search to find balance at start of timeframe window.
+        Uses binary search on the cached series to find the balance at the
+        start of the timeframe window. Anchored baselines (1D, YTD) are the
+        same for every point of a day/year, so they are memoized until the
+        next set_data().
 
         Args:
             at_time: Timestamp of hovered point
@@ -357,44 +417,30 @@ class HoverHandler(QtCore.QObject):
         Returns:
             Baseline balance, or None if no data
         """
-        if not self._current_points:
+        if self._xs.size == 0:
             return None
 
-        xs = [p[0] for p in self._current_points]
-        ys = [p[1] for p in self._current_points]
+        window = _BASELINE_WINDOWS.get(self._current_timeframe)
+        if window is not None:
+            return self._balance_at_or_before(at_time - window)
 
-        # Calculate baseline time based on timeframe
-        if self._current_timeframe == "LIVE":
-            baseline_time = at_time - 3600  # 1 hour ago
-
-        elif self._current_timeframe == "1D":
+        dt = datetime.fromtimestamp(at_time)
+        if self._current_timeframe == "1D":
             # Start of day (midnight)
-            dt = datetime.fromtimestamp(at_time)
-            baseline_time = datetime(dt.year, dt.month, dt.day).timestamp()
-
-        elif self._current_timeframe == "1W":
-            baseline_time = at_time - 604800  # 1 week ago
-
-        elif self._current_timeframe == "1M":
-            baseline_time = at_time - 2592000  # 30 days ago
-
-        elif self._current_timeframe == "3M":
-            baseline_time = at_time - 7776000  # 90 days ago
-
+            anchor = datetime(dt.year, dt.month, dt.day).timestamp()
         else:  # YTD
             # Start of year (January 1)
-            dt = datetime.fromtimestamp(at_time)
-            baseline_time = datetime(dt.year, 1, 1).timestamp()
-
-        # Binary search for point at or before baseline_time
-        i = bisect.bisect_right(xs, baseline_time)
+            anchor = datetime(dt.year, 1, 1).timestamp()
 
-        if i == 0:
-            # No points before baseline - use first point
-            return ys[0]
+        baseline = self._baseline_cache.get(anchor)
+        if baseline is None:
+            baseline = self._baseline_cache[anchor] = self._balance_at_or_before(anchor)
+        return baseline
 
-        # Return balance at or before baseline_time
-        return ys[i - 1]
+    def _balance_at_or_before(self, ts: float) -> float:
+        """Balance of the last point at or before ts (first point if none)."""
+        i = int(np.searchsorted(self._xs, ts, side="right"))
+        return float(self._ys[i - 1] if i else self._ys[0])
 
     def is_hovering(self) -> bool:
         """
@@ -414,18 +460,19 @@ class HoverHandler(QtCore.QObject):
         """
         return self._scrub_x
 
-    def _interpolate_balance(self, xs: list[float], ys: list[float], target_x: float) -> float:
+    def _interpolate_balance(self, target_x: float) -> float:
         """
         Interpolate balance value for an arbitrary timestamp.
         """
+        xs, ys = self._xs, self._ys
         if target_x <= xs[0]:
-            return ys[0]
+            return float(ys[0])
         if target_x >= xs[-1]:
-            return ys[-1]
+            return float(ys[-1])
 
-        idx = bisect.bisect_right(xs, target_x)
-        x0, x1 = xs[idx - 1], xs[idx]
-        y0, y1 = ys[idx - 1], ys[idx]
+        idx = int(np.searchsorted(xs, target_x, side="right"))
+        x0, x1 = float(xs[idx - 1]), float(xs[idx])
+        y0, y1 = float(ys[idx - 1]), float(ys[idx])
 
         if x1 == x0:
             return y1
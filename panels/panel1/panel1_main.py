@@ -65,17 +65,20 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
     - update_equity_series_from_balance(balance, mode)
     - set_connection_status(connected)
     - refresh()
+    - build_chart() (when constructed with defer_chart=True)
     """
 
     # Signals
     timeframeChanged = QtCore.pyqtSignal(str)
 
-    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None, defer_chart: bool = False):
         """
         Initialize Panel1.
 
         Args:
             parent: Parent widget (optional)
+            defer_chart: Leave the chart (and the pyqtgraph import) to a later
+                build_chart() call, e.g. a deferred startup stage
         """
         super().__init__(parent)
 
@@ -117,7 +120,8 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
         self._build_ui()
 
         # Initialize modules
-        self._init_modules()
+        if not defer_chart:
+            self._init_modules()
 
         # Wire signals
         self._wire_signals()
@@ -125,6 +129,11 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
         # Initialize display
         self.set_pnl_for_timeframe(pnl_value=0.0, pnl_pct=0.0, up=None)
 
+    @classmethod
+    def _theme_rules(cls, theme) -> str:
+        """Panel1 background for one theme."""
+        return f"QWidget#Panel1 {{ background:{theme['bg_panel']}; }}"
+
     def _build_ui(self) -> None:
         """
         Build UI layout.
@@ -135,7 +144,7 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
         - Graph container (MaskedFrame)
         """
         self.setObjectName("Panel1")
-        self.setStyleSheet(f"QWidget#Panel1 {{ background:{THEME.get('bg_panel', '#000000')}; }}")
+        self._apply_theme_stylesheet()
 
         # Root layout
         root = QtWidgets.QVBoxLayout(self)
@@ -314,6 +323,14 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
         # Start chart animation
         self._equity_chart.start_animation()
 
+    def build_chart(self) -> None:
+        """Create a deferred chart and plot the curve and PnL color gathered meanwhile."""
+        if self._equity_chart.has_plot():
+            return
+        self._init_modules()
+        self._equity_chart.update_endpoint_color(self._pnl_up)
+        self.set_timeframe(self._current_timeframe)
+
     def _wire_signals(self) -> None:
         """
         Wire signals between modules.
@@ -344,11 +361,16 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
             QtCore.Qt.ConnectionType.QueuedConnection,
         )
         bus.modeChanged.connect(
-            lambda mode: self.set_trading_mode(mode, None),
+            self._on_mode_changed,
             QtCore.Qt.ConnectionType.QueuedConnection,
         )
         bus.balanceDisplayRequested.connect(self._on_balance_display_requested)
         bus.equityPointRequested.connect(self._on_equity_point_requested)
+        # Chart pens are not stylesheet driven
+        bus.themeChangeRequested.connect(
+            self._equity_chart.refresh_theme,
+            QtCore.Qt.ConnectionType.QueuedConnection,
+        )
 
     def _on_equity_curve_loaded(self, mode: str, account: str, points: list[tuple[float, float]]) -> None:
         """
@@ -375,6 +397,10 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
             # Calculate PnL
             self._update_pnl_for_timeframe(points)
 
+    def _on_mode_changed(self, mode: str) -> None:
+        """Handle mode changes from SignalBus (bound slot: dropped with the panel)."""
+        self.set_trading_mode(mode, None)
+
     def _on_balance_display_requested(self, balance: float, mode: str) -> None:
         """Handle balance display events from SignalBus."""
         normalized_mode = self._ensure_mode_cache(mode or "SIM")
@@ -517,6 +543,7 @@ class Panel1(ThemeAwareMixin, QtWidgets.QWidget):
             self._pnl_val = val
             self._pnl_pct = pct
             self._pnl_up = up
+            self._equity_chart.update_endpoint_color(up)
 
     def _ensure_mode_cache(self, mode: str) -> str:
         """Ensure cache dictionaries have entries for the given mode."""
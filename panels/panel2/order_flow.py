@@ -28,9 +28,9 @@ Usage:
     # Set current state
     order_flow.set_state(position_state)
 
-    # Process DTC messages
-    order_flow.on_order_update(payload)
-    order_flow.on_position_update(payload)
+    # Process DTC messages (typed bus events, or raw DTC dicts)
+    order_flow.on_order_update(event)
+    order_flow.on_position_update(event)
 """
 
 from __future__ import annotations
@@ -42,8 +42,8 @@ from PyQt6 import QtCore
 
 import structlog
 
+from domain.events import OrderUpdateEvent, PositionUpdateEvent
 from services.trade_constants import COMM_PER_CONTRACT, DOLLARS_PER_POINT
-from utils.trade_mode import detect_mode_from_account
 
 from .position_state import PositionState
 
@@ -120,7 +120,7 @@ class OrderFlow(QtCore.QObject):
     # DTC MESSAGE HANDLERS
     # =========================================================================
 
-    def on_order_update(self, payload: dict) -> None:
+    def on_order_update(self, payload: OrderUpdateEvent | dict) -> None:
         """
         Handle normalized OrderUpdate from DTC (via data_bridge).
 
@@ -137,19 +137,14 @@ class OrderFlow(QtCore.QObject):
         - SIM mode: Must seed position from fills (no PositionUpdate)
 
         Args:
-            payload: Normalized order update dict from data_bridge
+            payload: OrderUpdateEvent from the SignalBus (raw DTC dicts are coerced)
         """
         try:
-            account = payload.get("TradeAccount") or self._state.current_account or ""
-            mode = detect_mode_from_account(account) if account else self._state.current_mode
-            self._state = self._state.with_scope(
-                mode=mode,
-                account=account or self._state.current_account or "",
-            )
+            event = payload if isinstance(payload, OrderUpdateEvent) else OrderUpdateEvent.from_dtc(payload)
+            self._apply_scope(event.account, event.mode)
 
-            order_status = payload.get("OrderStatus")
-            side = payload.get("BuySell")  # 1=Buy, 2=Sell
-            price1 = payload.get("Price1")
+            side = event.side  # 1=Buy, 2=Sell
+            price1 = event.price1
 
             # ----------------------------------------------------------------
             # Auto-detect stop/target from sell orders
@@ -157,7 +152,7 @@ class OrderFlow(QtCore.QObject):
             # Infer stop/target from sell order prices relative to entry
             # (DTC doesn't explicitly mark stop vs target orders)
             if side == 2 and self._state.entry_price is not None and self._state.entry_price > 0 and price1 is not None:
-                price1_float = float(price1)
+                price1_float = price1
 
                 # Lower than entry = Stop loss
                 if price1_float < self._state.entry_price:
@@ -182,12 +177,12 @@ class OrderFlow(QtCore.QObject):
             # ----------------------------------------------------------------
             # Process fills (Status 3=Filled, 7=Filled)
             # ----------------------------------------------------------------
-            if order_status not in (3, 7):
+            if not event.is_filled:
                 return
 
             # Extract fill data
-            qty = payload.get("FilledQuantity") or 0
-            price = payload.get("AverageFillPrice") or payload.get("Price1")
+            qty = event.filled_quantity or 0
+            price = event.average_fill_price or event.price1
             is_long = side == 1
 
             # ----------------------------------------------------------------
@@ -201,9 +196,9 @@ class OrderFlow(QtCore.QObject):
                     # Seed position from fill
                     self._state = self._open_position_from_fill(
                         qty=qty,
-                        price=float(price),
+                        price=price,
                         is_long=is_long,
-                        payload=payload
+                        event=event
                     )
 
                     log.info(
@@ -242,11 +237,11 @@ class OrderFlow(QtCore.QObject):
                 new_qty=qty
             )
 
-            # Extract exit price from payload (fallback chain)
+            # Extract exit price from the fill (fallback chain)
             exit_price = (
-                payload.get("LastFillPrice")
-                or payload.get("AverageFillPrice")
-                or payload.get("Price1")
+                event.last_fill_price
+                or event.average_fill_price
+                or event.price1
                 or self._state.last_price
             )
 
@@ -259,7 +254,7 @@ class OrderFlow(QtCore.QObject):
             # Build trade dict
             trade = self._build_trade_dict(
                 exit_price=exit_price,
-                payload=payload
+                event=event
             )
 
             log.info("[OrderFlow] Trade dict created", trade=trade)
@@ -277,7 +272,7 @@ class OrderFlow(QtCore.QObject):
         except Exception as e:
             log.error("[OrderFlow] Error in on_order_update", error=str(e), exc_info=True)
 
-    def on_position_update(self, payload: dict) -> None:
+    def on_position_update(self, payload: PositionUpdateEvent | dict) -> None:
         """
         Handle normalized PositionUpdate from DTC.
 
@@ -293,27 +288,23 @@ class OrderFlow(QtCore.QObject):
         - Symbol must be extracted from payload (not quote feed)
 
         Args:
-            payload: Normalized position update dict from MessageRouter
+            payload: PositionUpdateEvent from the SignalBus (raw DTC dicts are coerced)
         """
         try:
-            # Extract from normalized payload (lowercase keys)
-            qty = int(payload.get("qty", 0))
-            avg_price = payload.get("avg_entry")
+            event = payload if isinstance(payload, PositionUpdateEvent) else PositionUpdateEvent.from_dtc(payload)
+            qty = event.quantity
+            avg_price = event.average_price
 
-            # CRITICAL: Extract symbol from PositionUpdate payload
+            # CRITICAL: Symbol comes from the PositionUpdate
             # (NOT from quote feed - position symbol is authoritative)
-            symbol = payload.get("symbol") or payload.get("Symbol") or ""
-
-            # Convert to float if not None
-            if avg_price is not None:
-                avg_price = float(avg_price)
+            symbol = event.symbol
 
             log.debug(
                 "[OrderFlow] Position update received",
                 qty=qty,
                 avg_entry=avg_price,
                 symbol=symbol,
-                account=payload.get("TradeAccount", "unknown")
+                account=event.account or "unknown"
             )
 
             # ----------------------------------------------------------------
@@ -330,12 +321,7 @@ class OrderFlow(QtCore.QObject):
             # Determine direction
             is_long = None if qty == 0 else (qty > 0)
 
-            account = payload.get("TradeAccount") or self._state.current_account or ""
-            mode = detect_mode_from_account(account) if account else self._state.current_mode
-            self._state = self._state.with_scope(
-                mode=mode,
-                account=account or self._state.current_account or "",
-            )
+            self._apply_scope(event.account, event.mode)
 
             # ----------------------------------------------------------------
             # Detect trade closure (qty → 0)
@@ -353,7 +339,7 @@ class OrderFlow(QtCore.QObject):
                 # Build trade dict
                 trade = self._build_trade_dict(
                     exit_price=exit_price,
-                    payload=payload
+                    event=event
                 )
 
                 log.info("[OrderFlow] Trade dict created from position closure", trade=trade)
@@ -421,12 +407,19 @@ class OrderFlow(QtCore.QObject):
     # HELPER METHODS
     # =========================================================================
 
+    def _apply_scope(self, account: str, mode: str) -> None:
+        """Scope state to the event's account (mode was derived by the normalizer)."""
+        self._state = self._state.with_scope(
+            mode=mode if account else self._state.current_mode,
+            account=account or self._state.current_account or "",
+        )
+
     def _open_position_from_fill(
         self,
         qty: int,
         price: float,
         is_long: bool,
-        payload: dict
+        event: OrderUpdateEvent
     ) -> PositionState:
         """
         Create new position state from fill data.
@@ -437,17 +430,17 @@ class OrderFlow(QtCore.QObject):
             qty: Fill quantity
             price: Fill price
             is_long: True if long, False if short
-            payload: DTC payload (for symbol extraction)
+            event: Fill event (for symbol/account)
 
         Returns:
             New PositionState with position opened
         """
         import time
 
-        # Extract symbol from payload
-        symbol = payload.get("Symbol") or self._state.symbol
-        account = payload.get("TradeAccount") or self._state.current_account or ""
-        mode = detect_mode_from_account(account) if account else self._state.current_mode
+        # Extract symbol from the fill
+        symbol = event.symbol or self._state.symbol
+        account = event.account or self._state.current_account or ""
+        mode = event.mode if event.account else self._state.current_mode
 
         # Create new state with position
         state = self._state.with_position(
@@ -473,14 +466,14 @@ class OrderFlow(QtCore.QObject):
     def _build_trade_dict(
         self,
         exit_price: float,
-        payload: dict
+        event: OrderUpdateEvent | PositionUpdateEvent
     ) -> dict:
         """
         Build trade dict for closure with full P&L calculations.
 
         Args:
             exit_price: Exit price
-            payload: DTC payload (for account/timestamp)
+            event: Closing order/position event (for account/timestamp)
 
         Returns:
             Trade dict with all metrics
@@ -515,16 +508,16 @@ class OrderFlow(QtCore.QObject):
         if self._state.entry_time_epoch:
             entry_time = datetime.fromtimestamp(self._state.entry_time_epoch, tz=UTC)
 
-        # Use DTC timestamp from payload if available
-        exit_ts = payload.get("DateTime")
+        # Use DTC timestamp from the event if available
+        exit_ts = event.date_time
         if exit_ts:
-            exit_time = datetime.fromtimestamp(float(exit_ts), tz=UTC)
+            exit_time = datetime.fromtimestamp(exit_ts, tz=UTC)
         else:
             exit_time = datetime.now(tz=UTC)
 
         # Get account and mode
-        account = payload.get("TradeAccount") or self._state.current_account or ""
-        mode = detect_mode_from_account(account) if account else self._state.current_mode
+        account = event.account or self._state.current_account or ""
+        mode = event.mode if event.account else self._state.current_mode
 
         # Build trade dict
         trade = {
@@ -34,8 +34,10 @@ from PyQt6 import QtCore, QtWidgets
 
 from config.settings import SNAPSHOT_CSV_PATH
 from config.theme import THEME, ColorTheme
+from core import metrics
+from domain.events import OrderUpdateEvent, PositionUpdateEvent
 from utils.theme_mixin import ThemeAwareMixin
-from widgets.metric_cell import MetricCell
+from widgets.metric_grid import MetricGrid
 
 import structlog
 
@@ -50,6 +52,14 @@ from .order_flow import OrderFlow
 log = structlog.get_logger(__name__)
 
 
+# Metric grid cells, row-major (3 rows x 5 columns)
+PANEL2_METRICS = [
+    "Price", "Heat", "Time", "Target", "Stop",
+    "Planned Risk", "R-Multiple", "Range", "MAE", "MFE",
+    "VWAP", "Delta", "POC", "Efficiency", "Pts",
+]
+
+
 class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
     """
     Panel2 main orchestrator.
@@ -188,7 +198,7 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
     def _build_ui(self) -> None:
         """Build Panel2 UI widgets."""
         self.setObjectName("Panel2")
-        self.setStyleSheet(f"QWidget#Panel2 {{ background:{THEME.get('bg_panel', '#0B0F14')}; }}")
+        self._apply_theme_stylesheet()
 
         # Outer column layout
         outer = QtWidgets.QVBoxLayout(self)
@@ -257,53 +267,31 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
         hdr.addStretch(1)
         outer.addLayout(hdr)
 
-        # ---- Metric grid (3 rows x 5 columns)
-        grid = QtWidgets.QGridLayout()
-        grid.setHorizontalSpacing(8)
-        grid.setVerticalSpacing(8)
-        outer.addLayout(grid, 1)
+        # ---- Metric grid (3 rows x 5 columns, one custom-painted widget)
+        self.metric_grid = MetricGrid(PANEL2_METRICS, cols=5)
+        outer.addWidget(self.metric_grid, 1)
+        cell = self.metric_grid.cell
 
         # Row 1
-        self.c_price = MetricCell("Price")
-        self.c_heat = MetricCell("Heat")
-        self.c_time = MetricCell("Time")
-        self.c_target = MetricCell("Target")
-        self.c_stop = MetricCell("Stop")
+        self.c_price = cell("Price")
+        self.c_heat = cell("Heat")
+        self.c_time = cell("Time")
+        self.c_target = cell("Target")
+        self.c_stop = cell("Stop")
 
         # Row 2
-        self.c_risk = MetricCell("Planned Risk")
-        self.c_rmult = MetricCell("R-Multiple")
-        self.c_range = MetricCell("Range")
-        self.c_mae = MetricCell("MAE")
-        self.c_mfe = MetricCell("MFE")
+        self.c_risk = cell("Planned Risk")
+        self.c_rmult = cell("R-Multiple")
+        self.c_range = cell("Range")
+        self.c_mae = cell("MAE")
+        self.c_mfe = cell("MFE")
 
         # Row 3
-        self.c_vwap = MetricCell("VWAP")
-        self.c_delta = MetricCell("Delta")
-        self.c_poc = MetricCell("POC")
-        self.c_eff = MetricCell("Efficiency")
-        self.c_pts = MetricCell("Pts")
-
-        # Add cells to grid
-        cells = [
-            (0, 0, self.c_price),
-            (0, 1, self.c_heat),
-            (0, 2, self.c_time),
-            (0, 3, self.c_target),
-            (0, 4, self.c_stop),
-            (1, 0, self.c_risk),
-            (1, 1, self.c_rmult),
-            (1, 2, self.c_range),
-            (1, 3, self.c_mae),
-            (1, 4, self.c_mfe),
-            (2, 0, self.c_vwap),
-            (2, 1, self.c_delta),
-            (2, 2, self.c_poc),
-            (2, 3, self.c_eff),
-            (2, 4, self.c_pts),
-        ]
-        for r, c, w in cells:
-            grid.addWidget(w, r, c)
+        self.c_vwap = cell("VWAP")
+        self.c_delta = cell("Delta")
+        self.c_poc = cell("POC")
+        self.c_eff = cell("Efficiency")
+        self.c_pts = cell("Pts")
 
     # =========================================================================
     # SIGNAL WIRING
@@ -341,6 +329,7 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
         Args:
             market_data: Dict with keys: last, high, low, vwap, cum_delta, poc
         """
+        t0 = metrics.now()
         try:
             last_price = float(market_data.get("last_price", market_data.get("last", 0.0)) or 0.0)
             session_high = float(market_data.get("session_high", market_data.get("high", 0.0)) or 0.0)
@@ -375,7 +364,7 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
             self._state = updated_state
 
             # Calculate metrics
-            metrics = MetricsCalculator.calculate_all(
+            tick_metrics = MetricsCalculator.calculate_all(
                 self._state,
                 current_epoch=int(time.time())
             )
@@ -384,13 +373,14 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
             self.indicators.update(self._state, current_epoch=int(time.time()))
 
             # Update display
-            self.display.update(self._state, metrics, current_epoch=int(time.time()))
+            self.display.update(self._state, tick_metrics, current_epoch=int(time.time()))
 
             # Persist state (JSON)
             self.persistence.save_state(self._state)
 
         except Exception as e:
             log.error("[Panel2Main] Error handling feed update", error=str(e), exc_info=True)
+        metrics.observe("panel2.tick", t0)
 
     def _persist_trade_extremes(self, price: float, state: Optional[PositionState] = None) -> None:
         """Persist MAE/MFE extremes without re-writing the full position snapshot."""
@@ -552,25 +542,25 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
     # BACKWARDS-COMPATIBLE PUBLIC API
     # =========================================================================
 
-    def on_order_update(self, payload: dict) -> None:
+    def on_order_update(self, payload: OrderUpdateEvent | dict) -> None:
         """
         Handle DTC order update (backwards-compatible API).
 
         Delegates to OrderFlow handler.
 
         Args:
-            payload: Normalized order update dict from DTC
+            payload: OrderUpdateEvent from the SignalBus, or a raw DTC dict
         """
         self.order_flow.on_order_update(payload)
 
-    def on_position_update(self, payload: dict) -> None:
+    def on_position_update(self, payload: PositionUpdateEvent | dict) -> None:
         """
         Handle DTC position update (backwards-compatible API).
 
         Delegates to OrderFlow handler.
 
         Args:
-            payload: Normalized position update dict from DTC
+            payload: PositionUpdateEvent from the SignalBus, or a raw DTC dict
         """
         self.order_flow.on_position_update(payload)
 
@@ -603,6 +593,11 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
                 lambda mode: self.set_trading_mode(mode, self.current_account),
                 QtCore.Qt.ConnectionType.QueuedConnection,
             )
+            # Painted grid colors are not stylesheet driven
+            signal_bus.themeChangeRequested.connect(
+                self.metric_grid.refresh_theme,
+                QtCore.Qt.ConnectionType.QueuedConnection,
+            )
 
             log.info("[Panel2Main] Connected to SignalBus for DTC events")
             print("[Panel2Main] Connected to SignalBus")
@@ -825,21 +820,17 @@ class Panel2(QtWidgets.QWidget, ThemeAwareMixin):
     # THEME REFRESH (ThemeAwareMixin)
     # =========================================================================
 
-    def _build_theme_stylesheet(self) -> str:
-        """Build Panel2 stylesheet."""
-        return f"QWidget#Panel2 {{ background:{THEME.get('bg_panel', '#000000')}; }}"
+    @classmethod
+    def _theme_rules(cls, theme) -> str:
+        """Panel2 stylesheet for one theme."""
+        return f"QWidget#Panel2 {{ background:{theme['bg_panel']}; }}"
 
     def _get_theme_children(self) -> list:
         """Return child widgets to refresh on theme change."""
         children = []
 
-        # Add metric cells
-        for cell in [
-            self.c_price, self.c_heat, self.c_time, self.c_target, self.c_stop,
-            self.c_risk, self.c_rmult, self.c_range, self.c_mae, self.c_mfe,
-            self.c_vwap, self.c_delta, self.c_poc, self.c_eff, self.c_pts
-        ]:
-            children.append(cell)
+        # Metric grid (paints all 15 cells)
+        children.append(self.metric_grid)
 
         # Add pills
         if hasattr(self, "pills"):
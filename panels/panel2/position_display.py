@@ -9,7 +9,7 @@ and metrics and updates the UI.
 
 Architecture:
 - Input: PositionState + metrics dict
-- Output: UI updates (MetricCell instances)
+- Output: UI updates (MetricGrid cells; MetricCell-compatible API)
 - No business logic (pure rendering)
 - No state mutations (read-only)
 - Theme-aware styling
@@ -43,7 +43,7 @@ import structlog
 
 if TYPE_CHECKING:
     from panels.panel2.position_state import PositionState
-    from widgets.metric_cell import MetricCell
+    from widgets.metric_grid import MetricGridCell
     from panels.panel2.visual_indicators import VisualIndicators
 
 log = structlog.get_logger(__name__)
@@ -60,23 +60,23 @@ class PositionDisplay:
     def __init__(
         self,
         # Row 1
-        c_price: "MetricCell",
-        c_heat: "MetricCell",
-        c_time: "MetricCell",
-        c_target: "MetricCell",
-        c_stop: "MetricCell",
+        c_price: "MetricGridCell",
+        c_heat: "MetricGridCell",
+        c_time: "MetricGridCell",
+        c_target: "MetricGridCell",
+        c_stop: "MetricGridCell",
         # Row 2
-        c_risk: "MetricCell",
-        c_rmult: "MetricCell",
-        c_range: "MetricCell",
-        c_mae: "MetricCell",
-        c_mfe: "MetricCell",
+        c_risk: "MetricGridCell",
+        c_rmult: "MetricGridCell",
+        c_range: "MetricGridCell",
+        c_mae: "MetricGridCell",
+        c_mfe: "MetricGridCell",
         # Row 3
-        c_vwap: "MetricCell",
-        c_delta: "MetricCell",
-        c_poc: "MetricCell",
-        c_eff: "MetricCell",
-        c_pts: "MetricCell",
+        c_vwap: "MetricGridCell",
+        c_delta: "MetricGridCell",
+        c_poc: "MetricGridCell",
+        c_eff: "MetricGridCell",
+        c_pts: "MetricGridCell",
         # Banners
         symbol_banner=None,
         live_banner=None,
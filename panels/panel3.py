@@ -63,8 +63,9 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
         super().__init__()
         self._tf: str = "1D"
         self._panel_live = None  # Reference to Panel 2 for direct data access
+        self._stats_scope: Optional[tuple[str, Optional[str]]] = None  # (mode, account) shown in the grid
         self._build_ui()
-        # Initial load
+        # Initial load (schedules background precompute of all timeframes)
         with contextlib.suppress(Exception):
             self._load_metrics_for_timeframe(self._tf)
 
@@ -96,6 +97,7 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
         - themeChangeRequested  refresh_theme()
         - tradeClosedForAnalytics  on_trade_closed()
         - metricsReloadRequested  _load_metrics_for_timeframe()
+        - statsPrecomputed  _on_stats_precomputed()
         - snapshotAnalysisRequested  analyze_and_store_trade_snapshot()
         """
         try:
@@ -107,27 +109,33 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
 
             # Theme change requests (replaces direct calls from app_manager)
             signal_bus.themeChangeRequested.connect(
-                lambda: self.refresh_theme() if hasattr(self, 'refresh_theme') else None,
+                self.refresh_theme,
                 QtCore.Qt.ConnectionType.QueuedConnection
             )
 
             # Trade closed event for analytics (replaces direct on_trade_closed call)
             log.info("[Panel3 DEBUG] Connecting tradeClosedForAnalytics signal...")
             signal_bus.tradeClosedForAnalytics.connect(
-                lambda trade: self.on_trade_closed(trade) if hasattr(self, 'on_trade_closed') else None,
+                self.on_trade_closed,
                 QtCore.Qt.ConnectionType.QueuedConnection
             )
             log.info("[Panel3 DEBUG] tradeClosedForAnalytics signal connected successfully")
 
             # Metrics reload requested (replaces direct call)
             signal_bus.metricsReloadRequested.connect(
-                lambda tf: self._load_metrics_for_timeframe(tf) if hasattr(self, '_load_metrics_for_timeframe') else None,
+                self._load_metrics_for_timeframe,
+                QtCore.Qt.ConnectionType.QueuedConnection
+            )
+
+            # Background stats results (StatsPrecomputeWorker)
+            signal_bus.statsPrecomputed.connect(
+                self._on_stats_precomputed,
                 QtCore.Qt.ConnectionType.QueuedConnection
             )
 
             # Snapshot analysis requested (replaces direct call)
             signal_bus.snapshotAnalysisRequested.connect(
-                lambda: self.analyze_and_store_trade_snapshot() if hasattr(self, 'analyze_and_store_trade_snapshot') else None,
+                self.analyze_and_store_trade_snapshot,
                 QtCore.Qt.ConnectionType.QueuedConnection
             )
 
@@ -143,7 +151,7 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
 
     def _build_ui(self) -> None:
         self.setObjectName("Panel3")
-        self.setStyleSheet(f"QWidget#Panel3 {{ background:{THEME.get('bg_panel', '#0B0F14')}; }}")
+        self._apply_theme_stylesheet()
 
         root = QtWidgets.QVBoxLayout(self)
         # Match Panel 2 margins/spacing
@@ -152,11 +160,7 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
 
         # Title (centered) - uses heading font (Lato in LIVE/SIM)
         self.lbl_title = QtWidgets.QLabel("TRADING STATS")
-        self.lbl_title.setStyleSheet(
-            f"color:{THEME.get('ink', '#E5E7EB')}; "
-            f"{ColorTheme.heading_font_css(int(THEME.get('title_font_weight', 500)), int(THEME.get('title_font_size', 16)))}; "
-            "letter-spacing:0.6px;"
-        )
+        self.lbl_title.setObjectName("Panel3Title")
         root.addLayout(centered_row(self.lbl_title))
 
         # Timeframe pills (centered row)
@@ -226,9 +230,18 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
         with contextlib.suppress(Exception):
             self.update()
 
-    def _build_theme_stylesheet(self) -> str:
-        """Build Panel3 stylesheet."""
-        return f"QWidget#Panel3 {{ background:{THEME.get('bg_panel', '#000000')}; }}"
+    @classmethod
+    def _theme_rules(cls, theme) -> str:
+        """Panel3 background + title for one theme."""
+        title_font = ColorTheme.heading_font_css(
+            int(theme["title_font_weight"]),
+            int(theme["title_font_size"]),
+            family=str(theme["heading_font_family"]),
+        )
+        return (
+            f"QWidget#Panel3 {{ background:{theme['bg_panel']}; }}\n"
+            f"QWidget#Panel3 QLabel#Panel3Title {{ color:{theme['ink']}; {title_font}; letter-spacing:0.6px; }}"
+        )
 
     def _get_theme_children(self) -> list:
         """Return child widgets to refresh."""
@@ -239,15 +252,6 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
             children.append(self.metric_grid)
         return children
 
-    def _on_theme_refresh(self) -> None:
-        """Update title label after theme refresh."""
-        if hasattr(self, "lbl_title") and self.lbl_title:
-            self.lbl_title.setStyleSheet(
-                f"color:{THEME.get('ink', '#E5E7EB')}; "
-                f"{ColorTheme.heading_font_css(int(THEME.get('title_font_weight', 500)), int(THEME.get('title_font_size', 16)))}; "
-                "letter-spacing:0.6px;"
-            )
-
     # -------------------- Panel 2 Integration (Direct Data Access) ----------
     def set_live_panel(self, panel_live) -> None:
         """
@@ -372,61 +376,78 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
                 pass
 
     # -------------------- Data & Metrics (local to Panel 3) -----------------
-    def _load_metrics_for_timeframe(
+    def _resolve_stats_scope(
         self,
-        tf: str,
         mode_override: Optional[str] = None,
         account_override: Optional[str] = None,
-    ) -> None:
-        """Query closed trades within timeframe and update metric cells and Sharpe bar.
-        Prefers TradeRecord.exit_time; falls back to timestamp if absent.
-        Filters by trading mode (SIM/LIVE). Uses mode_override when provided,
-        otherwise falls back to the active UI mode from StateManager.
-        Account scope mirrors Panel 2 (mode + account) so stats always match
-        the currently selected book.
+    ) -> tuple[str, Optional[str]]:
+        """Resolve the (mode, account) scope stats should be shown for.
+        Uses mode_override when provided, otherwise the active UI mode from
+        StateManager. Account scope mirrors Panel 2 (mode + account) so stats
+        always match the currently selected book.
         """
-        log.info(f"[Panel3 DEBUG] ========== _load_metrics_for_timeframe CALLED ==========")
-        log.info(f"[Panel3 DEBUG] Timeframe: {tf}")
-
-        try:
-            from services.stats_service import compute_trading_stats_for_timeframe
-        except Exception as e:
-            log.error(f"[Panel3 DEBUG] Failed to import stats_service: {e}")
-            return
-
-        # Determine mode to query
         if mode_override:
             mode = mode_override
-            log.info(f"[Panel3 DEBUG] Mode override from payload: {mode}")
         else:
-            mode = None
             try:
                 from core.app_state import get_state_manager
                 state = get_state_manager()
                 # Use current_mode (UI mode) when no explicit mode is provided
                 mode = state.current_mode if state else "SIM"
-                log.info(f"[Panel3 DEBUG] Current mode from state manager: {mode}")
             except Exception as e:
                 mode = "SIM"  # Default fallback
-                log.error(f"[Panel3 DEBUG] Error getting mode, defaulting to SIM: {e}")
+                log.error(f"[Panel3] Error getting mode, defaulting to SIM: {e}")
 
-        # Determine account scope
         if account_override is not None:
             account = account_override
-            log.info(f"[Panel3 DEBUG] Account override from payload: {account}")
         else:
             account = self._get_active_account()
-            log.info(f"[Panel3 DEBUG] Active account from state manager: {account}")
 
-        log.info(f"[Panel3 DEBUG] Computing stats for timeframe={tf}, mode={mode}, account={account}...")
-        payload = compute_trading_stats_for_timeframe(tf, mode=mode, account=account)
-        log.info(f"[Panel3 DEBUG] Stats payload received: {payload}")
+        return (mode or "SIM").upper(), account
+
+    def _load_metrics_for_timeframe(
+        self,
+        tf: str,
+        mode_override: Optional[str] = None,
+        account_override: Optional[str] = None,
+    ) -> None:
+        """Show stats for timeframe from the background stats worker's memory.
+        Never queries the DB on the GUI thread: a cached payload is applied
+        immediately, and a precompute of all timeframes is scheduled when the
+        scope changed or the cached payload is missing/stale. The result is
+        applied by _on_stats_precomputed when it arrives.
+        """
+        try:
+            from services.stats_worker import get_stats_worker
+        except Exception as e:
+            log.error(f"[Panel3] Failed to import stats_worker: {e}")
+            return
+
+        mode, account = self._resolve_stats_scope(mode_override, account_override)
+        self._stats_scope = (mode, account)
+
+        worker = get_stats_worker()
+        payload = worker.get_cached(mode, account, tf)
+        if payload is not None:
+            self._apply_stats_payload(payload)
 
-        # Check if we have any trades for this mode in this timeframe
-        trades_count = payload.get("_trade_count", 0)
-        log.info(f"[Panel3 DEBUG] Trades count: {trades_count}")
+        if worker.active_scope() != (mode, account) or (payload is not None and worker.is_stale(mode, account, tf)):
+            log.debug(f"[Panel3] Scheduling stats precompute for mode={mode}, account={account}")
+            worker.precompute(mode, account)
 
-        log.info("[Panel3 DEBUG] Updating metrics with payload...")
+    def _on_stats_precomputed(self, event: dict) -> None:
+        """Apply a worker result if it belongs to the displayed scope and timeframe."""
+        try:
+            if (event.get("mode"), event.get("account")) != self._stats_scope:
+                return
+            if event.get("timeframe") != self._tf:
+                return
+            self._apply_stats_payload(event.get("payload") or {})
+        except Exception as e:
+            log.error(f"[Panel3] Failed to apply precomputed stats: {e}")
+
+    def _apply_stats_payload(self, payload: dict[str, Any]) -> None:
+        """Update metric cells, Sharpe bar and pill color from a stats payload."""
         self.update_metrics(payload)
 
         # Update Sharpe bar widget (Sharpe Ratio not in grid)
@@ -497,16 +518,15 @@ class Panel3(QtWidgets.QWidget, ThemeAwareMixin):
             log.info(f"[Panel3 DEBUG] Trade payload: {trade_payload}")
             log.info(f"[Panel3 DEBUG] Current timeframe: {self._tf}")
 
-            # Refresh the metrics for current timeframe, using trade mode when available
-            log.info("[Panel3 DEBUG] Calling _load_metrics_for_timeframe...")
+            # Recompute all timeframes off the UI thread, using trade mode when available
             trade_mode = trade_payload.get("mode")
             trade_account = trade_payload.get("account")
-            self._load_metrics_for_timeframe(
-                self._tf,
-                mode_override=trade_mode,
-                account_override=trade_account,
-            )
-            log.info("[Panel3 DEBUG] _load_metrics_for_timeframe completed")
+            mode, account = self._resolve_stats_scope(trade_mode, trade_account)
+            self._stats_scope = (mode, account)
+
+            from services.stats_worker import get_stats_worker
+            get_stats_worker().precompute(mode, account, invalidate=True)
+            log.info("[Panel3 DEBUG] Stats precompute scheduled")
 
             # Grab live data from Panel 2 if available
             if hasattr(self, "analyze_and_store_trade_snapshot"):
@@ -9,12 +9,35 @@ Exposes commonly-used classes and functions for import convenience.
 """
 
 # Core business logic exports
-from .dtc_schemas import OrderUpdate, PositionUpdate, parse_dtc_message
-from .live_state import load_open_position
-from .stats_service import compute_trading_stats_for_timeframe
-from .trade_constants import COMM_PER_CONTRACT, DOLLARS_PER_POINT
-from .trade_math import TradeMath
-from .trade_store import record_closed_trade
+# STARTUP: resolved lazily (PEP 562) so importing e.g. services.trade_constants
+# does not import the pydantic schemas and the stats service.
+import importlib
+from typing import Any
+
+
+_EXPORTS = {
+    "OrderUpdate": ".dtc_schemas",
+    "PositionUpdate": ".dtc_schemas",
+    "parse_dtc_message": ".dtc_schemas",
+    "load_open_position": ".live_state",
+    "compute_trading_stats_for_timeframe": ".stats_service",
+    "COMM_PER_CONTRACT": ".trade_constants",
+    "DOLLARS_PER_POINT": ".trade_constants",
+    "TradeMath": ".trade_math",
+    "record_closed_trade": ".trade_store",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # Note: Mock modules (ep_price_feed, ep_reader, json_parser) are available
 # for direct import but not exported here. Use for testing only.
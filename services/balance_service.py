@@ -9,7 +9,7 @@ Architecture:
 
 This module currently provides:
 - load_sim_balance_from_trades(state_manager): Initialize SIM balance at startup
-  by summing realized P&L from closed SIM trades in the ledger.
+  from the UnifiedBalanceManager SIM ledger (seeded by one aggregate query).
 """
 
 from __future__ import annotations
@@ -24,7 +24,7 @@ log = get_logger(__name__)
 
 def load_sim_balance_from_trades(state_manager: Any) -> float:
     """
-    Load the SIM balance from the database by summing all realized P&L trades.
+    Load the SIM balance from the trade ledger (starting balance + realized P&L).
 
     This is called on app startup to restore the balance if the app was restarted.
     The computed balance is written into the provided StateManager instance.
@@ -36,46 +36,23 @@ def load_sim_balance_from_trades(state_manager: Any) -> float:
         The loaded SIM balance.
     """
     try:
-        from data.db_engine import get_session
-        from data.schema import TradeRecord
-        from sqlalchemy import func
+        from services.unified_balance_manager import get_balance_manager
 
         log.debug("[BalanceService] Loading SIM balance from database...")
 
-        with get_session() as session:
-            # Query all closed trades in SIM mode and sum their realized P&L
-            result = (
-                session.query(func.sum(TradeRecord.realized_pnl))
-                .filter(
-                    TradeRecord.mode == "SIM",
-                    TradeRecord.realized_pnl != None,  # noqa: E711
-                    TradeRecord.is_closed == True,  # noqa: E712
-                )
-                .scalar()
-            )
-
-            # Also count how many trades we have
-            trade_count = (
-                session.query(TradeRecord)
-                .filter(
-                    TradeRecord.mode == "SIM",
-                    TradeRecord.is_closed == True,  # noqa: E712
-                )
-                .count()
-            )
-
-            total_pnl = float(result) if result else 0.0
-
-            # Update StateManager cache
-            state_manager.sim_balance = 10000.0 + total_pnl
-            new_balance = state_manager.sim_balance
+        # One aggregate query seeds the per-account ledger; later closes are
+        # applied as deltas, so this never rescans the trade table.
+        balance_mgr = get_balance_manager()
+        balance_mgr.seed_sim_ledger()
+        total_pnl = balance_mgr.get_sim_realized_total()
+
+        # Update StateManager cache
+        state_manager.sim_balance = 10000.0 + total_pnl
+        new_balance = state_manager.sim_balance
 
         log.info(
-            "[BalanceService] SIM balance restored from trades",
-            trades=trade_count,
-            base_balance=10000.0,
-            total_pnl=total_pnl,
-            current_balance=new_balance,
+            f"[BalanceService] SIM balance restored from ledger: "
+            f"base=$10,000.00 total_pnl={total_pnl:+,.2f} current=${new_balance:,.2f}"
         )
 
         print("\n[INITIAL BALANCE] SIM Account Loaded")
@@ -0,0 +1,286 @@
+"""
+services/fill_ingestion.py
+
+Bulk ingestion of the startup historical-fill response into OrderRecord.
+
+The initial HistoricalOrderFillsRequest (Type 303, 30 days) can
+return thousands of Type 304 messages. Routing each of them as an individual
+ORDER_UPDATE event means one signal hop and one DB round-trip per fill. This
+service takes that stream off the per-message path:
+
+- Fills for the historical request are buffered in memory as they arrive
+- When the final message arrives (MessageNumber == TotalNumberMessages, or
+  NoOrderFills=1) the buffer is flushed on a background thread:
+    1. One indexed lookup on OrderRecord.order_id finds fills already stored
+    2. The remaining rows are inserted with a single executemany
+    3. Both happen in one transaction
+- Progress is posted to the status bar via SignalBus.statusMessagePosted
+
+Usage:
+    from services.fill_ingestion import HistoricalFillIngestor
+
+    ingestor = HistoricalFillIngestor()
+    if ingestor.accepts(dtc):
+        ingestor.add_fill(dtc)   # flushes automatically on the final message
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import threading
+import time
+from typing import Any, Optional
+
+from PyQt6 import QtCore
+
+import structlog
+
+from services.dtc_constants import HISTORICAL_ORDER_FILL_RESPONSE
+
+log = structlog.get_logger(__name__)
+
+
+#: Default RequestID (DTCClientJSON calls begin() with the allocated one)
+HISTORICAL_FILLS_REQUEST_ID = 4
+
+#: Post a progress update to the status bar every N buffered fills
+PROGRESS_EVERY = 250
+
+#: Max bound parameters per IN (...) clause (SQLite default limit is 999)
+_LOOKUP_CHUNK = 900
+
+
+class HistoricalFillIngestor(QtCore.QObject):
+    """
+    Buffers historical fills for one request and bulk-inserts them.
+
+    Thread Safety:
+    - add_fill()/flush() are called from the DTC client (GUI) thread
+    - The DB write runs on a short-lived daemon thread
+    - Signals are emitted from the writer thread; Qt queues them to the GUI
+
+    Signals:
+    - ingestFinished(dict): {"received", "inserted", "duplicates", "elapsed_ms"}
+    """
+
+    ingestFinished = QtCore.pyqtSignal(dict)
+
+    def __init__(
+        self,
+        request_id: int = HISTORICAL_FILLS_REQUEST_ID,
+        background: bool = True,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self._request_id = request_id
+        self._background = background
+
+        # {order_id: row} - also de-duplicates repeats within the response
+        self._buffer: dict[str, dict[str, Any]] = {}
+        self._received = 0
+        self._writer: Optional[threading.Thread] = None
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def accepts(self, dtc: dict) -> bool:
+        """True when dtc is a historical fill belonging to our request."""
+        return (
+            dtc.get("Type") == HISTORICAL_ORDER_FILL_RESPONSE
+            and dtc.get("RequestID") == self._request_id
+        )
+
+    def begin(self, request_id: int) -> None:
+        """Start collecting fills for a newly sent request."""
+        self.reset()
+        self._request_id = request_id
+
+    def reset(self) -> None:
+        """Drop any partially received response (e.g. on disconnect)."""
+        self._buffer.clear()
+        self._received = 0
+
+    def add_fill(self, dtc: dict) -> bool:
+        """
+        Buffer one Type 304 message.
+
+        Returns:
+            True if this was the final message (the buffer has been flushed)
+        """
+        if not dtc.get("NoOrderFills"):
+            row = fill_to_order_row(dtc)
+            if row is not None:
+                self._buffer[row["order_id"]] = row
+            self._received += 1
+
+            if self._received % PROGRESS_EVERY == 0:
+                total = dtc.get("TotalNumberMessages")
+                suffix = f"/{total}" if total else ""
+                self._post_status(f"Loading historical fills... {self._received}{suffix}")
+
+        if self.is_final_message(dtc):
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Write the buffered fills to OrderRecord and clear the buffer."""
+        rows = list(self._buffer.values())
+        received = self._received
+        self.reset()
+
+        if not rows:
+            self._finish({"received": received, "inserted": 0, "duplicates": 0, "elapsed_ms": 0.0})
+            return
+
+        self._post_status(f"Saving {len(rows)} historical fills...")
+
+        if not self._background:
+            self._write(rows, received)
+            return
+
+        self._writer = threading.Thread(
+            target=self._write,
+            args=(rows, received),
+            name="HistoricalFillIngest",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until the last background flush completed (tests/shutdown)."""
+        writer = self._writer
+        if writer is not None:
+            writer.join(timeout)
+
+    @staticmethod
+    def is_final_message(dtc: dict) -> bool:
+        """DTC marks the last 304 by MessageNumber == TotalNumberMessages or NoOrderFills."""
+        if dtc.get("NoOrderFills"):
+            return True
+        number = dtc.get("MessageNumber")
+        total = dtc.get("TotalNumberMessages")
+        try:
+            return number is not None and total is not None and int(number) >= int(total)
+        except (TypeError, ValueError):
+            return False
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _write(self, rows: list[dict[str, Any]], received: int) -> None:
+        started = time.perf_counter()
+        try:
+            inserted = bulk_insert_order_rows(rows)
+        except Exception as e:
+            log.error("fills.ingest.failed", rows=len(rows), error=str(e))
+            self._post_status("Historical fills: save failed")
+            return
+
+        self._finish(
+            {
+                "received": received,
+                "inserted": inserted,
+                "duplicates": len(rows) - inserted,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 2),
+            }
+        )
+
+    def _finish(self, summary: dict[str, Any]) -> None:
+        log.info("fills.ingest.complete", **summary)
+        self._post_status(
+            f"Historical fills loaded: {summary['inserted']} new, {summary['duplicates']} already stored"
+        )
+        try:
+            self.ingestFinished.emit(summary)
+        except Exception as e:
+            log.warning("fills.ingest.signal_failed", error=str(e))
+
+    @staticmethod
+    def _post_status(message: str, timeout_ms: int = 5000) -> None:
+        try:
+            from core.signal_bus import get_signal_bus
+
+            get_signal_bus().statusMessagePosted.emit(message, timeout_ms)
+        except Exception:
+            pass
+
+
+# =============================================================================
+# ROW CONVERSION + BULK WRITE
+# =============================================================================
+
+
+def fill_to_order_row(dtc: dict) -> Optional[dict[str, Any]]:
+    """
+    Convert a Type 304 HistoricalOrderFillResponse into an OrderRecord row dict.
+
+    Uses UniqueExecutionID as order_id (one row per fill), falling back to
+    ServerOrderID. Returns None when the message carries no usable ID.
+    """
+    order_id = dtc.get("UniqueExecutionID") or dtc.get("ServerOrderID")
+    if not order_id:
+        return None
+
+    from utils.trade_mode import detect_mode_from_account
+
+    account = dtc.get("TradeAccount") or None
+    qty = int(dtc.get("Quantity") or 0)
+    price = float(dtc.get("Price") or 0.0)
+
+    ts = dtc.get("DateTime")
+    try:
+        timestamp = datetime.fromtimestamp(float(ts), tz=timezone.utc)
+    except (TypeError, ValueError, OSError):
+        timestamp = datetime.now(timezone.utc)
+
+    return {
+        "order_id": str(order_id),
+        "symbol": dtc.get("Symbol") or "",
+        "side": "BUY" if dtc.get("BuySell") == 1 else "SELL",
+        "qty": qty,
+        "price": price,
+        "filled_qty": qty,
+        "filled_price": price,
+        "status": "FILLED",
+        "mode": detect_mode_from_account(account) if account else "SIM",
+        "timestamp": timestamp,
+        "account": account,
+    }
+
+
+def bulk_insert_order_rows(rows: list[dict[str, Any]]) -> int:
+    """
+    Insert OrderRecord rows not already stored, in one transaction.
+
+    Existing order_ids are found with an indexed IN lookup (chunked to stay
+    under SQLite's bound-parameter limit); new rows go in as one executemany.
+
+    Returns:
+        Number of rows inserted
+    """
+    from sqlalchemy import insert, select
+
+    from data.db_engine import get_session
+    from data.schema import OrderRecord
+
+    ids = [row["order_id"] for row in rows]
+
+    with get_session() as session:
+        existing: set[str] = set()
+        for i in range(0, len(ids), _LOOKUP_CHUNK):
+            chunk = ids[i : i + _LOOKUP_CHUNK]
+            existing.update(
+                session.execute(
+                    select(OrderRecord.order_id).where(OrderRecord.order_id.in_(chunk))
+                ).scalars()
+            )
+
+        new_rows = [row for row in rows if row["order_id"] not in existing]
+        if new_rows:
+            session.execute(insert(OrderRecord), new_rows)
+        session.commit()
+
+    return len(new_rows)
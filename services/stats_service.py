@@ -24,7 +24,7 @@ Metrics Calculated:
 from __future__ import annotations
 
 import contextlib
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple
@@ -110,7 +110,9 @@ def compute_trading_stats_for_timeframe(
         return {}
 
     # CONSOLIDATION FIX: Use canonical timeframe_start function
-    start = timeframe_start(tf)
+    # Aware UTC bound: newer SQLModel rejects naive datetime parameters, and
+    # SQLite stores the same UTC string either way
+    start = timeframe_start(tf, datetime.now(UTC))
 
     # Get active mode from state manager if not provided
     # CRITICAL: This must happen BEFORE cache key is created
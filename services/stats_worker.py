@@ -0,0 +1,340 @@
+"""
+services/stats_worker.py
+
+Background precompute worker for Panel 3 trading statistics.
+
+Panel 3 used to call compute_trading_stats_for_timeframe() synchronously on
+the GUI thread for every timeframe pill click, mode switch and trade close,
+stalling the UI on a DB query each time. This worker moves that work off the
+UI thread:
+
+- All six timeframes (LIVE, 1D, 1W, 1M, 3M, YTD) are computed for the active
+  (mode, account) scope at startup and after every tradeClosedForAnalytics
+- Results are kept in memory and published through
+  SignalBus.statsPrecomputed, so a pill click only reads memory
+- Jobs belonging to a stale scope (or superseded by a newer precompute for the
+  same scope) are dropped before they hit the DB and never published
+
+Architecture:
+- A single daemon thread drains a FIFO job queue (DB access stays serialized)
+- Each precompute bumps a generation counter; queued jobs carry the generation
+  they were scheduled under and are cancelled when it no longer matches
+- Results are emitted from the worker thread; Qt queues them to the GUI thread
+
+Usage:
+    from services.stats_worker import get_stats_worker
+
+    worker = get_stats_worker()
+    worker.precompute("SIM", "Sim1")
+
+    payload = worker.get_cached("SIM", "Sim1", "1W")  # None until computed
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+from PyQt6 import QtCore
+
+import structlog
+
+from core import metrics
+
+log = structlog.get_logger(__name__)
+
+
+#: Timeframes precomputed for every scope (matches timeframe_start())
+STATS_TIMEFRAMES: tuple[str, ...] = ("LIVE", "1D", "1W", "1M", "3M", "YTD")
+
+#: Cached payloads older than this are served but refreshed in the background
+STATS_STALE_AFTER_SECONDS = 60.0
+
+# Scope key: (mode, account). account=None means "any account" (no filter).
+Scope = tuple[str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class _StatsJob:
+    """One queued timeframe computation."""
+
+    generation: int
+    mode: str
+    account: Optional[str]
+    timeframe: str
+
+
+class StatsPrecomputeWorker(QtCore.QObject):
+    """
+    Background worker that precomputes Panel 3 stats per (mode, account).
+
+    Thread Safety:
+    - _cache, _active_scope and _generation are protected by _lock
+    - DB queries run only on the worker thread
+    - Signals are emitted outside the lock
+
+    Signals:
+    - statsReady(dict): {"mode", "account", "timeframe", "payload"} for every
+      completed, non-stale job (mirrored to SignalBus.statsPrecomputed)
+    """
+
+    statsReady = QtCore.pyqtSignal(dict)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        self._lock = threading.Lock()
+        self._jobs: queue.Queue[Optional[_StatsJob]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+        # {(mode, account): {timeframe: (computed_at, payload)}}
+        self._cache: dict[Scope, dict[str, tuple[float, dict[str, Any]]]] = {}
+
+        self._active_scope: Optional[Scope] = None
+        self._generation: int = 0
+
+        log.info("[StatsWorker] Initialized")
+
+    # =========================================================================
+    # PUBLIC API - Thread-Safe
+    # =========================================================================
+
+    def precompute(
+        self,
+        mode: str,
+        account: Optional[str],
+        invalidate: bool = False,
+    ) -> None:
+        """
+        Schedule all timeframes for (mode, account) and make it the active scope.
+
+        Any queued jobs for other scopes, or from an earlier precompute of the
+        same scope, are cancelled.
+
+        Args:
+            mode: Trading mode ("SIM", "LIVE", "DEBUG")
+            account: Account identifier (None = all accounts)
+            invalidate: Drop the stats_service TTL cache first (use after a
+                trade was recorded so the worker does not re-read stale rows)
+        """
+        mode = (mode or "SIM").upper()
+        scope: Scope = (mode, account)
+
+        if invalidate:
+            from services.stats_service import invalidate_stats_cache
+
+            invalidate_stats_cache()
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._active_scope = scope
+
+        self._ensure_thread()
+        for tf in STATS_TIMEFRAMES:
+            self._jobs.put(_StatsJob(generation, mode, account, tf))
+
+        log.debug(
+            "stats.worker.scheduled",
+            mode=mode,
+            account=account,
+            generation=generation,
+        )
+
+    def get_cached(
+        self,
+        mode: str,
+        account: Optional[str],
+        timeframe: str,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Return the last computed payload for (mode, account, timeframe).
+
+        Never touches the database. Returns None when the timeframe has not
+        been computed yet for this scope.
+        """
+        entry = self._get_entry((mode or "SIM").upper(), account, timeframe)
+        return dict(entry[1]) if entry else None
+
+    def is_stale(self, mode: str, account: Optional[str], timeframe: str) -> bool:
+        """True when the cached payload is missing or older than STATS_STALE_AFTER_SECONDS."""
+        entry = self._get_entry((mode or "SIM").upper(), account, timeframe)
+        if entry is None:
+            return True
+        return (time.monotonic() - entry[0]) > STATS_STALE_AFTER_SECONDS
+
+    def snapshot(self) -> dict[Scope, dict[str, dict[str, Any]]]:
+        """Copy of every cached payload: {(mode, account): {timeframe: payload}}."""
+        with self._lock:
+            return {
+                scope: {tf: dict(entry[1]) for tf, entry in by_tf.items()}
+                for scope, by_tf in self._cache.items()
+            }
+
+    def prime(
+        self,
+        mode: str,
+        account: Optional[str],
+        payloads: dict[str, dict[str, Any]],
+    ) -> None:
+        """
+        Seed the cache from the warm-start snapshot.
+
+        Primed payloads are served by get_cached() but always report stale, so
+        the next precompute() replaces them. Computed entries are never
+        overwritten.
+        """
+        scope: Scope = ((mode or "SIM").upper(), account)
+        with self._lock:
+            by_tf = self._cache.setdefault(scope, {})
+            for tf, payload in payloads.items():
+                if tf in STATS_TIMEFRAMES and tf not in by_tf and isinstance(payload, dict):
+                    by_tf[tf] = (float("-inf"), dict(payload))
+
+    def active_scope(self) -> Optional[Scope]:
+        """Return the scope of the most recent precompute() call."""
+        with self._lock:
+            return self._active_scope
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the worker thread (pending jobs are discarded)."""
+        with self._lock:
+            self._generation += 1
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None and thread.is_alive():
+            self._jobs.put(None)
+            thread.join(timeout)
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _get_entry(
+        self,
+        mode: str,
+        account: Optional[str],
+        timeframe: str,
+    ) -> Optional[tuple[float, dict[str, Any]]]:
+        with self._lock:
+            return self._cache.get((mode, account), {}).get(timeframe)
+
+    def _is_current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="StatsPrecomputeWorker",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Worker thread loop."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            metrics.gauge("stats.queue_depth", self._jobs.qsize())
+
+            # Cancelled before it started (scope changed or superseded)
+            if not self._is_current(job.generation):
+                continue
+
+            started = time.perf_counter()
+            try:
+                from services.stats_service import compute_trading_stats_for_timeframe
+
+                payload = compute_trading_stats_for_timeframe(
+                    job.timeframe, mode=job.mode, account=job.account
+                )
+                metrics.observe("stats.compute", started)
+            except Exception as e:
+                log.error(
+                    "stats.worker.compute_failed",
+                    timeframe=job.timeframe,
+                    mode=job.mode,
+                    account=job.account,
+                    error=str(e),
+                )
+                continue
+
+            # Scope changed while the query was running: drop the result
+            with self._lock:
+                if job.generation != self._generation:
+                    continue
+                self._cache.setdefault((job.mode, job.account), {})[job.timeframe] = (
+                    time.monotonic(),
+                    payload,
+                )
+
+            log.debug(
+                "stats.worker.computed",
+                timeframe=job.timeframe,
+                mode=job.mode,
+                account=job.account,
+                elapsed_ms=round((time.perf_counter() - started) * 1000.0, 2),
+            )
+            self._publish(job, payload)
+
+    def _publish(self, job: _StatsJob, payload: dict[str, Any]) -> None:
+        event = {
+            "mode": job.mode,
+            "account": job.account,
+            "timeframe": job.timeframe,
+            "payload": dict(payload),
+        }
+        try:
+            self.statsReady.emit(event)
+            from core.signal_bus import get_signal_bus
+
+            get_signal_bus().statsPrecomputed.emit(event)
+        except Exception as e:
+            log.warning("stats.worker.publish_failed", error=str(e))
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_stats_worker_instance: Optional[StatsPrecomputeWorker] = None
+_stats_worker_lock = threading.Lock()
+
+
+def get_stats_worker() -> StatsPrecomputeWorker:
+    """Get the global StatsPrecomputeWorker singleton (thread-safe creation)."""
+    global _stats_worker_instance
+
+    if _stats_worker_instance is None:
+        with _stats_worker_lock:
+            if _stats_worker_instance is None:
+                _stats_worker_instance = StatsPrecomputeWorker()
+
+    return _stats_worker_instance
+
+
+def reset_stats_worker() -> None:
+    """
+    Stop and discard the global worker.
+
+    WARNING: Only use in tests.
+    """
+    global _stats_worker_instance
+
+    with _stats_worker_lock:
+        if _stats_worker_instance is not None:
+            try:
+                _stats_worker_instance.shutdown()
+                _stats_worker_instance.deleteLater()
+            except Exception:
+                pass
+        _stats_worker_instance = None
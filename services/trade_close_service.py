@@ -33,6 +33,7 @@ from PyQt6 import QtCore
 
 from utils.logger import get_logger
 from services.stats_service import invalidate_stats_cache
+from services.unified_balance_manager import get_balance_manager
 
 log = get_logger(__name__)
 
@@ -154,6 +155,13 @@ class TradeCloseService(QtCore.QObject):
 
                 self.state_manager.set_balance_for_mode(mode, new_balance)
 
+            # Apply the close to the SIM ledger as a delta (no trade-table rescan);
+            # keyed by the account the DB row was written under (legacy "" rows)
+            ledger_account = closed_position.pop("_ledger_account", account)
+            if realized_pnl is not None and mode == "SIM":
+                with contextlib.suppress(Exception):
+                    get_balance_manager().apply_trade_close(mode, ledger_account, realized_pnl)
+
             # Clear position state in StateManager
             self.state_manager.close_position()
 
@@ -237,6 +245,7 @@ class TradeCloseService(QtCore.QObject):
             closed_position["trade_id"] = trade_id
             closed_position["mode"] = mode
             closed_position["account"] = account
+            closed_position["_ledger_account"] = repo_account
 
             # Ensure realized_pnl is present for balance updates; fall back to 0.0
             if closed_position.get("realized_pnl") is None:
@@ -15,6 +15,13 @@ Architecture Benefits:
 - Database Integration: Direct integration with trade ledger
 - Event Emission: Automatic balance change events via SignalBus
 
+SIM Ledger:
+- One running ledger entry (realized P&L, trade count) per SIM account
+- Seeded from a single GROUP BY aggregate query at startup
+- Updated by delta on each trade close (apply_trade_close)
+- Cross-checked against the DB by a low-priority background reconciliation
+- Balance reads are O(1) memory lookups (no SQL after the seed)
+
 Usage:
     from services.unified_balance_manager import get_balance_manager
 
@@ -28,11 +35,16 @@ Usage:
 
     # Reset SIM balance
     balance_mgr.reset_balance("SIM", "Sim1")
+
+    # Record a closed trade in the SIM ledger
+    balance_mgr.apply_trade_close("SIM", "Sim1", realized_pnl)
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import threading
+import time
 from datetime import UTC, datetime
 from typing import Optional
 
@@ -43,6 +55,15 @@ import structlog
 log = structlog.get_logger(__name__)
 
 
+@dataclass
+class _SimLedgerEntry:
+    """Running realized P&L for one SIM account."""
+
+    realized_pnl: float = 0.0
+    trade_count: int = 0
+    version: int = 0  # Bumped on every local mutation (reconciliation guard)
+
+
 class UnifiedBalanceManager(QtCore.QObject):
     """
     Unified balance manager for all trading modes.
@@ -70,6 +91,12 @@ class UnifiedBalanceManager(QtCore.QObject):
     SIM_STARTING_BALANCE = 10000.0
     DEBUG_STARTING_BALANCE = 10000.0
 
+    # Background reconciliation (seconds)
+    RECONCILE_INITIAL_DELAY = 30.0
+    RECONCILE_INTERVAL = 300.0
+    RECONCILE_TOLERANCE = 0.005
+    SEED_RETRY_INTERVAL = 5.0  # after a failed seed query
+
     def __init__(self):
         super().__init__()
 
@@ -83,6 +110,16 @@ class UnifiedBalanceManager(QtCore.QObject):
         # Track initialized accounts to avoid redundant DB queries
         self._initialized: set[tuple[str, str]] = set()
 
+        # SIM ledger: {account: _SimLedgerEntry}, seeded once from the DB
+        self._sim_ledger: dict[str, _SimLedgerEntry] = {}
+        self._sim_ledger_seeded = False
+        self._seed_failed_at: Optional[float] = None  # monotonic time of last failed seed
+        self._seed_lock = threading.Lock()
+
+        # Background reconciliation thread
+        self._reconcile_thread: Optional[threading.Thread] = None
+        self._reconcile_stop = threading.Event()
+
         log.info("[UnifiedBalanceManager] Initialized")
 
     # =========================================================================
@@ -93,7 +130,7 @@ class UnifiedBalanceManager(QtCore.QObject):
         """
         Get current balance for mode/account pair.
 
-        For SIM mode: Lazily loads from database on first access
+        For SIM mode: Reads the in-memory ledger (seeded once from the DB)
         For LIVE mode: Returns last known balance from DTC
         For DEBUG mode: Returns default debug balance
 
@@ -111,14 +148,23 @@ class UnifiedBalanceManager(QtCore.QObject):
         """
         key = (mode, account)
 
+        # Fast path: no SQL once a balance is cached
+        with self._lock:
+            if key in self._balances:
+                return self._balances[key]
+
+        if mode == "SIM":
+            self._ensure_sim_ledger_seeded()
+
         with self._lock:
-            # Return cached balance if already loaded
+            # Another thread may have filled it while we were seeding
             if key in self._balances:
                 return self._balances[key]
 
             # Load balance based on mode
             if mode == "SIM":
-                balance = self._load_sim_balance_from_db(account)
+                entry = self._sim_ledger.get(account)
+                balance = self.SIM_STARTING_BALANCE + (entry.realized_pnl if entry else 0.0)
             elif mode == "LIVE":
                 balance = 0.0  # LIVE balance comes from DTC
             elif mode == "DEBUG":
@@ -131,6 +177,11 @@ class UnifiedBalanceManager(QtCore.QObject):
                 )
                 balance = 0.0
 
+            if mode == "SIM" and not self._sim_ledger_seeded:
+                # Seed query failed: serve the starting balance uncached so the
+                # next read (after SEED_RETRY_INTERVAL) picks up the real ledger
+                return balance
+
             # Cache and mark as initialized
             self._balances[key] = balance
             self._initialized.add(key)
@@ -276,23 +327,248 @@ class UnifiedBalanceManager(QtCore.QObject):
             return list(self._initialized)
 
     # =========================================================================
-    # INTERNAL HELPERS - Must be called within lock
+    # SIM LEDGER - Thread-Safe
     # =========================================================================
 
-    def _load_sim_balance_from_db(self, account: str) -> float:
+    def seed_sim_ledger(self, force: bool = False) -> int:
         """
-        Load SIM balance from database by summing realized P&L.
+        Seed the SIM ledger for all accounts from one aggregate query.
 
-        This is the source of truth for SIM balances - calculated from
-        the complete trade ledger in the database.
+        Runs at most once unless force=True; a failed query leaves the ledger
+        unseeded so it is retried. Balances already cached are left untouched
+        (seeding only fills accounts not read yet).
+
+        Returns:
+            Number of SIM accounts found in the trade ledger
+
+        Thread-safe: Yes
+        """
+        with self._seed_lock:
+            if self._sim_ledger_seeded and not force:
+                with self._lock:
+                    return len(self._sim_ledger)
+
+            aggregates = self._query_sim_ledger()
+            if aggregates is None:
+                # DB unavailable: serve starting balances, retry after SEED_RETRY_INTERVAL
+                self._seed_failed_at = time.monotonic()
+                return 0
+
+            with self._lock:
+                for account, (total_pnl, trade_count) in aggregates.items():
+                    entry = self._sim_ledger.setdefault(account, _SimLedgerEntry())
+                    entry.realized_pnl = total_pnl
+                    entry.trade_count = trade_count
+                    entry.version += 1
+                self._sim_ledger_seeded = True
+                self._seed_failed_at = None
+
+            log.info(
+                "[UnifiedBalanceManager] SIM ledger seeded from database",
+                accounts=len(aggregates),
+                trade_count=sum(c for _, c in aggregates.values()),
+                total_pnl=sum(p for p, _ in aggregates.values()),
+            )
+            return len(aggregates)
+
+    def apply_trade_close(self, mode: str, account: str, realized_pnl: float) -> float:
+        """
+        Record a closed trade: update the ledger and balance by delta.
 
         Args:
-            account: SIM account identifier
+            mode: Trading mode (ledger is kept for SIM only)
+            account: Account identifier
+            realized_pnl: Realized P&L of the closed trade
 
         Returns:
-            Calculated balance (starting balance + total realized P&L)
+            New balance after the trade
 
-        Thread-safe: NO - must be called within lock
+        Thread-safe: Yes
+        """
+        delta = float(realized_pnl or 0.0)
+        if mode != "SIM":
+            return self.adjust_balance(mode, account, delta)
+
+        key = (mode, account)
+        # Materialize the balance from the ledger first (cached once seeded)
+        self.get_balance(mode, account)
+        with self._lock:
+            entry = self._sim_ledger.setdefault(account, _SimLedgerEntry())
+            old_balance = self._balances.get(key)
+            entry.realized_pnl += delta
+            entry.trade_count += 1
+            entry.version += 1
+            if old_balance is not None:
+                new_balance = old_balance + delta
+                self._balances[key] = new_balance
+            else:
+                # Seed failed: the balance is derived from the ledger on every
+                # read and already carries the delta, so it is not applied again
+                new_balance = self.SIM_STARTING_BALANCE + entry.realized_pnl
+
+        # Emit signal outside lock
+        self.balanceChanged.emit(new_balance, account, mode)
+
+        log.info(
+            "[UnifiedBalanceManager] Trade close applied",
+            mode=mode,
+            account=account,
+            delta=delta,
+            old_balance=old_balance,
+            new_balance=new_balance
+        )
+
+        return new_balance
+
+    def get_sim_realized_total(self) -> float:
+        """
+        Total realized P&L across all SIM accounts (memory only).
+
+        Thread-safe: Yes
+        """
+        self._ensure_sim_ledger_seeded()
+        with self._lock:
+            return sum(entry.realized_pnl for entry in self._sim_ledger.values())
+
+    def get_trade_count(self, account: str) -> int:
+        """
+        Number of closed SIM trades recorded for account (memory only).
+
+        Thread-safe: Yes
+        """
+        self._ensure_sim_ledger_seeded()
+        with self._lock:
+            entry = self._sim_ledger.get(account)
+            return entry.trade_count if entry else 0
+
+    def reconcile_sim_ledger(self) -> dict[str, float]:
+        """
+        Cross-check the SIM ledger against the database and repair drift.
+
+        Accounts mutated locally while the query was running are skipped (their
+        DB snapshot may predate the in-memory delta) and checked next time.
+        Manual resets are preserved: only the realized P&L is compared, and
+        any drift is applied to the balance as a delta.
+
+        Returns:
+            {account: correction} for every account that was corrected
+
+        Thread-safe: Yes (runs the query outside the lock)
+        """
+        with self._lock:
+            versions = {acct: entry.version for acct, entry in self._sim_ledger.items()}
+
+        aggregates = self._query_sim_ledger()
+        if aggregates is None:
+            return {}
+
+        corrections: dict[str, float] = {}
+        changed: list[tuple[str, float]] = []
+
+        with self._lock:
+            for account in set(aggregates) | set(versions):
+                entry = self._sim_ledger.get(account)
+                if entry is None:
+                    entry = self._sim_ledger.setdefault(account, _SimLedgerEntry())
+                elif entry.version != versions.get(account):
+                    # Created or mutated during the query: check next round
+                    continue
+
+                db_pnl, db_count = aggregates.get(account, (0.0, 0))
+                drift = db_pnl - entry.realized_pnl
+                entry.trade_count = db_count
+                if abs(drift) <= self.RECONCILE_TOLERANCE:
+                    continue
+
+                entry.realized_pnl = db_pnl
+                entry.version += 1
+                corrections[account] = drift
+
+                key = ("SIM", account)
+                if key in self._balances:
+                    self._balances[key] += drift
+                    changed.append((account, self._balances[key]))
+
+        # Emit signals outside lock
+        for account, balance in changed:
+            self.balanceChanged.emit(balance, account, "SIM")
+
+        if corrections:
+            log.warning(
+                "[UnifiedBalanceManager] SIM ledger drift corrected",
+                corrections=corrections,
+            )
+        else:
+            log.debug("[UnifiedBalanceManager] SIM ledger reconciled", accounts=len(aggregates))
+
+        return corrections
+
+    def start_reconciliation(
+        self,
+        initial_delay: Optional[float] = None,
+        interval: Optional[float] = None,
+    ) -> None:
+        """
+        Start the low-priority background reconciliation thread.
+
+        The first pass runs after initial_delay (so it never competes with
+        startup), then every interval seconds until stop_reconciliation().
+
+        Thread-safe: Yes
+        """
+        delay = self.RECONCILE_INITIAL_DELAY if initial_delay is None else float(initial_delay)
+        period = self.RECONCILE_INTERVAL if interval is None else float(interval)
+
+        with self._lock:
+            if self._reconcile_thread is not None and self._reconcile_thread.is_alive():
+                return
+            self._reconcile_stop.clear()
+            self._reconcile_thread = threading.Thread(
+                target=self._reconcile_loop,
+                args=(delay, period),
+                name="SimLedgerReconciler",
+                daemon=True,
+            )
+            self._reconcile_thread.start()
+
+    def stop_reconciliation(self, timeout: float = 2.0) -> None:
+        """Stop the background reconciliation thread. Thread-safe: Yes"""
+        self._reconcile_stop.set()
+        thread = self._reconcile_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        self._reconcile_thread = None
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _ensure_sim_ledger_seeded(self) -> None:
+        if self._sim_ledger_seeded:
+            return
+        failed_at = self._seed_failed_at
+        if failed_at is None or time.monotonic() - failed_at >= self.SEED_RETRY_INTERVAL:
+            self.seed_sim_ledger()
+
+    def _reconcile_loop(self, delay: float, period: float) -> None:
+        if self._reconcile_stop.wait(delay):
+            return
+        while True:
+            try:
+                self.reconcile_sim_ledger()
+            except Exception as e:
+                log.error("[UnifiedBalanceManager] SIM ledger reconciliation failed", error=str(e))
+            if self._reconcile_stop.wait(period):
+                return
+
+    def _query_sim_ledger(self) -> Optional[dict[str, tuple[float, int]]]:
+        """
+        Aggregate realized P&L and trade count per SIM account in one query.
+
+        Returns:
+            {account: (total_realized_pnl, trade_count)}, or None on DB error
+
+        Thread-safe: Yes (no shared state touched)
         """
         try:
             from data.db_engine import get_session
@@ -300,52 +576,33 @@ class UnifiedBalanceManager(QtCore.QObject):
             from sqlalchemy import func
 
             with get_session() as session:
-                # Sum all realized P&L for this SIM account
-                result = (
-                    session.query(func.sum(TradeRecord.realized_pnl))
-                    .filter(
-                        TradeRecord.mode == "SIM",
-                        TradeRecord.account == account,
-                        TradeRecord.realized_pnl != None,  # noqa: E711
-                        TradeRecord.is_closed == True,  # noqa: E712
+                rows = (
+                    session.query(
+                        TradeRecord.account,
+                        func.sum(TradeRecord.realized_pnl),
+                        func.count(TradeRecord.id),
                     )
-                    .scalar()
-                )
-
-                total_pnl = float(result) if result else 0.0
-                balance = self.SIM_STARTING_BALANCE + total_pnl
-
-                # Also count trades for logging
-                trade_count = (
-                    session.query(TradeRecord)
                     .filter(
                         TradeRecord.mode == "SIM",
-                        TradeRecord.account == account,
+                        TradeRecord.realized_pnl != None,  # noqa: E711
                         TradeRecord.is_closed == True,  # noqa: E712
                     )
-                    .count()
-                )
-
-                log.info(
-                    "[UnifiedBalanceManager] SIM balance loaded from database",
-                    account=account,
-                    trade_count=trade_count,
-                    total_pnl=total_pnl,
-                    starting_balance=self.SIM_STARTING_BALANCE,
-                    current_balance=balance
+                    .group_by(TradeRecord.account)
+                    .all()
                 )
 
-                return balance
+            return {
+                (account or ""): (float(total or 0.0), int(count or 0))
+                for account, total, count in rows
+            }
 
         except Exception as e:
             log.error(
-                "[UnifiedBalanceManager] Error loading SIM balance from database",
-                account=account,
+                "[UnifiedBalanceManager] Error querying SIM ledger from database",
                 error=str(e),
                 exc_info=True
             )
-            # Fallback to starting balance on error
-            return self.SIM_STARTING_BALANCE
+            return None
 
     # =========================================================================
     # MIGRATION HELPERS - Backwards Compatibility
@@ -442,6 +699,7 @@ def reset_balance_manager() -> None:
     with _balance_manager_lock:
         if _balance_manager_instance is not None:
             try:
+                _balance_manager_instance.stop_reconciliation()
                 _balance_manager_instance.deleteLater()
             except Exception:
                 pass
@@ -0,0 +1,379 @@
+"""
+services/warm_start.py
+
+Warm-start snapshot: render the last known state before the DB answers.
+
+At launch Panel1's equity curve, Panel3's stats and the balances each wait
+on a DB query (get_equity_curve_for_scope, compute_trading_stats_for_timeframe,
+load_sim_balance_from_trades). This module keeps one compact file with what
+those queries returned last time:
+
+- balances per (mode, account)
+- the equity curve per (mode, account), decimated per timeframe
+- the Panel3 stats payloads per (mode, account, timeframe)
+
+MainWindow loads it before building the panels and primes the in-memory
+caches (StateManager, EquityStateManager, StatsPrecomputeWorker). Primed
+entries are marked stale, so the normal DB loads still run in the background
+and replace them when they arrive.
+
+StateManager keeps one balance per mode, so a balance is saved under the
+account that mode last used (scope_account) and earlier accounts' entries are
+carried over from the previous snapshot. prime() only applies the entry of
+the account each mode is on now.
+
+Written on closeEvent and every SAVE_INTERVAL_MS while the app runs.
+
+Usage:
+    from services.warm_start import get_warm_start_cache
+
+    cache = get_warm_start_cache()
+    snapshot = cache.load()            # {} when missing/corrupt/too old
+    cache.prime(snapshot, state=state, stats_worker=get_stats_worker())
+    cache.prime(snapshot, equity_state=panel1._equity_state)
+
+    cache.save(cache.collect(state, panel1._equity_state, get_stats_worker()))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+from pathlib import Path
+import threading
+import time
+from typing import Any, Optional
+
+import orjson
+import structlog
+
+from config.settings import WARM_START_FILE
+
+log = structlog.get_logger(__name__)
+
+
+#: Snapshot file (one per install, all scopes), in the app cache dir
+WARM_START_PATH = Path(WARM_START_FILE)
+
+#: Format version of the snapshot payload (bump on incompatible change)
+WARM_START_VERSION = 1
+
+#: Snapshots older than this are ignored at launch
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+#: Periodic save interval while the app runs
+SAVE_INTERVAL_MS = 60_000
+
+#: Max points kept per timeframe curve
+MAX_POINTS_PER_TIMEFRAME = 240
+
+
+def scope_account(state: Any, mode: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Account whose balance StateManager holds for mode.
+
+    The active mode's current account; otherwise the configured LIVE account,
+    or the account the mode last ran under (mode history). default when unknown.
+    """
+    if (getattr(state, "current_mode", None) or "").upper() == mode and getattr(state, "current_account", None):
+        return state.current_account
+    if mode == "LIVE" and getattr(state, "live_account_id", None):
+        return state.live_account_id
+    try:
+        history = state.get_mode_history()
+    except Exception:
+        history = []
+    for _, past_mode, account in reversed(history):
+        if past_mode == mode and account:
+            return account
+    return default
+
+
+# =============================================================================
+# DECIMATION
+# =============================================================================
+
+
+def decimate_points(
+    points: list[tuple[float, float]],
+    max_points: int = MAX_POINTS_PER_TIMEFRAME,
+) -> list[tuple[float, float]]:
+    """
+    Reduce a (ts, balance) series to at most max_points.
+
+    Splits the series into equal-count buckets and keeps each bucket's min and
+    max (in time order), so peaks and drawdowns survive. First and last points
+    are always kept.
+    """
+    n = len(points)
+    if n <= max_points:
+        return list(points)
+
+    inner = points[1:-1]
+    buckets = max(1, (max_points - 2) // 2)
+    size = len(inner) / buckets
+    out = [points[0]]
+    for b in range(buckets):
+        chunk = inner[int(b * size) : int((b + 1) * size)]
+        if not chunk:
+            continue
+        lo = min(chunk, key=lambda p: p[1])
+        hi = max(chunk, key=lambda p: p[1])
+        out.extend(sorted({lo, hi}, key=lambda p: p[0]))
+    out.append(points[-1])
+    return out
+
+
+def curves_by_timeframe(points: list[tuple[float, float]]) -> dict[str, list[list[float]]]:
+    """Window and decimate one scope's curve for every timeframe."""
+    from panels.panel1.timeframe_manager import TimeframeManager
+
+    out: dict[str, list[list[float]]] = {}
+    if not points:
+        return out
+    for tf in ("LIVE", "1D", "1W", "1M", "3M", "YTD"):
+        try:
+            windowed = TimeframeManager.filter_points_for_timeframe(points=points, timeframe=tf)
+        except Exception:
+            windowed = points
+        if windowed:
+            out[tf] = [[round(ts, 3), round(bal, 2)] for ts, bal in decimate_points(list(windowed))]
+    return out
+
+
+def merge_timeframe_curves(curves: dict[str, list[list[float]]]) -> list[tuple[float, float]]:
+    """
+    Rebuild one curve from the per-timeframe samples.
+
+    Long timeframes contribute coarse history, short ones the recent detail.
+    """
+    merged: dict[float, float] = {}
+    for samples in curves.values():
+        for ts, bal in samples:
+            merged[float(ts)] = float(bal)
+    return sorted(merged.items())
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+class WarmStartCache:
+    """
+    Reads, writes and applies the warm-start snapshot.
+
+    Thread Safety:
+    - prime() runs on the GUI thread, before the primed objects are in use
+    - collect() only reads through the sources' locked snapshot accessors, so
+      periodic saves collect and write on a background thread
+    - Writes are serialized by _lock
+    """
+
+    def __init__(self, path: Path | str = WARM_START_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        #: (mode, account) -> balance from the last load/collect (kept across saves)
+        self._balances: dict[tuple[str, str], float] = {}
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    def load(self, max_age: float = MAX_AGE_SECONDS) -> dict[str, Any]:
+        """Return the snapshot, or {} when missing, unreadable, outdated or too old."""
+        try:
+            data = orjson.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log.warning("warm_start.unreadable", path=str(self.path), error=str(e))
+            return {}
+        if not isinstance(data, dict) or data.get("version") != WARM_START_VERSION:
+            return {}
+        age = time.time() - float(data.get("saved_at", 0.0))
+        if age > max_age:
+            log.info("warm_start.too_old", age_s=round(age))
+            return {}
+        with self._lock:
+            for entry in data.get("balances", []):
+                with contextlib.suppress(KeyError, TypeError, ValueError):
+                    self._balances[(entry["mode"], entry["account"])] = float(entry["balance"])
+        return data
+
+    def save(self, snapshot: dict[str, Any]) -> bool:
+        """Write the snapshot atomically (compact JSON, temp file + rename)."""
+        started = time.perf_counter()
+        ok = True
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path.with_suffix(".tmp")
+                temp_path.write_bytes(orjson.dumps(snapshot))
+                temp_path.replace(self.path)
+            except Exception as e:
+                ok = False
+                log.warning("warm_start.save_failed", path=str(self.path), error=str(e))
+        log.debug(
+            "warm_start.saved",
+            ok=ok,
+            curves=len(snapshot.get("equity", [])),
+            elapsed_ms=round((time.perf_counter() - started) * 1000.0, 2),
+        )
+        return ok
+
+    def save_async(self, state: Any = None, equity_state: Any = None, stats_worker: Any = None) -> None:
+        """collect() + save() on a short-lived daemon thread (periodic saves)."""
+
+        def _run() -> None:
+            try:
+                self.save(self.collect(state, equity_state, stats_worker))
+            except Exception as e:
+                log.warning("warm_start.save_failed", path=str(self.path), error=str(e))
+
+        threading.Thread(target=_run, name="WarmStartSave", daemon=True).start()
+
+    # =========================================================================
+    # COLLECT (live state -> snapshot)
+    # =========================================================================
+
+    def collect(self, state: Any = None, equity_state: Any = None, stats_worker: Any = None) -> dict[str, Any]:
+        """
+        Build a snapshot from the live caches.
+
+        Args:
+            state: StateManager (balances, active scope)
+            equity_state: Panel1 EquityStateManager (curves per scope)
+            stats_worker: StatsPrecomputeWorker (Panel3 payloads)
+        """
+        balances: list[dict[str, Any]] = []
+        equity: list[dict[str, Any]] = []
+        stats: list[dict[str, Any]] = []
+        active: dict[str, Any] = {}
+
+        if state is not None:
+            mode_now = (getattr(state, "current_mode", None) or "SIM").upper()
+            active = {"mode": mode_now, "account": getattr(state, "current_account", None) or ""}
+            for mode in ("SIM", "LIVE"):
+                account = scope_account(state, mode)
+                try:
+                    value = float(state.get_balance_for_mode(mode))
+                except Exception:
+                    continue
+                if account and math.isfinite(value):
+                    with self._lock:
+                        self._balances[(mode, account)] = value
+        with self._lock:
+            balances = [
+                {"mode": mode, "account": account, "balance": value}
+                for (mode, account), value in self._balances.items()
+            ]
+
+        if equity_state is not None:
+            try:
+                for (mode, account), points in equity_state.snapshot_curves().items():
+                    curves = curves_by_timeframe(points)
+                    if curves:
+                        equity.append({"mode": mode, "account": account, "curves": curves})
+            except Exception as e:
+                log.warning("warm_start.collect_equity_failed", error=str(e))
+
+        if stats_worker is not None:
+            for (mode, account), payloads in stats_worker.snapshot().items():
+                stats.append({"mode": mode, "account": account, "payloads": payloads})
+
+        return {
+            "version": WARM_START_VERSION,
+            "saved_at": time.time(),
+            "active": active,
+            "balances": balances,
+            "equity": equity,
+            "stats": stats,
+        }
+
+    # =========================================================================
+    # PRIME (snapshot -> live caches)
+    # =========================================================================
+
+    def prime(
+        self,
+        snapshot: dict[str, Any],
+        state: Any = None,
+        equity_state: Any = None,
+        stats_worker: Any = None,
+    ) -> dict[str, int]:
+        """
+        Seed in-memory caches from a snapshot. Everything primed stays
+        reloadable: the DB results replace it when they arrive.
+
+        Returns:
+            Counts of primed entries {"balances", "curves", "stats"}
+        """
+        counts = {"balances": 0, "curves": 0, "stats": 0}
+        if not snapshot:
+            return counts
+
+        if state is not None:
+            active = snapshot.get("active") or {}
+            for mode in ("SIM", "LIVE"):
+                # Before DTC reports an account, assume the last session's one
+                last = active.get("account") if active.get("mode") == mode else None
+                account = scope_account(state, mode, default=last)
+                for entry in snapshot.get("balances", []):
+                    if entry.get("mode") != mode or entry.get("account") != account or not account:
+                        continue
+                    try:
+                        value = float(entry["balance"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    state.set_balance_for_mode(mode, value)
+                    counts["balances"] += 1
+                    break
+
+        if equity_state is not None:
+            for entry in snapshot.get("equity", []):
+                points = merge_timeframe_curves(entry.get("curves") or {})
+                if points:
+                    equity_state.prime_curve(entry.get("mode") or "SIM", entry.get("account") or "", points)
+                    counts["curves"] += 1
+
+        if stats_worker is not None:
+            for entry in snapshot.get("stats", []):
+                payloads = entry.get("payloads") or {}
+                stats_worker.prime(entry.get("mode") or "SIM", entry.get("account"), payloads)
+                counts["stats"] += len(payloads)
+
+        log.info("warm_start.primed", **counts)
+        return counts
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_warm_start_instance: Optional[WarmStartCache] = None
+_warm_start_lock = threading.Lock()
+
+
+def get_warm_start_cache() -> WarmStartCache:
+    """Get the global WarmStartCache singleton (thread-safe creation)."""
+    global _warm_start_instance
+
+    if _warm_start_instance is None:
+        with _warm_start_lock:
+            if _warm_start_instance is None:
+                _warm_start_instance = WarmStartCache()
+
+    return _warm_start_instance
+
+
+def reset_warm_start_cache(path: Optional[Path | str] = None) -> None:
+    """
+    Replace the global cache (optionally pointing at another file).
+
+    WARNING: Only use in tests.
+    """
+    global _warm_start_instance
+
+    with _warm_start_lock:
+        _warm_start_instance = WarmStartCache(path) if path is not None else None
@@ -0,0 +1,3 @@
+"""
+Opt-in benchmark suite for the trading hot paths (APPSIERRA_BENCH=1)
+"""
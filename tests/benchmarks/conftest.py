@@ -0,0 +1,158 @@
+"""
+tests/benchmarks/conftest.py
+
+Benchmark harness for the trading hot paths.
+
+Benchmarks are opt-in (they take minutes and need a quiet machine):
+
+    APPSIERRA_BENCH=1 pytest tests/benchmarks -o addopts="" -q
+    APPSIERRA_BENCH=1 APPSIERRA_BENCH_UPDATE=1 pytest tests/benchmarks   # record baseline
+
+Every run is written to reports/benchmarks/latest.json. When
+reports/benchmarks/baseline.json exists and was recorded on the same
+machine, a benchmark fails if it is statistically and practically slower
+than its baseline (see tools/benchmark_baseline.py).
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+import os
+import time
+from typing import Any, Optional
+
+import pytest
+
+from tools._common import write_json
+from tools.benchmark_baseline import (
+    BASELINE_FORMAT,
+    BASELINE_PATH,
+    LATEST_PATH,
+    compare_samples,
+    load_results,
+    machine_fingerprint,
+    summarize,
+)
+
+BENCH_ENABLED = os.getenv("APPSIERRA_BENCH", "0") == "1"
+UPDATE_BASELINE = os.getenv("APPSIERRA_BENCH_UPDATE", "0") == "1"
+
+#: Timing samples per benchmark (fewer for calls slower than SLOW_CALL_S)
+ROUNDS = 15
+SLOW_ROUNDS = 6
+SLOW_CALL_S = 0.25
+
+#: Each sample loops the call until it takes at least this long
+MIN_SAMPLE_S = 0.005
+
+skip_unless_enabled = pytest.mark.skipif(not BENCH_ENABLED, reason="set APPSIERRA_BENCH=1 to run benchmarks")
+
+
+class BenchSession:
+    """Collects results for the whole run and checks them against the baseline."""
+
+    def __init__(self) -> None:
+        self.machine = machine_fingerprint()
+        self.results: dict[str, dict[str, Any]] = {}
+        baseline = {} if UPDATE_BASELINE else load_results(BASELINE_PATH)
+        self.baseline = baseline.get("benchmarks", {}) if baseline.get("machine") == self.machine else {}
+
+    def measure(
+        self,
+        name: str,
+        size: int,
+        fn: Callable[[Any], Any],
+        setup: Optional[Callable[[], Any]] = None,
+        rounds: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Time fn(setup()) and record per-call samples under "name[size]".
+
+        setup() runs before every sample and is not timed (fresh state for
+        mutating benchmarks). Returns the summary plus the baseline verdict.
+        """
+        key = f"{name}[{size}]"
+        state = setup() if setup else None
+
+        # Warm up + calibrate loops per sample
+        started = time.perf_counter()
+        fn(state)
+        once = time.perf_counter() - started
+        loops = 1 if setup else max(1, min(10_000, int(MIN_SAMPLE_S / max(once, 1e-9))))
+        rounds = rounds or (SLOW_ROUNDS if once > SLOW_CALL_S else ROUNDS)
+
+        samples: list[float] = []
+        for _ in range(rounds):
+            if setup:
+                state = setup()
+            started = time.perf_counter()
+            for _ in range(loops):
+                fn(state)
+            samples.append((time.perf_counter() - started) / loops)
+
+        entry = {"name": name, "size": size, "loops": loops, "samples": samples, **summarize(samples)}
+        self.results[key] = entry
+
+        base = self.baseline.get(key)
+        entry["verdict"] = compare_samples(samples, base["samples"]) if base else None
+        return entry
+
+    def write(self) -> None:
+        if not self.results:
+            return
+        report = {
+            "format": BASELINE_FORMAT,
+            "recorded_at": datetime.now(UTC).isoformat(),
+            "machine": self.machine,
+            "benchmarks": {key: {k: v for k, v in entry.items() if k != "verdict"} for key, entry in self.results.items()},
+        }
+        write_json(report, LATEST_PATH)
+        if UPDATE_BASELINE:
+            write_json(report, BASELINE_PATH)
+
+
+@pytest.fixture(scope="session")
+def bench_session():
+    session = BenchSession()
+    yield session
+    session.write()
+
+
+@pytest.fixture
+def bench(bench_session, tmp_path, monkeypatch):
+    """
+    Measure a callable and fail on a significant regression vs the baseline.
+
+    Runs inside tmp_path so scoped state files (data/...) never touch the repo.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir(exist_ok=True)
+
+    def _bench(name: str, size: int, fn: Callable[[Any], Any], setup: Optional[Callable[[], Any]] = None, rounds: Optional[int] = None):
+        entry = bench_session.measure(name, size, fn, setup=setup, rounds=rounds)
+        verdict = entry["verdict"]
+        if verdict and verdict["regressed"]:
+            pytest.fail(
+                f"{name}[{size}] regressed: median {verdict['median_s'] * 1e3:.3f} ms vs "
+                f"baseline {verdict['baseline_median_s'] * 1e3:.3f} ms (x{verdict['ratio']:.2f}, p={verdict['p_value']:.4f})"
+            )
+        return entry
+
+    return _bench
+
+
+@pytest.fixture
+def bench_db(tmp_path):
+    """File-backed SQLite engine in tmp_path, installed as the app engine."""
+    from sqlmodel import SQLModel, create_engine
+
+    import data.db_engine as db_engine
+    from data import schema  # noqa: F401  # registers the tables
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    previous = db_engine._engine
+    db_engine._engine = engine
+    yield engine
+    db_engine._engine = previous
+    engine.dispose()
@@ -0,0 +1,77 @@
+"""
+tests/benchmarks/test_bench_dtc.py
+
+DTC inbound path: null-terminated framing + JSON decode + normalization +
+SignalBus dispatch (DTCClientJSON._on_ready_read), and normalization alone.
+"""
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from core.data_bridge import DTCClientJSON, _dtc_to_app_event
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+SIZES = [100, 1_000, 10_000]
+
+
+def _dtc_messages(count: int) -> list[dict]:
+    """Alternating PositionUpdate (306) / AccountBalanceUpdate (600) frames."""
+    messages = []
+    for i in range(count):
+        if i % 2:
+            messages.append({"Type": 600, "TradeAccount": "Sim1", "CashBalance": 10_000.0 + i, "AccountValue": 10_050.0 + i})
+        else:
+            messages.append(
+                {"Type": 306, "TradeAccount": "Sim1", "Symbol": "MESZ25", "Quantity": 1, "AveragePrice": 5000.25 + i * 0.25}
+            )
+    return messages
+
+
+class _FakeSocket:
+    """Stands in for QTcpSocket: serves one pre-built buffer in 64 KiB reads."""
+
+    def __init__(self, payload: bytes):
+        self._payload = payload
+        self._pos = 0
+
+    def bytesAvailable(self) -> int:
+        return len(self._payload) - self._pos
+
+    def read(self, size: int) -> bytes:
+        chunk = self._payload[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+@pytest.fixture
+def client(qapp):
+    client = DTCClientJSON(host="127.0.0.1", port=0, _sim_mode=True)
+    yield client
+    client.deleteLater()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_framing_decode_dispatch(bench, client, size):
+    wire = b"".join(orjson.dumps(m) + b"\x00" for m in _dtc_messages(size))
+
+    def setup():
+        client._sock = _FakeSocket(wire)
+        return client
+
+    bench("dtc.framing", size, lambda c: c._on_ready_read(), setup=setup)
+    assert not client._buf
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_normalize(bench, size):
+    messages = _dtc_messages(size)
+
+    def normalize_all(_):
+        for message in messages:
+            _dtc_to_app_event(message)
+
+    bench("dtc.normalize", size, normalize_all)
@@ -0,0 +1,73 @@
+"""
+tests/benchmarks/test_bench_equity.py
+
+Panel1 equity curve: appending a balance point, replotting the chart and
+hover scrubbing at 1k / 100k / 1M points.
+"""
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+_T0 = 1_700_000_000.0
+
+
+def _curve(count: int) -> list[tuple[float, float]]:
+    return [(_T0 + i, 10_000.0 + (i % 200) - 100) for i in range(count)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_append_balance_point(bench, qapp, size):
+    from panels.panel1.equity_state import EquityStateManager
+
+    curve = _curve(size)
+    manager = EquityStateManager()
+    manager.set_scope("SIM", "Sim1")
+
+    def setup():
+        # Fresh curve of `size` points; persistence writes to tmp_path/data
+        manager._equity_curves[("SIM", "Sim1")] = list(curve)
+        return manager
+
+    bench("equity.append", size, lambda m: m.add_balance_point(10_001.0, timestamp=_T0 + size), setup=setup)
+    assert len(manager.get_active_curve()) == size + 1
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_replot(bench, qapp, size):
+    from panels.panel1.equity_chart import HAS_PYQTGRAPH, EquityChart
+
+    if not HAS_PYQTGRAPH:
+        pytest.skip("pyqtgraph not installed")
+
+    chart = EquityChart()
+    plot = chart.create_plot_widget()
+    chart.stop_animation()
+    plot.resize(800, 400)
+    curve = _curve(size)
+
+    bench("equity.replot", size, lambda _: chart.replot(curve, "ALL"))
+    plot.deleteLater()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_hover_scrub(bench, qapp, size):
+    from panels.panel1.hover_handler import HoverHandler
+
+    handler = HoverHandler(plot_widget=None, view_box=None, on_balance_update=lambda _: None, on_pnl_update=lambda *_: None)
+    handler.set_data(_curve(size), "YTD")
+    targets = [_T0 + size * (i / 100.0) + 0.5 for i in range(100)]
+
+    def scrub(_):
+        for x in targets:
+            handler._interpolate_balance(x)
+            handler._get_baseline_for_timeframe(x)
+
+    bench("equity.hover", size, scrub)
+    handler.deleteLater()
@@ -0,0 +1,74 @@
+"""
+tests/benchmarks/test_bench_metric_grid.py
+
+One Panel2-style tick (15 value + color updates, then the repaint) on the
+custom-painted MetricGrid vs a grid of MetricCell widgets.
+"""
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+SIZES = [15, 60]
+_COLORS = ["#22C55E", "#EF4444", "#C9CDD0"]
+
+
+def _names(size: int) -> list[str]:
+    return [f"Metric {i}" for i in range(size)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_painted_grid(bench, qapp, size):
+    from widgets.metric_grid import MetricGrid
+
+    grid = MetricGrid(_names(size), cols=5)
+    grid.resize(900, 60 * (size // 5))
+    grid.show()
+    qapp.processEvents()
+    cells = list(grid.metrics().values())
+
+    ticks = itertools.count()
+
+    def tick(_):
+        i = next(ticks)
+        for cell in cells:
+            cell.set_value_text(f"{5000.0 + i * 0.25:.2f}")
+            cell.set_value_color(_COLORS[i % 3])
+        qapp.processEvents()
+
+    bench("metric_grid.tick_painted", size, tick)
+    grid.deleteLater()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_widget_cells(bench, qapp, size):
+    from PyQt6 import QtWidgets
+
+    from widgets.metric_cell import MetricCell
+
+    root = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout(root)
+    cells = [MetricCell(name) for name in _names(size)]
+    for i, cell in enumerate(cells):
+        layout.addWidget(cell, *divmod(i, 5))
+    root.resize(900, 60 * (size // 5))
+    root.show()
+    qapp.processEvents()
+
+    ticks = itertools.count()
+
+    def tick(_):
+        i = next(ticks)
+        for cell in cells:
+            cell.set_value_text(f"{5000.0 + i * 0.25:.2f}")
+            cell.set_value_color(_COLORS[i % 3])
+        qapp.processEvents()
+
+    bench("metric_grid.tick_widgets", size, tick)
+    root.deleteLater()
@@ -0,0 +1,51 @@
+"""
+tests/benchmarks/test_bench_panel2.py
+
+Panel2 tick handling: state update, MAE/MFE extremes, metric recalculation,
+display refresh and JSON state save per market-data tick.
+"""
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+
+def _ticks(count: int) -> list[dict]:
+    return [
+        {
+            "last": 5000.0 + (i % 40) * 0.25,
+            "high": 5010.0,
+            "low": 4990.0,
+            "vwap": 5001.5,
+            "cum_delta": float(i % 500 - 250),
+            "poc": 5000.75,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def panel2(qapp):
+    from panels.panel2 import Panel2
+
+    panel = Panel2()
+    # Long 1 @ 5000 with no account: extremes are tracked but not written to the DB
+    panel._state = panel._state.with_position(entry_qty=1, entry_price=5000.0, is_long=True)
+    yield panel
+    panel.deleteLater()
+
+
+@pytest.mark.parametrize("size", [100, 1_000])
+def test_feed_ticks(bench, panel2, size):
+    ticks = _ticks(size)
+
+    def run_ticks(_):
+        for tick in ticks:
+            panel2._on_feed_updated(tick)
+
+    bench("panel2.ticks", size, run_ticks)
+    assert panel2._state.trade_max_price == 5009.75
@@ -0,0 +1,93 @@
+"""
+tests/benchmarks/test_bench_persistence.py
+
+JSON vs DB persistence for the writes made on the hot paths:
+- equity point: EquityStatePersistence.append_point (rewrites the JSON
+  history) vs one AccountBalance row insert, with N points already stored
+- open position: Panel2 StatePersistence.save_state (JSON) vs
+  PositionRepository.save_open_position (DB upsert), N writes per sample
+"""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+HISTORY_SIZES = [100, 10_000, 100_000]
+WRITE_BATCHES = [10, 100]
+
+_T0 = 1_700_000_000.0
+
+
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+def test_equity_point_json(bench, size):
+    from panels.panel1.state_persistence import EquityStatePersistence
+    from utils.atomic_persistence import save_json_atomic
+
+    persistence = EquityStatePersistence("SIM", "Sim1")
+    history = [{"ts": _T0 + i, "balance": 10_000.0 + i % 100} for i in range(size)]
+
+    def setup():
+        save_json_atomic({"points": list(history)}, persistence._path())
+        return persistence
+
+    bench("persist.equity_json", size, lambda p: p.append_point(_T0 + size, 10_050.0), setup=setup)
+    assert len(persistence.load_points()) == size + 1
+
+
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+def test_equity_point_db(bench, bench_db, size):
+    from data.db_engine import get_session
+    from data.schema import AccountBalance
+
+    start = datetime.now(UTC) - timedelta(seconds=size)
+    with bench_db.begin() as conn:
+        conn.execute(
+            AccountBalance.__table__.insert(),
+            [
+                {"account_id": "Sim1", "balance": 10_000.0 + i % 100, "mode": "SIM", "timestamp": start + timedelta(seconds=i)}
+                for i in range(size)
+            ],
+        )
+
+    def insert_point(_):
+        with get_session() as session:
+            session.add(AccountBalance(account_id="Sim1", balance=10_050.0, mode="SIM", timestamp=datetime.now(UTC)))
+            session.commit()
+
+    bench("persist.equity_db", size, insert_point)
+
+
+@pytest.mark.parametrize("size", WRITE_BATCHES)
+def test_position_json(bench, size):
+    from panels.panel2.position_state import PositionState
+    from panels.panel2.state_persistence import StatePersistence
+
+    persistence = StatePersistence("SIM", "Sim1")
+    state = PositionState().with_scope("SIM", "Sim1").with_position(entry_qty=1, entry_price=5000.0, is_long=True)
+
+    def save_batch(_):
+        for _ in range(size):
+            persistence.save_state(state)
+
+    bench("persist.position_json", size, save_batch)
+
+
+@pytest.mark.parametrize("size", WRITE_BATCHES)
+def test_position_db(bench, bench_db, size):
+    from data.position_repository import PositionRepository
+
+    repo = PositionRepository()
+
+    def upsert_batch(_):
+        for i in range(size):
+            repo.save_open_position(
+                mode="SIM", account="Sim1", symbol="MESZ25", qty=1, entry_price=5000.0 + i * 0.25
+            )
+
+    bench("persist.position_db", size, upsert_batch)
@@ -0,0 +1,45 @@
+"""
+tests/benchmarks/test_bench_qt_bridge.py
+
+Marshaling a burst of callbacks to the GUI thread: the batched
+InvocationQueue (one posted event per batch) vs one QTimer.singleShot(0)
+per call.
+"""
+from __future__ import annotations
+
+from PyQt6 import QtCore
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+
+def _run_burst(qapp, post, calls: int) -> None:
+    done = [0]
+
+    def callback(_value: int) -> None:
+        done[0] += 1
+
+    for i in range(calls):
+        post(callback, i)
+    while done[0] < calls:
+        qapp.processEvents()
+
+
+@pytest.mark.parametrize("calls", [100, 1_000])
+def test_invocation_queue(bench, qapp, calls):
+    from utils.qt_bridge import InvocationQueue
+
+    queue = InvocationQueue()
+    bench("qt_bridge.queue", calls, lambda _: _run_burst(qapp, queue.post, calls))
+    assert queue.stats()["depth"] == 0
+
+
+@pytest.mark.parametrize("calls", [100, 1_000])
+def test_single_shot(bench, qapp, calls):
+    def post(callback, value: int) -> None:
+        QtCore.QTimer.singleShot(0, lambda: callback(value))
+
+    bench("qt_bridge.single_shot", calls, lambda _: _run_burst(qapp, post, calls))
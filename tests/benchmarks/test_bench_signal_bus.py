@@ -0,0 +1,99 @@
+"""
+tests/benchmarks/test_bench_signal_bus.py
+
+SignalBus fan-out: cost of one emit as the number of connected slots grows
+(plain and with per-slot profiling), and queued emit-to-slot cost for dict
+vs typed event payloads.
+"""
+from __future__ import annotations
+
+from PyQt6 import QtCore
+import pytest
+
+from core.signal_bus import SignalBus
+from domain.events import PositionUpdateEvent
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+EMITS = 1_000
+
+
+@pytest.mark.parametrize("profiled", [False, True], ids=["plain", "profiled"])
+@pytest.mark.parametrize("subscribers", [1, 10, 100])
+def test_position_updated_fan_out(bench, qapp, subscribers, profiled):
+    bus = SignalBus(profile=profiled)
+    received = [0]
+
+    def slot(payload: dict) -> None:
+        received[0] += 1
+
+    for _ in range(subscribers):
+        bus.positionUpdated.connect(slot)
+
+    payload = {"symbol": "MESZ25", "qty": 1, "avg_entry": 5000.25, "TradeAccount": "Sim1"}
+
+    def emit_batch(_):
+        for _ in range(EMITS):
+            bus.positionUpdated.emit(payload)
+
+    bench("signal_bus.fan_out_profiled" if profiled else "signal_bus.fan_out", subscribers, emit_batch)
+    assert received[0] % (EMITS * subscribers) == 0
+    bus.deleteLater()
+
+
+class _DictBus(QtCore.QObject):
+    """The pre-typed-events signature: dict payloads are converted to QVariantMap."""
+
+    positionUpdated = QtCore.pyqtSignal(dict)
+
+
+def _read_dict(msg: dict) -> tuple:
+    """What a dict slot does per message: alias lookups plus coercion."""
+    qty = msg.get("PositionQuantity", msg.get("Quantity", msg.get("qty", 0)))
+    avg = msg.get("AveragePrice", msg.get("avg_entry"))
+    return (
+        msg.get("Symbol") or msg.get("symbol") or "",
+        int(qty) if isinstance(qty, (int, float)) else 0,
+        float(avg) if avg is not None else None,
+        str(msg.get("TradeAccount") or ""),
+    )
+
+
+def _read_typed(event: PositionUpdateEvent) -> tuple:
+    return event.symbol, event.quantity, event.average_price, event.account
+
+
+@pytest.mark.parametrize("payload_kind", ["dict", "typed"])
+def test_position_updated_emit_to_slot(bench, qapp, payload_kind):
+    """Queued emit-to-slot cost (payload delivery + field reads in the slot) for dict vs typed payloads."""
+    msg = {
+        "Type": 306,
+        "Symbol": "MESZ25",
+        "PositionQuantity": 1,
+        "AveragePrice": 5000.25,
+        "OpenProfitLoss": 12.5,
+        "TradeAccount": "Sim1",
+        "DateTime": 1_700_000_000,
+    }
+    if payload_kind == "dict":
+        bus, payload, read = _DictBus(), msg, _read_dict
+    else:
+        bus, payload, read = SignalBus(), PositionUpdateEvent.from_dtc(msg), _read_typed
+    received = [0]
+
+    def slot(value) -> None:
+        read(value)
+        received[0] += 1
+
+    bus.positionUpdated.connect(slot, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def emit_batch(_):
+        for _ in range(EMITS):
+            bus.positionUpdated.emit(payload)
+        qapp.processEvents()
+
+    bench(f"signal_bus.emit_{payload_kind}", EMITS, emit_batch)
+    assert received[0] % EMITS == 0
+    bus.deleteLater()
@@ -0,0 +1,62 @@
+"""
+tests/benchmarks/test_bench_stats.py
+
+Panel3 stats: compute_trading_stats_for_timeframe over 100 / 10k / 100k
+closed trades (query + aggregation; the 5 s result cache is cleared per call).
+"""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+
+def _seed_trades(engine, count: int) -> None:
+    from data.schema import TradeRecord
+
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(count):
+        exit_time = now - timedelta(seconds=(count - i) * 5)
+        pnl = (i % 7 - 3) * 12.5
+        rows.append(
+            {
+                "symbol": "MESZ25",
+                "side": "LONG" if i % 2 else "SHORT",
+                "qty": 1,
+                "mode": "SIM",
+                "account": "Sim1",
+                "entry_time": exit_time - timedelta(seconds=90),
+                "entry_price": 5000.0,
+                "exit_time": exit_time,
+                "exit_price": 5000.0 + pnl / 5.0,
+                "is_closed": True,
+                "realized_pnl": pnl,
+                "commissions": 1.24,
+                "r_multiple": pnl / 25.0,
+                "mae": -6.25,
+                "mfe": 18.75,
+                "created_at": now,
+            }
+        )
+    with engine.begin() as conn:
+        conn.execute(TradeRecord.__table__.insert(), rows)
+
+
+@pytest.mark.parametrize("size", [100, 10_000, 100_000])
+def test_compute_stats(bench, bench_db, size):
+    from services.stats_service import compute_trading_stats_for_timeframe, invalidate_stats_cache
+
+    _seed_trades(bench_db, size)
+
+    def compute(_):
+        invalidate_stats_cache()
+        return compute_trading_stats_for_timeframe("1W", mode="SIM", account="Sim1")
+
+    bench("stats.compute", size, compute)
+    assert compute(None)["_trade_count"] == size
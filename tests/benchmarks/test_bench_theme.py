@@ -0,0 +1,65 @@
+"""
+tests/benchmarks/test_bench_theme.py
+
+Theme switch (DEBUG/SIM/LIVE) over a tree of MetricCells: precompiled
+property switch vs the legacy per-widget setStyleSheet refresh.
+"""
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from tests.benchmarks.conftest import skip_unless_enabled
+
+
+pytestmark = [pytest.mark.benchmark, skip_unless_enabled]
+
+SIZES = [30, 120, 480]
+
+
+def _tree(qapp, size: int):
+    from PyQt6 import QtWidgets
+
+    from widgets.metric_cell import MetricCell
+
+    root = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout(root)
+    cells = [MetricCell(f"M{i}") for i in range(size)]
+    for i, cell in enumerate(cells):
+        layout.addWidget(cell, *divmod(i, 10))
+    root.show()
+    qapp.processEvents()
+    return root, cells
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_compiled_switch(bench, qapp, size):
+    from utils.theme_compiler import get_theme_compiler, reset_theme_compiler
+
+    reset_theme_compiler()
+    compiler = get_theme_compiler()
+    root, _ = _tree(qapp, size)
+    compiler.install(qapp)
+    compiler.attach(root)
+    modes = itertools.cycle(["SIM", "LIVE", "DEBUG"])
+
+    bench("theme.switch_compiled", size, lambda _: compiler.apply(next(modes)))
+    reset_theme_compiler()
+    root.deleteLater()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_legacy_refresh(bench, qapp, size):
+    from config.theme import switch_theme
+
+    root, cells = _tree(qapp, size)
+    modes = itertools.cycle(["sim", "live", "debug"])
+
+    def switch(_):
+        switch_theme(next(modes))
+        for cell in cells:
+            cell.setStyleSheet(cell._build_theme_stylesheet())
+
+    bench("theme.switch_legacy", size, switch)
+    root.deleteLater()
@@ -0,0 +1,134 @@
+"""
+tests/test_animation_clock.py
+
+Shared animation clock: batched ticks, visibility-aware pausing, cleanup.
+"""
+from __future__ import annotations
+
+import time
+
+from PyQt6 import QtCore, QtWidgets
+import pytest
+
+from core.animation_clock import AnimationClock
+
+
+def _pump(qapp, seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def clock(qapp):
+    clock = AnimationClock(quantum_ms=20)
+    yield clock
+    clock._timer.stop()
+    clock.deleteLater()
+
+
+@pytest.fixture
+def window(qapp):
+    window = QtWidgets.QWidget()
+    child = QtWidgets.QLabel("pulse", window)
+    QtWidgets.QVBoxLayout(window).addWidget(child)
+    window.show()
+    _pump(qapp, 0.05)
+    yield window, child
+    window.close()
+    window.deleteLater()
+
+
+class TestScheduling:
+    def test_rates_share_one_timer(self, qapp, clock):
+        fast, slow = [], []
+        clock.subscribe(lambda: fast.append(1), 40).start()
+        clock.subscribe(lambda: slow.append(1), 63).start()  # quantized to 60 ms
+
+        assert not clock.idle
+        _pump(qapp, 0.62)
+
+        assert 11 <= len(fast) <= 16
+        assert 7 <= len(slow) <= 11
+        # Wakeups only at due times (40, 60, 80, 120 ms per 120 ms): coinciding
+        # ticks are batched, and there is no idle 20 ms GCD tick
+        assert clock.ticks < len(fast) + len(slow)
+        assert clock.ticks <= 0.62 / 0.120 * 4 + 2
+
+    def test_idle_clock_stops_its_timer(self, qapp, clock):
+        sub = clock.subscribe(lambda: None, 1000)
+        assert clock.idle
+        sub.start()
+        assert not clock.idle and clock._timer.remainingTime() <= 1000 + clock.quantum_ms
+        sub.stop()
+        assert clock.idle
+
+    def test_failing_callback_does_not_stop_others(self, qapp, clock):
+        seen = []
+        clock.subscribe(lambda: 1 / 0, 20).start()
+        clock.subscribe(lambda: seen.append(1), 20).start()
+        _pump(qapp, 0.1)
+        assert seen
+
+
+class TestVisibility:
+    def test_hidden_owner_is_suspended_and_resumes(self, qapp, clock, window):
+        top, child = window
+        ticks = []
+        sub = clock.subscribe(lambda: ticks.append(1), 20, owner=child)
+        sub.start()
+        _pump(qapp, 0.1)
+        assert ticks
+
+        child.hide()
+        _pump(qapp, 0.02)
+        ticks.clear()
+        _pump(qapp, 0.1)
+        assert not ticks and clock.idle
+        assert sub.isActive() and not sub.running
+
+        child.show()
+        _pump(qapp, 0.1)
+        assert ticks
+
+    def test_minimized_window_suspends_children(self, qapp, clock, window):
+        top, child = window
+        sub = clock.subscribe(lambda: None, 20, owner=child)
+        sub.start()
+
+        top.showMinimized()
+        _pump(qapp, 0.05)
+        assert not sub.running
+
+        top.showNormal()
+        _pump(qapp, 0.05)
+        assert sub.running
+
+    def test_destroyed_owner_is_unsubscribed(self, qapp, clock):
+        owner = QtWidgets.QWidget()
+        owner.show()
+        sub = clock.subscribe(lambda: None, 20, owner=owner)
+        sub.start()
+        assert clock.running_subscriptions() == [sub]
+
+        owner.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+        assert clock.running_subscriptions() == []
+        assert clock.idle
+
+    def test_destroyed_slots_are_held_until_they_fire(self, qapp, clock):
+        # Held by the clock, not only by the sender's wrapper: a wrapper freed
+        # by the cyclic collector would otherwise clear the slot before Qt
+        # emits destroyed()
+        window = QtWidgets.QWidget()
+        owner = QtWidgets.QLabel("pulse", window)
+        clock.subscribe(lambda: None, 20, owner=owner)
+        assert set(clock._destroyed_slots) == {("owner", id(owner)), ("window", id(window))}
+
+        window.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+        assert clock._destroyed_slots == {}
+        assert clock._watched_windows == set()
@@ -0,0 +1,101 @@
+"""
+tests/test_balance_ledger.py
+
+Tests for the incremental SIM balance ledger in UnifiedBalanceManager.
+"""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from services.unified_balance_manager import UnifiedBalanceManager
+
+
+@pytest.fixture
+def manager():
+    m = UnifiedBalanceManager()
+    yield m
+    m.stop_reconciliation()
+
+
+def _patch_query(aggregates):
+    return patch.object(UnifiedBalanceManager, "_query_sim_ledger", side_effect=aggregates)
+
+
+class TestSimLedger:
+    def test_seed_runs_one_query_and_reads_are_memory_only(self, manager):
+        with _patch_query(lambda: {"Sim1": (250.0, 3), "Sim2": (-100.0, 1)}) as query:
+            assert manager.get_balance("SIM", "Sim1") == 10250.0
+            assert manager.get_balance("SIM", "Sim2") == 9900.0
+            assert manager.get_balance("SIM", "Sim3") == 10000.0
+            assert manager.get_trade_count("Sim1") == 3
+            assert manager.get_sim_realized_total() == 150.0
+
+        assert query.call_count == 1
+
+    def test_trade_close_applies_delta(self, manager):
+        with _patch_query(lambda: {"Sim1": (100.0, 1)}) as query:
+            assert manager.apply_trade_close("SIM", "Sim1", 50.0) == 10150.0
+            assert manager.apply_trade_close("SIM", "Sim1", -25.0) == 10125.0
+
+        assert query.call_count == 1
+        assert manager.get_trade_count("Sim1") == 3
+        assert manager.get_sim_realized_total() == 125.0
+
+    def test_reconcile_repairs_drift_and_keeps_reset(self, manager):
+        with _patch_query(lambda: {"Sim1": (100.0, 1)}):
+            manager.get_balance("SIM", "Sim1")
+        manager.reset_balance("SIM", "Sim1")
+
+        # A trade reached the DB without passing through apply_trade_close
+        with _patch_query(lambda: {"Sim1": (175.0, 2)}):
+            corrections = manager.reconcile_sim_ledger()
+
+        assert corrections == {"Sim1": pytest.approx(75.0)}
+        assert manager.get_balance("SIM", "Sim1") == pytest.approx(10075.0)
+        assert manager.get_trade_count("Sim1") == 2
+
+        with _patch_query(lambda: {"Sim1": (175.0, 2)}):
+            assert manager.reconcile_sim_ledger() == {}
+
+    def test_reconcile_skips_accounts_mutated_during_query(self, manager):
+        with _patch_query(lambda: {"Sim1": (100.0, 1)}):
+            manager.get_balance("SIM", "Sim1")
+
+        def racing_query():
+            # Close lands in memory while the DB snapshot is being read
+            manager.apply_trade_close("SIM", "Sim1", 40.0)
+            return {"Sim1": (100.0, 1)}
+
+        with _patch_query(racing_query):
+            assert manager.reconcile_sim_ledger() == {}
+
+        assert manager.get_balance("SIM", "Sim1") == 10140.0
+
+    def test_db_unavailable_falls_back_to_starting_balance(self, manager):
+        with _patch_query(lambda: None):
+            assert manager.get_balance("SIM", "Sim1") == 10000.0
+            assert manager.reconcile_sim_ledger() == {}
+
+    def test_failed_seed_is_retried(self, manager):
+        with _patch_query(lambda: None) as query:
+            assert manager.get_balance("SIM", "Sim1") == 10000.0
+            assert manager.get_balance("SIM", "Sim1") == 10000.0
+        assert query.call_count == 1  # no retry inside SEED_RETRY_INTERVAL
+
+        manager._seed_failed_at -= manager.SEED_RETRY_INTERVAL
+        with _patch_query(lambda: {"Sim1": (250.0, 3)}):
+            assert manager.get_balance("SIM", "Sim1") == 10250.0
+
+    def test_trade_close_while_unseeded_counts_once(self, manager):
+        with _patch_query(lambda: None):
+            assert manager.apply_trade_close("SIM", "Sim1", 100.0) == 10100.0
+            assert manager.get_balance("SIM", "Sim1") == 10100.0
+            assert manager.apply_trade_close("SIM", "Sim1", -40.0) == 10060.0
+
+        # Seed succeeds later: the DB ledger (which has both trades) wins
+        manager._seed_failed_at -= manager.SEED_RETRY_INTERVAL
+        with _patch_query(lambda: {"Sim1": (60.0, 2)}):
+            assert manager.get_balance("SIM", "Sim1") == 10060.0
+            assert manager.reconcile_sim_ledger() == {}
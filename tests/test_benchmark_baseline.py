@@ -0,0 +1,48 @@
+"""
+tests/test_benchmark_baseline.py
+
+Benchmark regression check: Mann-Whitney U verdicts and run comparison.
+"""
+from __future__ import annotations
+
+import random
+
+from tools.benchmark_baseline import compare_runs, compare_samples, mann_whitney_greater
+
+
+def _samples(median: float, n: int = 15, jitter: float = 0.03, seed: int = 1) -> list[float]:
+    rng = random.Random(seed)
+    return [median * (1.0 + rng.uniform(-jitter, jitter)) for _ in range(n)]
+
+
+class TestRegressionVerdict:
+    def test_identical_distributions_do_not_regress(self):
+        base = _samples(0.010)
+        assert mann_whitney_greater(base, base) > 0.4
+        assert not compare_samples(_samples(0.010, seed=2), base)["regressed"]
+
+    def test_significant_slowdown_regresses(self):
+        verdict = compare_samples(_samples(0.013, seed=2), _samples(0.010))
+        assert verdict["regressed"]
+        assert verdict["p_value"] < 0.001 and 1.25 < verdict["ratio"] < 1.35
+
+    def test_small_or_faster_changes_are_not_regressions(self):
+        base = _samples(0.010)
+        # Significant but under the 10% practical floor
+        assert not compare_samples(_samples(0.0105, jitter=0.001, seed=2), _samples(0.010, jitter=0.001))["regressed"]
+        # Faster
+        assert not compare_samples(_samples(0.007, seed=2), base)["regressed"]
+
+    def test_compare_runs_flags_regressions_and_new_benchmarks(self):
+        machine = {"python": "3.11", "cpus": 8}
+        baseline = {"machine": machine, "benchmarks": {"a[1]": {"samples": _samples(0.01)}}}
+        latest = {
+            "machine": machine,
+            "benchmarks": {"a[1]": {"samples": _samples(0.02, seed=3)}, "b[1]": {"samples": _samples(0.01)}},
+        }
+
+        report = compare_runs(latest, baseline)
+
+        assert report["same_machine"]
+        assert report["regressions"] == ["a[1]"]
+        assert report["benchmarks"]["b[1]"] == {"status": "new"}
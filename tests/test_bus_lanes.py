@@ -0,0 +1,191 @@
+"""
+tests/test_bus_lanes.py
+
+SignalBus priority lanes: critical signals untouched, normal signals
+coalesced per frame, background signals deferred to idle time, cross-thread
+emits, and per-lane depth/wait metrics.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from PyQt6 import QtCore
+import pytest
+
+from core import metrics
+from core.bus_lanes import BACKGROUND, NORMAL, LanedSignal, lane_of
+from core.signal_bus import SignalBus
+from core.signal_profiler import ProfiledSignal
+
+
+def _pump(qapp, seconds: float = 0.1) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def bus(qapp):
+    bus = SignalBus(profile=False, lanes=True)
+    yield bus
+    bus.deleteLater()
+
+
+class TestRouting:
+    def test_critical_signals_are_not_wrapped(self, bus):
+        assert lane_of("orderUpdateReceived") == "critical"
+        assert isinstance(bus.orderUpdateReceived, QtCore.pyqtBoundSignal)
+        assert isinstance(bus.positionUpdated, QtCore.pyqtBoundSignal)
+        assert isinstance(bus.balanceUpdated, LanedSignal)
+        assert lane_of("metricsReloadRequested") == BACKGROUND
+
+    def test_lanes_off_delivers_immediately(self, qapp):
+        bus = SignalBus(profile=False, lanes=False)
+        seen: list[float] = []
+        bus.balanceUpdated.connect(lambda balance, account: seen.append(balance))
+
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        assert bus.lanes is None and seen == [1.0]
+        bus.deleteLater()
+
+
+class TestNormalLane:
+    def test_balances_coalesce_per_account_once_per_frame(self, bus, qapp):
+        seen: list[tuple[float, str]] = []
+        bus.balanceUpdated.connect(lambda balance, account: seen.append((balance, account)))
+
+        for balance in (1.0, 2.0, 3.0):
+            bus.balanceUpdated.emit(balance, "Sim1")
+        bus.balanceUpdated.emit(9.0, "120005")
+        assert seen == []
+
+        _pump(qapp, 0.1)
+
+        assert seen == [(3.0, "Sim1"), (9.0, "120005")]
+        stats = bus.lanes.lane_stats()[NORMAL]
+        assert (stats["enqueued"], stats["delivered"], stats["coalesced"], stats["max_depth"]) == (4, 2, 2, 2)
+        assert stats["depth"] == 0 and stats["wait_max_ms"] > 0.0
+
+    def test_non_coalescing_signal_keeps_every_emit_in_order(self, bus):
+        points: list[float] = []
+        bus.equityPointRequested.connect(lambda balance, mode: points.append(balance))
+
+        for balance in (1.0, 2.0, 3.0):
+            bus.equityPointRequested.emit(balance, "SIM")
+        bus.lanes.drain()
+
+        assert points == [1.0, 2.0, 3.0]
+
+    def test_emit_from_slot_is_delivered_in_same_flush(self, bus):
+        seen: list[str] = []
+        bus.balanceUpdated.connect(lambda balance, account: bus.balanceDisplayRequested.emit(balance, "SIM"))
+        bus.balanceDisplayRequested.connect(lambda balance, mode: seen.append(mode))
+
+        bus.balanceUpdated.emit(1.0, "Sim1")
+        bus.lanes._flush_normal()
+
+        assert seen == ["SIM"]
+
+    def test_worker_thread_emit_is_delivered_on_gui_thread(self, bus, qapp):
+        threads: list[QtCore.QThread] = []
+        bus.balanceUpdated.connect(lambda balance, account: threads.append(QtCore.QThread.currentThread()))
+
+        worker = threading.Thread(target=lambda: bus.balanceUpdated.emit(1.0, "Sim1"))
+        worker.start()
+        worker.join()
+        _pump(qapp, 0.1)
+
+        assert threads == [qapp.thread()]
+
+
+class TestBackgroundLane:
+    def test_analytics_wait_for_display_and_queued_events(self, bus, qapp):
+        order: list[str] = []
+        bus.tradeClosedForAnalytics.connect(lambda trade: order.append("analytics"))
+        bus.balanceUpdated.connect(lambda balance, account: order.append("balance"))
+        bus.positionUpdated.connect(lambda event: order.append("position"), QtCore.Qt.ConnectionType.QueuedConnection)
+
+        bus.tradeClosedForAnalytics.emit({"symbol": "MESZ25"})
+        bus.balanceUpdated.emit(1.0, "Sim1")
+        for _ in range(20):
+            bus.positionUpdated.emit(object())
+        _pump(qapp, 0.15)
+
+        assert order == ["position"] * 20 + ["balance", "analytics"]
+
+    def test_metrics_reload_coalesces_per_timeframe(self, bus):
+        reloads: list[str] = []
+        bus.metricsReloadRequested.connect(reloads.append)
+
+        for tf in ("1D", "1W", "1D", "1D"):
+            bus.metricsReloadRequested.emit(tf)
+        bus.lanes.drain()
+
+        assert reloads == ["1D", "1W"]
+
+    def test_idle_slices_respect_budget(self, bus, qapp):
+        bus.lanes.idle_budget_ms = 1.0
+        runs: list[float] = []
+
+        def slow(trade) -> None:
+            runs.append(time.perf_counter())
+            time.sleep(0.003)
+
+        bus.tradeClosedForAnalytics.connect(slow)
+        for i in range(3):
+            bus.tradeClosedForAnalytics.emit({"i": i})
+
+        bus.lanes._run_background()
+        assert len(runs) == 1
+        _pump(qapp, 0.1)
+        assert len(runs) == 3
+
+
+    def test_sustained_normal_traffic_does_not_starve_background(self, bus, qapp):
+        bus.lanes.background_max_wait_ms = 50.0
+        analytics: list[float] = []
+        bus.tradeClosedForAnalytics.connect(lambda trade: analytics.append(time.perf_counter()))
+        bus.balanceUpdated.connect(lambda balance, account: None)
+
+        started = time.perf_counter()
+        bus.tradeClosedForAnalytics.emit({"symbol": "MESZ25"})
+        deadline = started + 0.3
+        while time.perf_counter() < deadline and not analytics:
+            bus.balanceUpdated.emit(1.0, "Sim1")  # normal lane never empties
+            qapp.processEvents()
+            time.sleep(0.002)
+
+        assert analytics, "background item starved by normal-lane traffic"
+        assert analytics[0] - started >= 0.05
+
+
+class TestMetrics:
+    def test_wait_histograms_recorded_when_enabled(self, bus):
+        metrics.reset_metrics_registry()
+        metrics.set_enabled(True)
+        try:
+            bus.balanceUpdated.emit(1.0, "Sim1")
+            bus.snapshotAnalysisRequested.emit()
+            bus.lanes.drain()
+
+            registry = metrics.get_metrics_registry()
+            assert registry.histogram("bus.lane.normal.wait").count == 1
+            assert registry.histogram("bus.lane.background.wait").count == 1
+            assert registry.snapshot()["gauges"]["bus.lane.normal.depth"] == 0
+        finally:
+            metrics.set_enabled(False)
+            metrics.reset_metrics_registry()
+
+    def test_profiled_signals_stay_inside_lanes(self, qapp):
+        bus = SignalBus(profile=True, lanes=True)
+        bus.balanceUpdated.connect(lambda balance, account: None)
+
+        bus.balanceUpdated.emit(1.0, "Sim1")
+        bus.lanes.drain()
+
+        assert isinstance(bus.balanceUpdated._inner, ProfiledSignal)
+        assert bus.profiler.report()[0]["calls"] == 1
+        bus.deleteLater()
@@ -0,0 +1,123 @@
+"""
+tests/test_diagnostics_hub.py
+
+DiagnosticsHub pipeline: bounded queue, background dispatch, sampling.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from core.diagnostics import DiagnosticEvent, DiagnosticsHub, parse_sample_rates
+
+
+def _event(category: str = "data", level: str = "debug", message: str = "tick") -> DiagnosticEvent:
+    return DiagnosticEvent(
+        timestamp="2026-01-01T00:00:00+00:00",
+        category=category,
+        level=level,
+        module="tests",
+        event_type="Test",
+        message=message,
+    )
+
+
+@pytest.fixture
+def make_hub():
+    hubs: list[DiagnosticsHub] = []
+    DiagnosticsHub.reset_instance()
+
+    def _make(**kwargs) -> DiagnosticsHub:
+        kwargs.setdefault("sample_rates", {})
+        hub = DiagnosticsHub(**kwargs)
+        hub.router.unregister_handler(hub._console_handler)
+        hubs.append(hub)
+        return hub
+
+    yield _make
+    for hub in hubs:
+        hub.stop()
+
+
+class TestDispatch:
+    def test_handlers_run_off_the_producer_thread(self, make_hub):
+        hub = make_hub(async_dispatch=True)
+        seen: list[tuple[str, str]] = []
+        hub.router.register_handler(lambda e: seen.append((e.message, threading.current_thread().name)))
+
+        for i in range(200):
+            assert hub.emit_event(_event(message=str(i)))
+
+        assert hub.flush()
+        assert [m for m, _ in seen] == [str(i) for i in range(200)]
+        assert {name for _, name in seen} == {"DiagnosticsDispatch"}
+
+        stats = hub.get_statistics()
+        assert stats["total_events"] == 200
+        assert stats["events_by_category"] == {"data": 200}
+        assert stats["dropped_events"] == 0
+        assert [e["event_id"] for e in hub.snapshot(max_events=2)] == ["evt_000199", "evt_000200"]
+
+    def test_full_queue_drops_instead_of_blocking(self, make_hub):
+        hub = make_hub(async_dispatch=True, queue_size=8)
+        release = threading.Event()
+        hub.router.register_handler(lambda e: release.wait(5.0))
+
+        started = time.perf_counter()
+        accepted = [hub.emit_event(_event()) for _ in range(100)]
+        elapsed = time.perf_counter() - started
+        release.set()
+        hub.flush()
+
+        assert elapsed < 0.5
+        assert False in accepted
+        stats = hub.get_statistics()
+        assert stats["dropped_events"] == accepted.count(False)
+        assert stats["total_events"] == accepted.count(True)
+        assert stats["queue_high_water"] <= 8
+
+    def test_fatal_dump_runs_on_dispatcher(self, make_hub, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        hub = make_hub(async_dispatch=True)
+
+        hub.emit_event(_event(level="info"))
+        hub.emit_event(_event(level="fatal", message="boom"))
+        assert hub.flush()
+
+        dumps = list((tmp_path / "logs").glob("crash_dump_*.json"))
+        assert len(dumps) == 1
+        assert hub.get_statistics()["fatal_count"] == 1
+
+    def test_synchronous_mode_routes_inline(self, make_hub):
+        hub = make_hub(async_dispatch=False)
+        seen: list[str] = []
+        hub.router.register_handler(lambda e: seen.append(threading.current_thread().name))
+
+        hub.emit_event(_event())
+        assert seen == [threading.current_thread().name]
+
+
+class TestSampling:
+    def test_keeps_every_nth_low_level_event(self, make_hub):
+        hub = make_hub(async_dispatch=True)
+        hub.set_sampling("data", 10)
+
+        for _ in range(100):
+            hub.emit_event(_event(level="debug"))
+        for _ in range(3):
+            hub.emit_event(_event(level="warn"))
+        hub.emit_event(_event(category="network"))
+
+        stats = hub.get_statistics()
+        assert stats["events_by_level"] == {"debug": 11, "warn": 3}
+        assert stats["sampled_out"] == 90
+
+        hub.set_sampling("data", 1)
+        hub.emit_event(_event())
+        assert hub.get_statistics()["total_events"] == 15
+
+    def test_parse_sample_rates(self):
+        assert parse_sample_rates("data=10, PERF=5,ui=1,bad,x=y") == {"data": 10, "perf": 5}
+        assert parse_sample_rates("") == {}
@@ -0,0 +1,98 @@
+"""
+tests/test_dtc_keepalive.py
+
+Tests for the DTCClientJSON monotonic heartbeat/watchdog.
+"""
+from __future__ import annotations
+
+import time
+
+import orjson
+from PyQt6.QtNetwork import QAbstractSocket
+import pytest
+
+from core.data_bridge import DTCClientJSON
+from core.signal_bus import get_signal_bus
+
+ConnectedState = QAbstractSocket.SocketState.ConnectedState
+
+
+@pytest.fixture
+def client(qapp):
+    c = DTCClientJSON()
+    c._init_keepalive_system()
+    yield c
+    c._stop_keepalive_system()
+
+
+@pytest.fixture
+def heartbeats():
+    received: list[float] = []
+    bus = get_signal_bus()
+    bus.dtcHeartbeat.connect(received.append)
+    yield received
+    bus.dtcHeartbeat.disconnect(received.append)
+
+
+class TestKeepalive:
+    def test_heartbeat_skipped_after_recent_write(self, client, monkeypatch):
+        sent = []
+        monkeypatch.setattr(client, "_send_heartbeat", lambda now_ns=None: sent.append(now_ns))
+
+        client._last_tx_ns = time.monotonic_ns()
+        client._on_keepalive_tick()
+        assert sent == []
+
+        client._last_tx_ns -= client.HEARTBEAT_INTERVAL_NS
+        client._on_keepalive_tick()
+        assert len(sent) == 1
+
+    def test_watchdog_aborts_stale_link(self, client):
+        aborted = []
+        client.disconnected.connect(lambda: aborted.append(True))
+
+        client._last_rx_ns -= client.STALE_TIMEOUT_NS + 1
+        client._on_keepalive_tick()
+
+        assert aborted == [True]
+        assert not client._keepalive_timer.isActive()
+
+    def test_heartbeat_without_answered_request_reports_unknown(self, client, heartbeats):
+        client._send_heartbeat()
+        client._on_heartbeat_received()
+
+        assert heartbeats[-1] == -1.0
+        assert client.request_rtt_ms is None
+
+    def test_heartbeat_publishes_request_round_trip(self, client, heartbeats):
+        pending = client._requests.register("TRADE_ACCOUNTS_REQUEST")
+        pending.sent_at_ns -= 12_000_000  # sent 12 ms ago
+        client._requests.on_response({"Type": 401, "RequestID": pending.request_id, "TradeAccount": "Sim1"})
+        client._on_heartbeat_received()
+
+        assert heartbeats[-1] >= 12.0
+        assert client.request_rtt_ms == heartbeats[-1]
+
+    def test_stale_latency_is_refreshed_by_probe(self, client, monkeypatch):
+        sent = []
+        monkeypatch.setattr(client, "send", sent.append)
+        monkeypatch.setattr(client, "_sock", type("Sock", (), {"state": lambda self: ConnectedState})())
+        pending = client._requests.register("TRADE_ACCOUNTS_REQUEST")
+        client._requests.on_response({"Type": 401, "RequestID": pending.request_id, "TradeAccount": "Sim1"})
+        client._last_tx_ns = time.monotonic_ns()
+
+        client._on_keepalive_tick()
+        assert sent == []
+
+        client._requests._last_latency_at_ns -= client.LATENCY_PROBE_INTERVAL_NS
+        client._on_keepalive_tick()
+        client._on_keepalive_tick()  # no second probe while one is pending
+        assert [m["Type"] for m in sent] == [400]
+
+        routed = []
+        client.messageReceived.connect(routed.append)
+        measured_at = client._requests.last_latency_at_ns
+        client._handle_frame(orjson.dumps({"Type": 401, "RequestID": sent[0]["RequestID"], "TradeAccount": "Sim1"}))
+
+        assert client._requests.last_latency_at_ns > measured_at
+        assert routed == []  # probe responses are not routed to the app
@@ -0,0 +1,131 @@
+"""
+tests/test_dtc_simulator.py
+
+Tests for the local DTC simulator and the client benchmark harness.
+"""
+from __future__ import annotations
+
+import socket
+
+import orjson
+import pytest
+
+from services.dtc_constants import (
+    HEARTBEAT,
+    HISTORICAL_ORDER_FILL_RESPONSE,
+    HISTORICAL_ORDER_FILLS_REQUEST,
+    LOGON_REQUEST,
+    LOGON_RESPONSE,
+    ORDER_UPDATE,
+    POSITION_UPDATE,
+    TRADE_ACCOUNT_RESPONSE,
+    TRADE_ACCOUNTS_REQUEST,
+)
+from tools.dtc_simulator import DTCSimulator, SimulatorConfig, StreamConfig
+
+
+class _RawClient:
+    """Minimal null-terminated JSON socket client."""
+
+    def __init__(self, port: int):
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+        self._buf = b""
+
+    def send(self, msg: dict) -> None:
+        self.sock.sendall(orjson.dumps(msg) + b"\x00")
+
+    def recv(self) -> dict:
+        while b"\x00" not in self._buf:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("simulator closed the connection")
+            self._buf += chunk
+        frame, self._buf = self._buf.split(b"\x00", 1)
+        return orjson.loads(frame)
+
+    def recv_type(self, msg_type: int, n: int = 1) -> list[dict]:
+        out = []
+        while len(out) < n:
+            msg = self.recv()
+            if msg.get("Type") == msg_type:
+                out.append(msg)
+        return out
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+@pytest.fixture
+def simulator():
+    sims: list[DTCSimulator] = []
+
+    def _start(config: SimulatorConfig) -> tuple[DTCSimulator, _RawClient]:
+        sim = DTCSimulator(port=0, config=config)
+        sims.append(sim)
+        return sim, _RawClient(sim.start_in_thread())
+
+    yield _start
+    for sim in sims:
+        sim.stop()
+
+
+class TestSimulatorProtocol:
+    def test_logon_and_heartbeat_echo(self, simulator):
+        _, client = simulator(SimulatorConfig())
+        try:
+            client.send({"Type": LOGON_REQUEST, "ProtocolVersion": 8})
+            assert client.recv_type(LOGON_RESPONSE)[0]["Result"] == 1
+
+            client.send({"Type": HEARTBEAT})
+            assert client.recv_type(HEARTBEAT)
+        finally:
+            client.close()
+
+    def test_numbered_multi_message_responses(self, simulator):
+        _, client = simulator(SimulatorConfig(accounts=("Sim1", "120005"), historical_fills=3))
+        try:
+            client.send({"Type": LOGON_REQUEST})
+            client.recv_type(LOGON_RESPONSE)
+
+            client.send({"Type": TRADE_ACCOUNTS_REQUEST, "RequestID": 7})
+            accounts = client.recv_type(TRADE_ACCOUNT_RESPONSE, 2)
+            assert [m["TradeAccount"] for m in accounts] == ["Sim1", "120005"]
+            assert [m["MessageNumber"] for m in accounts] == [1, 2]
+            assert all(m["RequestID"] == 7 and m["TotalNumberMessages"] == 2 for m in accounts)
+
+            client.send({"Type": HISTORICAL_ORDER_FILLS_REQUEST, "RequestID": 8, "NumberOfDays": 30})
+            fills = client.recv_type(HISTORICAL_ORDER_FILL_RESPONSE, 3)
+            assert fills[-1]["MessageNumber"] == fills[-1]["TotalNumberMessages"] == 3
+            assert len({m["UniqueExecutionID"] for m in fills}) == 3
+        finally:
+            client.close()
+
+    def test_stream_is_stamped_and_counted(self, simulator):
+        config = SimulatorConfig(
+            stream=StreamConfig(rate=5000, count=200, kinds=("order", "position"), start_delay=0.0)
+        )
+        sim, client = simulator(config)
+        try:
+            client.send({"Type": LOGON_REQUEST})
+            streamed = []
+            while len(streamed) < 200:
+                msg = client.recv()
+                if msg.get("Type") in (ORDER_UPDATE, POSITION_UPDATE):
+                    streamed.append(msg)
+            assert all(m["SimTs"] > 0 for m in streamed)
+            assert {m["Type"] for m in streamed} == {ORDER_UPDATE, POSITION_UPDATE}
+            assert sim.stream_done.wait(2.0)
+        finally:
+            client.close()
+
+
+class TestBenchmarkHarness:
+    def test_small_run_delivers_every_message(self, qapp):
+        from tools.dtc_benchmark import run_benchmark
+
+        report = run_benchmark(rate=2000, count=300, timeout=20.0)
+
+        assert report["delivered"] == 300
+        assert report["throughput_msgs_s"] > 0
+        assert 0 < report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["max"]
+        assert "TRADE_ACCOUNTS_REQUEST" in report["request_latency"]
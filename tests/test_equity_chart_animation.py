@@ -0,0 +1,139 @@
+"""
+tests/test_equity_chart_animation.py
+
+EquityChart endpoint animation: overlay pulse item, pen churn and
+window-state pausing.
+"""
+from __future__ import annotations
+
+import time
+
+from PyQt6 import QtWidgets
+import pytest
+
+from panels.panel1.endpoint_pulse import PULSE_PHASE_STEPS, EndpointPulseItem
+from panels.panel1.equity_chart import HAS_PYQTGRAPH, EquityChart
+
+
+pytestmark = pytest.mark.skipif(not HAS_PYQTGRAPH, reason="pyqtgraph not installed")
+
+
+def _pump(qapp, seconds: float = 0.15) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def shown_chart(qapp):
+    chart = EquityChart()
+    window = QtWidgets.QWidget()
+    QtWidgets.QVBoxLayout(window).addWidget(chart.create_plot_widget())
+    window.resize(600, 300)
+    window.show()
+    window.activateWindow()
+    _pump(qapp)
+    now = time.time()
+    chart.replot([(now - 60, 10_000.0), (now - 30, 10_020.0), (now, 10_010.0)], "LIVE")
+    yield chart, window
+    chart.stop_animation()
+    window.close()
+    window.deleteLater()
+
+
+class TestPulseOverlay:
+    def test_ticks_do_not_touch_line_pens(self, shown_chart):
+        chart, _ = shown_chart
+        line_pen, glow_pen = chart._line.opts["pen"], chart._glow_line.opts["pen"]
+
+        for _ in range(PULSE_PHASE_STEPS + 5):
+            chart._on_pulse_tick()
+
+        assert chart._line.opts["pen"] is line_pen
+        assert chart._glow_line.opts["pen"] is glow_pen
+
+    def test_phase_follows_wall_clock_not_tick_count(self, shown_chart):
+        from panels.panel1.equity_chart import PULSE_INTERVAL_MS
+
+        chart, _ = shown_chart
+        # One second into the cycle: 25 full-rate steps, however many ticks ran
+        chart._pulse_epoch = time.monotonic() - 1.0 - PULSE_INTERVAL_MS / 2000.0
+        chart._on_pulse_tick()
+        chart._on_pulse_tick()
+
+        assert chart._pulse_item.phase_step == 1000 // PULSE_INTERVAL_MS
+
+    def test_line_pen_changes_only_when_pnl_color_flips(self, shown_chart):
+        chart, _ = shown_chart
+        chart.update_endpoint_color(True)
+        up_pen = chart._line.opts["pen"]
+        chart.update_endpoint_color(True)
+        assert chart._line.opts["pen"] is up_pen
+
+        chart.update_endpoint_color(False)
+        assert chart._line.opts["pen"] is not up_pen
+
+    def test_theme_switch_recolors_line(self, shown_chart):
+        from config.theme import ColorTheme, get_active_theme_name, switch_theme
+
+        chart, _ = shown_chart
+        previous = get_active_theme_name()
+        try:
+            switch_theme("debug")
+            chart.update_endpoint_color(True)
+            switch_theme("live")
+            chart.refresh_theme()
+
+            assert chart._line_color == ColorTheme.pnl_color_from_direction(True)
+            assert chart._line.opts["pen"].color().name() == chart._line_color.lower()
+        finally:
+            switch_theme(previous)
+
+    def test_frames_are_precomputed_per_color(self, qapp):
+        first, second = EndpointPulseItem(), EndpointPulseItem()
+        first.set_color("#20B36F")
+        second.set_color("#20B36F")
+
+        assert first._frames is second._frames
+        assert len(first._frames) == PULSE_PHASE_STEPS
+        assert first.boundingRect().width() < 40
+
+    def test_pulse_hidden_outside_live_timeframes(self, shown_chart):
+        chart, window = shown_chart
+        assert chart._pulse_item.isVisible()
+        now = time.time()
+        chart.replot([(now - 86400 * 3, 10_000.0), (now, 10_010.0)], "1W")
+        assert not chart._pulse_item.isVisible()
+        window.grab()  # paint path runs without errors
+
+
+class TestAnimationGate:
+    def test_pauses_while_minimized_or_hidden(self, qapp, shown_chart):
+        chart, window = shown_chart
+        chart.start_animation()
+        _pump(qapp)
+        assert not chart.animation_paused
+
+        window.showMinimized()
+        _pump(qapp)
+        assert chart.animation_paused
+
+        window.showNormal()
+        window.activateWindow()
+        _pump(qapp)
+        assert not chart.animation_paused
+
+        window.hide()
+        _pump(qapp)
+        assert chart.animation_paused
+
+    def test_unshown_chart_does_not_tick(self, qapp):
+        chart = EquityChart()
+        chart.create_plot_widget()
+        chart.start_animation()
+        _pump(qapp, 0.05)
+
+        assert chart.animation_paused
+        chart.stop_animation()
+        assert not chart.animation_paused
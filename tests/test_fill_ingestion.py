@@ -0,0 +1,110 @@
+"""
+tests/test_fill_ingestion.py
+
+Tests for bulk ingestion of historical fills into OrderRecord.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from data.schema import OrderRecord
+from services.fill_ingestion import HistoricalFillIngestor, fill_to_order_row
+
+
+@pytest.fixture
+def memory_db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    @contextmanager
+    def _session():
+        with Session(engine) as s:
+            yield s
+
+    with patch("data.db_engine.get_session", _session):
+        yield engine
+
+
+def _fill(n, total, exec_id=None, account="Sim1"):
+    return {
+        "Type": 304,
+        "RequestID": 4,
+        "MessageNumber": n,
+        "TotalNumberMessages": total,
+        "Symbol": "MESZ5",
+        "BuySell": 1 if n % 2 else 2,
+        "Quantity": 1,
+        "Price": 5000.0 + n,
+        "DateTime": 1_760_000_000 + n,
+        "UniqueExecutionID": exec_id or f"E{n}",
+        "ServerOrderID": f"S{n}",
+        "TradeAccount": account,
+    }
+
+
+def _order_ids(engine):
+    with Session(engine) as s:
+        return sorted(s.exec(select(OrderRecord.order_id)).all())
+
+
+class TestHistoricalFillIngestor:
+    def test_buffers_until_final_message(self, memory_db):
+        ingestor = HistoricalFillIngestor(background=False)
+        finished = []
+        ingestor.ingestFinished.connect(finished.append)
+
+        assert ingestor.add_fill(_fill(1, 3)) is False
+        assert ingestor.add_fill(_fill(2, 3)) is False
+        assert _order_ids(memory_db) == []
+
+        assert ingestor.add_fill(_fill(3, 3)) is True
+        assert _order_ids(memory_db) == ["E1", "E2", "E3"]
+        assert finished[-1]["inserted"] == 3
+
+    def test_skips_fills_already_stored(self, memory_db):
+        with Session(memory_db) as s:
+            s.add(OrderRecord(**fill_to_order_row(_fill(1, 1))))
+            s.commit()
+
+        ingestor = HistoricalFillIngestor(background=False)
+        finished = []
+        ingestor.ingestFinished.connect(finished.append)
+
+        ingestor.add_fill(_fill(1, 3))
+        ingestor.add_fill(_fill(2, 3))
+        ingestor.add_fill(_fill(3, 3, exec_id="E2"))  # repeat within the response
+
+        assert _order_ids(memory_db) == ["E1", "E2"]
+        assert finished[-1]["inserted"] == 1
+        assert finished[-1]["duplicates"] == 1
+
+    def test_no_order_fills_flushes_empty(self, memory_db):
+        ingestor = HistoricalFillIngestor(background=False)
+        finished = []
+        ingestor.ingestFinished.connect(finished.append)
+
+        assert ingestor.add_fill({"Type": 304, "RequestID": 4, "NoOrderFills": 1}) is True
+        assert finished[-1]["inserted"] == 0
+
+    def test_accepts_only_its_request(self):
+        ingestor = HistoricalFillIngestor()
+        assert ingestor.accepts(_fill(1, 1))
+        assert not ingestor.accepts({**_fill(1, 1), "RequestID": 9})
+        assert not ingestor.accepts({"Type": 307, "RequestID": 4})
+
+    def test_row_conversion(self):
+        row = fill_to_order_row(_fill(2, 2, account="120005"))
+        assert row["order_id"] == "E2"
+        assert row["side"] == "SELL"
+        assert row["mode"] == "LIVE"
+        assert row["status"] == "FILLED"
+        assert fill_to_order_row({"Type": 304}) is None
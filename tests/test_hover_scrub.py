@@ -0,0 +1,89 @@
+"""
+tests/test_hover_scrub.py
+
+Panel1 hover scrubbing: frame-coalesced mouse moves, cached series and
+memoized timeframe baselines.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import time
+
+from PyQt6 import QtCore
+import pytest
+
+from panels.panel1 import hover_handler as hover_module
+from panels.panel1.hover_handler import HoverHandler
+
+
+def _handler() -> HoverHandler:
+    return HoverHandler(plot_widget=None, view_box=None, on_balance_update=lambda _: None, on_pnl_update=lambda *_: None)
+
+
+@pytest.fixture
+def handler(qapp):
+    handler = _handler()
+    yield handler
+    handler.deleteLater()
+
+
+class TestScrubCoalescing:
+    def test_moves_within_a_frame_apply_latest_position_once(self, qapp, handler, monkeypatch):
+        applied: list[QtCore.QPointF] = []
+        monkeypatch.setattr(handler, "_scrub_to", applied.append)
+
+        for x in range(10):
+            handler._on_mouse_move(QtCore.QPointF(float(x), 0.0))
+        assert [p.x() for p in applied] == [0.0]
+
+        deadline = time.monotonic() + 1.0
+        while len(applied) < 2 and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.002)
+
+        assert [p.x() for p in applied] == [0.0, 9.0]
+
+    def test_leave_drops_pending_move(self, qapp, handler, monkeypatch):
+        applied: list[QtCore.QPointF] = []
+        monkeypatch.setattr(handler, "_scrub_to", applied.append)
+        viewport = QtCore.QObject()
+        handler._plot = type("Plot", (), {"viewport": lambda self: viewport})()
+        handler._on_mouse_move(QtCore.QPointF(1.0, 0.0))
+        handler._on_mouse_move(QtCore.QPointF(2.0, 0.0))
+
+        handler.eventFilter(viewport, QtCore.QEvent(QtCore.QEvent.Type.Leave))
+        time.sleep(hover_module.SCRUB_FRAME_MS / 1000.0 + 0.01)
+        qapp.processEvents()
+
+        assert [p.x() for p in applied] == [1.0]
+        assert not handler.is_hovering()
+
+
+class TestCachedSeries:
+    def test_interpolation_and_sliding_baseline(self, handler):
+        handler.set_data([(0.0, 100.0), (3600.0, 200.0), (7200.0, 150.0)], "LIVE")
+
+        assert handler._interpolate_balance(1800.0) == 150.0
+        assert handler._interpolate_balance(-5.0) == 100.0
+        assert handler._interpolate_balance(9999.0) == 150.0
+        # LIVE baseline: last point at or before one hour earlier
+        assert handler._get_baseline_for_timeframe(7199.0) == 100.0
+        assert handler._get_baseline_for_timeframe(7200.0) == 200.0
+
+    def test_anchored_baseline_is_memoized_per_data_version(self, handler):
+        jan1 = datetime(2025, 1, 1).timestamp()
+        handler.set_data([(jan1 - 86400, 90.0), (jan1 + 10, 100.0), (jan1 + 86400 * 40, 180.0)], "YTD")
+        version = handler.data_version
+
+        assert handler._get_baseline_for_timeframe(jan1 + 86400 * 30) == 90.0
+        assert handler._get_baseline_for_timeframe(jan1 + 86400 * 35) == 90.0
+        assert len(handler._baseline_cache) == 1
+
+        handler.set_data([(jan1 + 10, 100.0), (jan1 + 86400 * 40, 180.0)], "YTD")
+        assert handler.data_version == version + 1
+        assert not handler._baseline_cache
+        assert handler._get_baseline_for_timeframe(jan1 + 86400 * 30) == 100.0
+
+    def test_empty_series_has_no_baseline(self, handler):
+        handler.set_data([], "1D")
+        assert handler._get_baseline_for_timeframe(time.time()) is None
@@ -0,0 +1,154 @@
+"""
+tests/test_metric_grid.py
+
+Custom-painted MetricGrid: MetricCell-compatible cell API, per-cell dirty
+repaints, shared flashing and theme token refresh.
+"""
+from __future__ import annotations
+
+import time
+
+from PyQt6 import QtCore
+import pytest
+
+from config.theme import get_active_theme_name, switch_theme
+from utils.theme_compiler import get_theme_compiler
+from widgets.metric_grid import MetricGrid, MetricGridCell
+
+NAMES = ["Price", "Heat", "Time", "Target", "Stop", "MAE", "MFE"]
+
+
+def _pump(qapp, seconds: float = 0.1) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def grid(qapp):
+    grid = MetricGrid(NAMES, cols=5)
+    grid.resize(600, 140)
+    grid.show()
+    _pump(qapp)
+    painted: list[str] = []
+    paint_cell = grid._paint_cell
+
+    def record(painter, state):
+        painted.append(state.title)
+        paint_cell(painter, state)
+
+    grid._paint_cell = record
+    grid.painted = painted
+    yield grid
+    grid.close()
+    grid.deleteLater()
+
+
+class TestCellApi:
+    def test_update_metric_sets_text_and_inferred_color(self, grid):
+        grid.update_metric("MAE", "-12.50")
+        grid.update_metric("MFE", 30, color="#22C55E")
+        grid.update_metric("Heat", None)
+
+        assert grid.get_all_values()["MAE"] == "-12.50"
+        assert grid.get_all_values()["Heat"] == "--"
+        assert grid._metrics["MAE"]._state.color == get_theme_compiler().color("pnl_neg_color")
+        assert grid._metrics["MFE"]._state.color.name() == "#22c55e"
+
+    def test_cells_expose_metric_cell_api(self, grid):
+        cell = grid.cell("Price")
+
+        cell.set_value("1 @ 5000.00", color="#EF4444")
+        cell.set_value_html('<span style="color:#22C55E">+2.00</span>')
+
+        assert isinstance(cell, MetricGridCell)
+        assert cell.text().endswith("+2.00</span>")
+        assert cell._state.value_static.textFormat() == QtCore.Qt.TextFormat.RichText
+        with pytest.raises(KeyError):
+            grid.cell("Nope")
+
+    def test_set_enabled_dims_named_cells(self, grid):
+        grid.set_enabled(["Time", "Stop"], False)
+
+        assert [name for name, cell in grid.metrics().items() if not cell.isEnabled()] == ["Time", "Stop"]
+        grid.set_enabled("all", True)
+        assert all(cell.isEnabled() for cell in grid.metrics().values())
+
+
+class TestPainting:
+    def test_update_repaints_only_the_dirty_cell(self, grid, qapp):
+        grid.painted.clear()
+
+        grid.update_metric("Target", "5010.00")
+        _pump(qapp)
+
+        assert grid.painted == ["Target"]
+
+    def test_unchanged_value_schedules_no_repaint(self, grid, qapp):
+        grid.update_metric("Stop", "4990.00", color="#EF4444")
+        _pump(qapp)
+        grid.painted.clear()
+
+        grid.update_metric("Stop", "4990.00", color="#EF4444")
+        _pump(qapp)
+
+        assert grid.painted == []
+
+    def test_card_is_rendered_once_per_cell(self, grid, qapp):
+        card = grid._metrics["Price"]._state.card
+        assert card is not None
+
+        for i in range(5):
+            grid.update_metric("Price", f"{5000 + i}")
+            _pump(qapp, 0.02)
+
+        assert grid._metrics["Price"]._state.card is card
+        grid.cell("Price").set_title_color("#F59E0B")
+        assert grid._metrics["Price"]._state.card is None
+
+    def test_flashing_cells_share_one_timer(self, grid):
+        heat, stop = grid.cell("Heat"), grid.cell("Stop")
+
+        heat.start_flashing(border_color="#DC2626")
+        stop.start_flashing()
+        grid._on_flash_tick()
+        assert grid._flash_timer.isActive()
+        assert heat._state.flash_on is False and stop._state.flash_on is False
+
+        heat.stop_flashing()
+        assert grid._flash_timer.isActive()
+        stop.stop_flashing()
+        assert not grid._flash_timer.isActive()
+
+
+class TestTheme:
+    def test_refresh_resolves_tokens_for_new_mode(self, grid):
+        original = get_active_theme_name()
+        grid.cell("Price").set_title_color("#F59E0B")
+        try:
+            switch_theme("live")
+            grid.refresh_theme()
+
+            compiler = get_theme_compiler()
+            assert grid._ink == compiler.color("ink", mode="LIVE")
+            assert grid._card_brush.color() == compiler.color("card_bg", mode="LIVE")
+            assert grid._metrics["Price"]._state.title_color is None
+            assert all(state.card is None for state in grid._cells)
+        finally:
+            switch_theme(original)
+
+
+def test_panel2_cells_are_grid_cells(qapp):
+    from panels.panel2 import Panel2
+
+    panel = Panel2()
+    try:
+        assert isinstance(panel.c_price, MetricGridCell)
+        assert panel.display.c_pts is panel.metric_grid.cell("Pts")
+
+        panel.display._render_flat()
+
+        assert set(panel.metric_grid.get_all_values().values()) == {"--"}
+    finally:
+        panel.deleteLater()
@@ -0,0 +1,161 @@
+"""
+tests/test_metrics.py
+
+Hot-path metrics: histogram accuracy, disabled fast path, dumps and aggregation.
+"""
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from core import metrics
+from core.metrics import LatencyHistogram, MetricsRegistry
+
+
+@pytest.fixture
+def enabled_metrics():
+    previous = metrics.is_enabled()
+    metrics.reset_metrics_registry()
+    metrics.set_enabled(True)
+    yield metrics.get_metrics_registry()
+    metrics.set_enabled(previous)
+    metrics.reset_metrics_registry()
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_error(self):
+        rng = random.Random(7)
+        samples = sorted(int(rng.lognormvariate(6.0, 1.5)) for _ in range(20000))
+        hist = LatencyHistogram()
+        for us in samples:
+            hist.record_us(us)
+
+        assert hist.count == len(samples)
+        assert (hist.min_us, hist.max_us) == (samples[0], samples[-1])
+        for pct in (50.0, 90.0, 99.0, 99.9):
+            exact = samples[int(len(samples) * pct / 100) - 1]
+            assert hist.percentile_us(pct) == pytest.approx(exact, rel=0.02, abs=1)
+
+    def test_merge_is_exact_and_round_trips(self):
+        a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for us in range(0, 50000, 37):
+            (a if us % 2 else b).record_us(us)
+            both.record_us(us)
+
+        a.merge(LatencyHistogram.from_dict(json.loads(json.dumps(b.to_dict()))))
+        assert a.to_dict() == both.to_dict()
+
+
+class TestRecording:
+    def test_disabled_records_nothing(self, enabled_metrics):
+        metrics.set_enabled(False)
+        assert metrics.now() == 0.0
+
+        metrics.observe("dtc.decode", metrics.now())
+        metrics.incr("dtc.frames")
+        with metrics.timed("db.write"):
+            pass
+
+        snapshot = enabled_metrics.snapshot()
+        assert snapshot["histograms"] == {} and snapshot["counters"] == {}
+
+    def test_hot_path_api(self, enabled_metrics):
+        for _ in range(3):
+            metrics.observe("dtc.decode", metrics.now())
+        metrics.incr("dtc.frames", 3)
+        metrics.gauge("stats.queue_depth", 4)
+        with pytest.raises(RuntimeError), metrics.timed("db.write"):
+            raise RuntimeError("commit failed")
+
+        snapshot = enabled_metrics.snapshot()
+        assert snapshot["counters"] == {"dtc.frames": 3}
+        assert snapshot["gauges"] == {"stats.queue_depth": 4.0}
+        assert {name: h["count"] for name, h in snapshot["histograms"].items()} == {"dtc.decode": 3, "db.write": 1}
+
+    def test_session_commits_are_timed(self, enabled_metrics):
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.orm import Session
+
+        from data.db_engine import _instrument_commits
+
+        _instrument_commits()
+        _instrument_commits()  # idempotent
+        with Session(create_engine("sqlite://")) as session:
+            session.execute(text("SELECT 1"))
+            session.commit()
+
+        assert enabled_metrics.histogram("db.write").count == 1
+
+
+class TestDumpAndExport:
+    def test_exporter_merges_runs(self, tmp_path):
+        from tools.metrics_exporter import main
+
+        expected = LatencyHistogram()
+        for run in range(2):
+            registry = MetricsRegistry()
+            for i in range(100):
+                registry.record_ms("panel2.tick", 0.1 * (i + run))
+                expected.record_ms(0.1 * (i + run))
+            registry.incr("dtc.frames", 10)
+            registry.gauge("stats.queue_depth", run)
+            assert registry.dump(tmp_path / "metrics" / f"metrics_run{run}.json")
+
+        out = tmp_path / "aggregate.json"
+        assert main(["--metrics", str(tmp_path / "metrics"), "--out", str(out), "--csv", "--quiet"]) == 0
+
+        report = json.loads(out.read_text())
+        assert report["runs"] == 2
+        assert report["counters"] == {"dtc.frames": 20}
+        assert report["gauges"] == {"stats.queue_depth": 1.0}
+        assert report["histograms"]["panel2.tick"] == expected.to_dict()
+        assert out.with_suffix(".csv").read_text().splitlines()[0].startswith("name,count,mean_ms")
+
+    def test_periodic_dump(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.incr("dtc.frames")
+        path = registry.start_dumping(tmp_path, interval_s=0.1)
+        registry.stop_dumping()
+
+        assert path.parent == tmp_path and path.name.startswith("metrics_")
+        assert json.loads(path.read_text())["counters"] == {"dtc.frames": 1}
+
+
+class TestOverlay:
+    def test_perf_toggle_enables_metrics_and_shows_overlay(self, qapp, enabled_metrics):
+        from PyQt6 import QtWidgets
+
+        from widgets.dev_toolbar import DevToolbar, MetricsOverlay
+
+        metrics.set_enabled(False)
+        window = QtWidgets.QWidget()
+        window.resize(800, 600)
+        toolbar = DevToolbar(window)
+
+        toolbar.btn_perf.setChecked(True)
+        assert metrics.is_enabled()
+        metrics.observe("panel1.replot", metrics.now())
+        toolbar._overlay.refresh()
+        assert "panel1.replot" in toolbar._overlay.text()
+
+        toolbar.btn_perf.setChecked(False)
+        assert toolbar._overlay.isHidden()
+        assert MetricsOverlay.render_text().splitlines()[0].split() == ["metric", "count", "p50", "p99", "max"]
+
+    def test_main_window_mounts_dev_toolbar(self, qapp, monkeypatch):
+        from PyQt6 import QtWidgets
+
+        from core.app_manager import MainWindow
+        from widgets.dev_toolbar import DevToolbar
+
+        monkeypatch.setenv("APPSIERRA_SHOW_THEME_TOOLBAR", "1")
+        window = MainWindow()
+        try:
+            toolbar = window.findChild(QtWidgets.QToolBar)
+            assert window.findChild(DevToolbar) is not None
+            assert [a.text() for a in toolbar.actions()][:3] == ["DEBUG", "SIM", "LIVE"]
+        finally:
+            window.close()
+            window.deleteLater()
@@ -0,0 +1,200 @@
+"""
+tests/test_qt_bridge.py
+
+Batched cross-thread invocation queue: one drain per event-loop turn,
+main-thread execution in posting order, latest-value-wins keys, @qt_safe,
+and depth/drain-time stats.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from PyQt6 import QtCore
+import pytest
+
+from utils.qt_bridge import (
+    InvocationQueue,
+    get_invocation_queue,
+    install_invocation_queue,
+    marshal_latest,
+    marshal_to_qt_thread,
+    qt_safe,
+    reset_invocation_queue,
+)
+
+
+def _pump(qapp, seconds: float = 0.05) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def _in_worker(fn) -> None:
+    worker = threading.Thread(target=fn)
+    worker.start()
+    worker.join()
+
+
+@pytest.fixture
+def queue(qapp):
+    reset_invocation_queue()
+    yield get_invocation_queue()
+    reset_invocation_queue()
+
+
+class _Display:
+    def __init__(self):
+        self.values: list[float] = []
+        self.threads: list[QtCore.QThread] = []
+
+    @qt_safe
+    def append(self, value: float) -> str:
+        self.values.append(value)
+        self.threads.append(QtCore.QThread.currentThread())
+        return "direct"
+
+    @qt_safe(latest=True)
+    def set_value(self, value: float) -> None:
+        self.values.append(value)
+
+
+class TestQueue:
+    def test_worker_flood_is_one_batch_on_main_thread(self, queue, qapp):
+        seen: list[tuple[int, QtCore.QThread]] = []
+
+        def produce() -> None:
+            for i in range(200):
+                marshal_to_qt_thread(lambda i=i: seen.append((i, QtCore.QThread.currentThread())))
+
+        _in_worker(produce)
+        assert queue.stats()["depth"] == 200
+        _pump(qapp)
+
+        assert [i for i, _ in seen] == list(range(200))
+        assert {thread for _, thread in seen} == {qapp.thread()}
+        stats = queue.stats()
+        assert (stats["drains"], stats["max_batch"], stats["depth"]) == (1, 200, 0)
+        assert stats["drain_max_ms"] > 0.0
+
+    def test_latest_value_wins_per_key(self, queue, qapp):
+        seen: list[tuple[str, float]] = []
+
+        def produce() -> None:
+            marshal_to_qt_thread(seen.append, ("first", 0.0))
+            for value in (1.0, 2.0, 3.0):
+                marshal_latest("balance", seen.append, ("balance", value))
+            marshal_latest("status", seen.append, ("status", 1.0))
+
+        _in_worker(produce)
+        _pump(qapp)
+
+        assert seen == [("first", 0.0), ("balance", 3.0), ("status", 1.0)]
+        assert queue.stats()["deduped"] == 2
+
+    def test_calls_posted_during_drain_run_next_turn(self, queue, qapp):
+        order: list[str] = []
+
+        def first() -> None:
+            order.append("first")
+            marshal_to_qt_thread(order.append, "second")
+
+        marshal_to_qt_thread(first)
+        assert queue.drain() == 1
+        assert order == ["first"]
+
+        _pump(qapp)
+        assert order == ["first", "second"]
+
+    def test_failing_callback_does_not_stop_batch(self, queue, qapp):
+        seen: list[str] = []
+
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        marshal_to_qt_thread(boom)
+        marshal_to_qt_thread(seen.append, "after")
+        _pump(qapp)
+
+        assert seen == ["after"]
+
+
+    def test_burst_is_split_across_turns_by_budget(self, queue, qapp):
+        queue.max_calls = 50
+        seen: list[int] = []
+
+        _in_worker(lambda: [marshal_to_qt_thread(seen.append, i) for i in range(120)])
+        marshal_latest("status", seen.append, -1)
+        assert queue.drain() == 50
+        marshal_latest("status", seen.append, -2)  # replaces the leftover in place
+        _pump(qapp)
+
+        assert seen == list(range(120)) + [-2]
+        stats = queue.stats()
+        assert stats["max_batch"] == 50
+        assert stats["deferred"] == 71 + 21
+
+    def test_slow_callbacks_yield_after_time_budget(self, queue, qapp):
+        queue.budget_ms = 1.0
+        for _ in range(3):
+            marshal_to_qt_thread(time.sleep, 0.003)
+
+        assert queue.drain() == 1
+        assert queue.stats()["depth"] == 2
+
+    def test_queue_created_by_worker_is_rehomed_at_startup(self, qapp):
+        reset_invocation_queue()
+        import utils.qt_bridge as qt_bridge
+
+        created: list[InvocationQueue] = []
+        # As if a worker created it before the QApplication: no event loop drains it
+        _in_worker(lambda: created.append(InvocationQueue()))
+        qt_bridge._queue_instance = created[0]
+        seen: list[str] = []
+        marshal_to_qt_thread(seen.append, "early")
+        _pump(qapp)
+        assert seen == []
+        try:
+            queue = install_invocation_queue()
+            created[0].post(seen.append, "late")  # stale reference forwards
+            _pump(qapp)
+
+            assert queue is not created[0]
+            assert queue.thread() is qapp.thread()
+            assert seen == ["early", "late"]
+            assert install_invocation_queue() is queue
+        finally:
+            reset_invocation_queue()
+
+
+class TestQtSafe:
+    def test_main_thread_call_is_direct(self, queue):
+        display = _Display()
+
+        assert display.append(1.0) == "direct"
+        assert queue.stats()["posted"] == 0
+
+    def test_worker_call_is_marshaled(self, queue, qapp):
+        display = _Display()
+
+        _in_worker(lambda: display.append(2.0))
+        assert display.values == []
+        _pump(qapp)
+
+        assert display.values == [2.0]
+        assert display.threads == [qapp.thread()]
+        assert _Display.append.__name__ == "append"
+
+    def test_latest_dedupes_per_instance(self, queue, qapp):
+        a, b = _Display(), _Display()
+
+        def produce() -> None:
+            for value in (1.0, 2.0, 3.0):
+                a.set_value(value)
+                b.set_value(value * 10)
+
+        _in_worker(produce)
+        _pump(qapp)
+
+        assert (a.values, b.values) == ([3.0], [30.0])
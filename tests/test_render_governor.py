@@ -0,0 +1,166 @@
+"""
+tests/test_render_governor.py
+
+Render quality governor: step-down on overrun, hysteresis on recovery,
+diagnostics for every transition, and the EquityChart quality levels.
+"""
+from __future__ import annotations
+
+import time
+
+from PyQt6 import QtCore, QtWidgets
+import pytest
+
+from core.diagnostics import DiagnosticsHub
+from core.render_governor import MAX_LEVEL, QUALITY_STEPS, RenderQualityGovernor
+
+
+def _pump(qapp, seconds: float = 0.15) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def _feed(governor: RenderQualityGovernor, frame_ms: float, windows: int = 1) -> None:
+    for _ in range(governor.window_frames * windows):
+        governor.record_frame(frame_ms)
+
+
+@pytest.fixture
+def governor(qapp):
+    DiagnosticsHub.reset_instance()
+    yield RenderQualityGovernor(budget_ms=10.0, window_frames=10, headroom_ratio=0.5, recovery_windows=3, enabled=True)
+    DiagnosticsHub.reset_instance()
+
+
+class TestGovernor:
+    def test_steps_down_in_order_while_over_budget(self, governor):
+        levels: list[int] = []
+        governor.qualityChanged.connect(levels.append)
+
+        _feed(governor, 25.0, windows=MAX_LEVEL + 2)
+
+        assert levels == [1, 2, 3, 4]
+        assert [t.step for t in governor.transitions()] == list(QUALITY_STEPS)
+        assert governor.degraded("antialias") and governor.level == MAX_LEVEL
+
+    def test_single_slow_frame_does_not_degrade(self, governor):
+        for _ in range(governor.window_frames - 1):
+            governor.record_frame(2.0)
+        governor.record_frame(500.0)
+
+        assert governor.level == 0
+
+    def test_recovers_only_after_sustained_headroom(self, governor):
+        _feed(governor, 25.0, windows=2)
+        assert governor.level == 2
+
+        _feed(governor, 2.0, windows=2)
+        assert governor.level == 2
+        _feed(governor, 7.0)  # inside the budget but no headroom: resets the streak
+        _feed(governor, 2.0, windows=2)
+        assert governor.level == 2
+
+        _feed(governor, 2.0)
+        assert governor.level == 1
+        assert not governor.degraded("glow") and governor.degraded("pulse_fps")
+
+    def test_transitions_are_reported_to_diagnostics(self, governor):
+        _feed(governor, 25.0)
+        _feed(governor, 1.0, windows=3)
+
+        events = [e for e in DiagnosticsHub.get_instance().events if e.event_type == "RenderQualityChanged"]
+        assert [(e.level, e.context["from_level"], e.context["to_level"]) for e in events] == [
+            ("warn", 0, 1),
+            ("info", 1, 0),
+        ]
+        assert events[0].category == "perf"
+        assert events[0].context["step"] == "pulse_fps"
+
+    def test_disabled_governor_ignores_frames(self, governor):
+        governor.enabled = False
+        _feed(governor, 100.0, windows=3)
+
+        assert governor.level == 0 and governor.frames_recorded == 0
+
+
+class TestEquityChartQuality:
+    @pytest.fixture
+    def chart(self, qapp, governor):
+        from panels.panel1.equity_chart import HAS_PYQTGRAPH, PULSE_INTERVAL_MS, EquityChart
+
+        if not HAS_PYQTGRAPH:
+            pytest.skip("pyqtgraph not installed")
+
+        chart = EquityChart(governor=governor)
+        window = QtWidgets.QWidget()
+        QtWidgets.QVBoxLayout(window).addWidget(chart.create_plot_widget())
+        window.resize(600, 300)
+        window.show()
+        _pump(qapp)
+        now = time.time()
+        chart.replot([(now - 60 + i, 10_000.0 + i) for i in range(60)], "LIVE")
+        chart.start_animation()
+        assert chart._pulse_timer.interval_ms == PULSE_INTERVAL_MS
+        yield chart
+        chart.stop_animation()
+        window.close()
+        window.deleteLater()
+
+    def test_paint_path_reports_frame_times(self, chart, governor, qapp):
+        _pump(qapp, 0.05)
+        before = governor.frames_recorded
+        chart.get_plot_widget().viewport().repaint()
+        _pump(qapp, 0.05)
+
+        assert governor.frames_recorded > before
+
+    def test_pulse_repaints_are_not_recorded(self, chart, governor, qapp):
+        _pump(qapp, 0.05)
+        before = governor.frames_recorded
+        plot = chart.get_plot_widget()
+        plot.viewport().repaint(QtCore.QRect(0, 0, 12, 12))
+        _pump(qapp, 0.05)
+
+        assert governor.frames_recorded == before
+
+    @pytest.fixture
+    def synthetic(self, chart):
+        """Only synthetic frames drive the governor (real paints would mix in)."""
+        chart.get_plot_widget().frame_sink = None
+        return chart
+
+    def test_levels_reduce_pulse_glow_trails_antialias(self, synthetic, governor):
+        from panels.panel1.equity_chart import PULSE_INTERVAL_MS
+
+        chart = synthetic
+        _feed(governor, 50.0)
+        assert chart._pulse_timer.interval_ms == 2 * PULSE_INTERVAL_MS
+        assert chart._glow_line.isVisible()
+
+        _feed(governor, 50.0)
+        assert not chart._glow_line.isVisible()
+        assert all(t.isVisible() for t in chart._trail_lines)
+
+        _feed(governor, 50.0, windows=2)
+        assert not any(t.isVisible() for t in chart._trail_lines)
+        assert chart._line.opts["antialias"] is False
+        assert chart._line.curve.opts["antialias"] is False
+        assert chart._pulse_item._antialiased is False
+        assert len(chart._line.yData) == 60
+
+        _feed(governor, 1.0, windows=3)
+        assert chart._line.curve.opts["antialias"] is True
+        assert len(chart._line.yData) == 60
+
+    def test_restored_glow_gets_current_data(self, synthetic, governor):
+        chart = synthetic
+        _feed(governor, 50.0, windows=2)
+        now = time.time()
+        chart.replot([(now - 10, 1.0), (now, 2.0)], "LIVE")  # glow hidden: not updated
+
+        _feed(governor, 1.0, windows=3)
+
+        assert chart._glow_line.isVisible()
+        assert len(chart._glow_line.xData) == 2
@@ -0,0 +1,124 @@
+"""
+tests/test_request_correlator.py
+
+Tests for DTC request/response correlation and timer-wheel expiry.
+"""
+from __future__ import annotations
+
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from utils.request_correlator import (
+    RequestCorrelator,
+    TimerWheel,
+    is_final_response,
+)
+
+
+def _now(wheel_or_correlator) -> int:
+    wheel = getattr(wheel_or_correlator, "_wheel", wheel_or_correlator)
+    return wheel._current_tick * wheel._tick_ns
+
+
+class TestTimerWheel:
+    def test_expires_on_deadline(self):
+        wheel = TimerWheel(tick_seconds=0.25, slots=8)
+        t0 = _now(wheel)
+        wheel.schedule(1, 1.0, t0)
+        wheel.schedule(2, 5.0, t0)  # more than one revolution away
+
+        assert wheel.advance(t0 + int(0.99e9)) == []
+        assert wheel.advance(t0 + int(1.0e9)) == [1]
+        assert wheel.advance(t0 + int(4.9e9)) == []
+        assert wheel.advance(t0 + int(5.0e9)) == [2]
+        assert len(wheel) == 0
+
+    def test_cancel_and_long_stall(self):
+        wheel = TimerWheel(tick_seconds=0.25, slots=8)
+        t0 = _now(wheel)
+        wheel.schedule(1, 1.0, t0)
+        wheel.schedule(2, 3.0, t0)
+        assert wheel.cancel(1)
+        assert not wheel.cancel(1)
+
+        # Cursor jumps many revolutions at once
+        assert wheel.advance(t0 + int(100e9)) == [2]
+
+
+class TestRequestCorrelator:
+    def test_ids_are_monotonic_and_unique(self):
+        corr = RequestCorrelator()
+        ids = [corr.register("OPEN_ORDERS_REQUEST").request_id for _ in range(3)]
+        assert ids == sorted(ids) and len(set(ids)) == 3
+
+    def test_multi_message_response_resolves_on_final(self):
+        corr = RequestCorrelator()
+        done = []
+        pending = corr.register("TRADE_ACCOUNTS_REQUEST", callback=done.append)
+        rid = pending.request_id
+
+        corr.on_response({"Type": 401, "RequestID": rid, "MessageNumber": 1, "TotalNumberMessages": 2})
+        assert not pending.future.done()
+        corr.on_response({"Type": 401, "RequestID": rid, "MessageNumber": 2, "TotalNumberMessages": 2})
+
+        assert len(pending.future.result(timeout=0)) == 2
+        assert done == [pending]
+        assert corr.get_pending_count() == 0
+        assert corr.get_latency_stats()["TRADE_ACCOUNTS_REQUEST"]["count"] == 1
+
+    def test_last_latency_is_time_to_first_frame(self):
+        corr = RequestCorrelator()
+        pending = corr.register("HISTORICAL_FILLS_REQUEST")
+        pending.sent_at_ns -= 20_000_000  # sent 20 ms ago
+        corr.on_response({"RequestID": pending.request_id, "MessageNumber": 1, "TotalNumberMessages": 2})
+        first_ms = corr.last_latency_ms
+
+        pending.sent_at_ns -= 5_000_000_000  # the rest of the response trickles in much later
+        corr.on_response({"RequestID": pending.request_id, "MessageNumber": 2, "TotalNumberMessages": 2})
+
+        assert 20.0 <= first_ms < 1000.0
+        assert corr.last_latency_ms == first_ms
+        assert corr.get_latency_stats()["HISTORICAL_FILLS_REQUEST"]["max_ms"] >= 5000.0
+
+    def test_unknown_request_id_is_ignored(self):
+        corr = RequestCorrelator()
+        assert corr.on_response({"Type": 401, "RequestID": 999}) is None
+
+    def test_timeout_fails_future(self):
+        corr = RequestCorrelator()
+        t0 = _now(corr)
+        pending = corr.register("ACCOUNT_BALANCE_REQUEST", timeout=0.5)
+
+        expired = corr.advance(t0 + int(10e9))
+        assert expired == [pending]
+        with pytest.raises(FutureTimeoutError):
+            pending.future.result(timeout=0)
+        assert corr.get_stats()["timed_out"] == 1
+
+    def test_cancel_all_on_disconnect(self):
+        corr = RequestCorrelator()
+        pending = corr.register("OPEN_ORDERS_REQUEST")
+        assert corr.cancel_all() == 1
+        with pytest.raises(ConnectionError):
+            pending.future.result(timeout=0)
+
+
+def test_final_markers():
+    assert is_final_response({"Type": 600})
+    assert is_final_response({"Type": 304, "NoOrderFills": 1})
+    assert not is_final_response({"Type": 301, "MessageNumber": 1, "TotalNumMessages": 3})
+
+
+def test_latency_stats_use_metrics_histogram():
+    corr = RequestCorrelator()
+    for ms in (3, 4, 40, 40, 900):
+        pending = corr.register("ACCOUNT_BALANCE_REQUEST")
+        pending.sent_at_ns -= ms * 1_000_000
+        corr.on_response({"Type": 600, "RequestID": pending.request_id})
+
+    stats = corr.get_latency_stats()["ACCOUNT_BALANCE_REQUEST"]
+    assert stats["count"] == 5
+    assert stats["p50_ms"] == pytest.approx(40.0, rel=0.05)  # log-linear bucket midpoint
+    assert stats["p99_ms"] == pytest.approx(900.0, rel=0.05)
+    assert set(stats) >= {"mean_ms", "p90_ms", "buckets"}
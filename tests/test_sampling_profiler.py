@@ -0,0 +1,121 @@
+"""
+tests/test_sampling_profiler.py
+
+Sampling profiler: collapsed stacks, bounded memory and flamegraph exports.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from core.sampling_profiler import TRUNCATED_FRAME, SamplingProfiler
+
+
+def _busy_leaf(stop: threading.Event, ready: threading.Event) -> None:
+    ready.set()
+    while not stop.is_set():
+        sum(range(200))
+
+
+def _busy_worker(stop: threading.Event, ready: threading.Event) -> None:
+    _busy_leaf(stop, ready)
+
+
+def _run_worker(profiler: SamplingProfiler, samples: int) -> None:
+    stop, ready = threading.Event(), threading.Event()
+    worker = threading.Thread(target=_busy_worker, args=(stop, ready), name="BusyWorker", daemon=True)
+    worker.start()
+    ready.wait(5.0)
+    try:
+        for _ in range(samples):
+            profiler.sample()
+            time.sleep(0.001)
+    finally:
+        stop.set()
+        worker.join()
+
+
+class TestSampling:
+    def test_collapsed_stacks_name_thread_and_frames(self, tmp_path):
+        profiler = SamplingProfiler(interval_ms=1, output_dir=tmp_path)
+        _run_worker(profiler, 30)
+
+        worker_stacks = {k: n for k, n in profiler.collapsed().items() if k.startswith("BusyWorker;")}
+        assert sum(worker_stacks.values()) == 30
+        assert all(
+            f"{__name__}:_busy_worker;{__name__}:_busy_leaf" in key for key in worker_stacks
+        ), worker_stacks
+        assert profiler.stats()["samples"] == 30
+
+    def test_background_thread_samples_and_stops(self, tmp_path):
+        profiler = SamplingProfiler(interval_ms=2, output_dir=tmp_path)
+        profiler.start()
+        time.sleep(0.1)
+        profiler.stop()
+
+        assert not profiler.running
+        taken = profiler.samples
+        assert taken > 5
+        assert not any(key.startswith("SamplingProfiler;") for key in profiler.collapsed())
+        time.sleep(0.02)
+        assert profiler.samples == taken
+
+    def test_distinct_stacks_are_bounded(self, tmp_path):
+        profiler = SamplingProfiler(interval_ms=1, max_stacks=1, max_depth=4, output_dir=tmp_path)
+        _run_worker(profiler, 20)
+
+        stacks = profiler.collapsed()
+        assert len([k for k in stacks if not k.endswith(TRUNCATED_FRAME)]) == 1
+        assert profiler.truncated == sum(n for k, n in stacks.items() if k.endswith(TRUNCATED_FRAME))
+        assert all(len(k.split(";")) <= 5 for k in stacks)
+
+
+class TestExport:
+    def test_collapsed_and_speedscope_outputs(self, tmp_path):
+        profiler = SamplingProfiler(interval_ms=10, output_dir=tmp_path)
+        stacks = {"MainThread;app:main;app:paint": 3, "MainThread;app:main": 1, "Worker;db:query": 2}
+
+        collapsed_path, speedscope_path = profiler.dump("unit", stacks)
+
+        assert collapsed_path.read_text().splitlines() == [
+            "MainThread;app:main 1",
+            "MainThread;app:main;app:paint 3",
+            "Worker;db:query 2",
+        ]
+        doc = json.loads(speedscope_path.read_text())
+        names = [f["name"] for f in doc["shared"]["frames"]]
+        assert sorted(names) == ["main", "paint", "query"]
+        main = next(p for p in doc["profiles"] if p["name"] == "MainThread")
+        assert [[names[i] for i in s] for s in main["samples"]] == [["main"], ["main", "paint"]]
+        assert main["weights"] == [10.0, 30.0] and main["endValue"] == 40.0
+
+    def test_dump_window_only_includes_window_samples(self, tmp_path):
+        profiler = SamplingProfiler(interval_ms=1, output_dir=tmp_path)
+        _run_worker(profiler, 5)
+        time.sleep(0.05)
+        window_start = time.time()
+        _run_worker(profiler, 5)
+
+        window = profiler.collapsed(window_start, time.time())
+        assert sum(n for k, n in window.items() if k.startswith("BusyWorker;")) == 5
+        assert profiler.dump_window(time.time() + 10, time.time() + 20) == []
+        assert len(profiler.dump_window(window_start, time.time(), "stall")) == 2
+
+    def test_recent_window_does_not_shrink_with_thread_count(self, tmp_path):
+        profiler = SamplingProfiler(interval_ms=1000, output_dir=tmp_path)  # 30 samples in the window
+        stop = threading.Event()
+        sleepers = [threading.Thread(target=stop.wait, daemon=True) for _ in range(8)]
+        for thread in sleepers:
+            thread.start()
+        try:
+            started = time.time()
+            for _ in range(30):
+                profiler.sample()
+        finally:
+            stop.set()
+            for thread in sleepers:
+                thread.join()
+
+        window = profiler.collapsed(started, time.time())
+        assert sum(window.values()) == sum(profiler.collapsed().values())
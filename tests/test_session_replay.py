@@ -0,0 +1,178 @@
+"""
+tests/test_session_replay.py
+
+Streaming JSONL session dumps and the indexed SessionReplay queries.
+"""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import json
+
+import orjson
+import pytest
+
+from core.diagnostics import DiagnosticEvent, DiagnosticsHub
+from core.session_replay import SessionReplay
+
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _record(i: int, category: str = "data", level: str = "info", message: str = "tick", **extra) -> dict:
+    record = {
+        "timestamp": (BASE + timedelta(seconds=i)).isoformat(),
+        "category": category,
+        "level": level,
+        "module": "tests",
+        "event_type": "Test",
+        "message": message,
+        "context": {"i": i},
+    }
+    record.update(extra)
+    return record
+
+
+def _session(count: int = 600) -> list[dict]:
+    records = []
+    for i in range(count):
+        if i % 100 == 0:
+            records.append(_record(i, "network", "error", f"connection {i} failed"))
+        elif i % 7 == 0:
+            records.append(_record(i, "perf", "debug", "render", elapsed_ms=float(i)))
+        else:
+            records.append(_record(i))
+    return records
+
+
+def _write_jsonl(path, records, summary: dict | None = None) -> None:
+    with open(path, "wb") as f:
+        f.write(orjson.dumps({"_meta": "session", "format": 1, "session_start": BASE.isoformat()}) + b"\n")
+        for record in records:
+            f.write(orjson.dumps(record) + b"\n")
+        if summary is not None:
+            f.write(orjson.dumps({"_meta": "summary", **summary}) + b"\n")
+
+
+class TestJsonlLoading:
+    def test_jsonl_and_json_dumps_give_identical_answers(self, tmp_path):
+        records = _session()
+        _write_jsonl(tmp_path / "session.jsonl", records, {"session_end": "end", "statistics": {"total_events": 600}})
+        (tmp_path / "session.json").write_text(json.dumps({"session_start": BASE.isoformat(), "events": records}))
+
+        streamed = SessionReplay.from_file(str(tmp_path / "session.jsonl"))
+        legacy = SessionReplay.from_file(str(tmp_path / "session.json"))
+        try:
+            assert streamed.session_start == BASE.isoformat()
+            assert streamed.session_end == "end"
+            assert streamed.metadata["statistics"] == {"total_events": 600}
+
+            a, b = streamed.analyze(), legacy.analyze()
+            assert a == b
+            assert a.total_events == 600
+            assert a.categories == {"network": 6, "perf": 85, "data": 509}
+            assert a.duration_sec == 599.0
+            assert a.performance_stats["total_measurements"] == 85
+            assert a.timeline_summary[:2] == [("0s", 60), ("60s", 60)]
+        finally:
+            streamed.close()
+
+    def test_out_of_order_truncated_and_malformed_lines(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        _write_jsonl(path, [_record(5, message="late"), _record(1, message="early"), {"bogus": True}])
+        with open(path, "ab") as f:
+            f.write(b'{"timestamp": "2026-01-01T00:00:09')  # writer died mid-line
+
+        replay = SessionReplay.from_file(str(path))
+        try:
+            assert [e.message for e in replay.events] == ["early", "late"]
+            assert replay.index.skipped == 2
+        finally:
+            replay.close()
+
+    def test_hub_export_jsonl_round_trip(self, tmp_path):
+        DiagnosticsHub.reset_instance()
+        hub = DiagnosticsHub(async_dispatch=True, sample_rates={})
+        hub.router.unregister_handler(hub._console_handler)
+        try:
+            writer = hub.stream_to_jsonl(str(tmp_path / "stream.jsonl"))
+            for i in range(50):
+                hub.emit_event(DiagnosticEvent(**_record(i, level="warn" if i % 10 == 0 else "info")))
+            hub.flush()
+            writer.close()
+            hub.export_jsonl(str(tmp_path / "export.jsonl"))
+        finally:
+            hub.stop()
+
+        for name in ("stream.jsonl", "export.jsonl"):
+            replay = SessionReplay.from_file(str(tmp_path / name))
+            try:
+                assert len(replay.events) == 50
+                assert len(replay.search(level="warn")) == 5
+                assert replay.metadata["statistics"]["total_events"] == 50
+            finally:
+                replay.close()
+
+
+    def test_stream_starts_one_session_per_file(self, tmp_path):
+        path = tmp_path / "stream.jsonl"
+        DiagnosticsHub.reset_instance()
+        hub = DiagnosticsHub(async_dispatch=False, sample_rates={})
+        hub.router.unregister_handler(hub._console_handler)
+        try:
+            for run in ("first", "second"):
+                writer = hub.stream_to_jsonl(str(path))
+                hub.emit_event(DiagnosticEvent(**_record(0, message=run)))
+                writer.close()
+        finally:
+            hub.stop()
+
+        for name, message in (("stream.jsonl", "second"), ("stream.prev.jsonl", "first")):
+            replay = SessionReplay.from_file(str(tmp_path / name))
+            try:
+                assert [e.message for e in replay.events] == [message]
+            finally:
+                replay.close()
+
+
+class TestIndexedQueries:
+    @pytest.fixture
+    def replay(self, tmp_path):
+        _write_jsonl(tmp_path / "session.jsonl", _session())
+        replay = SessionReplay.from_file(str(tmp_path / "session.jsonl"))
+        yield replay
+        replay.close()
+
+    def test_search_matches_linear_filter(self, replay):
+        records = _session()
+
+        results = replay.search(pattern="connection.*FAILED", category="network", level="error")
+        assert [e.context["i"] for e in results] == [r["context"]["i"] for r in records if r["category"] == "network"]
+
+        start, end = BASE + timedelta(seconds=100), (BASE + timedelta(seconds=199)).isoformat()
+        windowed = replay.search(category="perf", start=start, end=end)
+        assert [e.context["i"] for e in windowed] == [i for i in range(100, 200) if i % 7 == 0 and i % 100]
+
+        assert [e.context["i"] for e in replay.search(context_key="i", context_value=42)] == [42]
+        assert len(replay.search(category="data", limit=3)) == 3
+        assert replay.search(category="missing") == []
+        assert replay.search(pattern="no such message") == []
+
+    def test_time_queries(self, replay):
+        assert replay.count_between(BASE + timedelta(seconds=10), BASE + timedelta(seconds=19)) == 10
+        assert replay.count_between() == 600
+        assert replay._create_timeline_summary(bucket_size_sec=300) == [("0s", 300), ("300s", 300)]
+
+    def test_events_view_is_lazy(self, replay):
+        view = replay.events
+        assert len(view) == 600
+        assert view[-1].context["i"] == 599
+        assert [e.context["i"] for e in view[10:13]] == [10, 11, 12]
+
+    def test_patterns(self, tmp_path):
+        records = [_record(i, level="error", message=f"retry attempt {i}") for i in range(4)]
+        records += [_record(4, message="ok", elapsed_ms=1500.0)]
+        replay = SessionReplay.from_events(records)
+
+        patterns = {p.pattern_type: p for p in replay.analyze().patterns}
+        assert patterns["repeated_errors"].occurrences == 1
+        assert patterns["retry_attempts"].occurrences == 4
+        assert patterns["slow_operations"].example_events[0]["message"] == "ok"
@@ -0,0 +1,171 @@
+"""
+tests/test_signal_profiler.py
+
+SignalBus per-slot cost attribution: off by default, emit/fan-out counts,
+per-slot timing report, and PyQt connection semantics (arity, disconnect,
+receiver thread affinity and lifetime) preserved while profiling.
+"""
+from __future__ import annotations
+
+import gc
+import time
+
+from PyQt6 import QtCore
+import pytest
+
+from core.signal_bus import SignalBus
+from core.signal_profiler import ProfiledSignal
+
+
+def _pump(qapp, seconds: float = 0.1) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def bus(qapp):
+    bus = SignalBus(profile=True, lanes=False)
+    yield bus
+    bus.deleteLater()
+
+
+class _Receiver(QtCore.QObject):
+    def __init__(self):
+        super().__init__()
+        self.threads: list[QtCore.QThread] = []
+
+    def on_position(self, event) -> None:
+        self.threads.append(QtCore.QThread.currentThread())
+
+
+class _Plain:
+    def __init__(self):
+        self.calls = 0
+
+    def on_balance(self, balance: float, account: str) -> None:
+        self.calls += 1
+
+
+class TestOptIn:
+    def test_off_leaves_plain_signals(self, qapp):
+        bus = SignalBus(profile=False)
+
+        assert bus.profiler is None
+        assert isinstance(bus.positionUpdated, QtCore.pyqtBoundSignal)
+        bus.deleteLater()
+
+    def test_on_shadows_every_signal(self, bus):
+        assert isinstance(bus.positionUpdated, ProfiledSignal)
+        assert isinstance(bus.dtcConnected, ProfiledSignal)
+        assert bus.enable_profiling() is bus.profiler
+
+
+class TestAttribution:
+    def test_report_ranks_slow_subscriber_first(self, bus):
+        def slow(event) -> None:
+            time.sleep(0.004)
+
+        def fast(event) -> None:
+            pass
+
+        bus.positionUpdated.connect(fast)
+        bus.positionUpdated.connect(slow)
+        for _ in range(5):
+            bus.positionUpdated.emit({"qty": 1})
+        bus.orderUpdateReceived.emit({})
+
+        rows = bus.profiler.report()
+        assert [row["slot"].rsplit(".", 1)[-1] for row in rows] == ["slow", "fast"]
+        assert rows[0]["signal"] == "positionUpdated"
+        assert (rows[0]["emits"], rows[0]["fan_out"], rows[0]["calls"]) == (5, 2, 5)
+        assert rows[0]["total_ms"] >= 15.0 and rows[0]["p99_ms"] >= 3.0
+        assert bus.profiler.signal_counts()["orderUpdateReceived"] == {"emits": 1, "fan_out": 0}
+
+    def test_report_sorting_and_validation(self, bus):
+        bus.balanceUpdated.connect(lambda balance, account: None)
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        assert bus.profiler.report(sort_by="calls", limit=1)[0]["calls"] == 1
+        assert "balanceUpdated" in bus.profiler.format_report()
+        with pytest.raises(ValueError):
+            bus.profiler.report(sort_by="slot")
+
+    def test_reset_keeps_connections_timed(self, bus):
+        calls: list[float] = []
+        bus.balanceUpdated.connect(lambda balance, account: calls.append(balance))
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        bus.profiler.reset()
+        bus.balanceUpdated.emit(2.0, "Sim1")
+
+        assert calls == [1.0, 2.0]
+        assert bus.profiler.report()[0]["calls"] == 1
+
+
+class TestConnectionSemantics:
+    def test_slot_with_fewer_args_gets_truncated_args(self, bus):
+        hits: list[str] = []
+        bus.balanceUpdated.connect(lambda: hits.append("x"))
+
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        assert hits == ["x"]
+
+    def test_disconnect_by_equal_bound_method(self, bus):
+        plain = _Plain()
+        bus.balanceUpdated.connect(plain.on_balance)
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        bus.balanceUpdated.disconnect(plain.on_balance)
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        assert plain.calls == 1
+        with pytest.raises(TypeError):
+            bus.balanceUpdated.disconnect(plain.on_balance)
+
+    def test_plain_receiver_is_held_weakly(self, bus):
+        plain = _Plain()
+        bus.balanceUpdated.connect(plain.on_balance)
+        del plain
+        gc.collect()
+
+        bus.balanceUpdated.emit(1.0, "Sim1")
+
+        assert bus.profiler.report() == []
+
+    def test_qobject_receiver_keeps_thread_affinity(self, bus, qapp):
+        receiver = _Receiver()
+        thread = QtCore.QThread()
+        receiver.moveToThread(thread)
+        thread.start()
+        try:
+            bus.positionUpdated.connect(receiver.on_position)
+            bus.positionUpdated.emit({})
+            deadline = time.monotonic() + 2.0
+            while not receiver.threads and time.monotonic() < deadline:
+                _pump(qapp, 0.02)
+
+            assert receiver.threads == [thread]
+        finally:
+            thread.quit()
+            thread.wait()
+
+    def test_deleted_receiver_drops_connection(self, bus, qapp):
+        receiver = _Receiver()
+        bus.positionUpdated.connect(receiver.on_position)
+
+        receiver.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete.value)
+        bus.positionUpdated.emit({})
+
+        assert bus.profiler.signal_counts()["positionUpdated"]["fan_out"] == 0
+
+    def test_emit_safe_accepts_profiled_signal(self, bus):
+        hits: list[str] = []
+        bus.statusMessagePosted.connect(lambda message, timeout: hits.append(message))
+
+        bus.emit_safe(bus.statusMessagePosted, "ok", 0)
+
+        assert hits == ["ok"]
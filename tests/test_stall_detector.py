@@ -0,0 +1,78 @@
+"""
+tests/test_stall_detector.py
+
+UI stall detector: heartbeat lag, stack capture at the stall site, summary.
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from core.diagnostics import DiagnosticsHub
+from core.stall_detector import StallDetector
+
+
+def _pump(qapp, seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def _blocking_stats_query(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.fixture
+def detector(qapp):
+    DiagnosticsHub.reset_instance()
+    detector = StallDetector(interval_ms=20, threshold_ms=100)
+    yield detector
+    detector.stop()
+    DiagnosticsHub.reset_instance()
+
+
+class TestStallDetector:
+    def test_responsive_loop_records_nothing(self, qapp, detector):
+        detector.start()
+        _pump(qapp, 0.3)
+
+        assert detector.summary()["stall_count"] == 0
+
+    def test_stall_is_attributed_to_blocking_call(self, qapp, detector):
+        seen: list[dict] = []
+        detector.stallDetected.connect(seen.append)
+        detector.start()
+        _pump(qapp, 0.1)
+
+        _blocking_stats_query(0.35)
+        _pump(qapp, 0.2)
+
+        assert len(seen) == 1
+        stall = seen[0]
+        assert stall["duration_ms"] >= 250
+        assert stall["function"] == "_blocking_stats_query"
+        assert stall["call_site"].startswith("tests/test_stall_detector.py:")
+        assert "_blocking_stats_query" in stall["stack"]
+
+        events = [e for e in DiagnosticsHub.get_instance().events if e.event_type == "UIStall"]
+        assert len(events) == 1
+        assert events[0].level == "warn" and events[0].category == "perf"
+        assert events[0].function_name == "_blocking_stats_query"
+        assert events[0].context["duration_ms"] == stall["duration_ms"]
+
+    def test_summary_aggregates_by_call_site(self, qapp, detector):
+        detector.start()
+        for seconds in (0.2, 0.3):
+            _pump(qapp, 0.06)
+            _blocking_stats_query(seconds)
+            _pump(qapp, 0.1)
+        detector.stop()
+
+        summary = detector.summary()
+        assert summary["stall_count"] == 2
+        assert summary["max_stall_ms"] >= 250
+        assert summary["worst"][0]["duration_ms"] == summary["max_stall_ms"]
+        (site,) = summary["by_call_site"]
+        assert site["count"] == 2 and site["call_site"].endswith("in _blocking_stats_query")
@@ -0,0 +1,136 @@
+"""
+tests/test_startup_budget.py
+
+Staged startup: deferred stage runner and the startup regression budget.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tools._common import REPO_ROOT
+from tools.startup_profiler import (
+    STARTUP_BUDGET_MS,
+    check_budget,
+    parse_importtime,
+    profile_imports,
+)
+
+
+class TestStartupTimeline:
+    def test_deferred_stages_run_in_order_and_survive_failures(self, qapp):
+        from core.startup_stages import StartupTimeline
+
+        timeline = StartupTimeline()
+        calls: list[str] = []
+
+        def _boom():
+            calls.append("boom")
+            raise RuntimeError("stage failed")
+
+        with timeline.stage("shell"):
+            calls.append("shell")
+        timeline.run_deferred([("first", lambda: calls.append("first")), ("boom", _boom)])
+        timeline.run_deferred([("last", lambda: calls.append("last"))])
+
+        # Deferred stages never run inline
+        assert calls == ["shell"]
+        assert timeline.deferred_pending == 3
+
+        deadline = time.monotonic() + 5.0
+        while timeline.deferred_pending and time.monotonic() < deadline:
+            qapp.processEvents()
+
+        assert calls == ["shell", "first", "boom", "last"]
+        report = timeline.report()
+        assert [s["name"] for s in report["stages"]] == ["shell", "first", "boom", "last"]
+        assert [s["deferred"] for s in report["stages"]] == [False, True, True, True]
+        assert report["stages"][2]["error"] == "stage failed"
+
+
+class TestStartupBudget:
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     numpy._core\n"
+            "import time:      2000 |       2120 |   numpy\n"
+            "import time:       500 |       2620 | core.app_manager\n"
+        )
+        rows = parse_importtime(stderr)
+        assert [r["module"] for r in rows] == ["numpy._core", "numpy", "core.app_manager"]
+        assert [r["depth"] for r in rows] == [2, 1, 0]
+        assert rows[2]["cumulative_ms"] == pytest.approx(2.62)
+
+    def test_check_budget_flags_regressions(self):
+        stages = {
+            "stages": [
+                {"name": "window_shell", "ms": STARTUP_BUDGET_MS["window_shell"] + 1, "deferred": False},
+                {"name": "database", "ms": 99999.0, "deferred": True},
+            ],
+            "marks": {"first_paint": 10.0},
+            "completed": True,
+        }
+        violations = check_budget(stages=stages)
+        assert len(violations) == 1 and violations[0].startswith("window_shell")
+
+        imports = {"total_ms": 10.0, "loaded_deferred": ["core.data_bridge"]}
+        assert check_budget(imports=imports) == ["core.data_bridge is imported on the paint-first path"]
+
+    def test_app_manager_import_stays_light(self):
+        report = profile_imports("core.app_manager")
+        assert report["loaded_deferred"] == []
+        assert check_budget(imports=report) == []
+
+    def test_staged_startup_within_budget(self, tmp_path):
+        out = tmp_path / "startup.json"
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        proc = subprocess.run(
+            [sys.executable, "-m", "tools.startup_profiler", "--stages", "--check-budget", "--quiet", "--out", str(out)],
+            cwd=str(REPO_ROOT),
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        report = json.loads(out.read_text())
+
+        assert report["budget"]["violations"] == [], report["budget"]
+        assert proc.returncode == 0
+
+        stages = report["stages"]
+        assert stages["completed"]
+        deferred = [s["name"] for s in stages["stages"] if s["deferred"]]
+        assert deferred == ["equity_chart", "database", "position_recovery", "dtc_connect", "diagnostics"]
+        inline = [s["name"] for s in stages["stages"] if not s["deferred"]]
+        assert inline.index("database_schema") < inline.index("panels")
+        first_deferred = min(s["start_ms"] for s in stages["stages"] if s["deferred"])
+        assert stages["marks"]["first_paint"] <= first_deferred
+
+    def test_panel1_defers_pyqtgraph_to_chart_construction(self):
+        code = (
+            "import sys\n"
+            "from PyQt6 import QtWidgets\n"
+            "app = QtWidgets.QApplication([])\n"
+            "from panels.panel1 import Panel1\n"
+            "panel = Panel1(defer_chart=True)\n"
+            "print('STATE', 'pyqtgraph' in sys.modules, panel._equity_chart.has_plot())\n"
+            "panel.build_chart()\n"
+            "print('STATE', 'pyqtgraph' in sys.modules, panel._equity_chart.has_plot())\n"
+        )
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(REPO_ROOT),
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert proc.returncode == 0, proc.stderr
+        states = [line.split()[1:] for line in proc.stdout.splitlines() if line.startswith("STATE ")]
+        assert states == [["False", "False"], ["True", "True"]]
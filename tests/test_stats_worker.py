@@ -0,0 +1,82 @@
+"""
+tests/test_stats_worker.py
+
+Tests for the Panel 3 background stats precompute worker.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.stats_worker import STATS_TIMEFRAMES, StatsPrecomputeWorker
+
+
+def _fake_stats(tf, mode=None, account=None):
+    return {"Trades": "1", "_tf": tf, "_mode": mode, "_account": account}
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def worker():
+    w = StatsPrecomputeWorker()
+    yield w
+    w.shutdown()
+
+
+class TestStatsPrecomputeWorker:
+    def test_precompute_fills_all_timeframes(self, worker):
+        with patch("services.stats_service.compute_trading_stats_for_timeframe", side_effect=_fake_stats):
+            worker.precompute("sim", "Sim1")
+            assert _wait_for(lambda: all(worker.get_cached("SIM", "Sim1", tf) for tf in STATS_TIMEFRAMES))
+
+        payload = worker.get_cached("SIM", "Sim1", "1W")
+        assert payload["_tf"] == "1W"
+        assert payload["_mode"] == "SIM"
+        assert worker.active_scope() == ("SIM", "Sim1")
+        assert not worker.is_stale("SIM", "Sim1", "1W")
+
+    def test_get_cached_miss_returns_none(self, worker):
+        assert worker.get_cached("LIVE", "120005", "1D") is None
+        assert worker.is_stale("LIVE", "120005", "1D")
+
+    def test_stale_scope_jobs_are_cancelled(self, worker):
+        gate = threading.Event()
+        computed: list[tuple[str, str]] = []
+
+        def slow_stats(tf, mode=None, account=None):
+            gate.wait(2.0)
+            computed.append((mode, tf))
+            return _fake_stats(tf, mode, account)
+
+        with patch("services.stats_service.compute_trading_stats_for_timeframe", side_effect=slow_stats):
+            worker.precompute("SIM", "Sim1")
+            worker.precompute("LIVE", "120005")
+            gate.set()
+            assert _wait_for(lambda: all(worker.get_cached("LIVE", "120005", tf) for tf in STATS_TIMEFRAMES))
+
+        # At most the job already running when the scope changed touched the DB,
+        # and its result was dropped instead of being cached.
+        assert sum(1 for mode, _ in computed if mode == "SIM") <= 1
+        assert all(worker.get_cached("SIM", "Sim1", tf) is None for tf in STATS_TIMEFRAMES)
+
+    def test_results_are_published(self, worker, qtbot):
+        received: list[dict] = []
+        worker.statsReady.connect(received.append)
+
+        with patch("services.stats_service.compute_trading_stats_for_timeframe", side_effect=_fake_stats):
+            worker.precompute("SIM", None)
+            qtbot.waitUntil(lambda: len(received) == len(STATS_TIMEFRAMES), timeout=3000)
+
+        assert {e["timeframe"] for e in received} == set(STATS_TIMEFRAMES)
+        assert all(e["mode"] == "SIM" and e["account"] is None for e in received)
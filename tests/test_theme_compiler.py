@@ -0,0 +1,199 @@
+"""
+tests/test_theme_compiler.py
+
+Precompiled theme stylesheets: per-mode compilation, dynamic-property
+switching with one polish pass, token caches and switch time.
+"""
+from __future__ import annotations
+
+import time
+
+from PyQt6 import QtGui, QtWidgets
+import pytest
+
+from config.theme import _THEME_MAP, THEME, get_active_theme_name, switch_theme
+from utils.theme_compiler import THEME_MODE_PROPERTY, ThemeCompiler, get_theme_compiler, reset_theme_compiler
+
+_COLORS = {"DEBUG": "#111111", "SIM": "#222222", "LIVE": "#333333"}
+
+
+def _test_rules(theme) -> str:
+    mode = next(name.upper() for name, mode_theme in _THEME_MAP.items() if mode_theme is theme)
+    return f"QLabel#CompilerProbe {{ color: {_COLORS[mode]}; }}"
+
+
+def _text_color(label: QtWidgets.QLabel) -> str:
+    return label.palette().color(QtGui.QPalette.ColorRole.WindowText).name()
+
+
+@pytest.fixture
+def compiler(qapp):
+    original = get_active_theme_name()
+    reset_theme_compiler()
+    compiler = get_theme_compiler()
+    yield compiler
+    reset_theme_compiler()
+    switch_theme(original)
+
+
+class TestCompilation:
+    def test_rules_are_scoped_per_mode(self, qapp):
+        compiler = ThemeCompiler()
+        compiler.register(_test_rules)
+
+        sheets = compiler.compile()
+
+        assert set(sheets) == {"DEBUG", "SIM", "LIVE"}
+        assert sheets["SIM"] == f'*[{THEME_MODE_PROPERTY}="SIM"] QLabel#CompilerProbe {{ color: #222222; }}'
+        assert compiler._targets == frozenset({"CompilerProbe"})
+
+    def test_builders_run_once_per_mode(self, qapp):
+        calls = []
+        compiler = ThemeCompiler()
+        compiler.register(lambda theme: calls.append(theme) or "")
+
+        compiler.compile()
+        compiler.compile()
+        _ = compiler.stylesheet
+
+        assert len(calls) == 3
+
+    def test_selector_without_object_name_polishes_everything(self, qapp):
+        compiler = ThemeCompiler()
+        compiler.register(lambda theme: "QLabel { color: red; }")
+
+        compiler.compile()
+
+        assert compiler._targets is None
+
+
+class TestSwitching:
+    def test_property_flip_restyles_without_reparsing(self, compiler, qapp):
+        probe_compiler = ThemeCompiler()
+        probe_compiler.register(_test_rules)
+        root = QtWidgets.QWidget()
+        probe = QtWidgets.QLabel("x", root)
+        probe.setObjectName("CompilerProbe")
+        try:
+            probe_compiler.install(qapp)
+            probe_compiler.attach(root)
+            probe_compiler.apply("SIM")
+            sheet = qapp.styleSheet()
+            assert _text_color(probe) == _COLORS["SIM"]
+
+            probe_compiler.apply("LIVE")
+
+            assert root.property(THEME_MODE_PROPERTY) == "LIVE"
+            assert _text_color(probe) == _COLORS["LIVE"]
+            assert qapp.styleSheet() == sheet
+            assert THEME["bg_panel"] == "#000000"
+        finally:
+            probe_compiler.uninstall()
+            root.deleteLater()
+
+    def test_install_keeps_existing_app_stylesheet(self, compiler, qapp):
+        probe_compiler = ThemeCompiler()
+        probe_compiler.register(_test_rules)
+        qapp.setStyleSheet("QToolTip { color: #abcdef; }")
+        try:
+            probe_compiler.install(qapp)
+            assert qapp.styleSheet().startswith("QToolTip { color: #abcdef; }")
+            assert "QLabel#CompilerProbe" in qapp.styleSheet()
+
+            probe_compiler.register(lambda theme: "")  # late registration reinstalls
+            assert qapp.styleSheet().startswith("QToolTip { color: #abcdef; }")
+        finally:
+            probe_compiler.uninstall()
+        assert qapp.styleSheet() == "QToolTip { color: #abcdef; }"
+        qapp.setStyleSheet("")
+
+    def test_legacy_widget_keeps_its_stylesheet(self, compiler, qapp):
+        from utils.theme_mixin import ThemedPanel, ThemedWidget
+
+        compiler.install(qapp)
+        panel = ThemedPanel("LegacyPanel")
+        widget = ThemedWidget("LegacyWidget")
+
+        panel.refresh_theme()
+        widget.refresh_theme()
+
+        assert "QWidget#LegacyPanel" in panel.styleSheet()
+        assert "QWidget#LegacyWidget" in widget.styleSheet()
+        panel.deleteLater()
+        widget.deleteLater()
+
+    def test_unknown_mode_is_rejected(self, compiler):
+        assert compiler.apply("PAPER") is False
+
+    def test_metric_cell_uses_compiled_rules(self, compiler, qapp):
+        from widgets.metric_cell import MetricCell
+
+        compiler.install(qapp)
+        root = QtWidgets.QWidget()
+        compiler.attach(root)
+        cell = MetricCell("P&L")
+        cell.setParent(root)
+
+        cell.start_flashing("#FF0000")
+        cell._on_flash_tick()
+        assert cell.styleSheet()
+        cell.stop_flashing()
+
+        # Inline flash override dropped: the compiled sheet styles the cell again
+        assert cell.styleSheet() == ""
+        assert "QFrame#MetricCell" in compiler.stylesheet
+        root.deleteLater()
+
+    def test_switch_is_faster_than_per_widget_refresh(self, compiler, qapp):
+        from widgets.metric_cell import MetricCell
+
+        root = QtWidgets.QWidget()
+        layout = QtWidgets.QGridLayout(root)
+        cells = [MetricCell(f"M{i}") for i in range(120)]
+        for i, cell in enumerate(cells):
+            layout.addWidget(cell, *divmod(i, 10))
+        root.show()
+        qapp.processEvents()
+
+        # Legacy path: rebuild + set every widget's stylesheet (best of 3)
+        legacy_ms = []
+        for mode in ("sim", "live", "sim"):
+            started = time.perf_counter()
+            switch_theme(mode)
+            for cell in cells:
+                cell.setStyleSheet(cell._build_theme_stylesheet())
+                cell.lbl_title.setStyleSheet(f"color: {THEME.get('text_dim', '#5B6C7A')};")
+            legacy_ms.append((time.perf_counter() - started) * 1000.0)
+
+        for cell in cells:
+            cell.setStyleSheet("")
+            cell.lbl_title.setStyleSheet("")
+        compiler.install(qapp)
+        compiler.attach(root)
+        switch_ms = []
+        for mode in ("LIVE", "SIM", "LIVE"):
+            compiler.apply(mode)
+            switch_ms.append(compiler.last_switch_ms)
+
+        assert min(switch_ms) < min(legacy_ms)
+        root.close()
+        root.deleteLater()
+
+
+class TestTokenCache:
+    def test_tokens_are_cached_per_mode(self, compiler):
+        compiler.apply("SIM")
+        pen = compiler.pen("border", 2.0)
+
+        assert compiler.pen("border", 2.0) is pen
+        assert pen.widthF() == 2.0
+        assert compiler.brush("card_bg").color() == compiler.color("card_bg")
+        assert compiler.color("bg_panel", mode="LIVE").name() == "#000000"
+        assert compiler.color("bg_panel").name() == "#ffffff"
+
+    def test_tokens_follow_direct_switch_theme(self, compiler):
+        compiler.apply("SIM")
+        switch_theme("live")
+
+        assert compiler.mode == "LIVE"
+        assert compiler.color("bg_panel").name() == "#000000"
@@ -0,0 +1,149 @@
+"""
+tests/test_typed_events.py
+
+Typed DTC bus events: from_dtc coercion, immutability, and delivery of the
+event object itself through the SignalBus (raw dicts when the flag is off).
+"""
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from core.data_bridge import DTCClientJSON, _dtc_to_app_event
+from core.signal_bus import get_signal_bus
+from domain.events import BalanceUpdateEvent, OrderUpdateEvent, PositionUpdateEvent, TradeAccountEvent
+
+POSITION = {"Type": 306, "Symbol": "MESZ25", "PositionQuantity": -2.0, "AveragePrice": "5000.25", "TradeAccount": "Sim1"}
+FILL = {
+    "Type": 301,
+    "Symbol": "MESZ25",
+    "OrderStatus": 3,
+    "BuySell": 1,
+    "FilledQuantity": 1,
+    "AverageFillPrice": 5001.5,
+    "ServerOrderID": 42,
+    "TradeAccount": "Sim1",
+    "DateTime": 1_700_000_000,
+}
+
+
+class TestFromDtc:
+    def test_position_fields_are_coerced(self):
+        event = PositionUpdateEvent.from_dtc(POSITION)
+
+        assert event.quantity == -2 and isinstance(event.quantity, int)
+        assert event.average_price == 5000.25
+        assert (event.symbol, event.account, event.mode) == ("MESZ25", "Sim1", "SIM")
+        assert event.is_short and not event.is_flat
+
+    def test_position_accepts_legacy_aliases(self):
+        event = PositionUpdateEvent.from_dtc({"symbol": "ESZ25", "qty": 1, "avg_entry": None})
+
+        assert (event.symbol, event.quantity, event.average_price) == ("ESZ25", 1, None)
+        assert event.account == "" and event.mode == ""
+
+    def test_order_fill(self):
+        event = OrderUpdateEvent.from_dtc(FILL)
+
+        assert event.is_filled
+        assert event.server_order_id == "42"
+        assert event.date_time == 1_700_000_000.0
+        assert event.price1 is None and event.text is None
+
+    def test_balance_picks_first_available_value(self):
+        event = BalanceUpdateEvent.from_dtc({"Type": 600, "CashBalance": "1000", "AccountValue": 1200, "TradeAccount": "Sim1"})
+
+        assert event.balance == 1200.0
+        assert event.cash_balance == 1000.0
+
+    def test_events_are_frozen_and_slotted(self):
+        event = PositionUpdateEvent.from_dtc(POSITION)
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.quantity = 0
+
+
+class TestNormalizer:
+    @pytest.mark.parametrize(
+        ("msg", "cls"),
+        [
+            (POSITION, PositionUpdateEvent),
+            (FILL, OrderUpdateEvent),
+            ({"Type": 600, "CashBalance": 1.0}, BalanceUpdateEvent),
+            ({"Type": 401, "TradeAccount": " 120005 "}, TradeAccountEvent),
+        ],
+    )
+    def test_routes_to_typed_event(self, msg, cls):
+        assert isinstance(_dtc_to_app_event(msg), cls)
+
+    def test_trade_account_is_stripped(self):
+        assert _dtc_to_app_event({"Type": 401, "TradeAccount": " 120005 "}).account == "120005"
+
+
+class TestBusDelivery:
+    @pytest.fixture
+    def client(self, qapp):
+        client = DTCClientJSON()
+        yield client
+        client.deleteLater()
+
+    def _received(self, signal) -> list:
+        received: list = []
+        signal.connect(received.append)
+        return received
+
+    def test_event_object_is_the_payload(self, client):
+        bus = get_signal_bus()
+        received = self._received(bus.positionUpdated)
+        event = _dtc_to_app_event(POSITION)
+        try:
+            client._emit_app(event, POSITION)
+        finally:
+            bus.positionUpdated.disconnect(received.append)
+
+        assert received[0] is event
+
+    def test_flag_off_publishes_raw_dtc(self, client):
+        bus = get_signal_bus()
+        received = self._received(bus.orderUpdateReceived)
+        client._typed_events = False
+        try:
+            client._emit_app(_dtc_to_app_event(FILL), FILL)
+        finally:
+            bus.orderUpdateReceived.disconnect(received.append)
+
+        assert received[0] == FILL
+
+    def test_balance_keeps_float_signature(self, client):
+        bus = get_signal_bus()
+        received: list = []
+
+        def slot(balance, account):
+            received.append((balance, account))
+
+        bus.balanceUpdated.connect(slot)
+        try:
+            client._emit_app(_dtc_to_app_event({"Type": 600, "CashBalance": "250.5", "TradeAccount": "Sim1"}))
+            if bus.lanes is not None:
+                bus.lanes.drain()  # balances ride the per-frame lane
+        finally:
+            bus.balanceUpdated.disconnect(slot)
+
+        assert received == [(250.5, "Sim1")]
+
+
+def test_order_flow_accepts_typed_and_raw_payloads(qapp):
+    from panels.panel2.order_flow import OrderFlow
+
+    long_position = {**POSITION, "PositionQuantity": 2}
+    typed, raw = OrderFlow(), OrderFlow()
+    typed.on_position_update(PositionUpdateEvent.from_dtc(long_position))
+    raw.on_position_update(long_position)
+
+    for flow in (typed, raw):
+        state = flow.get_state()
+        assert state.has_position()
+        assert (state.entry_qty, state.entry_price, state.is_long) == (2, 5000.25, True)
+        assert (state.current_mode, state.current_account) == ("SIM", "Sim1")
@@ -0,0 +1,165 @@
+"""
+tests/test_warm_start.py
+
+Warm-start snapshot: decimation, save/load round trip and cache priming.
+"""
+from __future__ import annotations
+
+import time
+
+import orjson
+
+from services.warm_start import (
+    WARM_START_VERSION,
+    WarmStartCache,
+    curves_by_timeframe,
+    decimate_points,
+    merge_timeframe_curves,
+)
+
+
+class _State:
+    """Minimal StateManager stand-in (balance accessors only)."""
+
+    def __init__(self, sim: float = 10000.0, live: float = 0.0, account: str | None = "Sim1"):
+        self.current_mode = "SIM"
+        self.current_account = account
+        self.live_account_id = "120005"
+        self.balances = {"SIM": sim, "LIVE": live}
+
+    def get_balance_for_mode(self, mode: str) -> float:
+        return self.balances[mode]
+
+    def set_balance_for_mode(self, mode: str, balance: float) -> None:
+        self.balances[mode] = balance
+
+
+def _curve(n: int, end: float | None = None) -> list[tuple[float, float]]:
+    end = end or time.time()
+    return [(end - (n - i) * 60.0, 10000.0 + (i % 50) * 10.0 - (i % 7) * 3.0) for i in range(n)]
+
+
+class TestDecimation:
+    def test_keeps_short_series_and_bounds_long_ones(self):
+        short = _curve(10)
+        assert decimate_points(short) == short
+
+        points = _curve(5000)
+        points[2500] = (points[2500][0], 50000.0)  # spike must survive
+        out = decimate_points(points, max_points=100)
+
+        assert len(out) <= 100
+        assert out[0] == points[0] and out[-1] == points[-1]
+        assert (points[2500][0], 50000.0) in out
+        assert [p[0] for p in out] == sorted(p[0] for p in out)
+
+    def test_timeframe_curves_merge_back(self):
+        points = _curve(3000)
+        curves = curves_by_timeframe(points)
+
+        assert set(curves) == {"LIVE", "1D", "1W", "1M", "3M", "YTD"}
+        assert max(len(samples) for samples in curves.values()) <= 240
+        merged = merge_timeframe_curves(curves)
+        assert merged[-1][1] == round(points[-1][1], 2)
+        assert len(merged) < len(points)
+
+
+class TestWarmStartCache:
+    def test_collect_save_load_prime_round_trip(self, qapp, tmp_path):
+        from panels.panel1.equity_state import EquityStateManager
+        from services.stats_worker import StatsPrecomputeWorker
+
+        equity = EquityStateManager()
+        equity.prime_curve("SIM", "Sim1", _curve(500))
+        stats = StatsPrecomputeWorker()
+        stats.prime("SIM", "Sim1", {"1D": {"Total PnL": 125.0, "_trade_count": 3}})
+
+        cache = WarmStartCache(tmp_path / "warm.json")
+        assert cache.save(cache.collect(_State(sim=12345.5, live=800.0), equity, stats))
+
+        snapshot = cache.load()
+        assert snapshot["version"] == WARM_START_VERSION
+        assert orjson.loads((tmp_path / "warm.json").read_bytes()) == snapshot
+
+        state = _State()
+        fresh_equity = EquityStateManager()
+        fresh_stats = StatsPrecomputeWorker()
+        counts = cache.prime(snapshot, state=state, equity_state=fresh_equity, stats_worker=fresh_stats)
+
+        assert counts == {"balances": 2, "curves": 1, "stats": 1}
+        assert state.balances == {"SIM": 12345.5, "LIVE": 800.0}
+        assert fresh_equity.snapshot_curves()[("SIM", "Sim1")]
+        assert fresh_stats.get_cached("SIM", "Sim1", "1D") == {"Total PnL": 125.0, "_trade_count": 3}
+        # Primed stats are served but always refreshed
+        assert fresh_stats.is_stale("SIM", "Sim1", "1D")
+
+    def test_balances_are_keyed_by_account(self, tmp_path):
+        cache = WarmStartCache(tmp_path / "warm.json")
+        cache.save(cache.collect(_State(sim=11000.0)))
+        cache.save(cache.collect(_State(sim=9000.0, account="Sim2")))
+
+        snapshot = WarmStartCache(tmp_path / "warm.json").load()
+        assert {(b["mode"], b["account"]): b["balance"] for b in snapshot["balances"]} == {
+            ("SIM", "Sim1"): 11000.0,
+            ("SIM", "Sim2"): 9000.0,
+            ("LIVE", "120005"): 0.0,
+        }
+
+        state = _State(sim=10000.0, account="Sim1")
+        cache.prime(snapshot, state=state)
+        assert state.balances["SIM"] == 11000.0
+
+        # Account not in the snapshot: keep the default rather than another account's balance
+        state = _State(sim=10000.0, account="Sim3")
+        cache.prime(snapshot, state=state)
+        assert state.balances["SIM"] == 10000.0
+
+        # Account not known yet: the last session's active account
+        state = _State(sim=10000.0, account=None)
+        cache.prime(snapshot, state=state)
+        assert state.balances["SIM"] == 9000.0
+
+    def test_rejects_missing_corrupt_and_old_snapshots(self, tmp_path):
+        cache = WarmStartCache(tmp_path / "warm.json")
+        assert cache.load() == {}
+
+        cache.path.write_bytes(b"{not json")
+        assert cache.load() == {}
+
+        cache.save({"version": WARM_START_VERSION, "saved_at": time.time() - 3600})
+        assert cache.load(max_age=60) == {}
+        assert cache.load()["version"] == WARM_START_VERSION
+
+        cache.save({"version": WARM_START_VERSION + 1, "saved_at": time.time()})
+        assert cache.load() == {}
+
+
+class TestEquityWarmScope:
+    def test_primed_curve_is_served_then_replaced_by_db_load(self, qapp, monkeypatch):
+        from panels.panel1 import equity_state as equity_module
+
+        monkeypatch.setattr(equity_module, "HAS_QTCONCURRENT", False)
+        loads: list[tuple[str, str]] = []
+
+        def _fake_load(self, mode, account):
+            loads.append((mode, account))
+            return [(1.0, 10000.0), (2.0, 10100.0)]
+
+        monkeypatch.setattr(equity_module.EquityStateManager, "_load_equity_curve_from_database", _fake_load)
+
+        manager = equity_module.EquityStateManager()
+        manager.prime_curve("SIM", "Sim1", [(1.0, 9000.0)])
+        manager.set_scope("SIM", "Sim1")
+        assert manager.get_active_curve() == [(1.0, 9000.0)]
+
+        # First read triggers the reconcile load; the DB result wins
+        assert manager.get_equity_curve("SIM", "Sim1") == [(1.0, 10000.0), (2.0, 10100.0)]
+        assert manager.get_active_curve() == [(1.0, 10000.0), (2.0, 10100.0)]
+
+        # Once reconciled the scope is a normal cache hit
+        manager.get_equity_curve("SIM", "Sim1")
+        assert loads == [("SIM", "Sim1")]
+
+        # Priming never overwrites a loaded scope
+        manager.prime_curve("SIM", "Sim1", [(1.0, 1.0)])
+        assert manager.get_active_curve() == [(1.0, 10000.0), (2.0, 10100.0)]
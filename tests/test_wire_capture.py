@@ -0,0 +1,180 @@
+"""
+tests/test_wire_capture.py
+
+Tests for DTC wire capture files and replay through DTCClientJSON.
+"""
+from __future__ import annotations
+
+import time
+
+import orjson
+import pytest
+
+from core.wire_capture import WireRecorder, iter_capture, read_header, replay_capture
+from services.dtc_constants import ACCOUNT_BALANCE_UPDATE, HEARTBEAT
+
+
+def _frames(n: int) -> list[bytes]:
+    return [orjson.dumps({"Type": HEARTBEAT, "Seq": i}) for i in range(n)]
+
+
+class TestWireRecorder:
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_round_trip_preserves_frames_and_order(self, tmp_path, compress):
+        path = tmp_path / "capture.bin"
+        frames = _frames(500)
+
+        recorder = WireRecorder(path, compress=compress)
+        for i, frame in enumerate(frames):
+            recorder.record(frame, t_ns=recorder._mono_start + i * 1000)
+        recorder.close()
+
+        assert read_header(path).compressed is compress
+        records = list(iter_capture(path))
+        assert [frame for _, frame in records] == frames
+        assert [t for t, _ in records] == [i * 1000 for i in range(500)]
+        assert recorder.stats()["frames"] == 500
+        assert recorder.stats()["dropped"] == 0
+
+    def test_restart_rotates_previous_capture(self, tmp_path, monkeypatch):
+        path = tmp_path / "capture.bin"
+        first = WireRecorder(path)
+        first.record(_frames(1)[0])
+        first.close()
+
+        # A new process (later time base) must not append to or truncate it
+        monkeypatch.setattr("core.wire_capture._PROCESS_START_WALL", time.time() + 1.0)
+        second = WireRecorder(path, resume=True)
+        second.close()
+
+        assert [frame for _, frame in iter_capture(second.previous_path)] == _frames(1)
+        assert list(iter_capture(path)) == []
+
+    def test_resume_appends_in_the_same_process(self, tmp_path):
+        path = tmp_path / "capture.bin"
+        frames = _frames(4)
+        first = WireRecorder(path, compress=False)
+        first.record(frames[0])
+        first.record(frames[1])
+        first.close()
+
+        second = WireRecorder(path, compress=True, resume=True)
+        second.record(frames[2])
+        second.record(frames[3])
+        second.close()
+
+        assert second.compress is False  # keeps the file's encoding
+        records = list(iter_capture(path))
+        assert [frame for _, frame in records] == frames
+        assert [t for t, _ in records] == sorted(t for t, _ in records)
+        assert not second.previous_path.exists()
+
+    def test_truncated_file_reads_complete_blocks(self, tmp_path):
+        path = tmp_path / "capture.bin"
+        recorder = WireRecorder(path, compress=True)
+        recorder.record(b'{"Type":3}')
+        recorder._wake.set()  # force a block out before the second record
+        for _ in range(100):
+            if recorder.bytes_written > 24:
+                break
+            time.sleep(0.01)
+        recorder.record(b'{"Type":3,"Seq":2}')
+        recorder.close()
+
+        data = path.read_bytes()
+        path.write_bytes(data[:-3])  # cut the last block short
+        assert [frame for _, frame in iter_capture(path)] == [b'{"Type":3}']
+
+    def test_drops_when_writer_is_behind(self, tmp_path):
+        recorder = WireRecorder(tmp_path / "capture.bin", flush_interval=60.0, max_pending_bytes=64)
+        accepted = [recorder.record(b"x" * 40) for _ in range(5)]
+        recorder.close()
+
+        assert accepted[0] is True
+        assert False in accepted
+        assert recorder.stats()["dropped"] == accepted.count(False)
+        assert len(list(iter_capture(recorder.path))) == accepted.count(True)
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "not_a_capture.bin"
+        path.write_bytes(b"\x00" * 64)
+        with pytest.raises(ValueError):
+            read_header(path)
+
+
+class TestReplay:
+    def test_paced_replay_honours_recorded_offsets(self, tmp_path):
+        path = tmp_path / "capture.bin"
+        recorder = WireRecorder(path, compress=False)
+        recorder.record(b"a", t_ns=recorder._mono_start)
+        recorder.record(b"b", t_ns=recorder._mono_start + 200_000_000)
+        recorder.close()
+
+        seen: list[bytes] = []
+        fast = replay_capture(path, seen.append)
+        paced = replay_capture(path, seen.append, speed=2.0)
+
+        assert seen == [b"a", b"b", b"a", b"b"]
+        assert fast["elapsed_s"] < 0.05
+        assert paced["elapsed_s"] >= 0.09
+
+    def test_client_replay_reaches_signal_bus(self, qapp, tmp_path):
+        from core.data_bridge import DTCClientJSON
+        from core.signal_bus import get_signal_bus
+
+        path = tmp_path / "capture.bin"
+        recorder = WireRecorder(path)
+        for i in range(3):
+            recorder.record(
+                orjson.dumps(
+                    {"Type": ACCOUNT_BALANCE_UPDATE, "TradeAccount": "Sim1", "CashBalance": 10000.0 + i}
+                )
+            )
+        recorder.close()
+
+        client = DTCClientJSON(host="127.0.0.1", port=0, _sim_mode=True)
+        balances: list = []
+        bus = get_signal_bus()
+
+        def _on_balance(*args):
+            balances.append(args)
+
+        bus.balanceUpdated.connect(_on_balance)
+        try:
+            stats = client.replay_capture(str(path))
+            if bus.lanes is not None:
+                bus.lanes.drain()
+        finally:
+            bus.balanceUpdated.disconnect(_on_balance)
+            client.deleteLater()
+
+        assert stats["frames"] == 3
+        if bus.lanes is not None:
+            # One account: the normal lane coalesces to the latest balance
+            assert balances == [(10002.0, "Sim1")]
+        else:
+            assert len(balances) == 3
+
+    def test_client_resumes_capture_after_reconnect(self, qapp, tmp_path):
+        from core.data_bridge import DTCClientJSON
+
+        path = tmp_path / "capture.bin"
+        client = DTCClientJSON(host="127.0.0.1", port=1, _sim_mode=True)
+        try:
+            client.start_capture(str(path))
+            client._recorder.record(_frames(1)[0])
+            client.disconnect()
+            assert client._recorder is None
+
+            client.connect()
+            assert client._recorder is not None
+            client._recorder.record(_frames(2)[1])
+            client.stop_capture()
+            client.connect()  # explicit stop: not resumed
+            assert client._recorder is None
+        finally:
+            client.disconnect()
+            client.deleteLater()
+
+        assert [frame for _, frame in iter_capture(path)] == _frames(2)
+
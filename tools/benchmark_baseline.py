@@ -0,0 +1,203 @@
+"""
+Benchmark baselines and regression checks for tests/benchmarks.
+
+The benchmark suite (APPSIERRA_BENCH=1 pytest tests/benchmarks) writes every
+run to reports/benchmarks/latest.json. A run is compared against
+reports/benchmarks/baseline.json benchmark by benchmark. A benchmark
+regresses only when both of these hold:
+
+- it is statistically slower: a one-sided Mann-Whitney U test on the per-op
+  timing samples gives p < ALPHA. The test is rank based, so a single noisy
+  sample does not decide the result.
+- it is practically slower: the median slowed by more than MIN_SLOWDOWN.
+
+Baselines are machine specific. Each file records a machine fingerprint,
+and comparing runs from different machines only warns.
+
+Usage:
+    python -m tools.benchmark_baseline                  # compare latest vs baseline
+    python -m tools.benchmark_baseline --promote        # latest becomes the baseline
+    python -m tools.benchmark_baseline --latest a.json --baseline b.json --out report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+from pathlib import Path
+import platform
+import shutil
+import statistics
+import sys
+from typing import Any
+
+
+try:
+    from tools._common import DEFAULT_REPORTS, add_common_args, write_json
+except Exception:
+    from _common import DEFAULT_REPORTS, add_common_args, write_json
+
+__scope__ = "performance.benchmark_baseline"
+
+BENCH_DIR = DEFAULT_REPORTS / "benchmarks"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+LATEST_PATH = BENCH_DIR / "latest.json"
+
+#: Significance level of the one-sided Mann-Whitney U test
+ALPHA = 0.01
+
+#: Median slowdown below this is never reported (noise floor)
+MIN_SLOWDOWN = 0.10
+
+BASELINE_FORMAT = 1
+
+
+def machine_fingerprint() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Median/IQR/mean/min of per-op timings (seconds)."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        return {"n": 0, "median": 0.0, "iqr": 0.0, "mean": 0.0, "min": 0.0}
+    q1, q3 = (statistics.quantiles(ordered, n=4)[0::2] if n >= 2 else (ordered[0], ordered[0]))
+    return {
+        "n": n,
+        "median": statistics.median(ordered),
+        "iqr": q3 - q1,
+        "mean": statistics.fmean(ordered),
+        "min": ordered[0],
+    }
+
+
+def mann_whitney_greater(current: list[float], baseline: list[float]) -> float:
+    """
+    One-sided p-value for "current tends to be larger (slower) than baseline".
+
+    Normal approximation with tie correction and continuity correction.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    pooled = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        t = j - i + 1
+        tie_term += t**3 - t
+        i = j + 1
+
+    r1 = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2.0
+    mean_u = n1 * n2 / 2.0
+    n = n1 + n2
+    var_u = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0
+    z = (u1 - mean_u - 0.5) / math.sqrt(var_u)
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def compare_samples(
+    current: list[float],
+    baseline: list[float],
+    alpha: float = ALPHA,
+    min_slowdown: float = MIN_SLOWDOWN,
+) -> dict[str, Any]:
+    """Regression verdict for one benchmark."""
+    cur, base = summarize(current), summarize(baseline)
+    ratio = cur["median"] / base["median"] if base["median"] > 0 else 1.0
+    p_value = mann_whitney_greater(current, baseline)
+    return {
+        "ratio": round(ratio, 4),
+        "p_value": round(p_value, 6),
+        "regressed": p_value < alpha and ratio > 1.0 + min_slowdown,
+        "median_s": cur["median"],
+        "baseline_median_s": base["median"],
+    }
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def compare_runs(latest: dict[str, Any], baseline: dict[str, Any]) -> dict[str, Any]:
+    """Compare every benchmark present in both runs."""
+    rows: dict[str, Any] = {}
+    base_benchmarks = baseline.get("benchmarks", {})
+    for key, entry in sorted(latest.get("benchmarks", {}).items()):
+        base = base_benchmarks.get(key)
+        if base is None:
+            rows[key] = {"status": "new"}
+            continue
+        verdict = compare_samples(entry["samples"], base["samples"])
+        verdict["status"] = "regressed" if verdict["regressed"] else "ok"
+        rows[key] = verdict
+    same_machine = latest.get("machine") == baseline.get("machine")
+    return {
+        "same_machine": same_machine,
+        "regressions": [key for key, row in rows.items() if row.get("regressed")],
+        "benchmarks": rows,
+    }
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Compare benchmark runs against the stored baseline")
+    ap.add_argument("--latest", default=str(LATEST_PATH), help="Run to check (default: reports/benchmarks/latest.json)")
+    ap.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline (default: reports/benchmarks/baseline.json)")
+    ap.add_argument("--promote", action="store_true", help="Copy the latest run over the baseline and exit")
+    add_common_args(ap)
+    args = ap.parse_args(argv)
+
+    latest_path, baseline_path = Path(args.latest), Path(args.baseline)
+    if args.promote:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(latest_path, baseline_path)
+        print(f"Baseline updated from {latest_path}")
+        return 0
+
+    latest, baseline = load_results(latest_path), load_results(baseline_path)
+    if not latest or not baseline:
+        print(f"Nothing to compare (latest: {bool(latest)}, baseline: {bool(baseline)})")
+        return 0
+
+    report = compare_runs(latest, baseline)
+    if args.out:
+        write_json(report, Path(args.out))
+    if not args.quiet:
+        if not report["same_machine"]:
+            print("WARNING: baseline was recorded on a different machine; regressions are advisory")
+        for key, row in report["benchmarks"].items():
+            if row["status"] == "new":
+                print(f"  new        {key}")
+            else:
+                print(f"  {row['status']:<10} {key}  x{row['ratio']:.2f}  p={row['p_value']:.4f}")
+    if report["regressions"]:
+        print(f"{len(report['regressions'])} benchmark(s) regressed: {', '.join(report['regressions'])}")
+        return 1 if report["same_machine"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
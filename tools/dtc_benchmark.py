@@ -0,0 +1,212 @@
+"""
+DTC client load/latency benchmark.
+
+Drives the real DTCClientJSON against the in-repo DTC simulator
+(tools/dtc_simulator.py) and reports:
+
+- throughput: messages delivered to SignalBus slots per second
+- latency: p50/p99/max from simulator send to SignalBus slot (the simulator
+  stamps each message with time.monotonic_ns(); both ends share the clock
+  because they run in one process). Balance updates ride the SignalBus
+  normal lane (core/bus_lanes.py): every balance frame waiting for a frame
+  flush counts as delivered, with its own wait, when the flush lands
+- UI stall: gaps in a 5 ms GUI-thread probe timer (max gap, total time
+  spent in gaps over STALL_THRESHOLD_MS)
+
+Usage:
+    python -m tools.dtc_benchmark --rate 20000 --count 100000
+    python -m tools.dtc_benchmark --rate 50000 --count 200000 --kinds order
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+
+try:
+    from tools._common import DEFAULT_REPORTS, add_common_args, write_json
+    from tools.dtc_simulator import STREAM_KINDS, DTCSimulator, SimulatorConfig, StreamConfig
+except Exception:
+    from _common import DEFAULT_REPORTS, add_common_args, write_json
+    from dtc_simulator import STREAM_KINDS, DTCSimulator, SimulatorConfig, StreamConfig
+
+__scope__ = "performance.dtc_benchmark"
+
+PROBE_INTERVAL_MS = 5
+STALL_THRESHOLD_MS = 50.0
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[idx]
+
+
+def run_benchmark(
+    rate: float = 10000.0,
+    count: int = 20000,
+    kinds: tuple[str, ...] = STREAM_KINDS,
+    fills: int = 0,
+    timeout: float = 60.0,
+) -> dict[str, Any]:
+    """Run one simulator -> DTCClientJSON -> SignalBus pass and return the report."""
+    from PyQt6 import QtCore, QtWidgets
+
+    from core.bus_lanes import NORMAL, lane_of
+    from core.data_bridge import DTCClientJSON
+    from core.signal_bus import get_signal_bus
+    from services.dtc_constants import ACCOUNT_BALANCE_UPDATE
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    sim = DTCSimulator(
+        port=0,
+        config=SimulatorConfig(
+            historical_fills=fills,
+            stream=StreamConfig(rate=rate, count=count, kinds=kinds),
+        ),
+    )
+    port = sim.start_in_thread()
+    client = DTCClientJSON(host="127.0.0.1", port=port)
+    bus = get_signal_bus()
+
+    # The raw frame signal fires right before routing; stash its send stamp so
+    # the SignalBus slot (direct connection, same call stack) can measure it.
+    current_ts = [0]
+    latencies_ns: list[int] = []
+    delivered = [0]
+    first_last = [0, 0]
+    # Balance frames queued in the normal lane, waiting for the next flush
+    balances_laned = bus.lanes is not None and lane_of("balanceUpdated") == NORMAL
+    pending_balance_ts: list[int] = []
+
+    def _on_raw(msg: dict) -> None:
+        if balances_laned and msg.get("Type") == ACCOUNT_BALANCE_UPDATE:
+            pending_balance_ts.append(msg.get("SimTs", 0))
+        else:
+            current_ts[0] = msg.get("SimTs", 0)
+
+    def _record(now: int, ts: int) -> None:
+        latencies_ns.append(now - ts)
+        delivered[0] += 1
+        if not first_last[0]:
+            first_last[0] = now
+        first_last[1] = now
+
+    def _on_slot(*_args: Any) -> None:
+        ts = current_ts[0]
+        if ts:
+            _record(time.monotonic_ns(), ts)
+            current_ts[0] = 0
+
+    def _on_balance(*_args: Any) -> None:
+        if not balances_laned:
+            _on_slot()
+            return
+        now = time.monotonic_ns()
+        for ts in pending_balance_ts:
+            if ts:
+                _record(now, ts)
+        pending_balance_ts.clear()
+
+    client.message.connect(_on_raw)
+    slots = ((bus.orderUpdateReceived, _on_slot), (bus.positionUpdated, _on_slot), (bus.balanceUpdated, _on_balance))
+    for signal, slot in slots:
+        signal.connect(slot)
+
+    # GUI-thread stall probe
+    gaps_ms: list[float] = []
+    last_tick = [time.perf_counter()]
+
+    def _probe() -> None:
+        now = time.perf_counter()
+        gaps_ms.append((now - last_tick[0]) * 1000.0)
+        last_tick[0] = now
+
+    probe = QtCore.QTimer()
+    probe.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+    probe.timeout.connect(_probe)
+    probe.start(PROBE_INTERVAL_MS)
+
+    started = time.perf_counter()
+    client.connect()
+    deadline = started + timeout
+    try:
+        while delivered[0] < count and time.perf_counter() < deadline:
+            app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+            time.sleep(0.0005)
+    finally:
+        probe.stop()
+        for signal, slot in slots:
+            signal.disconnect(slot)
+        client.message.disconnect(_on_raw)
+        client.disconnect()
+        # No reconnect attempts against a simulator that is going away
+        if client._reconnect_timer is not None:
+            client._reconnect_timer.stop()
+        sim.stop()
+
+    lat_ms = sorted(ns / 1e6 for ns in latencies_ns)
+    span_s = (first_last[1] - first_last[0]) / 1e9 if delivered[0] > 1 else 0.0
+    stalls = [g for g in gaps_ms if g > STALL_THRESHOLD_MS]
+
+    return {
+        "target_rate": rate,
+        "count": count,
+        "kinds": list(kinds),
+        "delivered": delivered[0],
+        "dropped_or_late": count - delivered[0],
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "throughput_msgs_s": round(delivered[0] / span_s, 1) if span_s else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(lat_ms, 50), 3),
+            "p99": round(_percentile(lat_ms, 99), 3),
+            "max": round(lat_ms[-1], 3) if lat_ms else 0.0,
+        },
+        "ui_stall": {
+            "probe_interval_ms": PROBE_INTERVAL_MS,
+            "max_gap_ms": round(max(gaps_ms), 2) if gaps_ms else 0.0,
+            "stalls_over_threshold": len(stalls),
+            "stall_ms": round(sum(stalls), 2),
+        },
+        "request_rtt_ms": client.request_rtt_ms,
+        "request_latency": client.request_latency_stats(),
+    }
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark DTCClientJSON against the local DTC simulator")
+    ap.add_argument("--rate", type=float, default=10000.0, help="Stream rate (msgs/s)")
+    ap.add_argument("--count", type=int, default=20000, help="Messages to stream")
+    ap.add_argument("--kinds", default="order,position,balance", help="Comma list: order,position,balance")
+    ap.add_argument("--fills", type=int, default=0, help="Historical fills returned at startup")
+    ap.add_argument("--timeout", type=float, default=60.0, help="Give up after N seconds")
+    add_common_args(ap)
+    ap.set_defaults(out=str(DEFAULT_REPORTS / "dtc_benchmark.json"))
+    args = ap.parse_args(argv)
+
+    kinds = tuple(k.strip() for k in args.kinds.split(",") if k.strip())
+    report = run_benchmark(args.rate, args.count, kinds, args.fills, args.timeout)
+
+    out_path = Path(args.out)
+    write_json(report, out_path)
+    if not args.quiet:
+        lat = report["latency_ms"]
+        stall = report["ui_stall"]
+        print(
+            f"delivered {report['delivered']}/{report['count']} "
+            f"@ {report['throughput_msgs_s']:,.0f} msg/s | "
+            f"latency p50 {lat['p50']} ms p99 {lat['p99']} ms | "
+            f"UI max gap {stall['max_gap_ms']} ms, stalled {stall['stall_ms']} ms"
+        )
+        print(f"DTC benchmark written to {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,79 @@
+"""
+Replay a DTC wire capture through DTCClientJSON._handle_frame.
+
+Turns a capture recorded in production (DTC_CAPTURE_PATH=...) into a
+deterministic benchmark: the frames go through the real decode/normalize/
+SignalBus path without a socket, either as fast as possible or at the
+recorded pace.
+
+Usage:
+    python -m tools.dtc_replay logs/dtc_capture.bin
+    python -m tools.dtc_replay logs/dtc_capture.bin --speed 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+from typing import Any, Optional
+
+
+try:
+    from tools._common import DEFAULT_REPORTS, add_common_args, write_json
+except Exception:
+    from _common import DEFAULT_REPORTS, add_common_args, write_json
+
+__scope__ = "performance.dtc_replay"
+
+
+def run_replay(path: str, speed: Optional[float] = None) -> dict[str, Any]:
+    """Replay one capture and return the stats plus capture metadata."""
+    from PyQt6 import QtWidgets
+
+    from core.data_bridge import DTCClientJSON
+    from core.wire_capture import read_header
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    header = read_header(path)
+    client = DTCClientJSON(host="127.0.0.1", port=0, _sim_mode=True)
+    try:
+        stats = client.replay_capture(path, speed=speed, on_wait=app.processEvents)
+        app.processEvents()
+    finally:
+        client.deleteLater()
+
+    return {
+        "capture": str(path),
+        "compressed": header.compressed,
+        "recorded_at": header.wall_start,
+        "speed": speed,
+        **stats,
+    }
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Replay a DTC wire capture through DTCClientJSON")
+    ap.add_argument("capture", help="Capture file written by core.wire_capture.WireRecorder")
+    ap.add_argument("--speed", type=float, default=None, help="Pace multiplier (omit = as fast as possible)")
+    add_common_args(ap)
+    ap.set_defaults(out=str(DEFAULT_REPORTS / "dtc_replay.json"))
+    args = ap.parse_args(argv)
+
+    report = run_replay(args.capture, args.speed)
+
+    out_path = Path(args.out)
+    write_json(report, out_path)
+    if not args.quiet:
+        handle = report["handle_ms"]
+        print(
+            f"replayed {report['frames']} frames in {report['elapsed_s']} s "
+            f"({report['frames_per_s']:,.0f} frames/s) | "
+            f"handle p50 {handle['p50']} ms p99 {handle['p99']} ms max {handle['max']} ms"
+        )
+        print(f"DTC replay written to {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,402 @@
+"""
+Local DTC JSON server simulator.
+
+A small asyncio server that speaks enough of the DTC JSON protocol (null-
+terminated frames) to drive DTCClientJSON without Sierra Chart:
+
+- Logon / heartbeat handshake (heartbeats are answered immediately)
+- TradeAccountsRequest (400), OpenOrdersRequest (305),
+  HistoricalOrderFillsRequest (303) and AccountBalanceRequest (601), answered
+  with correctly numbered multi-message responses
+- OrderUpdate / PositionUpdate / AccountBalanceUpdate streams, randomized
+  (seeded) or replayed from a JSONL script, at up to ~50k msgs/s
+
+Every streamed message carries "SimTs" (time.monotonic_ns() at send) so an
+in-process consumer can compute send-to-slot latency.
+
+Usage:
+    # Standalone server (point the app at 127.0.0.1:11199)
+    python -m tools.dtc_simulator --port 11199 --rate 5000 --count 100000
+
+    # Embedded (benchmarks/tests)
+    sim = DTCSimulator(port=0, config=SimulatorConfig(stream=StreamConfig(rate=20000, count=50000)))
+    port = sim.start_in_thread()
+    ...
+    sim.stop()
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import random
+import sys
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+import orjson
+
+from services.dtc_constants import (
+    ACCOUNT_BALANCE_REQUEST,
+    ACCOUNT_BALANCE_UPDATE,
+    HEARTBEAT,
+    HISTORICAL_ORDER_FILL_RESPONSE,
+    HISTORICAL_ORDER_FILLS_REQUEST,
+    LOGON_REQUEST,
+    LOGON_RESPONSE,
+    OPEN_ORDERS_REQUEST,
+    ORDER_UPDATE,
+    POSITION_UPDATE,
+    TRADE_ACCOUNT_RESPONSE,
+    TRADE_ACCOUNTS_REQUEST,
+)
+
+__scope__ = "dtc.simulator"
+
+STREAM_KINDS = ("order", "position", "balance")
+
+
+@dataclass
+class StreamConfig:
+    """What to push after logon (count=0 disables streaming)."""
+
+    rate: float = 1000.0  # messages per second
+    count: int = 0
+    kinds: tuple[str, ...] = STREAM_KINDS
+    seed: int = 1
+    script: Optional[Path] = None  # JSONL file of DTC dicts (overrides random)
+    start_delay: float = 0.5  # seconds after logon (lets initial requests settle)
+
+
+@dataclass
+class SimulatorConfig:
+    accounts: tuple[str, ...] = ("Sim1", "120005")
+    symbol: str = "MESZ25"
+    historical_fills: int = 0
+    open_orders: int = 0
+    balance: float = 10000.0
+    heartbeat_interval: float = 5.0
+    stream: StreamConfig = field(default_factory=StreamConfig)
+
+
+class DTCSimulator:
+    """Asyncio DTC JSON server. One instance serves any number of clients."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[SimulatorConfig] = None):
+        self.host = host
+        self.port = port  # 0 = pick a free port (see .port after start)
+        self.config = config or SimulatorConfig()
+
+        self.sent = 0
+        self.received = 0
+        self.stream_done = threading.Event()
+        self.ready = threading.Event()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------ lifecycle
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.ready.set()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self, timeout: float = 5.0) -> int:
+        """Run the server on a daemon thread with its own loop. Returns the port."""
+
+        def _run() -> None:
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.serve_forever())
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=_run, name="DTCSimulator", daemon=True)
+        self._thread.start()
+        if not self.ready.wait(timeout):
+            raise RuntimeError("DTC simulator did not start")
+        return self.port
+
+    def stop(self, timeout: float = 2.0) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+
+        def _shutdown() -> None:
+            if self._server is not None:
+                self._server.close()
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+
+        loop.call_soon_threadsafe(_shutdown)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    # ------------------------------------------------------------- protocol
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        stream_task: Optional[asyncio.Task] = None
+        hb_task: Optional[asyncio.Task] = None
+        try:
+            while True:
+                try:
+                    raw = await reader.readuntil(b"\x00")
+                except asyncio.IncompleteReadError:
+                    break
+                raw = raw[:-1]
+                if not raw:
+                    continue
+                try:
+                    msg = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    continue
+                self.received += 1
+
+                for reply in self._respond(msg):
+                    self._write(writer, reply)
+
+                if msg.get("Type") == LOGON_REQUEST:
+                    hb_task = asyncio.create_task(self._heartbeat_loop(writer))
+                    if self.config.stream.count > 0 or self.config.stream.script:
+                        stream_task = asyncio.create_task(self._stream(writer))
+
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            for task in (stream_task, hb_task):
+                if task is not None:
+                    task.cancel()
+            writer.close()
+
+    def _respond(self, msg: dict) -> list[dict]:
+        cfg = self.config
+        msg_type = msg.get("Type")
+        request_id = msg.get("RequestID", 0)
+
+        if msg_type == LOGON_REQUEST:
+            return [
+                {
+                    "Type": LOGON_RESPONSE,
+                    "ProtocolVersion": 8,
+                    "Result": 1,
+                    "ResultText": "Logon successful (simulator)",
+                    "ServerName": "APPSIERRA-SIM",
+                    "TradingIsSupported": 1,
+                    "OrderCancelReplaceSupported": 1,
+                    "HistoricalPriceDataSupported": 0,
+                }
+            ]
+
+        if msg_type == HEARTBEAT:
+            return [{"Type": HEARTBEAT, "CurrentDateTime": int(time.time())}]
+
+        if msg_type == TRADE_ACCOUNTS_REQUEST:
+            total = len(cfg.accounts)
+            return [
+                {
+                    "Type": TRADE_ACCOUNT_RESPONSE,
+                    "RequestID": request_id,
+                    "TradeAccount": account,
+                    "MessageNumber": i,
+                    "TotalNumberMessages": total,
+                }
+                for i, account in enumerate(cfg.accounts, start=1)
+            ]
+
+        if msg_type == OPEN_ORDERS_REQUEST:
+            if cfg.open_orders <= 0:
+                return [{"Type": ORDER_UPDATE, "RequestID": request_id, "NoOrders": 1, "TotalNumMessages": 1, "MessageNumber": 1}]
+            rng = random.Random(cfg.stream.seed)
+            return [
+                {
+                    **self._order_update(rng, i),
+                    "RequestID": request_id,
+                    "MessageNumber": i,
+                    "TotalNumMessages": cfg.open_orders,
+                    "OrderStatus": 1,
+                }
+                for i in range(1, cfg.open_orders + 1)
+            ]
+
+        if msg_type == HISTORICAL_ORDER_FILLS_REQUEST:
+            if cfg.historical_fills <= 0:
+                return [{"Type": HISTORICAL_ORDER_FILL_RESPONSE, "RequestID": request_id, "NoOrderFills": 1}]
+            return list(self._historical_fills(request_id, msg.get("StartDateTime")))
+
+        if msg_type == ACCOUNT_BALANCE_REQUEST:
+            return [
+                {
+                    "Type": ACCOUNT_BALANCE_UPDATE,
+                    "RequestID": request_id,
+                    "TradeAccount": msg.get("TradeAccount") or cfg.accounts[-1],
+                    "CashBalance": cfg.balance,
+                    "BalanceAvailableForNewPositions": cfg.balance,
+                    "MessageNumber": 1,
+                    "TotalNumberMessages": 1,
+                }
+            ]
+
+        return []
+
+    def _historical_fills(self, request_id: int, start_ts: Any) -> Iterator[dict]:
+        cfg = self.config
+        rng = random.Random(cfg.stream.seed)
+        total = cfg.historical_fills
+        start = int(start_ts or time.time() - 30 * 86400)
+        step = max(1, int((time.time() - start) / total))
+        for i in range(1, total + 1):
+            yield {
+                "Type": HISTORICAL_ORDER_FILL_RESPONSE,
+                "RequestID": request_id,
+                "MessageNumber": i,
+                "TotalNumberMessages": total,
+                "Symbol": cfg.symbol,
+                "ServerOrderID": f"SIM-O{i}",
+                "UniqueExecutionID": f"SIM-E{i}",
+                "BuySell": 1 if i % 2 else 2,
+                "Price": round(5000.0 + rng.uniform(-50, 50), 2),
+                "Quantity": rng.randint(1, 3),
+                "DateTime": start + i * step,
+                "TradeAccount": cfg.accounts[i % len(cfg.accounts)],
+            }
+
+    async def _heartbeat_loop(self, writer: asyncio.StreamWriter) -> None:
+        while True:
+            await asyncio.sleep(self.config.heartbeat_interval)
+            self._write(writer, {"Type": HEARTBEAT, "CurrentDateTime": int(time.time())})
+            await writer.drain()
+
+    # -------------------------------------------------------------- streams
+
+    async def _stream(self, writer: asyncio.StreamWriter) -> None:
+        cfg = self.config.stream
+        await asyncio.sleep(cfg.start_delay)
+
+        messages = self._scripted(cfg.script) if cfg.script else self._randomized(cfg)
+
+        # Pace in ~1 ms batches: one write per batch keeps 50k msg/s feasible
+        batch_interval = 0.001
+        per_batch = max(1, int(cfg.rate * batch_interval))
+        started = time.perf_counter()
+        sent = 0
+        batch = bytearray()
+
+        for msg in messages:
+            msg["SimTs"] = time.monotonic_ns()
+            batch += orjson.dumps(msg) + b"\x00"
+            sent += 1
+            if sent % per_batch:
+                continue
+            writer.write(bytes(batch))
+            batch.clear()
+            self.sent += per_batch
+            await writer.drain()
+            # Sleep until this message is due (absolute schedule, no drift)
+            delay = started + sent / cfg.rate - time.perf_counter()
+            await asyncio.sleep(delay if delay > 0 else 0)
+
+        if batch:
+            writer.write(bytes(batch))
+            self.sent += sent % per_batch
+            await writer.drain()
+        self.stream_done.set()
+
+    def _randomized(self, cfg: StreamConfig) -> Iterator[dict]:
+        rng = random.Random(cfg.seed)
+        kinds = [k for k in cfg.kinds if k in STREAM_KINDS] or list(STREAM_KINDS)
+        for i in range(1, cfg.count + 1):
+            kind = kinds[i % len(kinds)]
+            if kind == "order":
+                yield self._order_update(rng, i)
+            elif kind == "position":
+                yield {
+                    "Type": POSITION_UPDATE,
+                    "Symbol": self.config.symbol,
+                    "TradeAccount": self.config.accounts[0],
+                    "Quantity": rng.randint(0, 3),
+                    "AveragePrice": round(5000.0 + rng.uniform(-20, 20), 2),
+                }
+            else:
+                yield {
+                    "Type": ACCOUNT_BALANCE_UPDATE,
+                    "TradeAccount": self.config.accounts[-1],
+                    "CashBalance": round(self.config.balance + rng.uniform(-500, 500), 2),
+                }
+
+    def _order_update(self, rng: random.Random, i: int) -> dict:
+        price = round(5000.0 + rng.uniform(-20, 20), 2)
+        return {
+            "Type": ORDER_UPDATE,
+            "Symbol": self.config.symbol,
+            "TradeAccount": self.config.accounts[0],
+            "ServerOrderID": f"SIM-S{i}",
+            "ClientOrderID": f"SIM-C{i}",
+            "BuySell": 1 if i % 2 else 2,
+            "OrderStatus": 1,  # Open: flows through routing but never closes a trade
+            "OrderType": 2,
+            "Price1": price,
+            "Quantity": 1,
+            "FilledQuantity": 0,
+        }
+
+    @staticmethod
+    def _scripted(path: Path) -> Iterator[dict]:
+        with Path(path).open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def _write(self, writer: asyncio.StreamWriter, msg: dict) -> None:
+        writer.write(orjson.dumps(msg) + b"\x00")
+        self.sent += 1
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Run a local DTC JSON server simulator")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=11199)
+    ap.add_argument("--rate", type=float, default=1000.0, help="Stream rate (msgs/s, up to ~50000)")
+    ap.add_argument("--count", type=int, default=0, help="Messages to stream after logon (0 = none)")
+    ap.add_argument("--kinds", default="order,position,balance", help="Comma list: order,position,balance")
+    ap.add_argument("--script", type=str, help="JSONL file of DTC messages to replay instead")
+    ap.add_argument("--fills", type=int, default=0, help="Historical fills to return for Type 303")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    config = SimulatorConfig(
+        historical_fills=args.fills,
+        stream=StreamConfig(
+            rate=args.rate,
+            count=args.count,
+            kinds=tuple(k.strip() for k in args.kinds.split(",") if k.strip()),
+            seed=args.seed,
+            script=Path(args.script) if args.script else None,
+        ),
+    )
+    sim = DTCSimulator(args.host, args.port, config)
+    print(f"DTC simulator listening on {args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        asyncio.run(sim.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -15,6 +15,18 @@ except Exception:
 
 __scope__ = "reporting.metrics_exporter"
 
+HISTOGRAM_COLUMNS = ("name", "count", "mean_ms", "p50_ms", "p90_ms", "p99_ms", "p99.9_ms", "max_ms")
+
+
+def default_metrics_dir() -> str:
+    """METRICS_DUMP_DIR from config.settings (where core/metrics.py writes dumps)."""
+    repo = Path(__file__).resolve().parents[1]
+    if str(repo) not in sys.path:
+        sys.path.insert(0, str(repo))
+    from config.settings import METRICS_DUMP_DIR
+
+    return METRICS_DUMP_DIR
+
 
 def gather(paths: list[Path]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
@@ -29,18 +41,75 @@ def gather(paths: list[Path]) -> list[dict[str, Any]]:
     return rows
 
 
+def aggregate_metrics(directory: Path) -> dict[str, Any]:
+    """
+    Merge core/metrics.py dumps (one file per process) into one report.
+
+    Counters are summed, gauges keep the newest dump's value, and histograms
+    are merged bucket by bucket before percentiles are recomputed.
+    """
+    from core.metrics import LatencyHistogram
+
+    files: list[str] = []
+    counters: dict[str, int] = {}
+    gauges: dict[str, tuple[float, float]] = {}
+    histograms: dict[str, LatencyHistogram] = {}
+
+    for path in sorted(directory.glob("metrics_*.json")) if directory.exists() else []:
+        try:
+            dump = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"Skipping unreadable metrics dump {path}: {e}", file=sys.stderr)
+            continue
+        files.append(str(path))
+        stamp = float(dump.get("timestamp", 0.0))
+        for name, value in (dump.get("counters") or {}).items():
+            counters[name] = counters.get(name, 0) + int(value)
+        for name, value in (dump.get("gauges") or {}).items():
+            if name not in gauges or stamp >= gauges[name][0]:
+                gauges[name] = (stamp, float(value))
+        for name, data in (dump.get("histograms") or {}).items():
+            histograms.setdefault(name, LatencyHistogram()).merge(LatencyHistogram.from_dict(data))
+
+    return {
+        "runs": len(files),
+        "files": files,
+        "counters": dict(sorted(counters.items())),
+        "gauges": {name: value for name, (_, value) in sorted(gauges.items())},
+        "histograms": {name: histograms[name].to_dict() for name in sorted(histograms)},
+    }
+
+
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser(description="Aggregate tool outputs (logs/reports) into a summary")
     ap.add_argument("--inputs", nargs="+", default=["reports", "logs"], help="Directories to scan")
     ap.add_argument("--csv", action="store_true", help="Also write CSV summary")
+    ap.add_argument(
+        "--metrics",
+        nargs="?",
+        const=default_metrics_dir(),
+        help="Aggregate hot-path metrics dumps from this directory instead (default: METRICS_DUMP_DIR)",
+    )
     add_common_args(ap)
-    ap.set_defaults(out=str(DEFAULT_REPORTS / "metrics_summary.json"))
+    ap.set_defaults(out=None)
     args = ap.parse_args(argv)
 
     repo = Path(__file__).resolve().parents[1]
+    if args.metrics:
+        report = aggregate_metrics(Path(args.metrics))
+        out_path = Path(args.out or DEFAULT_REPORTS / "metrics_aggregate.json")
+        write_json(report, out_path)
+        if args.csv:
+            csv_path = out_path.with_suffix(".csv")
+            rows = ([name] + [hist[col] for col in HISTOGRAM_COLUMNS[1:]] for name, hist in report["histograms"].items())
+            write_csv(rows, HISTOGRAM_COLUMNS, csv_path)
+            print(f"Metrics CSV written: {csv_path}")
+        print(f"Aggregated {report['runs']} metrics dump(s) into {out_path}")
+        return 0
+
     paths = [repo / Path(x) for x in args.inputs]
     rows = gather(paths)
-    out_path = Path(args.out)
+    out_path = Path(args.out or DEFAULT_REPORTS / "metrics_summary.json")
     write_json(rows, out_path)
     if args.csv:
         csv_path = out_path.with_suffix(".csv")
@@ -2,20 +2,39 @@ from __future__ import annotations
 
 import argparse
 import importlib
+import os
 from pathlib import Path
 import sqlite3
+import subprocess
 import sys
 import time
-from typing import Any
+from typing import Any, Optional
 
 
 try:
-    from tools._common import DEFAULT_REPORTS, add_common_args, write_json
+    from tools._common import DEFAULT_REPORTS, REPO_ROOT, add_common_args, write_json
 except Exception:
-    from _common import DEFAULT_REPORTS, add_common_args, write_json
+    from _common import DEFAULT_REPORTS, REPO_ROOT, add_common_args, write_json
 
 __scope__ = "performance.startup_profiler"
 
+# Regression budget (ms). Generous enough for a cold CI machine; a breach means
+# something heavy moved back onto the paint-first path.
+STARTUP_BUDGET_MS: dict[str, float] = {
+    "import_app_manager": 2500.0,  # -X importtime total for core.app_manager
+    "window_shell": 4000.0,  # MainWindow() construction
+    "first_paint": 6000.0,  # since timeline origin
+}
+
+# Modules that must stay off the paint-first import path (loaded by deferred stages)
+DEFERRED_MODULES: tuple[str, ...] = (
+    "core.data_bridge",
+    "data.db_engine",
+    "sqlmodel",
+    "pydantic",
+    "pyqtgraph",
+)
+
 
 def time_construct(target: str) -> float:
     """
@@ -80,11 +99,151 @@ def bench_sqlite(rows: int = 10000) -> dict:
     return {"insert_ms": round(t_ins, 2), "query_ms": round(t_q, 2), "delete_ms": round(t_del, 2), "rows": rows}
 
 
+def parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        [{"module", "self_ms", "cumulative_ms", "depth"}] in import order
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        raw_name = parts[2].rstrip()
+        rows.append(
+            {
+                "module": raw_name.strip(),
+                "self_ms": int(parts[0]) / 1000.0,
+                "cumulative_ms": int(parts[1]) / 1000.0,
+                "depth": (len(raw_name) - len(raw_name.lstrip())) // 2,
+            }
+        )
+    return rows
+
+
+def profile_imports(module: str, top: int = 15) -> dict[str, Any]:
+    """
+    Import module in a fresh interpreter with -X importtime and summarize.
+
+    Returns:
+        {"module", "total_ms", "top_cumulative", "top_self", "loaded_deferred"}
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    code = f"import sys, {module}; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(REPO_ROOT),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+
+    rows = parse_importtime(proc.stderr)
+    target = next((r for r in rows if r["module"] == module and r["depth"] == 0), None)
+    total = target["cumulative_ms"] if target else sum(r["self_ms"] for r in rows)
+
+    def _fmt(r: dict[str, Any]) -> dict[str, Any]:
+        return {"module": r["module"], "self_ms": round(r["self_ms"], 2), "cumulative_ms": round(r["cumulative_ms"], 2)}
+
+    return {
+        "module": module,
+        "total_ms": round(total, 2),
+        "top_cumulative": [_fmt(r) for r in sorted(rows, key=lambda r: -r["cumulative_ms"])[:top]],
+        "top_self": [_fmt(r) for r in sorted(rows, key=lambda r: -r["self_ms"])[:top]],
+        "loaded_deferred": [m for m in proc.stdout.strip().split(",") if m],
+    }
+
+
+def profile_stages(timeout: float = 30.0) -> dict[str, Any]:
+    """
+    Build MainWindow, show it and run the event loop until every deferred
+    startup stage has finished. Returns the StartupTimeline report.
+    """
+    from PyQt6 import QtCore, QtWidgets
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    from core.startup_stages import get_startup_timeline, reset_startup_timeline
+
+    reset_startup_timeline()
+    timeline = get_startup_timeline()
+
+    with timeline.stage("import_app_manager"):
+        from core.app_manager import MainWindow
+    with timeline.stage("window_shell"):
+        win = MainWindow()
+    win.show()
+
+    deadline = time.perf_counter() + timeout
+    finished: list[dict] = []
+    timeline.deferredFinished.connect(finished.append)
+    while not finished and time.perf_counter() < deadline:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+
+    report = timeline.report()
+    report["completed"] = bool(finished)
+
+    # Don't leave a reconnecting DTC client behind
+    dtc = getattr(win, "_dtc", None)
+    if dtc is not None:
+        timer = getattr(dtc, "_reconnect_timer", None)
+        if timer is not None:
+            timer.stop()
+        dtc.disconnect()
+    win.hide()
+    return report
+
+
+def check_budget(
+    stages: Optional[dict[str, Any]] = None,
+    imports: Optional[dict[str, Any]] = None,
+    budget: Optional[dict[str, float]] = None,
+) -> list[str]:
+    """Return a list of budget violations (empty = within budget)."""
+    budget = budget or STARTUP_BUDGET_MS
+    measured: dict[str, float] = {}
+    violations: list[str] = []
+
+    if imports is not None:
+        measured["import_app_manager"] = imports["total_ms"]
+        for module in imports.get("loaded_deferred", []):
+            violations.append(f"{module} is imported on the paint-first path")
+    if stages is not None:
+        for s in stages["stages"]:
+            if not s["deferred"]:
+                measured[s["name"]] = s["ms"]
+        if "first_paint" in stages["marks"]:
+            measured["first_paint"] = stages["marks"]["first_paint"]
+        if not stages.get("completed", True):
+            violations.append("deferred startup stages did not finish")
+
+    for key, limit in budget.items():
+        if key in measured and measured[key] > limit:
+            violations.append(f"{key}: {measured[key]:.1f} ms > budget {limit:.0f} ms")
+    return violations
+
+
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser(description="Profile startup/construct times and database performance")
     ap.add_argument("--targets", nargs="+", help="List like module:Class")
     ap.add_argument("--bench-db", action="store_true", help="Run database benchmark")
     ap.add_argument("--db-rows", type=int, default=10000, help="Rows for DB benchmark")
+    ap.add_argument("--stages", action="store_true", help="Time staged MainWindow startup (shell + deferred stages)")
+    ap.add_argument(
+        "--importtime",
+        nargs="?",
+        const="core.app_manager",
+        metavar="MODULE",
+        help="-X importtime breakdown for MODULE (default core.app_manager)",
+    )
+    ap.add_argument("--check-budget", action="store_true", help="Exit 1 when STARTUP_BUDGET_MS is exceeded")
     add_common_args(ap)
     ap.set_defaults(out=str(DEFAULT_REPORTS / "startup_timings.json"))
     args = ap.parse_args(argv)
@@ -121,15 +280,40 @@ def main(argv: list[str]) -> int:
         except Exception as e:
             results["db_benchmark"] = {"error": str(e)}
 
+    if args.importtime:
+        results["importtime"] = profile_imports(args.importtime)
+        if not args.quiet:
+            imp = results["importtime"]
+            print(f"Import {imp['module']}: {imp['total_ms']:.1f} ms")
+            for row in imp["top_cumulative"][:10]:
+                print(f"  {row['cumulative_ms']:8.1f} ms  {row['module']}")
+
+    if args.stages:
+        results["stages"] = profile_stages()
+        if not args.quiet:
+            print("Startup stages:")
+            for stage in results["stages"]["stages"]:
+                kind = "deferred" if stage["deferred"] else "shell"
+                print(f"  {stage['start_ms']:8.1f} +{stage['ms']:7.1f} ms  [{kind}] {stage['name']}")
+            for name, at in results["stages"]["marks"].items():
+                print(f"  {at:8.1f} ms  mark {name}")
+
     if not results:
-        print("Error: Specify --targets and/or --bench-db")
+        print("Error: Specify --targets, --bench-db, --stages and/or --importtime")
         return 1
 
+    violations: list[str] = []
+    if args.check_budget:
+        violations = check_budget(results.get("stages"), results.get("importtime"))
+        results["budget"] = {"limits_ms": STARTUP_BUDGET_MS, "violations": violations}
+        for v in violations:
+            print(f"BUDGET: {v}")
+
     out_path = Path(args.out)
     write_json(results, out_path)
     if not args.quiet:
         print(f" Performance timings written to {out_path}")
-    return 0
+    return 1 if violations else 0
 
 
 if __name__ == "__main__":
@@ -12,8 +12,18 @@ Background:
     is in a different thread."
 
 Solution:
-    This module provides helpers to safely marshal callbacks to the Qt thread using
-    QTimer.singleShot(0, ...), which posts the callback to the event loop.
+    One thread-safe InvocationQueue living on the main thread. Callbacks from any
+    thread are appended under a lock; the first one after a drain posts a single
+    custom event, and that event runs the whole batch on the next event-loop turn.
+    A flood of worker-thread results (equity loads, DB results, transport threads)
+    therefore costs one posted event per turn, not one timer and one event per call.
+
+    post_latest(key, ...) / @qt_safe(latest=True) keep only the newest pending call
+    per key ("latest value wins" updates). One drain runs for at most
+    DRAIN_BUDGET_MS / DRAIN_MAX_CALLS; the rest of a burst goes to the next turn so
+    input and paint events get in between. stats() reports queue depth, batch sizes,
+    deduplicated calls and drain time; with core/metrics enabled the same data is
+    recorded as the "qt_bridge.depth" gauge and "qt_bridge.drain" histogram.
 
 Usage:
     # From background thread (e.g., Blinker signal handler):
@@ -26,15 +36,276 @@ Usage:
     def update_ui(balance_data):
         # This will ALWAYS run on Qt main thread
         panel.set_balance(balance_data["balance"])
+
+    # Only the newest pending value matters:
+    marshal_latest(("balance", account), panel.set_balance, balance)
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Hashable
+import functools
+import itertools
+import threading
+import time
+from typing import Any, Optional
 
 from PyQt6 import QtCore
 
+from core import metrics
+from core.metrics import LatencyHistogram
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+# =============================================================================
+# INVOCATION QUEUE
+# =============================================================================
+
+#: Custom event that drains the queue (one per event-loop turn at most)
+_DRAIN_EVENT = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+
+#: Per-drain budget: time (ms) and number of calls before yielding a turn
+DRAIN_BUDGET_MS = 8.0
+DRAIN_MAX_CALLS = 500
+
+
+class InvocationQueue(QtCore.QObject):
+    """
+    Batched cross-thread invocation queue drained on the main thread.
+
+    Thread Safety:
+    - post()/post_latest() may be called from any thread (one lock guards the
+      pending batch)
+    - Callbacks always run on the thread the queue lives in (the main thread)
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        budget_ms: float = DRAIN_BUDGET_MS,
+        max_calls: int = DRAIN_MAX_CALLS,
+    ):
+        super().__init__(parent)
+        self.budget_ms = budget_ms
+        self.max_calls = max(1, int(max_calls))
+        self._lock = threading.Lock()
+        #: key -> (callback, args, kwargs); dict order = call order
+        self._pending: dict[Hashable, tuple[Callable, tuple, dict]] = {}
+        self._seq = itertools.count()
+        self._scheduled = False
+        self._replacement: Optional[InvocationQueue] = None  # set by install_invocation_queue()
+
+        self.posted = 0
+        self.deduped = 0
+        self.drains = 0
+        self.deferred = 0  # calls pushed to a later turn by the drain budget
+        self.max_depth = 0
+        self.max_batch = 0
+        self._drain_time = LatencyHistogram()
+
+    # =========================================================================
+    # POSTING
+    # =========================================================================
+
+    def post(self, callback: Callable, *args: Any, **kwargs: Any) -> None:
+        """Run callback(*args, **kwargs) on the main thread on the next drain."""
+        self._enqueue(("call", next(self._seq)), callback, args, kwargs)
+
+    def post_latest(self, key: Hashable, callback: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Like post(), but a pending call with the same key is replaced.
+
+        The replacement keeps the original call's place in the batch.
+        """
+        self._enqueue(("latest", key), callback, args, kwargs)
+
+    def _enqueue(self, key: Hashable, callback: Callable, args: tuple, kwargs: dict) -> None:
+        with self._lock:
+            replacement = self._replacement
+            if replacement is None:
+                self.posted += 1
+                if key in self._pending:
+                    self.deduped += 1
+                self._pending[key] = (callback, args, kwargs)
+                depth = len(self._pending)
+                self.max_depth = max(self.max_depth, depth)
+                schedule = not self._scheduled
+                self._scheduled = True
+        if replacement is not None:
+            # Replaced by install_invocation_queue(): caller held the old queue
+            replacement._enqueue(key, callback, args, kwargs)
+            return
+        metrics.gauge("qt_bridge.depth", depth)
+        if schedule:
+            self._schedule_drain()
+
+    def _schedule_drain(self) -> None:
+        app = QtCore.QCoreApplication.instance()
+        if app is not None and self.thread() is not app.thread() and QtCore.QThread.currentThread() is self.thread():
+            # Created off the main thread (before install_invocation_queue()):
+            # its owner can still hand it to the main thread
+            self.moveToThread(app.thread())
+        QtCore.QCoreApplication.postEvent(self, QtCore.QEvent(_DRAIN_EVENT))
+
+    # =========================================================================
+    # DRAINING
+    # =========================================================================
+
+    def event(self, ev: QtCore.QEvent) -> bool:
+        if ev.type() == _DRAIN_EVENT:
+            self.drain()
+            return True
+        return super().event(ev)
+
+    def drain(self) -> int:
+        """
+        Run pending calls (main thread) within the drain budget. Returns how many ran.
+
+        Calls posted while the batch runs go to the next turn's batch. Calls
+        left over when the budget runs out keep their place ahead of those and
+        are drained on the next turn.
+        """
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+            self._scheduled = False
+        if not batch:
+            return 0
+
+        t0 = metrics.now()
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000.0
+        items = iter(batch.items())
+        ran = 0
+        for _key, (callback, args, kwargs) in items:
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                log.error(f"[QtBridge] Marshaled callback {getattr(callback, '__qualname__', callback)} failed: {e}", exc_info=True)
+            ran += 1
+            if ran >= self.max_calls or time.perf_counter() >= deadline:
+                break
+        leftover = dict(items)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        schedule = False
+        with self._lock:
+            if leftover:
+                # A newer post_latest() for a leftover key replaces its arguments
+                for key in leftover.keys() & self._pending.keys():
+                    leftover[key] = self._pending.pop(key)
+                self._pending = {**leftover, **self._pending}
+                self.deferred += len(leftover)
+                schedule = not self._scheduled
+                self._scheduled = True
+            self.drains += 1
+            self.max_batch = max(self.max_batch, ran)
+            self._drain_time.record_ms(elapsed_ms)
+            depth = len(self._pending)
+        metrics.observe("qt_bridge.drain", t0)
+        metrics.gauge("qt_bridge.depth", depth)
+        if schedule:
+            self._schedule_drain()
+        return ran
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
+    def stats(self) -> dict[str, Any]:
+        """Depth, posted/deduped/deferred counts, drains, batch sizes and drain time (ms)."""
+        with self._lock:
+            return {
+                "depth": len(self._pending),
+                "max_depth": self.max_depth,
+                "posted": self.posted,
+                "deduped": self.deduped,
+                "drains": self.drains,
+                "deferred": self.deferred,
+                "max_batch": self.max_batch,
+                "drain_p50_ms": self._drain_time.percentile_us(50.0) / 1000.0,
+                "drain_p99_ms": self._drain_time.percentile_us(99.0) / 1000.0,
+                "drain_max_ms": self._drain_time.max_us / 1000.0,
+            }
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_queue_instance: Optional[InvocationQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_invocation_queue() -> InvocationQueue:
+    """
+    Get the global InvocationQueue (thread-safe creation).
+
+    Created after the QApplication, the queue lives on the application's
+    main thread whichever thread creates it. install_invocation_queue() at
+    startup covers a queue created earlier by another thread.
+    """
+    global _queue_instance
+
+    if _queue_instance is None:
+        with _queue_lock:
+            if _queue_instance is None:
+                queue = InvocationQueue()
+                app = QtCore.QCoreApplication.instance()
+                if app is not None and queue.thread() is not app.thread():
+                    queue.moveToThread(app.thread())
+                _queue_instance = queue
+
+    return _queue_instance
+
+
+def install_invocation_queue() -> InvocationQueue:
+    """
+    Create the global queue on the main thread (call at app startup).
+
+    A queue created earlier by a worker thread (before the QApplication
+    existed) has no event loop to drain it: it is replaced, and its pending
+    calls move to the new queue.
+    """
+    global _queue_instance
+
+    app = QtCore.QCoreApplication.instance()
+    with _queue_lock:
+        old = _queue_instance
+        if old is not None and app is not None and old.thread() is app.thread():
+            return old
+        queue = InvocationQueue()
+        if app is not None and queue.thread() is not app.thread():
+            queue.moveToThread(app.thread())
+        _queue_instance = queue
+
+    if old is not None:
+        with old._lock:
+            pending, old._pending = old._pending, {}
+            old._replacement = queue
+        for key, (callback, args, kwargs) in pending.items():
+            queue._enqueue(key, callback, args, kwargs)
+    return queue
+
+
+def reset_invocation_queue() -> None:
+    """
+    Drop the global queue (pending calls are discarded).
+
+    WARNING: Only use in tests.
+    """
+    global _queue_instance
+
+    with _queue_lock:
+        _queue_instance = None
+
+
+# =============================================================================
+# MARSHALING HELPERS
+# =============================================================================
+
 
 def marshal_to_qt_thread(callback: Callable, *args: Any, **kwargs: Any) -> None:
     """
@@ -56,21 +327,24 @@ def marshal_to_qt_thread(callback: Callable, *args: Any, **kwargs: Any) -> None:
         marshal_to_qt_thread(panel.update_position, symbol="ES", qty=2, avg=5000.0)
 
     Notes:
-        - Uses QTimer.singleShot(0, ...) which posts to event loop
-        - Callback executes on next event loop iteration
+        - Appends to the shared InvocationQueue (one posted event per batch)
+        - Callback executes on next event loop iteration, in posting order
         - Non-blocking for caller
         - Safe to call from any thread, including main thread
     """
-    try:
-        QtCore.QTimer.singleShot(0, lambda: callback(*args, **kwargs))
-    except Exception as e:
-        # Log but don't crash if marshaling fails
-        import sys
+    get_invocation_queue().post(callback, *args, **kwargs)
 
-        print(f"ERROR: Qt thread marshaling failed: {e}", file=sys.stderr)
-        import traceback
 
-        traceback.print_exc()
+def marshal_latest(key: Hashable, callback: Callable, *args: Any, **kwargs: Any) -> None:
+    """
+    Like marshal_to_qt_thread(), but only the newest pending call per key runs.
+
+    Use for "latest value wins" updates (balances, progress, status text).
+
+    Example:
+        marshal_latest(("balance", account), panel.set_balance, balance)
+    """
+    get_invocation_queue().post_latest(key, callback, *args, **kwargs)
 
 
 def is_main_thread() -> bool:
@@ -152,7 +426,7 @@ class QtThreadSafeMixin:
     pass
 
 
-def qt_safe(method: Callable) -> Callable:
+def qt_safe(method: Optional[Callable] = None, *, latest: bool = False) -> Callable:
     """
     Decorator to make a method thread-safe for Qt operations.
 
@@ -161,6 +435,8 @@ def qt_safe(method: Callable) -> Callable:
 
     Args:
         method: The method to decorate
+        latest: Only the newest pending off-thread call per instance runs
+            ("latest value wins" setters)
 
     Returns:
         Wrapped method that's thread-safe
@@ -172,6 +448,10 @@ def qt_safe(method: Callable) -> Callable:
                 # Always safe to touch Qt widgets here
                 self.balance_label.setText(f"${balance:,.2f}")
 
+            @qt_safe(latest=True)
+            def set_progress(self, pct: float):
+                self.progress.setValue(int(pct))
+
         # Can call from any thread:
         panel.set_balance(50000.0)  # Automatically marshaled if needed
 
@@ -180,16 +460,19 @@ def qt_safe(method: Callable) -> Callable:
         - Safe to apply to methods already on main thread
         - Use for any method that touches Qt widgets
     """
+    if method is None:
+        return functools.partial(qt_safe, latest=latest)
 
+    @functools.wraps(method)
     def wrapper(self, *args: Any, **kwargs: Any):
         if is_main_thread():
             return method(self, *args, **kwargs)
+        if latest:
+            marshal_latest((id(self), method.__qualname__), method, self, *args, **kwargs)
         else:
             marshal_to_qt_thread(method, self, *args, **kwargs)
-            return None  # Async call, no return value
+        return None  # Async call, no return value
 
-    wrapper.__name__ = method.__name__
-    wrapper.__doc__ = method.__doc__
     return wrapper
 
 
@@ -0,0 +1,442 @@
+"""
+DTC Request/Response Correlator
+
+Allocates RequestIDs, matches responses back to the request that caused them,
+and expires requests Sierra Chart never answered.
+
+Replaces RequestTimeoutManager (fixed 5-second scan over every pending
+request, static RequestIDs 1/3/4/5 that collided on repeated requests):
+
+- RequestIDs are allocated monotonically, so concurrent or repeated requests
+  of the same type never share an ID
+- Expiry uses a hashed timer wheel: register, complete and expire are O(1)
+  (amortized), independent of how many requests are in flight
+- Each request carries a concurrent.futures.Future and an optional callback,
+  resolved with every message of the response once the final one arrives
+- Multi-message responses are accumulated until the DTC final marker
+  (MessageNumber == TotalNumberMessages, or a No* "empty" flag)
+- Round-trip latency is recorded per request type in a core.metrics
+  LatencyHistogram (the same log-linear histogram as the hot-path metrics);
+  last_latency_ms is the time to the first frame of the latest response
+
+Usage:
+    correlator = RequestCorrelator(default_timeout=15.0)
+
+    # When sending a request:
+    pending = correlator.register("TRADE_ACCOUNTS_REQUEST", timeout=15.0)
+    client.send({"Type": 400, "RequestID": pending.request_id})
+    pending.future.add_done_callback(...)
+
+    # For every inbound frame:
+    correlator.on_response(dtc)
+
+    # From a coarse periodic timer:
+    expired = correlator.advance()
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.metrics import LatencyHistogram
+
+try:
+    import structlog
+    log = structlog.get_logger(__name__)
+    HAS_STRUCTLOG = True
+except ImportError:
+    HAS_STRUCTLOG = False
+
+    class SimpleLogger:
+        """Simple logger fallback"""
+        def debug(self, msg, **kwargs):
+            pass
+        def info(self, msg, **kwargs):
+            pass
+        def warning(self, msg, **kwargs):
+            print(f"[WARNING] {msg}", kwargs if kwargs else "")
+        def error(self, msg, **kwargs):
+            print(f"[ERROR] {msg}", kwargs if kwargs else "")
+
+    log = SimpleLogger()
+
+
+# DTC flags that mark an "empty" (and therefore final) response
+_EMPTY_RESPONSE_FLAGS = ("NoOrders", "NoOrderFills", "NoPositions", "NoTradeAccounts")
+
+# RequestIDs are DTC int32 values
+_MAX_REQUEST_ID = 2**31 - 1
+
+
+def is_final_response(dtc: dict) -> bool:
+    """
+    True when dtc is the last message of its response.
+
+    DTC multi-message responses number their messages (MessageNumber out of
+    TotalNumberMessages; OrderUpdate uses TotalNumMessages) and flag empty
+    results with NoOrders/NoOrderFills/... Messages without either marker are
+    single-message responses.
+    """
+    for flag in _EMPTY_RESPONSE_FLAGS:
+        if dtc.get(flag):
+            return True
+
+    total = dtc.get("TotalNumberMessages", dtc.get("TotalNumMessages"))
+    number = dtc.get("MessageNumber")
+    if total is None or number is None:
+        return True
+    try:
+        return int(number) >= int(total)
+    except (TypeError, ValueError):
+        return True
+
+
+# ============================================================================
+# HASHED TIMER WHEEL
+# ============================================================================
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel keyed by int.
+
+    Deadlines are rounded up to whole ticks and hashed into one of `slots`
+    buckets; each entry stores how many full revolutions remain. schedule()
+    and cancel() are O(1); advance() touches only the buckets for the ticks
+    that elapsed.
+    """
+
+    def __init__(self, tick_seconds: float = 0.25, slots: int = 256):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self._tick_ns = int(tick_seconds * 1e9)
+        self._mask = slots - 1
+        self._slots: List[Dict[int, int]] = [{} for _ in range(slots)]  # {key: rounds}
+        self._where: Dict[int, int] = {}  # {key: slot index}
+        self._current_tick = time.monotonic_ns() // self._tick_ns
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def schedule(self, key: int, delay_seconds: float, now_ns: Optional[int] = None) -> None:
+        self.cancel(key)
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        ticks = max(1, math.ceil(delay_seconds * 1e9 / self._tick_ns))
+        # Deadline counts from now, even if advance() has not run for a while
+        target_tick = max(self._current_tick, now_ns // self._tick_ns) + ticks
+        offset = target_tick - self._current_tick
+        slot = target_tick & self._mask
+        self._slots[slot][key] = (offset - 1) // (self._mask + 1)
+        self._where[key] = slot
+
+    def cancel(self, key: int) -> bool:
+        slot = self._where.pop(key, None)
+        if slot is None:
+            return False
+        self._slots[slot].pop(key, None)
+        return True
+
+    def advance(self, now_ns: Optional[int] = None) -> List[int]:
+        """Move the cursor to now and return the keys whose deadline passed."""
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        start = self._current_tick
+        target = now_ns // self._tick_ns
+        expired: List[int] = []
+        if target <= start:
+            return expired
+
+        # Visit each slot at most once, even after a long stall; `skipped`
+        # counts the earlier revolutions over that slot we did not walk
+        revolution = self._mask + 1
+        for tick in range(max(start + 1, target - revolution + 1), target + 1):
+            skipped = (tick - start - 1) // revolution
+            bucket = self._slots[tick & self._mask]
+            for key in list(bucket):
+                rounds = bucket[key] - skipped
+                if rounds <= 0:
+                    del bucket[key]
+                    self._where.pop(key, None)
+                    expired.append(key)
+                else:
+                    bucket[key] = rounds - 1
+        self._current_tick = target
+        return expired
+
+
+# ============================================================================
+# CORRELATOR
+# ============================================================================
+
+
+@dataclass
+class PendingRequest:
+    """A DTC request waiting for its (possibly multi-message) response"""
+    request_id: int
+    request_type: str
+    sent_at_ns: int  # time.monotonic_ns()
+    timeout: float  # Seconds
+    first_response_ns: Optional[int] = None  # time.monotonic_ns() of the first response frame
+    metadata: Optional[Dict] = None
+    callback: Optional[Callable[["PendingRequest"], None]] = None
+    responses: List[dict] = field(default_factory=list)
+    future: Future = field(default_factory=Future)
+
+    def elapsed_ms(self, now_ns: Optional[int] = None) -> float:
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        return (now_ns - self.sent_at_ns) / 1e6
+
+
+class RequestCorrelator:
+    """
+    Correlates DTC requests and responses by monotonically allocated RequestID.
+
+    Not thread-safe: owned by DTCClientJSON and used on its (GUI) thread only.
+    Futures may be waited on from any thread.
+    """
+
+    # Default timeout for various request types (in seconds)
+    DEFAULT_TIMEOUTS = {
+        "TRADE_ACCOUNTS_REQUEST": 15.0,      # Type 400
+        "POSITION_REQUEST": 10.0,             # Type 500
+        "OPEN_ORDERS_REQUEST": 10.0,          # Type 305
+        "HISTORICAL_FILLS_REQUEST": 30.0,     # Type 303 (can take longer)
+        "ACCOUNT_BALANCE_REQUEST": 10.0,      # Type 601
+        "MARKET_DATA_REQUEST": 5.0,           # Type 101
+    }
+
+    def __init__(
+        self,
+        default_timeout: float = 10.0,
+        tick_seconds: float = 0.25,
+        slots: int = 256,
+    ):
+        """
+        Initialize request correlator.
+
+        Args:
+            default_timeout: Timeout in seconds for request types without an
+                entry in DEFAULT_TIMEOUTS
+            tick_seconds: Timer wheel resolution (expiry granularity)
+            slots: Timer wheel size (power of two)
+        """
+        self._default_timeout = default_timeout
+        self._wheel = TimerWheel(tick_seconds=tick_seconds, slots=slots)
+        self._pending: Dict[int, PendingRequest] = {}
+        self._next_id = 1
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._last_latency_ms: Optional[float] = None
+        self._last_latency_at_ns: Optional[int] = None
+        self._completed = 0
+        self._timed_out = 0
+
+    # ------------------------------------------------------------------ IDs
+
+    def next_request_id(self) -> int:
+        """Allocate the next free RequestID (monotonic, wraps at int32 max)."""
+        while True:
+            request_id = self._next_id
+            self._next_id = 1 if self._next_id >= _MAX_REQUEST_ID else self._next_id + 1
+            if request_id not in self._pending:
+                return request_id
+
+    # ------------------------------------------------------------ lifecycle
+
+    def register(
+        self,
+        request_type: str,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[PendingRequest], None]] = None,
+        metadata: Optional[Dict] = None,
+    ) -> PendingRequest:
+        """
+        Allocate a RequestID and start tracking the request.
+
+        Args:
+            request_type: Type of request (e.g., "TRADE_ACCOUNTS_REQUEST")
+            timeout: Custom timeout in seconds (overrides DEFAULT_TIMEOUTS)
+            callback: Called with the PendingRequest once it completes or expires
+            metadata: Optional additional context to track with request
+
+        Returns:
+            PendingRequest (use .request_id in the outgoing message, .future to wait)
+        """
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUTS.get(request_type, self._default_timeout)
+
+        now_ns = time.monotonic_ns()
+        pending = PendingRequest(
+            request_id=self.next_request_id(),
+            request_type=request_type,
+            sent_at_ns=now_ns,
+            timeout=timeout,
+            metadata=metadata,
+            callback=callback,
+        )
+        self._pending[pending.request_id] = pending
+        self._wheel.schedule(pending.request_id, timeout, now_ns)
+
+        log.debug(
+            "request_registered",
+            request_id=pending.request_id,
+            request_type=request_type,
+            timeout=timeout,
+        )
+        return pending
+
+    def on_response(self, dtc: dict) -> Optional[PendingRequest]:
+        """
+        Feed an inbound DTC message.
+
+        Returns:
+            The PendingRequest the message belongs to (whether or not this was
+            its final message), or None for unsolicited/unknown RequestIDs
+        """
+        request_id = dtc.get("RequestID")
+        pending = self._pending.get(request_id) if request_id is not None else None
+        if pending is None:
+            return None
+
+        if pending.first_response_ns is None:
+            # Time to first frame: a multi-message response (e.g. historical
+            # fills) would otherwise report its transfer time as latency
+            now_ns = time.monotonic_ns()
+            pending.first_response_ns = now_ns
+            self._last_latency_ms = (now_ns - pending.sent_at_ns) / 1e6
+            self._last_latency_at_ns = now_ns
+
+        pending.responses.append(dtc)
+        if is_final_response(dtc):
+            self._complete(pending)
+        return pending
+
+    def complete(self, request_id: int) -> bool:
+        """Resolve a request explicitly (e.g. response without a final marker)."""
+        pending = self._pending.get(request_id)
+        if pending is None:
+            return False
+        self._complete(pending)
+        return True
+
+    def advance(self, now_ns: Optional[int] = None) -> List[PendingRequest]:
+        """
+        Expire requests whose deadline passed.
+
+        Returns:
+            Requests that timed out since the last call (futures already failed
+            with TimeoutError)
+        """
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        expired: List[PendingRequest] = []
+        for request_id in self._wheel.advance(now_ns):
+            pending = self._pending.pop(request_id, None)
+            if pending is None:
+                continue
+            self._timed_out += 1
+            expired.append(pending)
+            log.warning(
+                "request_timeout",
+                request_id=request_id,
+                request_type=pending.request_type,
+                timeout=pending.timeout,
+                elapsed_ms=round(pending.elapsed_ms(now_ns), 1),
+                partial_messages=len(pending.responses),
+            )
+            self._resolve(
+                pending,
+                error=TimeoutError(f"{pending.request_type} (ID: {request_id}) timed out"),
+            )
+        return expired
+
+    def cancel_all(self, reason: str = "disconnected") -> int:
+        """Fail every pending request (e.g. on disconnect). Returns count."""
+        pending_all = list(self._pending.values())
+        self._pending.clear()
+        for pending in pending_all:
+            self._wheel.cancel(pending.request_id)
+            self._resolve(pending, error=ConnectionError(reason))
+        if pending_all:
+            log.info("request_correlator_cancelled", count=len(pending_all), reason=reason)
+        return len(pending_all)
+
+    # --------------------------------------------------------------- queries
+
+    def get(self, request_id: int) -> Optional[PendingRequest]:
+        return self._pending.get(request_id)
+
+    def pending(self) -> List[PendingRequest]:
+        """Requests still waiting for their final response."""
+        return list(self._pending.values())
+
+    def get_pending_count(self) -> int:
+        """Get number of currently pending requests"""
+        return len(self._pending)
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histogram snapshot per request type."""
+        return {name: hist.to_dict() for name, hist in self._latency.items()}
+
+    @property
+    def last_latency_ms(self) -> Optional[float]:
+        """Time from send to the first response frame of the latest answered request (ms)."""
+        return self._last_latency_ms
+
+    @property
+    def last_latency_at_ns(self) -> Optional[int]:
+        """time.monotonic_ns() when last_latency_ms was measured (None until then)."""
+        return self._last_latency_at_ns
+
+    def get_stats(self) -> Dict:
+        """
+        Get statistics about requests.
+
+        Returns:
+            Dictionary with pending/completed/timed_out counts and success rate
+        """
+        finished = self._completed + self._timed_out
+        return {
+            "pending": len(self._pending),
+            "completed": self._completed,
+            "timed_out": self._timed_out,
+            "success_rate": (self._completed / finished) if finished else 1.0,
+        }
+
+    # -------------------------------------------------------------- internal
+
+    def _complete(self, pending: PendingRequest) -> None:
+        self._pending.pop(pending.request_id, None)
+        self._wheel.cancel(pending.request_id)
+        self._completed += 1
+
+        latency_ms = pending.elapsed_ms()
+        self._latency.setdefault(pending.request_type, LatencyHistogram()).record_ms(latency_ms)
+
+        log.debug(
+            "request_completed",
+            request_id=pending.request_id,
+            request_type=pending.request_type,
+            messages=len(pending.responses),
+            latency_ms=round(latency_ms, 2),
+        )
+        self._resolve(pending)
+
+    @staticmethod
+    def _resolve(pending: PendingRequest, error: Optional[BaseException] = None) -> None:
+        if not pending.future.done():
+            if error is None:
+                pending.future.set_result(list(pending.responses))
+            else:
+                pending.future.set_exception(error)
+        if pending.callback is not None:
+            try:
+                pending.callback(pending)
+            except Exception as e:
+                log.error(
+                    "request_callback_failed",
+                    request_id=pending.request_id,
+                    request_type=pending.request_type,
+                    error=str(e),
+                )
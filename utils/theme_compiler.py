@@ -0,0 +1,306 @@
+"""
+utils/theme_compiler.py
+
+Precompiled application stylesheets for the DEBUG / SIM / LIVE themes.
+
+A theme switch used to rebuild an f-string stylesheet for every themed widget
+and call setStyleSheet() on each one, so Qt re-parsed CSS across the whole
+tree (twice, since switch_theme() ran from both _set_theme_mode and
+on_theme_changed).
+
+The ThemeCompiler does the expensive work once:
+- themed classes register a rule builder (ThemeAwareMixin._theme_rules) that
+  turns a theme dict into QSS
+- compile() runs every builder against each mode's theme dict and scopes the
+  rules under a dynamic property selector: *[themeMode="SIM"] QFrame#MetricCell
+- install() sets the three compiled blocks as ONE application stylesheet
+  (parsed once), appended to any stylesheet the application already had
+
+Switching modes only flips the themeMode property on the attached roots and
+re-polishes the widgets the compiled rules target (one polish pass, no CSS
+parsing). Painters get cached QColor/QPen/QBrush tokens per mode instead of
+rebuilding them from THEME strings on every paintEvent.
+
+Usage:
+    from utils.theme_compiler import get_theme_compiler
+
+    compiler = get_theme_compiler()
+    compiler.install(QtWidgets.QApplication.instance())
+    compiler.attach(main_window)
+    compiler.apply("SIM")                    # flips themeMode, one polish pass
+
+    painter.setPen(compiler.pen("border"))   # cached per (mode, token)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import re
+import threading
+import time
+from typing import Any, Optional
+import weakref
+
+from PyQt6 import QtGui, QtWidgets
+
+from config.theme import _THEME_MAP, get_active_theme_name, switch_theme
+from utils.logger import get_logger
+from utils.theme_helpers import normalize_color
+
+log = get_logger(__name__)
+
+THEME_MODES = ("DEBUG", "SIM", "LIVE")
+
+#: Dynamic property flipped on the root widgets to select the compiled block
+THEME_MODE_PROPERTY = "themeMode"
+
+RuleBuilder = Callable[[Mapping[str, Any]], str]
+
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_OBJECT_NAME_RE = re.compile(r"#([A-Za-z_][\w-]*)\s*(?:::?[\w-]+)*\s*$")
+
+
+def _scope_rules(qss: str, mode: str) -> tuple[str, Optional[set[str]]]:
+    """
+    Prefix every selector of qss with the mode's property selector.
+
+    Returns the scoped QSS and the object names the rules style (None if a
+    selector does not end in #objectName, i.e. any widget may be affected).
+    """
+    scope = f'*[{THEME_MODE_PROPERTY}="{mode}"]'
+    targets: Optional[set[str]] = set()
+    rules = []
+    for selectors, body in _RULE_RE.findall(qss):
+        scoped = []
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            if not selector:
+                continue
+            scoped.append(f"{scope} {selector}")
+            match = _OBJECT_NAME_RE.search(selector)
+            if match is None:
+                targets = None
+            elif targets is not None:
+                targets.add(match.group(1))
+        declarations = " ".join(line.strip() for line in body.strip().splitlines() if line.strip())
+        if scoped:
+            rules.append(f"{', '.join(scoped)} {{ {declarations} }}")
+    return "\n".join(rules), targets
+
+
+class ThemeCompiler:
+    """
+    Compiles themed rule builders into one app stylesheet and switches modes.
+
+    Thread Safety:
+    - GUI thread only
+    """
+
+    def __init__(self) -> None:
+        self._builders: list[RuleBuilder] = []
+        self._sheets: dict[str, str] = {}
+        self._targets: Optional[frozenset[str]] = frozenset()
+        self._compiled = False
+        self._app: Optional[QtWidgets.QApplication] = None
+        self._base_sheet = ""  # app stylesheet set by others, kept ahead of ours
+        self._installed_sheet: Optional[str] = None
+        self._roots: weakref.WeakSet[QtWidgets.QWidget] = weakref.WeakSet()
+        self._tokens: dict[tuple, Any] = {}
+
+        self.last_switch_ms: Optional[float] = None  # duration of the last apply() (diagnostics)
+
+    # =========================================================================
+    # COMPILATION
+    # =========================================================================
+
+    def register(self, builder: RuleBuilder) -> RuleBuilder:
+        """Add a rule builder (idempotent; usable as a decorator)."""
+        if builder not in self._builders:
+            self._builders.append(builder)
+            self._compiled = False
+            if self._app is not None:
+                self.install(self._app)  # late registration (lazy import): rebuild once
+        return builder
+
+    def compile(self) -> dict[str, str]:
+        """Build the per-mode stylesheets (cached until a builder is added)."""
+        if self._compiled:
+            return self._sheets
+
+        sheets: dict[str, str] = {}
+        targets: Optional[set[str]] = set()
+        for mode in THEME_MODES:
+            theme = _THEME_MAP[mode.lower()]
+            parts = []
+            for builder in self._builders:
+                try:
+                    parts.append(builder(theme))
+                except Exception as e:
+                    log.warning(f"[ThemeCompiler] Rule builder {getattr(builder, '__qualname__', builder)} failed: {e}")
+            sheet, mode_targets = _scope_rules("\n".join(parts), mode)
+            sheets[mode] = sheet
+            if mode_targets is None or targets is None:
+                targets = None
+            else:
+                targets |= mode_targets
+
+        self._sheets = sheets
+        self._targets = frozenset(targets) if targets is not None else None
+        self._compiled = True
+        return sheets
+
+    @property
+    def stylesheet(self) -> str:
+        """The application stylesheet: every mode's block, scoped by themeMode."""
+        sheets = self.compile()
+        return "\n".join(sheets[mode] for mode in THEME_MODES)
+
+    # =========================================================================
+    # INSTALL / SWITCH
+    # =========================================================================
+
+    @property
+    def mode(self) -> str:
+        """Active mode (follows THEME, also when switched via switch_theme)."""
+        return get_active_theme_name().upper()
+
+    @property
+    def installed(self) -> bool:
+        return self._app is not None
+
+    def install(self, app: QtWidgets.QApplication) -> None:
+        """Merge the compiled stylesheet into the application's (parsed once)."""
+        current = app.styleSheet()
+        if app is not self._app or current != self._installed_sheet:
+            # First install, or someone replaced the sheet since: keep theirs
+            self._base_sheet = current
+        self._app = app
+        self._installed_sheet = "\n".join(filter(None, (self._base_sheet, self.stylesheet)))
+        app.setStyleSheet(self._installed_sheet)
+
+    def uninstall(self) -> None:
+        """Restore the application stylesheet that was there before install()."""
+        if self._app is not None and self._app.styleSheet() == self._installed_sheet:
+            self._app.setStyleSheet(self._base_sheet)
+        self._app = None
+        self._base_sheet = ""
+        self._installed_sheet = None
+
+    def attach(self, root: QtWidgets.QWidget) -> None:
+        """Scope root (and its descendants) to the current mode's rules."""
+        self._roots.add(root)
+        root.setProperty(THEME_MODE_PROPERTY, self.mode)
+
+    def apply(self, mode: str) -> bool:
+        """
+        Switch to mode: update THEME, flip themeMode on the roots, polish once.
+
+        Returns False for an unknown mode.
+        """
+        mode = mode.upper()
+        if mode not in THEME_MODES:
+            log.warning(f"[ThemeCompiler] Unknown theme mode: {mode}")
+            return False
+
+        started = time.perf_counter()
+        switch_theme(mode.lower())  # THEME dict for painters and f-string styles
+        self.compile()
+        for root in list(self._roots):
+            root.setProperty(THEME_MODE_PROPERTY, mode)
+            self._polish(root)
+        self.last_switch_ms = (time.perf_counter() - started) * 1000.0
+        log.debug(f"[ThemeCompiler] Switched to {mode} in {self.last_switch_ms:.2f} ms")
+        return True
+
+    def _polish(self, root: QtWidgets.QWidget) -> None:
+        """Re-evaluate the property selectors for the widgets the rules style."""
+        style = root.style()
+        targets = self._targets
+        for widget in [root, *root.findChildren(QtWidgets.QWidget)]:
+            if targets is not None and widget.objectName() not in targets:
+                continue
+            style.unpolish(widget)
+            style.polish(widget)
+            widget.update()
+
+    # =========================================================================
+    # TOKEN CACHES
+    # =========================================================================
+
+    def _token_hex(self, key: str, mode: str, default: str) -> str:
+        return normalize_color(str(_THEME_MAP[mode.lower()].get(key, default)))
+
+    def color(self, key: str, default: str = "#000000", mode: Optional[str] = None) -> QtGui.QColor:
+        """Cached QColor for a theme key (current mode unless given)."""
+        mode = (mode or self.mode).upper()
+        cache_key = ("color", mode, key, default)
+        color = self._tokens.get(cache_key)
+        if color is None:
+            color = self._tokens[cache_key] = QtGui.QColor(self._token_hex(key, mode, default))
+        return color
+
+    def pen(
+        self,
+        key: str,
+        width: float = 1.0,
+        default: str = "#000000",
+        mode: Optional[str] = None,
+    ) -> QtGui.QPen:
+        """Cached QPen for a theme key."""
+        mode = (mode or self.mode).upper()
+        cache_key = ("pen", mode, key, width, default)
+        pen = self._tokens.get(cache_key)
+        if pen is None:
+            pen = self._tokens[cache_key] = QtGui.QPen(self.color(key, default, mode), width)
+        return pen
+
+    def brush(self, key: str, default: str = "#000000", mode: Optional[str] = None) -> QtGui.QBrush:
+        """Cached QBrush for a theme key."""
+        mode = (mode or self.mode).upper()
+        cache_key = ("brush", mode, key, default)
+        brush = self._tokens.get(cache_key)
+        if brush is None:
+            brush = self._tokens[cache_key] = QtGui.QBrush(self.color(key, default, mode))
+        return brush
+
+
+# =============================================================================
+# SINGLETON ACCESSOR
+# =============================================================================
+
+_compiler_instance: Optional[ThemeCompiler] = None
+_compiler_lock = threading.Lock()
+
+
+def get_theme_compiler() -> ThemeCompiler:
+    """Get the global ThemeCompiler singleton."""
+    global _compiler_instance
+
+    if _compiler_instance is None:
+        with _compiler_lock:
+            if _compiler_instance is None:
+                _compiler_instance = ThemeCompiler()
+
+    return _compiler_instance
+
+
+def register_theme_rules(builder: RuleBuilder) -> RuleBuilder:
+    """Register a rule builder with the global compiler (decorator-friendly)."""
+    return get_theme_compiler().register(builder)
+
+
+def reset_theme_compiler() -> None:
+    """
+    Uninstall and drop the global compiler, keeping registered builders.
+
+    WARNING: Only use in tests.
+    """
+    global _compiler_instance
+
+    with _compiler_lock:
+        builders = []
+        if _compiler_instance is not None:
+            builders = list(_compiler_instance._builders)
+            _compiler_instance.uninstall()
+        _compiler_instance = ThemeCompiler()
+        _compiler_instance._builders = builders
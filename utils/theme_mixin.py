@@ -13,21 +13,27 @@ Usage:
             self.setObjectName("MyWidget")
             self._setup_theme()
 
-        def _build_theme_stylesheet(self) -> str:
+        @classmethod
+        def _theme_rules(cls, theme) -> str:
             return f'''
                 QWidget#MyWidget {{
-                    background: {THEME.get('card_bg', '#1A1F2E')};
-                    border-radius: {THEME.get('card_radius', 8)}px;
+                    background: {theme.get('card_bg', '#1A1F2E')};
+                    border-radius: {theme.get('card_radius', 8)}px;
                 }}
             '''
+
+_theme_rules() is compiled once per mode into the application stylesheet
+(utils/theme_compiler.py). Widgets whose stylesheet depends on instance state
+override _build_theme_stylesheet() instead.
 """
 
-from collections.abc import Callable
-from typing import List, Optional
+from collections.abc import Callable, Mapping
+from typing import Any, List, Optional
 
 from PyQt6 import QtWidgets
 
 from config.theme import THEME
+from utils.theme_compiler import get_theme_compiler, register_theme_rules
 
 
 class ThemeAwareMixin:
@@ -35,16 +41,26 @@ class ThemeAwareMixin:
     Mixin providing standardized theme refresh functionality.
 
     This mixin eliminates duplicate refresh_theme() implementations by:
-    1. Providing a base refresh_theme() that rebuilds stylesheets
+    1. Compiling each class's theme rules into the app stylesheet (ThemeCompiler)
     2. Supporting delegation to child widgets
     3. Allowing custom refresh logic via hooks
 
     Subclasses should override:
-    - _build_theme_stylesheet() - Return widget's stylesheet (most common)
+    - _theme_rules() - Return the class's QSS for a theme dict (most common)
     - _get_theme_children() - Return list of children to refresh (for containers)
     - _on_theme_refresh() - Custom logic after stylesheet update (optional)
+
+    Classes defining _theme_rules are registered with the ThemeCompiler. Once
+    the compiler is installed on the application their rules come from the
+    precompiled app stylesheet and a theme switch costs no CSS parsing;
+    otherwise (standalone widgets, tests) the rules are set per widget.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_theme_rules" in cls.__dict__:
+            register_theme_rules(cls._theme_rules)
+
     def _setup_theme(self) -> None:
         """
         Initialize theme support (call in __init__).
@@ -58,73 +74,69 @@ class ThemeAwareMixin:
         Refresh theme styling on this widget and children.
 
         This is the main entry point called when theme changes.
-        Override _build_theme_stylesheet() to customize behavior.
+        Override _theme_rules() to customize behavior.
         """
-        from utils.logger import get_logger
-        log = get_logger(__name__)
-
-        widget_name = getattr(self, 'objectName', lambda: 'Unknown')()
-        log.debug(f"[THEME MIXIN] refresh_theme() called on {widget_name}")
-
         # Step 1: Update this widget's stylesheet
-        log.debug(f"[THEME MIXIN] {widget_name}: Building stylesheet")
-        stylesheet = self._build_theme_stylesheet()
-        if stylesheet:
-            if isinstance(self, QtWidgets.QWidget):
-                log.debug(f"[THEME MIXIN] {widget_name}: Setting stylesheet ({len(stylesheet)} chars)")
-                self.setStyleSheet(stylesheet)
-                log.debug(f"[THEME MIXIN] {widget_name}: Stylesheet applied")
-        else:
-            log.debug(f"[THEME MIXIN] {widget_name}: No stylesheet returned (empty)")
+        self._apply_theme_stylesheet()
 
         # Step 2: Refresh child widgets
-        log.debug(f"[THEME MIXIN] {widget_name}: Getting theme children")
-        children = self._get_theme_children()
-        if children:
-            log.debug(f"[THEME MIXIN] {widget_name}: Found {len(children)} theme children")
-            for i, child in enumerate(children):
-                child_name = getattr(child, 'objectName', lambda: f'Child{i}')()
-                log.debug(f"[THEME MIXIN] {widget_name}: Refreshing child {i}: {child_name}")
-                if hasattr(child, "refresh_theme"):
-                    child.refresh_theme()
-                else:
-                    log.warning(f"[THEME MIXIN] {widget_name}: Child {child_name} has no refresh_theme method")
-        else:
-            log.debug(f"[THEME MIXIN] {widget_name}: No children to refresh")
+        for child in self._get_theme_children():
+            if hasattr(child, "refresh_theme"):
+                child.refresh_theme()
 
         # Step 3: Custom refresh logic (hook for subclasses)
-        log.debug(f"[THEME MIXIN] {widget_name}: Calling _on_theme_refresh hook")
         self._on_theme_refresh()
-        log.debug(f"[THEME MIXIN] {widget_name}: _on_theme_refresh hook completed")
 
         # Step 4: Trigger repaint if this is a widget
         if isinstance(self, QtWidgets.QWidget):
-            log.debug(f"[THEME MIXIN] {widget_name}: Calling update() to trigger repaint")
             self.update()
-            log.debug(f"[THEME MIXIN] {widget_name}: update() called")
 
-        log.debug(f"[THEME MIXIN] {widget_name}: refresh_theme() completed")
+    def _apply_theme_stylesheet(self) -> None:
+        """Style this widget only (no children, no hooks)."""
+        if not isinstance(self, QtWidgets.QWidget):
+            return
+        if _defines_theme_rules(type(self)) and get_theme_compiler().installed:
+            # Rules live in the compiled app stylesheet; drop transient
+            # per-widget overrides (e.g. a flash border) so they apply again
+            if self.styleSheet():
+                self.setStyleSheet("")
+            return
+        stylesheet = self._build_theme_stylesheet()
+        if stylesheet:
+            self.setStyleSheet(stylesheet)
 
-    def _build_theme_stylesheet(self) -> str:
+    @classmethod
+    def _theme_rules(cls, theme: Mapping[str, Any]) -> str:
         """
-        Build stylesheet for this widget using current THEME.
-
-        Override this in subclasses to provide custom stylesheets.
+        Build this class's QSS for one theme dict (DEBUG, SIM or LIVE).
 
-        Returns:
-            Stylesheet string, or empty string if no stylesheet needed
+        Called once per mode by the ThemeCompiler, so it must only read the
+        given theme (not the global THEME or instance state).
 
         Example:
-            def _build_theme_stylesheet(self) -> str:
+            @classmethod
+            def _theme_rules(cls, theme) -> str:
                 return f'''
                     QWidget#MyWidget {{
-                        background: {THEME.get('card_bg', '#1A1F2E')};
-                        color: {THEME.get('ink', '#E5E7EB')};
+                        background: {theme.get('card_bg', '#1A1F2E')};
+                        color: {theme.get('ink', '#E5E7EB')};
                     }}
                 '''
         """
         return ""
 
+    def _build_theme_stylesheet(self) -> str:
+        """
+        Build the per-widget stylesheet used when the compiler is not installed.
+
+        Defaults to the class's _theme_rules() for the active THEME. Override
+        for widgets whose stylesheet depends on instance state.
+
+        Returns:
+            Stylesheet string, or empty string if no stylesheet needed
+        """
+        return self._theme_rules(THEME)
+
     def _get_theme_children(self) -> list:
         """
         Return list of child widgets that should have refresh_theme() called.
@@ -155,6 +167,16 @@ class ThemeAwareMixin:
         pass
 
 
+def _defines_theme_rules(cls: type) -> bool:
+    """True if a class below ThemeAwareMixin in cls's MRO defines _theme_rules."""
+    for klass in cls.__mro__:
+        if klass is ThemeAwareMixin:
+            return False
+        if "_theme_rules" in vars(klass):
+            return True
+    return False
+
+
 class ThemedPanel(QtWidgets.QWidget, ThemeAwareMixin):
     """
     Base class for themed panels.
@@ -7,6 +7,8 @@ from typing import Optional
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from config.theme import THEME
+from core.animation_clock import get_animation_clock
+from utils.theme_compiler import get_theme_compiler
 from utils.theme_helpers import normalize_color
 from utils.theme_mixin import ThemeAwareMixin
 
@@ -27,6 +29,13 @@ DATA_DEAD_THRESHOLD = 15.0  # >15s with no message -> red
 # -------------------- Visual Constants (start)
 OUTER_RING_WIDTH = 3  # Outer ring stroke width
 INNER_CORE_INSET = 5  # Inner core inset from outer edge
+
+# Stoplight state -> THEME key (painted via the compiler's cached pens/brushes)
+_STATE_TOKENS = {
+    "green": "conn_status_green",
+    "yellow": "conn_status_yellow",
+    "red": "conn_status_red",
+}
 # -------------------- Visual Constants (end)
 
 
@@ -52,24 +61,29 @@ class ConnectionIcon(QtWidgets.QWidget, ThemeAwareMixin):
         # Timing state
         self._last_heartbeat_time: Optional[float] = None  # Epoch timestamp
         self._last_data_time: Optional[float] = None  # Epoch timestamp
+        self._latency_ms: Optional[float] = None  # DTC request-to-first-response latency
 
         # Color state (computed from timing)
         self._outer_color: str = "red"  # Start red (disconnected)
         self._inner_color: str = "red"  # Start red (no data)
 
-        # Update timer (checks thresholds every second)
-        self._timer = QtCore.QTimer(self)
-        self._timer.timeout.connect(self._update_colors)
-        self._timer.start(1000)  # 1 second interval
+        # Threshold check every second on the shared animation clock (paused while hidden)
+        self._timer = get_animation_clock().subscribe(self._update_colors, 1000, owner=self)
+        self._timer.start()
 
         self.setFixedSize(18, 18)
         self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
         self._update_tooltip()
 
     # ---- Public API -----------------------------------------------------
-    def mark_heartbeat(self) -> None:
-        """Called when a heartbeat is received from DTC (updates outer ring)."""
+    def mark_heartbeat(self, latency_ms: Optional[float] = None) -> None:
+        """Called when a heartbeat is received from DTC (updates outer ring).
+
+        latency_ms: DTC request-to-first-response latency (None/negative = unknown)
+        """
         self._last_heartbeat_time = time.time()
+        if latency_ms is not None and latency_ms >= 0:
+            self._latency_ms = latency_ms
         self._update_colors()
         self._update_tooltip()
 
@@ -87,6 +101,7 @@ class ConnectionIcon(QtWidgets.QWidget, ThemeAwareMixin):
         """Called when DTC connection is lost (clears all timers)."""
         self._last_heartbeat_time = None
         self._last_data_time = None
+        self._latency_ms = None
         self._update_colors()
         self._update_tooltip()
 
@@ -165,6 +180,7 @@ class ConnectionIcon(QtWidgets.QWidget, ThemeAwareMixin):
         data_time = (
             datetime.fromtimestamp(self._last_data_time).strftime("%H:%M:%S") if self._last_data_time else "Never"
         )
+        latency = f"{self._latency_ms:.1f} ms" if self._latency_ms is not None else "n/a"
 
         # Build tooltip
         bg_color = normalize_color(THEME["bg_panel"])
@@ -186,6 +202,7 @@ class ConnectionIcon(QtWidgets.QWidget, ThemeAwareMixin):
             f"Inner (Data Feed): <b style='color:{inner_hex};'>{inner_status}</b><br>"
             f"Host: {self._host}  Port: {self._port}<br>"
             f"Last Heartbeat: {hb_time}<br>"
+            f"Request Latency: {latency}<br>"
             f"Last Data: {data_time}</div>"
         )
         self.setToolTip(html)
@@ -205,14 +222,11 @@ class ConnectionIcon(QtWidgets.QWidget, ThemeAwareMixin):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
 
-        # Get colors from THEME
-        outer_hex = self._get_color_hex(self._outer_color)
-        inner_hex = self._get_color_hex(self._inner_color)
+        # Cached per (theme mode, token): no QColor/QPen parsing per paint
+        tokens = get_theme_compiler()
 
         # Outer ring (connection health)
-        outer_color = QtGui.QColor(outer_hex)
-        pen = QtGui.QPen(outer_color, OUTER_RING_WIDTH)
-        painter.setPen(pen)
+        painter.setPen(tokens.pen(_STATE_TOKENS[self._outer_color], OUTER_RING_WIDTH))
         painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
 
         # Draw outer ring circle
@@ -225,9 +239,8 @@ class ConnectionIcon(QtWidgets.QWidget, ThemeAwareMixin):
         painter.drawEllipse(ring_rect)
 
         # Inner core (data feed)
-        inner_color = QtGui.QColor(inner_hex)
         painter.setPen(QtCore.Qt.PenStyle.NoPen)
-        painter.setBrush(inner_color)
+        painter.setBrush(tokens.brush(_STATE_TOKENS[self._inner_color]))
 
         # Draw inner core circle
         core_rect = QtCore.QRectF(
@@ -7,10 +7,67 @@ import contextlib
 from PyQt6 import QtCore, QtWidgets
 
 from config.theme import THEME
+from core import metrics
+
+# Overlay refresh interval (reads the registry, never blocks recorders for long)
+OVERLAY_REFRESH_MS = 500
+
+
+class MetricsOverlay(QtWidgets.QLabel):
+    """Floating table of hot-path latencies (count, p50, p99, max) from core/metrics.py."""
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None):
+        super().__init__(parent)
+        self.setObjectName("MetricsOverlay")
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        self.setStyleSheet(
+            f"background: rgba(0, 0, 0, 190); color: {THEME.get('fg_primary', '#E5E7EB')};"
+            " font-family: Consolas, 'DejaVu Sans Mono', monospace; font-size: 11px; padding: 6px;"
+        )
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(OVERLAY_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def refresh(self) -> None:
+        self.setText(self.render_text())
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(max(0, parent.width() - self.width() - 12), 12)
+        self.raise_()
+
+    @staticmethod
+    def render_text() -> str:
+        registry = metrics.get_metrics_registry()
+        lines = [f"{'metric':<15}{'count':>8}{'p50':>9}{'p99':>9}{'max':>9}"]
+        for row in registry.summary_rows():
+            lines.append(
+                f"{row['name']:<15}{row['count']:>8}"
+                f"{row['p50_ms']:>9.3f}{row['p99_ms']:>9.3f}{row['max_ms']:>9.2f}"
+            )
+        if len(lines) == 1:
+            lines.append("(no samples yet)" if metrics.is_enabled() else "(metrics disabled)")
+        snapshot = registry.snapshot()
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"{name:<15}{value:>8}")
+        for name, value in sorted(snapshot["gauges"].items()):
+            lines.append(f"{name:<15}{value:>8g}")
+        return "\n".join(lines)
 
 
 class DevToolbar(QtWidgets.QWidget):
-    """Small toolbar with Theme toggle and font size controls.
+    """Small toolbar with Theme toggle, font size controls and the Perf overlay.
     Emits `changed` so MainWindow can refresh styles.
     """
 
@@ -19,6 +76,7 @@ class DevToolbar(QtWidgets.QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self._overlay: MetricsOverlay | None = None
         self._build_ui()
 
     def _build_ui(self):
@@ -38,9 +96,21 @@ class DevToolbar(QtWidgets.QWidget):
         self.btn_font_down.setFixedHeight(28)
         self.btn_font_down.clicked.connect(self._font_down)
 
+        self.btn_perf = QtWidgets.QPushButton("Perf")
+        self.btn_perf.setFixedHeight(28)
+        self.btn_perf.setCheckable(True)
+        self.btn_perf.toggled.connect(self._toggle_perf)
+
         layout.addWidget(self.btn_theme)
         layout.addWidget(self.btn_font_up)
         layout.addWidget(self.btn_font_down)
+        layout.addWidget(self.btn_perf)
+
+        self.btn_profile = QtWidgets.QPushButton("Profile")
+        self.btn_profile.setFixedHeight(28)
+        self.btn_profile.setToolTip("Write a flamegraph of the samples so far (starts the sampler if idle)")
+        self.btn_profile.clicked.connect(self._dump_profile)
+        layout.addWidget(self.btn_profile)
         layout.addStretch(1)
 
         self.setStyleSheet("background: transparent;")
@@ -73,3 +143,27 @@ class DevToolbar(QtWidgets.QWidget):
         except Exception:
             THEME["font_base_size"] = 12
         self.changed.emit()
+
+    def _toggle_perf(self, checked: bool):
+        """Show/hide the metrics overlay; showing it turns recording on."""
+        if checked:
+            metrics.set_enabled(True)
+            if self._overlay is None:
+                host = self.main_window if isinstance(self.main_window, QtWidgets.QWidget) else None
+                self._overlay = MetricsOverlay(host)
+            self._overlay.show()
+        elif self._overlay is not None:
+            self._overlay.hide()
+
+    def _dump_profile(self):
+        """Dump the sampling profiler; first click starts it when it is not running."""
+        from core.sampling_profiler import get_sampling_profiler
+
+        profiler = get_sampling_profiler()
+        if not profiler.running:
+            profiler.start(dump_on_exit=True)
+            self.btn_profile.setText("Dump")
+            return
+        paths = profiler.dump("on_demand")
+        if paths:
+            self.btn_profile.setToolTip(f"Last profile: {paths[-1]}")
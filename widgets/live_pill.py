@@ -4,6 +4,7 @@ from __future__ import annotations
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from config.theme import THEME
+from core.animation_clock import get_animation_clock
 
 from .pill_widget import PillWidget
 
@@ -16,9 +17,8 @@ class LivePillWidget(PillWidget):
         self._pulsing = False
         self._dot_visible = True
         self._pulse_phase = 0.0
-        self._pulse_timer = QtCore.QTimer(self)
-        self._pulse_timer.setInterval(60)  # ~16 FPS
-        self._pulse_timer.timeout.connect(self._tick_pulse)
+        # ~16 FPS on the shared animation clock (paused while hidden)
+        self._pulse_timer = get_animation_clock().subscribe(self._tick_pulse, 60, owner=self)
 
     def set_live_dot_visible(self, visible: bool):
         self._dot_visible = visible
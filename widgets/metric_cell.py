@@ -10,6 +10,7 @@ from typing import Optional
 from PyQt6 import QtCore, QtWidgets
 
 from config.theme import THEME, ColorTheme
+from core.animation_clock import get_animation_clock
 from utils.theme_mixin import ThemeAwareMixin
 
 
@@ -32,10 +33,8 @@ class MetricCell(QtWidgets.QFrame, ThemeAwareMixin):
         self._build()
         self._setup_theme()
 
-        # Flash timer
-        self._flash_timer = QtCore.QTimer(self)
-        self._flash_timer.setInterval(FLASH_INTERVAL_MS)
-        self._flash_timer.timeout.connect(self._on_flash_tick)
+        # Flash ticks from the shared animation clock (paused while hidden)
+        self._flash_timer = get_animation_clock().subscribe(self._on_flash_tick, FLASH_INTERVAL_MS, owner=self)
 
     def _build(self):
         lay = QtWidgets.QVBoxLayout(self)
@@ -43,8 +42,8 @@ class MetricCell(QtWidgets.QFrame, ThemeAwareMixin):
         lay.setSpacing(4)
 
         self.lbl_title = QtWidgets.QLabel(self._title, self)
+        self.lbl_title.setObjectName("MetricTitle")
         self.lbl_title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.lbl_title.setStyleSheet(f"color: {THEME.get('text_dim', '#5B6C7A')};")
 
         self.lbl_val = QtWidgets.QLabel(self._initial_value, self)
         self.lbl_val.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -56,35 +55,16 @@ class MetricCell(QtWidgets.QFrame, ThemeAwareMixin):
         lay.addWidget(self.lbl_title)
         lay.addWidget(self.lbl_val, 1)
 
-        # Panel styling (uses centralized THEME)
-        radius = int(THEME.get("card_radius", 8))
-        card_bg = THEME.get("card_bg", "#1A1F2E")
-        cell_border = THEME.get("cell_border", "none")  # Uses cell_border from theme (neon blue in SIM mode)
+    @classmethod
+    def _theme_rules(cls, theme) -> str:
+        """MetricCell card + title colors for one theme."""
+        radius = int(theme["card_radius"])
+        card_bg = theme["card_bg"]
+        cell_border = theme.get("cell_border", "none")  # Uses cell_border from theme (neon blue in SIM mode)
 
         # If cell_border is "none", use default 1px solid border, otherwise use the theme value
         if cell_border == "none":
-            border_style = f"border: 1px solid {THEME.get('border', '#374151')};"
-        else:
-            border_style = f"border: {cell_border};"
-
-        self.setStyleSheet(
-            f"""
-            QFrame#MetricCell {{
-                background: {card_bg};
-                {border_style}
-                border-radius: {radius}px;
-            }}
-            """
-        )
-
-    def _build_theme_stylesheet(self) -> str:
-        """Build MetricCell stylesheet using current THEME."""
-        radius = int(THEME.get("card_radius", 8))
-        card_bg = THEME.get("card_bg", "#1A1F2E")
-        cell_border = THEME.get("cell_border", "none")
-
-        if cell_border == "none":
-            border_style = f"border: 1px solid {THEME.get('border', '#374151')};"
+            border_style = f"border: 1px solid {theme['border']};"
         else:
             border_style = f"border: {cell_border};"
 
@@ -94,11 +74,15 @@ class MetricCell(QtWidgets.QFrame, ThemeAwareMixin):
                 {border_style}
                 border-radius: {radius}px;
             }}
+            QFrame#MetricCell QLabel#MetricTitle {{
+                color: {theme['text_dim']};
+            }}
         """
 
     def _on_theme_refresh(self) -> None:
-        """Update label colors after theme refresh."""
-        self.lbl_title.setStyleSheet(f"color: {THEME.get('text_dim', '#5B6C7A')};")
+        """Drop a custom title color so the themed one applies again."""
+        if self.lbl_title.styleSheet():
+            self.lbl_title.setStyleSheet("")
 
     # Value/text/color API
     def set_value_text(self, text: str):
@@ -177,6 +161,9 @@ class MetricCell(QtWidgets.QFrame, ThemeAwareMixin):
                     {border_style}
                     border-radius: {radius}px;
                 }}
+                QFrame#MetricCell QLabel#MetricTitle {{
+                    color: {THEME.get('text_dim', '#5B6C7A')};
+                }}
                 """
             )
 
@@ -1,18 +1,133 @@
 # File: widgets/metric_grid.py
+"""
+Custom-painted grid of metric cells (title on top, value below).
+
+One widget paints every cell in a single paintEvent instead of one QFrame +
+two stylesheet-driven QLabels per metric:
+- title/value text is cached as QStaticText (re-laid out only when it changes)
+- an update repaints only the dirty cell's rect (Qt coalesces them per frame)
+- theme tokens are resolved to QColor/QPen once per mode (ThemeCompiler cache)
+- each cell's card (background, border, title) is rendered once into a
+  pixmap and blitted, so a value tick only draws the value text
+- flashing cells share one animation clock subscription
+
+Each cell is exposed as a MetricGridCell handle with the MetricCell value API
+(set_value_text, set_value_color, start_flashing, ...), so code written
+against MetricCell drives grid cells unchanged.
+"""
 from __future__ import annotations
 
 from collections.abc import Iterable
 from typing import Any, Dict, List, Optional
 
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 
 from config.theme import THEME, ColorTheme
+from core.animation_clock import get_animation_clock
+from utils.theme_compiler import get_theme_compiler
+from utils.theme_helpers import normalize_color
 from utils.theme_mixin import ThemeAwareMixin
-from widgets.metric_cell import KeyValCard  # type: ignore
+from widgets.metric_cell import FLASH_INTERVAL_MS
+
+
+# Cell geometry (matches the MetricCell layout margins/spacing)
+CELL_SPACING = 8
+CELL_PAD_X = 8
+CELL_PAD_Y = 6
+TITLE_VALUE_GAP = 4
+
+# Value opacity while a flashing cell is in its "off" phase
+FLASH_DIM_OPACITY = 0.35
+
+
+class _CellState:
+    """Paint state of one cell (owned by MetricGrid)."""
+
+    __slots__ = (
+        "index",
+        "title",
+        "text",
+        "rich",
+        "color",
+        "title_color",
+        "enabled",
+        "flashing",
+        "flash_on",
+        "flash_border",
+        "rect",
+        "title_static",
+        "value_static",
+        "card",
+    )
+
+    def __init__(self, index: int, title: str, text: str) -> None:
+        self.index = index
+        self.title = title
+        self.text = text
+        self.rich = False
+        self.color: Optional[QtGui.QColor] = None  # None -> theme ink
+        self.title_color: Optional[QtGui.QColor] = None  # None -> theme text_dim
+        self.enabled = True
+        self.flashing = False
+        self.flash_on = False
+        self.flash_border: Optional[QtGui.QColor] = None
+        self.rect = QtCore.QRect()
+        self.title_static = QtGui.QStaticText(title)
+        self.value_static = QtGui.QStaticText(text)
+        self.card: Optional[QtGui.QPixmap] = None  # background + border + title
+
+
+class MetricGridCell:
+    """MetricCell-compatible handle for one grid cell."""
+
+    __slots__ = ("_grid", "_state")
+
+    def __init__(self, grid: "MetricGrid", state: _CellState) -> None:
+        self._grid = grid
+        self._state = state
+
+    @property
+    def title(self) -> str:
+        return self._state.title
+
+    def text(self) -> str:
+        return self._state.text
+
+    def set_value_text(self, text: str) -> None:
+        self._grid._set_text(self._state, str(text), rich=False)
+
+    def set_value_html(self, html: str) -> None:
+        self._grid._set_text(self._state, str(html), rich=True)
+
+    def set_value_color(self, color_css: str) -> None:
+        self._grid._set_color(self._state, color_css)
+
+    def set_title_color(self, color_css: str) -> None:
+        self._grid._set_title_color(self._state, color_css)
+
+    def set_value(self, text: str, color: Optional[str] = None) -> None:
+        self.set_value_text(text)
+        if color:
+            self.set_value_color(color)
+
+    def start_flashing(self, border_color: Optional[str] = None) -> None:
+        self._grid._start_flashing(self._state, border_color)
+
+    def stop_flashing(self) -> None:
+        self._grid._stop_flashing(self._state)
+
+    def setEnabled(self, enabled: bool) -> None:
+        self._grid._set_cell_enabled(self._state, enabled)
+
+    def isEnabled(self) -> bool:
+        return self._state.enabled
+
+    def update(self) -> None:
+        self._grid._mark_dirty(self._state)
 
 
 class MetricGrid(QtWidgets.QWidget, ThemeAwareMixin):
-    """Reusable grid of KeyValCard cells.
+    """Custom-painted grid of metric cells.
 
     Args:
         metric_names: Flat list of metric display names.
@@ -24,31 +139,249 @@ class MetricGrid(QtWidgets.QWidget, ThemeAwareMixin):
         - update_many(pairs: Iterable[tuple[str, Any]]) -> None
         - set_enabled_all(enabled: bool) -> None
         - set_enabled(names_or_all: Iterable[str] | str, enabled: bool) -> None
-        - metrics() -> Dict[str, KeyValCard]
+        - cell(name) -> MetricGridCell
+        - metrics() -> Dict[str, MetricGridCell]
+        - get_all_values() -> Dict[str, str]
     """
 
     def __init__(self, metric_names: list[str], cols: int = 5, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         if not metric_names:
             metric_names = ["-"]
-        self._metrics: dict[str, KeyValCard] = {}
+        self.setObjectName("MetricGrid")
         self._cols = max(1, int(cols))
-        self._build_grid(metric_names)
+        self._cells: list[_CellState] = []
+        self._metrics: dict[str, MetricGridCell] = {}
+        self._css_colors: dict[str, QtGui.QColor] = {}
+        for idx, name in enumerate(metric_names):
+            label = str(name)
+            state = _CellState(idx, label, "--")
+            self._cells.append(state)
+            self._metrics[label] = MetricGridCell(self, state)
+        self._rows = (len(self._cells) + self._cols - 1) // self._cols
 
-    def _build_grid(self, names: Iterable[str]) -> None:
-        grid = QtWidgets.QGridLayout(self)
-        # Match Panel 2 grid spacing
-        grid.setContentsMargins(0, 0, 0, 0)
-        grid.setHorizontalSpacing(8)
-        grid.setVerticalSpacing(8)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        self._setup_theme()
 
-        for idx, name in enumerate(names):
-            label = str(name)
-            cell = KeyValCard(label, "--")
+        # One flash subscription for every flashing cell (paused while hidden)
+        self._flash_timer = get_animation_clock().subscribe(self._on_flash_tick, FLASH_INTERVAL_MS, owner=self)
+
+    # =========================================================================
+    # THEME
+    # =========================================================================
+
+    def _on_theme_refresh(self) -> None:
+        """Resolve fonts/colors for the active mode and re-lay out the text."""
+        compiler = get_theme_compiler()
+        self._card_brush = compiler.brush("card_bg")
+        self._border_pen = compiler.pen("border", 1.0)
+        self._ink = compiler.color("ink")
+        self._title_ink = compiler.color("text_dim")
+        self._radius = int(THEME.get("card_radius", 8))
+        self._title_font = ColorTheme.qfont(THEME.get("title_font_weight", 500), THEME.get("title_font_size", 16))
+        self._value_font = ColorTheme.qfont(600, THEME.get("balance_font_size", 18))
+        self._title_h = QtGui.QFontMetrics(self._title_font).height()
+        self._value_h = QtGui.QFontMetrics(self._value_font).height()
+        for state in self._cells:
+            state.title_static.prepare(QtGui.QTransform(), self._title_font)
+            state.value_static.prepare(QtGui.QTransform(), self._value_font)
+            state.title_color = None
+            state.card = None
+        self.updateGeometry()
+        self._layout_cells()
+
+    def _qcolor(self, color_css: str) -> QtGui.QColor:
+        color = self._css_colors.get(color_css)
+        if color is None:
+            color = self._css_colors[color_css] = QtGui.QColor(normalize_color(color_css))
+        return color
+
+    # =========================================================================
+    # GEOMETRY
+    # =========================================================================
 
-            row, col = divmod(idx, self._cols)
-            grid.addWidget(cell, row, col)
-            self._metrics[label] = cell
+    def _cell_height(self) -> int:
+        return CELL_PAD_Y * 2 + self._title_h + TITLE_VALUE_GAP + self._value_h
+
+    def sizeHint(self) -> QtCore.QSize:
+        title_metrics = QtGui.QFontMetrics(self._title_font)
+        widest = max(title_metrics.horizontalAdvance(state.title) for state in self._cells)
+        cell_w = max(widest, QtGui.QFontMetrics(self._value_font).horizontalAdvance("00000.00")) + CELL_PAD_X * 2
+        return QtCore.QSize(
+            cell_w * self._cols + CELL_SPACING * (self._cols - 1),
+            self._cell_height() * self._rows + CELL_SPACING * (self._rows - 1),
+        )
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(
+            (CELL_PAD_X * 2 + 1) * self._cols,
+            self._cell_height() * self._rows + CELL_SPACING * (self._rows - 1),
+        )
+
+    def resizeEvent(self, ev: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(ev)
+        self._layout_cells()
+
+    def _layout_cells(self) -> None:
+        width, height = self.width(), self.height()
+        cell_w = (width - CELL_SPACING * (self._cols - 1)) / self._cols
+        cell_h = (height - CELL_SPACING * (self._rows - 1)) / self._rows
+        for state in self._cells:
+            row, col = divmod(state.index, self._cols)
+            x = round(col * (cell_w + CELL_SPACING))
+            y = round(row * (cell_h + CELL_SPACING))
+            rect = QtCore.QRect(
+                x,
+                y,
+                round((col + 1) * (cell_w + CELL_SPACING) - CELL_SPACING) - x,
+                round((row + 1) * (cell_h + CELL_SPACING) - CELL_SPACING) - y,
+            )
+            if rect.size() != state.rect.size():
+                state.card = None
+            state.rect = rect
+        self.update()
+
+    # =========================================================================
+    # PAINTING
+    # =========================================================================
+
+    def _mark_dirty(self, state: _CellState) -> None:
+        self.update(state.rect)
+
+    def paintEvent(self, ev: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        dirty = ev.region()
+        for state in self._cells:
+            if dirty.intersects(state.rect):
+                self._paint_cell(painter, state)
+        painter.end()
+
+    def _card_pixmap(self, state: _CellState) -> QtGui.QPixmap:
+        """Cell background + border + title, rendered once per size/theme/title color."""
+        if state.card is None:
+            ratio = self.devicePixelRatioF()
+            size = state.rect.size()
+            pixmap = QtGui.QPixmap(round(size.width() * ratio), round(size.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            self._draw_border(painter, QtCore.QRectF(0, 0, size.width(), size.height()), self._border_pen, self._card_brush)
+
+            if not state.enabled:
+                painter.setOpacity(0.5)
+            content = QtCore.QRect(QtCore.QPoint(0, 0), size).adjusted(CELL_PAD_X, CELL_PAD_Y, -CELL_PAD_X, -CELL_PAD_Y)
+            painter.setFont(self._title_font)
+            painter.setPen(state.title_color or self._title_ink)
+            painter.drawStaticText(
+                QtCore.QPointF(content.center().x() + 0.5 - state.title_static.size().width() / 2, content.top()),
+                state.title_static,
+            )
+            painter.end()
+            state.card = pixmap
+        return state.card
+
+    def _draw_border(
+        self,
+        painter: QtGui.QPainter,
+        rect: QtCore.QRectF,
+        pen: QtGui.QPen,
+        brush: QtGui.QBrush | QtCore.Qt.BrushStyle,
+    ) -> None:
+        inset = pen.widthF() / 2
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawRoundedRect(rect.adjusted(inset, inset, -inset, -inset), self._radius, self._radius)
+
+    def _paint_cell(self, painter: QtGui.QPainter, state: _CellState) -> None:
+        painter.drawPixmap(state.rect.topLeft(), self._card_pixmap(state))
+        if state.flashing and state.flash_border is not None and state.flash_on:
+            self._draw_border(
+                painter,
+                QtCore.QRectF(state.rect),
+                QtGui.QPen(state.flash_border, 2.0),
+                QtCore.Qt.BrushStyle.NoBrush,
+            )
+
+        # Value: centered below the title
+        content = state.rect.adjusted(CELL_PAD_X, CELL_PAD_Y, -CELL_PAD_X, -CELL_PAD_Y)
+        value_top = content.top() + self._title_h + TITLE_VALUE_GAP
+        value_size = state.value_static.size()
+        opacity = 1.0 if state.enabled else 0.5
+        if state.flashing and not state.flash_on:
+            opacity *= FLASH_DIM_OPACITY
+        painter.setOpacity(opacity)
+        painter.setFont(self._value_font)
+        painter.setPen(state.color or self._ink)
+        painter.drawStaticText(
+            QtCore.QPointF(
+                content.center().x() + 0.5 - value_size.width() / 2,
+                value_top + max(0.0, (content.bottom() + 1 - value_top - value_size.height()) / 2),
+            ),
+            state.value_static,
+        )
+        painter.setOpacity(1.0)
+
+    # =========================================================================
+    # CELL STATE (via MetricGridCell)
+    # =========================================================================
+
+    def _set_text(self, state: _CellState, text: str, rich: bool) -> None:
+        if text == state.text and rich == state.rich:
+            return
+        state.text = text
+        if rich != state.rich:
+            state.rich = rich
+            state.value_static.setTextFormat(
+                QtCore.Qt.TextFormat.RichText if rich else QtCore.Qt.TextFormat.PlainText
+            )
+        state.value_static.setText(text)
+        state.value_static.prepare(QtGui.QTransform(), self._value_font)
+        self._mark_dirty(state)
+
+    def _set_color(self, state: _CellState, color_css: str) -> None:
+        color = self._qcolor(color_css)
+        if color != state.color:
+            state.color = color
+            self._mark_dirty(state)
+
+    def _set_title_color(self, state: _CellState, color_css: str) -> None:
+        color = self._qcolor(color_css)
+        if color != state.title_color:
+            state.title_color = color
+            state.card = None
+            self._mark_dirty(state)
+
+    def _set_cell_enabled(self, state: _CellState, enabled: bool) -> None:
+        if bool(enabled) != state.enabled:
+            state.enabled = bool(enabled)
+            state.card = None
+            self._mark_dirty(state)
+
+    def _start_flashing(self, state: _CellState, border_color: Optional[str]) -> None:
+        if state.flashing:
+            return
+        state.flashing = True
+        state.flash_on = True
+        state.flash_border = self._qcolor(border_color) if border_color else None
+        self._flash_timer.start()
+        self._mark_dirty(state)
+
+    def _stop_flashing(self, state: _CellState) -> None:
+        if not state.flashing:
+            return
+        state.flashing = False
+        state.flash_border = None
+        if not any(cell.flashing for cell in self._cells):
+            self._flash_timer.stop()
+        self._mark_dirty(state)
+
+    def _on_flash_tick(self) -> None:
+        for state in self._cells:
+            if state.flashing:
+                state.flash_on = not state.flash_on
+                self._mark_dirty(state)
 
     def _infer_color(self, value: Any, color: Optional[str]) -> Optional[str]:
         """Derive green/red/neutral based on numeric sign when color not provided."""
@@ -73,32 +406,12 @@ class MetricGrid(QtWidgets.QWidget, ThemeAwareMixin):
         if not cell:
             return
         text = "--" if value is None else str(value)
-        col = self._infer_color(value, color)
-        try:
-            cell.set_value(text, color=col)  # type: ignore[attr-defined]
-        except Exception:
-            try:
-                if col:
-                    cell.setStyleSheet(f"color:{col};")
-                if hasattr(cell, "setText"):
-                    cell.setText(text)  # type: ignore[attr-defined]
-            except Exception:
-                pass
-
-        # CRITICAL FIX: Tell Qt to repaint the cell after update
-        if hasattr(cell, "update"):
-            cell.update()
-        if hasattr(cell, "repaint"):
-            cell.repaint()
+        cell.set_value(text, color=self._infer_color(value, color))
 
     def update_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
         for name, val in pairs:
             self.update_metric(name, val)
 
-        # CRITICAL FIX: Repaint the entire grid after bulk update
-        self.update()
-        self.repaint()
-
     def set_enabled_all(self, enabled: bool) -> None:
         for cell in self._metrics.values():
             cell.setEnabled(enabled)
@@ -112,9 +425,14 @@ class MetricGrid(QtWidgets.QWidget, ThemeAwareMixin):
             if cell:
                 cell.setEnabled(enabled)
 
-    def metrics(self) -> dict[str, KeyValCard]:
+    def cell(self, name: str) -> MetricGridCell:
+        return self._metrics[name]
+
+    def metrics(self) -> dict[str, MetricGridCell]:
         return self._metrics
 
-    def _get_theme_children(self) -> list:
-        """Delegate theme refresh to all metric cells."""
-        return list(self._metrics.values())
+    def get_all_values(self) -> dict[str, str]:
+        return {name: cell.text() for name, cell in self._metrics.items()}
+
+
+__all__ = ["MetricGrid", "MetricGridCell"]
@@ -7,6 +7,7 @@ from typing import Dict, Optional
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from config.theme import THEME, ColorTheme
+from core.animation_clock import get_animation_clock
 from utils.theme_helpers import normalize_color
 
 
@@ -95,12 +96,10 @@ class LivePillButton(QtWidgets.QToolButton):
         self._dot.setGraphicsEffect(self._eff)
         self._eff.setOpacity(1.0)
 
-        # Timer for pulse
+        # Pulse ticks from the shared animation clock (paused while hidden)
         self._pulsing = False
         self._pulse_on = True
-        self._timer = QtCore.QTimer(self)
-        self._timer.setInterval(int(THEME["live_dot_pulse_ms"]))
-        self._timer.timeout.connect(self._on_pulse_tick)
+        self._timer = get_animation_clock().subscribe(self._on_pulse_tick, int(THEME["live_dot_pulse_ms"]), owner=self)
 
         # Keep some extra left padding so text doesnt collide with the dot
         # (We already have padding in QSS; we just position the dot precisely.)